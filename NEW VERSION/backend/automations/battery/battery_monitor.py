@@ -25,6 +25,14 @@ class BatteryMonitor:
     Runs independently of user commands
     """
 
+    # Fixed alerts, pre-rendered into the speech audio cache at startup
+    CANNED_RESPONSES = (
+        "Charger connected.",
+        "Charger disconnected.",
+        "Battery is critically low. Please connect the charger.",
+        "Battery is fully charged. You may unplug the charger.",
+    )
+
     def __init__(self, speaker, interval=60, config: BatteryMonitorConfig | None = None, settings=None):
         self.speaker = speaker
         self.interval = interval
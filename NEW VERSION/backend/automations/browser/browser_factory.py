@@ -39,10 +39,11 @@ def _detect_browser():
     return None, None
 
 
-def create_browser():
+def create_browser(refresh_driver: bool = False):
     """
     Creates Selenium browser instance.
     Auto-falls back to Brave if nothing configured.
+    Prefer BrowserPool (browser_pool.py): it shares one instance between automations.
     """
 
     browser = get_browser_choice()
@@ -94,10 +95,10 @@ def create_browser():
     edge_options.add_argument("--start-maximized")
 
     if browser == "edge":
-        driver_path = DriverManager.get_driver_path("edge")
+        driver_path = DriverManager.get_driver_path("edge", refresh=refresh_driver)
         service = EdgeService(driver_path)
         return webdriver.Edge(service=service, options=edge_options)
 
-    driver_path = DriverManager.get_driver_path("chrome")
+    driver_path = DriverManager.get_driver_path("chrome", refresh=refresh_driver)
     service = ChromeService(driver_path)
     return webdriver.Chrome(service=service, options=chrome_options)
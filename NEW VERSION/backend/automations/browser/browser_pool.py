@@ -0,0 +1,254 @@
+# BACKEND/automations/browser/browser_pool.py
+"""
+One shared, pre-warmed Selenium browser for the browser automations.
+
+YouTube and Google each get a tab of the same browser process instead of
+launching a Chromium of their own:
+
+    with BrowserPool().lease():
+        driver = BrowserPool().driver("youtube")
+        ...
+
+- lease() holds the browser for one whole command: YouTube and Google share
+  one WebDriver, and another automation switching tabs mid-command would
+  leave the first one acting on the wrong tab
+
+- the driver binary is resolved once and pinned (DriverManager)
+- prewarm() launches the browser and opens the tabs before the first command
+- driver() does no health round trip: a background thread checks the browser
+  every health_interval, check() does it on demand (after a failed command),
+  and a dead browser is recycled on the next driver() call
+- tabs are bounded (max_tabs, least recently used closed first)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional
+
+HOME_URLS = {
+    "youtube": "https://www.youtube.com",
+    "google": "https://www.google.com",
+}
+
+PREWARM = os.getenv("SYNEX_BROWSER_PREWARM", "youtube,google")  # "" = launch on first use
+HEALTH_INTERVAL = float(os.getenv("SYNEX_BROWSER_HEALTH_INTERVAL", "10"))
+MAX_TABS = 4
+PAGE_LOAD_TIMEOUT = 15
+
+
+def launch_browser():
+    from BACKEND.automations.browser.browser_factory import create_browser
+    try:
+        return create_browser()
+    except Exception as e:
+        # The browser may have updated past the pinned driver
+        print(f"[Browser] Launch failed ({e}); resolving the driver again")
+        return create_browser(refresh_driver=True)
+
+
+class BrowserPool:
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, launcher: Callable = launch_browser, health_interval: float = HEALTH_INTERVAL,
+                 max_tabs: int = MAX_TABS):
+        if self._initialized:
+            return
+        self.launcher = launcher
+        self.health_interval = health_interval
+        self.max_tabs = max_tabs
+
+        self._driver = None
+        self._tabs: "OrderedDict[str, str]" = OrderedDict()  # automation -> window handle, LRU first
+        self._spare: Optional[str] = None   # blank tab the browser started with
+        self._current: Optional[str] = None  # handle the driver is switched to
+        self._lock = threading.RLock()
+        self._health_thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"launches": 0, "recycles": 0, "tabs_opened": 0, "switches": 0, "health_checks": 0}
+        self._initialized = True
+
+    # ------------------------
+    # Tabs
+    # ------------------------
+    @contextmanager
+    def lease(self):
+        """Exclusive use of the shared browser until the block ends (reentrant)"""
+        with self._lock:
+            yield self
+
+    def driver(self, name: str, url: Optional[str] = None):
+        """The shared driver, switched to `name`'s tab (opened at url / HOME_URLS[name] if new)"""
+        with self._lock:
+            driver = self._ensure_driver()
+            handle = self._tabs.get(name)
+            if handle is None:
+                return self._open_tab(driver, name, url)
+
+            self._tabs.move_to_end(name)
+            if handle != self._current:
+                try:
+                    driver.switch_to.window(handle)
+                except Exception:
+                    # Tab closed by hand, or the whole browser is gone
+                    if not self._alive():
+                        self._recycle()
+                        driver = self._ensure_driver()
+                    self._tabs.pop(name, None)
+                    return self._open_tab(driver, name, url)
+                self._current = handle
+                self.stats["switches"] += 1
+            return driver
+
+    def _open_tab(self, driver, name: str, url: Optional[str]):
+        if len(self._tabs) >= self.max_tabs:
+            self._close_handle(driver, self._tabs.popitem(last=False)[1])
+
+        if self._spare is not None:
+            handle, self._spare = self._spare, None
+            if handle != self._current:
+                driver.switch_to.window(handle)
+        else:
+            driver.switch_to.new_window("tab")
+            handle = driver.current_window_handle
+        self._current = handle
+        self._tabs[name] = handle
+        self.stats["tabs_opened"] += 1
+
+        url = url or HOME_URLS.get(name)
+        if url:
+            driver.get(url)
+        return driver
+
+    def adopt(self, name: str):
+        """Make the tab the driver is focused on `name`'s (the automation switched tabs itself)"""
+        with self._lock:
+            if self._driver is None:
+                return
+            try:
+                handle = self._driver.current_window_handle
+            except Exception:
+                self._current = None
+                return
+            self._tabs[name] = handle
+            self._tabs.move_to_end(name)
+            self._current = handle
+            if self._spare == handle:
+                self._spare = None
+
+    def close_tab(self, name: str):
+        with self._lock:
+            handle = self._tabs.pop(name, None)
+            if handle is not None and self._driver is not None:
+                self._close_handle(self._driver, handle)
+
+    def _close_handle(self, driver, handle: str):
+        try:
+            if len(driver.window_handles) <= 1:
+                # Closing the last tab would end the session: keep it as the spare
+                self._spare = handle
+                return
+            driver.switch_to.window(handle)
+            driver.close()
+            self._current = None
+        except Exception:
+            pass
+
+    # ------------------------
+    # Browser lifecycle
+    # ------------------------
+    def _ensure_driver(self):
+        if self._driver is not None:
+            return self._driver
+        started = time.perf_counter()
+        driver = self.launcher()
+        try:
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        except Exception:
+            pass
+        self._driver = driver
+        self._closed = False
+        self._tabs.clear()
+        self._spare = self._current = driver.current_window_handle
+        self.stats["launches"] += 1
+        print(f"[Browser] Launched in {time.perf_counter() - started:.1f}s")
+        self._start_health_thread()
+        return driver
+
+    def _alive(self) -> bool:
+        self.stats["health_checks"] += 1
+        try:
+            return bool(self._driver.window_handles)
+        except Exception:
+            return False
+
+    def _recycle(self):
+        driver, self._driver = self._driver, None
+        self._tabs.clear()
+        self._spare = self._current = None
+        self.stats["recycles"] += 1
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def check(self) -> bool:
+        """One health round trip now; a dead browser is dropped and relaunched on next use"""
+        with self._lock:
+            if self._driver is None:
+                return False
+            if self._alive():
+                return True
+            print("[Browser] Browser is gone; it will be relaunched on next use")
+            self._recycle()
+            return False
+
+    def _start_health_thread(self):
+        if self.health_interval <= 0 or (self._health_thread and self._health_thread.is_alive()):
+            return
+        self._health_thread = threading.Thread(target=self._health_loop, name="BrowserPoolHealth", daemon=True)
+        self._health_thread.start()
+
+    def _health_loop(self):
+        while not self._closed:
+            time.sleep(self.health_interval)
+            if self._driver is None:
+                continue
+            # Someone is switching tabs right now: skip this round
+            if self._lock.acquire(blocking=False):
+                try:
+                    if self._driver is not None and not self._alive():
+                        print("[Browser] Browser is gone; it will be relaunched on next use")
+                        self._recycle()
+                finally:
+                    self._lock.release()
+
+    def prewarm(self, names: Iterable[str] = None) -> Dict[str, bool]:
+        """Launch the browser and open each automation's tab ahead of its first command"""
+        names = [n.strip() for n in (PREWARM.split(",") if names is None else names) if n.strip()]
+        opened = {}
+        for name in names:
+            try:
+                self.driver(name)
+                opened[name] = True
+            except Exception as e:
+                print(f"[Browser] Prewarm of {name} failed: {e}")
+                opened[name] = False
+        return opened
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._recycle()
+
+    def get_stats(self) -> dict:
+        return {**self.stats, "running": self._driver is not None, "tabs": list(self._tabs)}
@@ -1,15 +1,65 @@
 # BACKEND/automations/browser/driver_manager.py
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+import json
+import os
+import threading
+
+from BACKEND.automations.browser.browser_config import BASE_DIR
+
+# Resolved driver binaries, pinned across runs so a launch never has to ask
+# webdriver_manager (and possibly the network) again
+PINNED_PATH = os.path.join(BASE_DIR, "DATA", "config", "drivers.json")
+
 
 class DriverManager:
+    _paths = {}  # browser -> driver binary, this process
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_driver_path(cls, browser: str, refresh: bool = False):
+        """
+        Cached / pinned driver path; refresh=True resolves it again
+        (e.g. the browser updated and the pinned driver no longer matches).
+        """
+        with cls._lock:
+            if not refresh:
+                path = cls._paths.get(browser) or cls._load_pinned().get(browser)
+                if path and os.path.exists(path):
+                    cls._paths[browser] = path
+                    return path
+
+            path = cls._install(browser)
+            cls._paths[browser] = path
+            cls._save_pinned(browser, path)
+            return path
+
     @staticmethod
-    def get_driver_path(browser: str):
+    def _install(browser: str):
         try:
             if browser == "chrome":
+                from webdriver_manager.chrome import ChromeDriverManager
                 return ChromeDriverManager().install()
             if browser == "edge":
+                from webdriver_manager.microsoft import EdgeChromiumDriverManager
                 return EdgeChromiumDriverManager().install()
             raise ValueError(f"Unsupported browser: {browser}")
         except Exception as e:
-            raise RuntimeError(f"Failed to sync driver for {browser}: {e}")
\ No newline at end of file
+            raise RuntimeError(f"Failed to sync driver for {browser}: {e}")
+
+    @staticmethod
+    def _load_pinned():
+        try:
+            with open(PINNED_PATH, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    @classmethod
+    def _save_pinned(cls, browser: str, path: str):
+        pinned = cls._load_pinned()
+        pinned[browser] = path
+        try:
+            os.makedirs(os.path.dirname(PINNED_PATH), exist_ok=True)
+            with open(PINNED_PATH, "w") as f:
+                json.dump(pinned, f)
+        except OSError:
+            pass  # still cached for this process
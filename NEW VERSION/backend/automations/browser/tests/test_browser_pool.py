@@ -0,0 +1,168 @@
+# BACKEND/automations/browser/tests/test_browser_pool.py
+"""
+Unit tests for the shared browser pool (fake WebDriver, no browser)
+"""
+
+import itertools
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from BACKEND.automations.browser import driver_manager
+from BACKEND.automations.browser.browser_pool import BrowserPool
+from BACKEND.automations.browser.driver_manager import DriverManager
+
+
+class FakeDriver:
+    _ids = itertools.count()
+
+    def __init__(self):
+        self.handles = [f"tab-{next(self._ids)}"]
+        self.current_window_handle = self.handles[0]
+        self.urls = {}
+        self.calls = []
+        self.dead = False
+        self.switch_to = self
+
+    def _call(self, name):
+        if self.dead:
+            raise RuntimeError("invalid session id")
+        self.calls.append(name)
+
+    @property
+    def window_handles(self):
+        self._call("window_handles")
+        return list(self.handles)
+
+    def window(self, handle):
+        self._call("switch")
+        if handle not in self.handles:
+            raise RuntimeError("no such window")
+        self.current_window_handle = handle
+
+    def new_window(self, kind):
+        self._call("new_window")
+        self.handles.append(f"tab-{next(self._ids)}")
+        self.current_window_handle = self.handles[-1]
+
+    def get(self, url):
+        self._call("get")
+        self.urls[self.current_window_handle] = url
+
+    def close(self):
+        self._call("close")
+        self.handles.remove(self.current_window_handle)
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def quit(self):
+        self.calls.append("quit")
+
+
+class TestBrowserPool(unittest.TestCase):
+    def setUp(self):
+        BrowserPool._instance = None
+        self.launched = []
+        self.pool = BrowserPool(launcher=self._launch, health_interval=0, max_tabs=3)
+
+    def tearDown(self):
+        BrowserPool._instance = None
+
+    def _launch(self):
+        driver = FakeDriver()
+        self.launched.append(driver)
+        return driver
+
+    def test_one_browser_one_tab_per_automation(self):
+        yt = self.pool.driver("youtube")
+        google = self.pool.driver("google")
+        self.assertIs(yt, google)
+        self.assertEqual(len(self.launched), 1)
+        self.assertEqual(sorted(yt.urls.values()), ["https://www.google.com", "https://www.youtube.com"])
+
+        # Same tab again: no round trip at all (no health check, no switch)
+        yt.calls.clear()
+        self.pool.driver("google")
+        self.assertEqual(yt.calls, [])
+        self.pool.driver("youtube")
+        self.assertEqual(yt.calls, ["switch"])
+        self.assertEqual(yt.urls[yt.current_window_handle], "https://www.youtube.com")
+
+    def test_crash_is_recycled(self):
+        driver = self.pool.driver("youtube")
+        driver.dead = True
+        self.assertFalse(self.pool.check())
+        self.assertIn("quit", driver.calls)
+
+        fresh = self.pool.driver("youtube")
+        self.assertIsNot(fresh, driver)
+        self.assertEqual(fresh.urls[fresh.current_window_handle], "https://www.youtube.com")
+        self.assertEqual(self.pool.stats["launches"], 2)
+
+    def test_tab_closed_by_hand_is_reopened(self):
+        driver = self.pool.driver("youtube")
+        self.pool.driver("google")
+        driver.handles.remove(self.pool._tabs["youtube"])
+        self.pool.driver("youtube")
+        self.assertEqual(len(self.launched), 1)
+        self.assertEqual(driver.urls[driver.current_window_handle], "https://www.youtube.com")
+
+    def test_tabs_are_bounded(self):
+        for name in ("a", "b", "c", "d"):
+            self.pool.driver(name, f"https://{name}.example")
+        self.assertEqual(list(self.pool._tabs), ["b", "c", "d"])
+        self.assertEqual(len(self.launched[0].handles), 3)
+
+    def test_lease_keeps_the_tab_until_the_command_ends(self):
+        switched = threading.Event()
+
+        def google_command():
+            self.pool.driver("google")
+            switched.set()
+
+        with self.pool.lease():
+            driver = self.pool.driver("youtube")
+            worker = threading.Thread(target=google_command)
+            worker.start()
+            # Google waits for the lease; YouTube's tab stays focused
+            self.assertFalse(switched.wait(0.2))
+            self.assertEqual(driver.current_window_handle, self.pool._tabs["youtube"])
+        self.assertTrue(switched.wait(5))
+        worker.join()
+        self.assertEqual(driver.current_window_handle, self.pool._tabs["google"])
+
+    def test_prewarm(self):
+        self.assertEqual(self.pool.prewarm(["youtube", "google"]), {"youtube": True, "google": True})
+        self.assertEqual(self.pool.get_stats()["tabs"], ["youtube", "google"])
+
+
+class TestDriverManager(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.binary = os.path.join(self.dir, "chromedriver")
+        open(self.binary, "w").close()
+        DriverManager._paths = {}
+        self.pinned = patch.object(driver_manager, "PINNED_PATH", os.path.join(self.dir, "drivers.json"))
+        self.pinned.start()
+
+    def tearDown(self):
+        self.pinned.stop()
+        DriverManager._paths = {}
+
+    def test_resolved_once_and_pinned(self):
+        with patch.object(DriverManager, "_install", return_value=self.binary) as install:
+            self.assertEqual(DriverManager.get_driver_path("chrome"), self.binary)
+            self.assertEqual(DriverManager.get_driver_path("chrome"), self.binary)
+            DriverManager._paths = {}  # a new process
+            self.assertEqual(DriverManager.get_driver_path("chrome"), self.binary)
+            self.assertEqual(install.call_count, 1)
+
+            DriverManager.get_driver_path("chrome", refresh=True)
+            self.assertEqual(install.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
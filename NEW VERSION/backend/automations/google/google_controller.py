@@ -99,21 +99,25 @@ class GoogleController:
         if self._should_use_native() and native_new_tab():
             return
         open_new_tab(self._driver())
+        self.session.adopt_current_tab()
 
     def close_tab(self):
         if self._should_use_native() and native_close_tab():
             return
         close_tab(self._driver())
+        self.session.adopt_current_tab()
 
     def next_tab(self):
         if self._should_use_native() and native_next_tab():
             return
         next_tab(self._driver())
+        self.session.adopt_current_tab()
 
     def previous_tab(self):
         if self._should_use_native() and native_previous_tab():
             return
         previous_tab(self._driver())
+        self.session.adopt_current_tab()
 
     def back(self):
         if self._should_use_native() and native_back():
@@ -178,7 +178,6 @@ def _open_whatsapp_web_internal(settings=None):
         browser_win = find_browser_window()
         if browser_win:
             bring_window_to_front(browser_win)
-            time.sleep(0.5)
 
         # Open WhatsApp in new tab
         try:
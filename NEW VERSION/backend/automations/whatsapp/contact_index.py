@@ -0,0 +1,351 @@
+# BACKEND/automations/whatsapp/contact_index.py
+"""
+Local contact index for WhatsApp sends
+
+Resolves what was said ("rahul bhai", "Priyaa", "sharma ji") to one contact
+before any UI work, instead of pasting the raw words into WhatsApp search and
+taking the first hit. Built from exported / synced contact lists in
+DATA/contacts (vCard .vcf, CSV exports, JSON [{name, phone, aliases}]) plus
+any files in the contact_sources setting; refresh() re-reads them
+(refresh_contacts intent).
+
+Lookup order, first decisive step wins:
+1. phone number (last 10 digits)
+2. exact name / nickname
+3. phonetic key: Hinglish spelling variants fold together
+   ("Priyaa" / "Priya", "Shweta" / "Sweta", "Vijay" / "Wijay")
+4. every spoken word matches (or starts) a word of one contact's name
+5. trigram similarity of the phonetic keys (misheard names)
+More than one contact at a deciding step is "ambiguous": the caller asks
+instead of guessing. Results are kept in a TTL + LRU cache
+(cache_contact_searches / contact_cache_duration / contact_cache_size).
+"""
+
+import bisect
+import csv
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+CONTACTS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "DATA", "contacts")
+
+# Said after a name, not part of it ("Rahul bhai", "Sharma ji")
+HONORIFICS = {"ji", "jee", "bhai", "bhaiya", "bhaiyya", "sir", "saab", "sahab", "madam", "maam", "mam"}
+
+# Hinglish / transliteration variants folded to one spelling, in order
+_FOLDS = (
+    ("ph", "f"), ("bh", "b"), ("dh", "d"), ("th", "t"), ("kh", "k"), ("gh", "g"), ("jh", "j"),
+    ("sh", "s"), ("ch", "c"), ("ck", "k"), ("q", "k"), ("z", "j"), ("w", "v"), ("x", "ks"),
+    ("ee", "i"), ("oo", "u"), ("aa", "a"), ("ou", "o"), ("au", "o"), ("ai", "e"), ("ei", "e"), ("y", "i"),
+)
+_CONSONANT_H = re.compile(r"(?<=[bcdfgjklmnpqrstvxz])h")
+_REPEATS = re.compile(r"(.)\1+")
+_NON_WORD = re.compile(r"[^a-z0-9\s]")
+
+MATCH_THRESHOLD = 0.55  # trigram similarity a guess needs at all
+AMBIGUITY_MARGIN = 0.08  # runner-up this close to the best = ambiguous
+
+
+def normalize(text: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", (text or "").lower()).split())
+
+
+def phonetic(text: str) -> str:
+    """One spelling for the usual transliteration variants of a name"""
+    words = []
+    for word in normalize(text).split():
+        for variant, canonical in _FOLDS:
+            word = word.replace(variant, canonical)
+        word = _CONSONANT_H.sub("", word)
+        words.append(_REPEATS.sub(r"\1", word))
+    return " ".join(words)
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _digits(text: str) -> str:
+    digits = re.sub(r"\D", "", text or "")
+    return digits[-10:] if len(digits) >= 7 else ""
+
+
+@dataclass
+class Contact:
+    name: str
+    phones: List[str] = field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
+
+    @property
+    def chat(self) -> str:
+        """What to search for in WhatsApp to open this contact's chat"""
+        return self.name or (self.phones[0] if self.phones else "")
+
+
+@dataclass
+class Resolution:
+    status: str  # "resolved" | "ambiguous" | "unknown"
+    query: str
+    contact: Optional[Contact] = None
+    candidates: List[Contact] = field(default_factory=list)
+
+    @property
+    def chat(self) -> Optional[str]:
+        return self.contact.chat if self.contact else None
+
+
+# ------------------------
+# Contact list readers
+# ------------------------
+def read_vcf(path: str) -> List[Contact]:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        # Folded lines continue with a leading space
+        text = re.sub(r"\r?\n[ \t]", "", f.read())
+    contacts, card = [], None
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        key = key.split(";")[0].upper()
+        if key == "BEGIN":
+            card = {"name": "", "n": "", "phones": [], "aliases": []}
+        elif card is None:
+            continue
+        elif key == "FN":
+            card["name"] = value.strip()
+        elif key == "N":
+            card["n"] = " ".join(p for p in reversed(value.split(";")[:2]) if p).strip()
+        elif key == "TEL":
+            card["phones"].append(value.strip())
+        elif key == "NICKNAME":
+            card["aliases"] += [a.strip() for a in value.split(",") if a.strip()]
+        elif key == "END":
+            name = card["name"] or card["n"]
+            if name or card["phones"]:
+                contacts.append(Contact(name, card["phones"], card["aliases"]))
+            card = None
+    return contacts
+
+
+def read_csv(path: str) -> List[Contact]:
+    contacts = []
+    with open(path, "r", encoding="utf-8-sig", errors="ignore", newline="") as f:
+        for row in csv.DictReader(f):
+            row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+            name = row.get("name") or row.get("display name") or " ".join(
+                p for p in (row.get("first name") or row.get("given name"),
+                            row.get("last name") or row.get("family name")) if p
+            )
+            phones = [v for k, v in row.items() if v and ("phone" in k or k == "mobile") and "type" not in k
+                      and "label" not in k]
+            aliases = [a.strip() for a in row.get("nickname", "").split(",") if a.strip()]
+            if name or phones:
+                contacts.append(Contact(name, phones, aliases))
+    return contacts
+
+
+def read_json(path: str) -> List[Contact]:
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    contacts = []
+    for entry in entries if isinstance(entries, list) else []:
+        phones = entry.get("phones") or ([entry["phone"]] if entry.get("phone") else [])
+        if entry.get("name") or phones:
+            contacts.append(Contact(entry.get("name", ""), list(phones), list(entry.get("aliases", []))))
+    return contacts
+
+
+READERS = {".vcf": read_vcf, ".csv": read_csv, ".json": read_json}
+
+
+class ContactIndex:
+    """In-memory contact lookup; refresh() / add() swap in a new index"""
+
+    def __init__(self, settings=None, sources: Optional[Iterable[str]] = None, clock=time.monotonic):
+        self.settings = settings
+        self.sources = list(sources) if sources is not None else None
+        self.clock = clock
+        self.contacts: List[Contact] = []
+        self._lock = threading.Lock()
+        self._cache: Dict[str, tuple] = OrderedDict()  # normalized query -> (expires, Resolution)
+        self.stats = {"lookups": 0, "cache_hits": 0, "cache_misses": 0, "evictions": 0,
+                      "resolved": 0, "ambiguous": 0, "unknown": 0}
+        self._build([])
+
+    def _setting(self, name: str, default):
+        if self.settings is None:
+            return default
+        return self.settings._settings.get(name, default)
+
+    # ------------------------
+    # Building
+    # ------------------------
+    def source_files(self) -> List[str]:
+        if self.sources is not None:
+            return self.sources
+        files = []
+        if os.path.isdir(CONTACTS_DIR):
+            files += [os.path.join(CONTACTS_DIR, name) for name in sorted(os.listdir(CONTACTS_DIR))]
+        return files + list(self._setting("contact_sources", []))
+
+    def refresh(self) -> int:
+        """Re-read the contact lists; returns how many contacts are indexed"""
+        contacts = []
+        for path in self.source_files():
+            reader = READERS.get(os.path.splitext(path)[1].lower())
+            if reader is None or not os.path.isfile(path):
+                continue
+            try:
+                contacts += reader(path)
+            except Exception as e:
+                print(f"⚠️ Could not read contacts from {path}: {e}")
+        self._build(contacts)
+        return len(self.contacts)
+
+    def add(self, contacts: Iterable[Contact]):
+        self._build(self.contacts + list(contacts))
+
+    def _build(self, contacts: List[Contact]):
+        # Same name from two lists (phone + export) is one contact
+        merged: Dict[str, Contact] = {}
+        for contact in contacts:
+            key = normalize(contact.name) or _digits(contact.phones[0] if contact.phones else "")
+            if key in merged:
+                known = merged[key]
+                known.phones += [p for p in contact.phones if p not in known.phones]
+                known.aliases += [a for a in contact.aliases if a not in known.aliases]
+            else:
+                merged[key] = Contact(contact.name, list(contact.phones), list(contact.aliases))
+        contacts = list(merged.values())
+
+        exact, sounds, words, grams, phones = (defaultdict(set) for _ in range(5))
+        keys = []
+        for i, contact in enumerate(contacts):
+            for name in [contact.name] + contact.aliases:
+                if not name:
+                    continue
+                exact[normalize(name)].add(i)
+                key = phonetic(name)
+                sounds[key].add(i)
+                for word in key.split():
+                    words[word].add(i)
+            key = phonetic(contact.name)
+            keys.append(key)
+            for gram in trigrams(key):
+                grams[gram].add(i)
+            for phone in contact.phones:
+                if _digits(phone):
+                    phones[_digits(phone)].add(i)
+
+        with self._lock:
+            self.contacts = contacts
+            self._exact, self._sounds, self._words = exact, sounds, words
+            self._word_list = sorted(words)  # for prefix lookups
+            self._grams, self._phones = grams, phones
+            self._gram_counts = [len(trigrams(key)) for key in keys]
+            self._cache = OrderedDict()
+
+    # ------------------------
+    # Lookup
+    # ------------------------
+    def resolve(self, query: str) -> Resolution:
+        norm = normalize(query)
+        cache = self._setting("cache_contact_searches", True)
+        with self._lock:
+            self.stats["lookups"] += 1
+            hit = self._cache.get(norm) if cache else None
+            if hit and hit[0] > self.clock():
+                self._cache.move_to_end(norm)
+                self.stats["cache_hits"] += 1
+                result = hit[1]
+            else:
+                if cache:
+                    self.stats["cache_misses"] += 1
+                result = self._resolve(query, norm)
+                if cache:
+                    self._remember(norm, result)
+            self.stats[result.status] += 1
+        return result
+
+    def _remember(self, norm: str, result: Resolution):
+        self._cache[norm] = (self.clock() + self._setting("contact_cache_duration", 300), result)
+        self._cache.move_to_end(norm)
+        max_size = max(1, int(self._setting("contact_cache_size", 256)))
+        while len(self._cache) > max_size:
+            self._cache.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _resolve(self, query: str, norm: str) -> Resolution:
+        if not self.contacts or not norm:
+            return Resolution("unknown", query)
+
+        words = norm.split()
+        if words[0] == "the" and len(words) > 1:
+            words = words[1:]
+        while len(words) > 1 and words[-1] in HONORIFICS:
+            words = words[:-1]
+        norm = " ".join(words)
+        key = phonetic(norm)
+
+        steps = (
+            lambda: self._phones.get(_digits(query), set()),
+            lambda: self._exact.get(norm, set()),
+            lambda: self._sounds.get(key, set()),
+            lambda: self._word_matches(key.split()),
+        )
+        for step in steps:
+            ids = step()
+            if ids:
+                return self._decide(query, sorted(ids))
+
+        return self._similar(query, key)
+
+    def _word_matches(self, spoken: List[str]) -> Set[int]:
+        ids = None
+        for word in spoken:
+            found = set(self._words.get(word, ()))
+            if len(word) >= 3:
+                start = bisect.bisect_left(self._word_list, word)
+                for known in self._word_list[start:]:
+                    if not known.startswith(word):
+                        break
+                    found |= self._words[known]
+            ids = found if ids is None else ids & found
+            if not ids:
+                return set()
+        return ids or set()
+
+    def _similar(self, query: str, key: str) -> Resolution:
+        grams = trigrams(key)
+        shared = defaultdict(int)
+        for gram in grams:
+            for i in self._grams.get(gram, ()):
+                shared[i] += 1
+        scored = sorted(
+            ((2 * n / (len(grams) + self._gram_counts[i]), i) for i, n in shared.items()),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < MATCH_THRESHOLD:
+            return Resolution("unknown", query)
+        best = scored[0][0]
+        close = [i for score, i in scored if score >= best - AMBIGUITY_MARGIN]
+        return self._decide(query, close)
+
+    def _decide(self, query: str, ids: List[int]) -> Resolution:
+        candidates = [self.contacts[i] for i in ids]
+        if len(candidates) == 1:
+            return Resolution("resolved", query, candidates[0], candidates)
+        return Resolution("ambiguous", query, None, candidates)
+
+    def get_stats(self) -> dict:
+        checked = self.stats["cache_hits"] + self.stats["cache_misses"]
+        return {
+            **self.stats,
+            "contacts": len(self.contacts),
+            "cached": len(self._cache),
+            "hit_rate": (self.stats["cache_hits"] / checked) if checked else 0.0,
+        }
@@ -5,7 +5,7 @@ Supports multiple message formats, Hinglish, and contact validation
 """
 
 import re
-from typing import Tuple, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class MessageParserError(Exception):
@@ -57,7 +57,7 @@ def parse_whatsapp_message(text: str) -> Tuple[Optional[str], Optional[str]]:
         
         # Compact formats with colon
         r"^(?:message|ping|text)\s+(?P<contact>[^:,]+):\s*(?P<message>.+)",
-        r"(?:message|ping|text)\s+(?P<contact>\w+(?:\s+\w+)?)\s+(?:saying|that)\s+(?P<message>.+)",
+        r"(?:message|ping|text)\s+(?P<contact>\w+(?:\s+\w+)?(?:(?:\s*,\s*|\s+and\s+)\w+(?:\s+\w+)?)*)\s+(?:saying|that)\s+(?P<message>.+)",
         
         # Tell format
         r"tell\s+(?P<contact>[^,]+)\s+(?:that|to)\s+(?P<message>.+)",
@@ -144,6 +144,38 @@ def _clean_message(message: str) -> str:
     return message.strip()
 
 
+def split_recipients(contact: str, groups: Optional[Dict[str, List[str]]] = None) -> List[str]:
+    """
+    Split a parsed contact into recipients and expand contact groups
+    
+    "Rahul, Priya And Amit" -> ["Rahul", "Priya", "Amit"]; "The Team" -> the
+    members of the "team" group when one is configured.
+    
+    Args:
+        contact: Contact as returned by parse_whatsapp_message
+        groups: Group name -> member names (the contact_groups setting)
+        
+    Returns:
+        Recipient names, in order, without duplicates
+    """
+    if not contact:
+        return []
+    
+    groups = {name.lower(): members for name, members in (groups or {}).items()}
+    recipients = []
+    for name in re.split(r"\s*,\s*|\s+and\s+|\s*&\s*", contact, flags=re.IGNORECASE):
+        name = name.strip()
+        if not name:
+            continue
+        key = name.lower()
+        if key.startswith("the "):
+            key = key[4:]
+        for recipient in groups.get(key, [name]):
+            if recipient.lower() not in (r.lower() for r in recipients):
+                recipients.append(recipient)
+    return recipients
+
+
 def validate_contact(contact: str, min_length: int = 1, max_length: int = 100) -> bool:
     """
     Validate contact name
@@ -0,0 +1,131 @@
+# BACKEND/automations/whatsapp/tests/test_contact_index.py
+"""
+Unit tests for the WhatsApp contact index
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from BACKEND.automations.whatsapp.contact_index import Contact, ContactIndex, phonetic
+
+
+VCF = """BEGIN:VCARD
+VERSION:3.0
+FN:Rahul Sharma
+N:Sharma;Rahul;;;
+TEL;TYPE=CELL:+91 98765 43210
+NICKNAME:Bhaiya
+END:VCARD
+BEGIN:VCARD
+VERSION:3.0
+N:Verma;Rahul;;;
+TEL;TYPE=CELL:+91 91234 56789
+END:VCARD
+"""
+
+CSV = """Name,Given Name,Family Name,Nickname,Phone 1 - Type,Phone 1 - Value
+Priya Nair,Priya,Nair,,Mobile,+91 99887 76655
+Shweta Kapoor,Shweta,Kapoor,,Mobile,+91 90000 11111
+"""
+
+
+class FakeSettings:
+    def __init__(self, **overrides):
+        self._settings = {"cache_contact_searches": True, "contact_cache_duration": 300}
+        self._settings.update(overrides)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestContactIndex(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.sources = []
+        for name, text in (("phone.vcf", VCF), ("google.csv", CSV)):
+            path = os.path.join(self.dir, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            self.sources.append(path)
+        self.clock = FakeClock()
+        self.index = ContactIndex(FakeSettings(), sources=self.sources, clock=self.clock)
+        self.assertEqual(self.index.refresh(), 4)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_exact_and_nickname(self):
+        self.assertEqual(self.index.resolve("priya nair").chat, "Priya Nair")
+        self.assertEqual(self.index.resolve("Bhaiya").chat, "Rahul Sharma")
+
+    def test_hinglish_spellings(self):
+        self.assertEqual(phonetic("Priyaa"), phonetic("Priya"))
+        self.assertEqual(phonetic("Sweta"), phonetic("Shweta"))
+        self.assertEqual(self.index.resolve("Priyaa").chat, "Priya Nair")
+        self.assertEqual(self.index.resolve("sweta").chat, "Shweta Kapoor")
+        self.assertEqual(self.index.resolve("Priya ji").chat, "Priya Nair")
+
+    def test_misheard_name(self):
+        self.assertEqual(self.index.resolve("Shweta Kapur").chat, "Shweta Kapoor")
+        self.assertEqual(self.index.resolve("Zebediah").status, "unknown")
+
+    def test_ambiguous_fails_early(self):
+        resolution = self.index.resolve("Rahul")
+        self.assertEqual(resolution.status, "ambiguous")
+        self.assertEqual(sorted(c.name for c in resolution.candidates), ["Rahul Sharma", "Rahul Verma"])
+        self.assertEqual(self.index.resolve("rahul verma").chat, "Rahul Verma")
+
+    def test_phone_number(self):
+        self.assertEqual(self.index.resolve("9876543210").chat, "Rahul Sharma")
+
+    def test_cache_expires_and_refresh_clears_it(self):
+        self.index.resolve("priyaa")
+        self.index.resolve("priyaa")
+        self.assertEqual(self.index.stats["cache_hits"], 1)
+
+        self.clock.now += 301
+        self.index.resolve("priyaa")
+        self.assertEqual(self.index.stats["cache_hits"], 1)
+
+        self.index.add([Contact("Priya Menon")])
+        self.assertEqual(self.index.resolve("priyaa").status, "ambiguous")
+
+    def test_cache_is_bounded_lru(self):
+        index = ContactIndex(FakeSettings(contact_cache_size=2), sources=self.sources, clock=self.clock)
+        index.refresh()
+        index.resolve("priya")
+        index.resolve("sweta")
+        index.resolve("priya")  # most recent again
+        index.resolve("rahul verma")  # evicts "sweta"
+        self.assertEqual(index.get_stats()["cached"], 2)
+        self.assertEqual(index.stats["evictions"], 1)
+
+        index.resolve("priya")
+        index.resolve("sweta")
+        self.assertEqual(index.stats["cache_hits"], 2)
+        self.assertEqual(index.stats["cache_misses"], 4)
+
+    def test_every_status_is_counted(self):
+        self.index.resolve("priya nair")
+        self.index.resolve("priya nair")
+        self.index.resolve("Rahul")
+        self.index.resolve("Zebediah")
+        stats = self.index.get_stats()
+        self.assertEqual((stats["resolved"], stats["ambiguous"], stats["unknown"]), (2, 1, 1))
+        self.assertEqual(stats["lookups"], 4)
+        self.assertEqual((stats["cache_hits"], stats["cache_misses"]), (1, 3))
+        self.assertAlmostEqual(stats["hit_rate"], 0.25)
+
+    def test_empty_index_knows_nobody(self):
+        self.assertEqual(ContactIndex(sources=[]).resolve("Rahul").status, "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ from BACKEND.automations.whatsapp.message_parser import (
     validate_contact,
     validate_message,
     parse_and_validate,
+    split_recipients,
     MessageParserError,
     _clean_contact_name,
     _clean_message
@@ -228,5 +229,27 @@ class TestParseAndValidate(unittest.TestCase):
             parse_and_validate("send to John,")
 
 
+class TestSplitRecipients(unittest.TestCase):
+    """Test recipient lists and contact groups"""
+
+    def test_list_of_contacts(self):
+        """Test: "message X, Y and Z saying ..." gives three recipients"""
+        contact, message = parse_whatsapp_message("message rahul, priya and amit saying standup at 10")
+        self.assertEqual(message, "standup at 10")
+        self.assertEqual(split_recipients(contact), ["Rahul", "Priya", "Amit"])
+
+    def test_group_is_expanded(self):
+        """Test: "the team" expands to the configured group"""
+        contact, _ = parse_whatsapp_message("message the team saying build is green")
+        groups = {"Team": ["Rahul", "Priya"]}
+        self.assertEqual(split_recipients(contact, groups), ["Rahul", "Priya"])
+        self.assertEqual(split_recipients("Priya And The Team", groups), ["Priya", "Rahul"])
+
+    def test_single_contact(self):
+        """Test: a plain contact is left alone"""
+        self.assertEqual(split_recipients("John Smith"), ["John Smith"])
+        self.assertEqual(split_recipients(""), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,164 @@
+# BACKEND/automations/whatsapp/tests/test_whatsapp_outbox.py
+"""
+Unit tests for the persistent WhatsApp outbox (fake delivery, no UI)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from BACKEND.automations.whatsapp.whatsapp_outbox import OutboxFullError, WhatsAppOutbox
+
+
+class FakeSettings:
+    def __init__(self, **overrides):
+        self._settings = {
+            "queue_max_size": 50,
+            "parallel_message_sending": False,
+            "max_parallel_messages": 3,
+            "save_failed_messages": True,
+        }
+        self._settings.update(overrides)
+
+
+class FakeDelivery:
+    """Records each session; fails while `failing`, blocks while `gate` is closed"""
+
+    def __init__(self):
+        self.sessions = []
+        self.failing = False
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+        self.done = threading.Semaphore(0)
+
+    def __call__(self, items, on_sent):
+        self.entered.set()
+        self.gate.wait(5)
+        try:
+            self.sessions.append(list(items))
+            if self.failing:
+                raise RuntimeError("WhatsApp not ready")
+            for contact, message in items:
+                on_sent(contact, message)
+        finally:
+            self.done.release()
+
+
+class TestWhatsAppOutbox(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "outbox.json")
+        self.failed_path = os.path.join(self.dir, "failed.json")
+        self.delivery = FakeDelivery()
+        self.status = []
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _outbox(self, **settings):
+        outbox = WhatsAppOutbox(self.delivery, FakeSettings(**settings), notify=self.status.append,
+                                path=self.path, failed_path=self.failed_path, coalesce_window=0.05)
+        self.addCleanup(outbox.stop)
+        return outbox
+
+    def _wait_sessions(self, count):
+        for _ in range(count):
+            self.assertTrue(self.delivery.done.acquire(timeout=5))
+
+    def test_submit_returns_at_once_and_coalesces(self):
+        outbox = self._outbox().start()
+        self.delivery.gate.clear()
+        outbox.submit(["Mom"], "first")
+        self.assertTrue(self.delivery.entered.wait(5))
+
+        # Mom is in flight; these wait and Rahul's two collapse into one message
+        outbox.submit(["Rahul"], "running late")
+        outbox.submit(["Rahul"], "start without me")
+        self.assertEqual(outbox.get_stats()["pending"], 2)
+        self.delivery.gate.set()
+        self._wait_sessions(2)
+
+        self.assertEqual(self.delivery.sessions, [[("Mom", "first")],
+                                                  [("Rahul", "running late\nstart without me")]])
+        self.assertEqual(self.status, ["Message sent to Mom.", "Message sent to Rahul."])
+        self.assertEqual(outbox.get_stats()["coalesced"], 1)
+
+    def test_bulk_send_is_one_session(self):
+        outbox = self._outbox().start()
+        outbox.submit(["Rahul", "Priya", "Amit"], "standup moved to 11")
+        self._wait_sessions(1)
+        self.assertEqual([contact for contact, _ in self.delivery.sessions[0]], ["Rahul", "Priya", "Amit"])
+
+    def test_parallel_setting_batches_other_contacts(self):
+        outbox = self._outbox(parallel_message_sending=True, max_parallel_messages=2)
+        for name in ("A", "B", "C"):
+            outbox.submit([name], "hi")
+        outbox.start()
+        self._wait_sessions(2)
+        self.assertEqual([len(s) for s in self.delivery.sessions], [2, 1])
+
+    def test_queue_is_bounded(self):
+        outbox = self._outbox(queue_max_size=2)
+        outbox.submit(["A", "B"], "hi")
+        with self.assertRaises(OutboxFullError):
+            outbox.submit(["C"], "hi")
+        # Coalescing into a waiting contact is still fine
+        outbox.submit(["A"], "again")
+
+    def test_queue_survives_restart(self):
+        self._outbox().submit(["Rahul"], "hi")
+        outbox = self._outbox()
+        self.assertEqual(outbox.get_stats()["pending"], 1)
+        outbox.start()
+        self._wait_sessions(1)
+        self.assertEqual(self.delivery.sessions, [[("Rahul", "hi")]])
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_failed_messages_are_saved_and_replayed_on_request(self):
+        self.delivery.failing = True
+        outbox = self._outbox().start()
+        outbox.submit(["Rahul"], "hi")
+        self._wait_sessions(1)  # the backend retries; the outbox does not again
+        outbox.stop()
+        self.assertEqual(len(self.delivery.sessions), 1)
+
+        with open(self.failed_path) as f:
+            failed = json.load(f)
+        self.assertEqual([(m["contact"], m["message"]) for m in failed], [("Rahul", "hi")])
+        self.assertIn("Couldn't send the message to Rahul", self.status[-1])
+        settings = FakeSettings(outbox_file=self.path, failed_messages_file=self.failed_path)
+        self.assertFalse(WhatsAppOutbox.has_backlog(settings))
+        self.assertEqual(WhatsAppOutbox.failed_count(settings), 1)
+
+        # A restart does not resend on its own
+        self.delivery.failing = False
+        replay = self._outbox().start()
+        self.assertFalse(self.delivery.done.acquire(timeout=0.3))
+
+        self.assertEqual(replay.replay_failed(), 1)
+        self._wait_sessions(1)
+        self.assertEqual(self.delivery.sessions[-1], [("Rahul", "hi")])
+        self.assertEqual(replay.get_stats()["replayed"], 1)
+        with open(self.failed_path) as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_stale_failed_messages_are_discarded(self):
+        now = time.time()
+        with open(self.failed_path, "w") as f:
+            json.dump([{"id": "old", "contact": "Mom", "message": "yesterday", "group": "g1",
+                        "created": now - 90000, "attempts": 3, "failed_at": now - 86400},
+                       {"id": "new", "contact": "Rahul", "message": "hi", "group": "g2",
+                        "created": now - 60, "attempts": 3, "failed_at": now - 30}], f)
+        outbox = self._outbox(failed_replay_max_age=3600).start()
+        self.assertEqual(outbox.replay_failed(), 1)
+        self._wait_sessions(1)
+        self.assertEqual(self.delivery.sessions, [[("Rahul", "hi")]])
+
+if __name__ == "__main__":
+    unittest.main()
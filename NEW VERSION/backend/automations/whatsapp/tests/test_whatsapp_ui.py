@@ -0,0 +1,254 @@
+# BACKEND/automations/whatsapp/tests/test_whatsapp_ui.py
+"""
+Unit tests for the event-driven WhatsApp UI flow (fake desktop, virtual clock)
+"""
+
+import unittest
+from unittest.mock import patch
+
+from BACKEND.automations.whatsapp import whatsapp_desktop
+from BACKEND.automations.whatsapp.whatsapp_desktop import WhatsAppDesktop
+from BACKEND.automations.whatsapp.whatsapp_ui import (
+    PROBE,
+    ChatNotOpenError,
+    SEARCH_KEYS_DESKTOP,
+    SEARCH_KEYS_WEB,
+    StepTimer,
+    WhatsAppUiFlow,
+    wait_until
+)
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeWhatsAppUI:
+    """
+    WhatsApp as a small state machine on a virtual clock: the window shows at
+    window_at, search takes input from ready_at, the result list re-filters
+    results_after a paste and a chat takes chat_after to open. Every key costs
+    key_time.
+    """
+
+    def __init__(self, clock, search_keys=SEARCH_KEYS_WEB, window_at=0.0, ready_at=0.0,
+                 results_after=0.2, chat_after=0.5, key_time=0.03):
+        self.clock = clock
+        self.search_keys = tuple(search_keys)
+        self.window_at = window_at
+        self.ready_at = ready_at
+        self.results_after = results_after
+        self.chat_after = chat_after
+        self.key_time = key_time
+
+        self.clipboard = ""
+        self.fields = {"search": "", "composer": ""}
+        self.focused = None
+        self.selected = False
+        self.pasted_at = 0.0
+        self.opening = None  # (chat, opens at)
+        self.chat = None
+        self.sent = []
+        self.typed = []
+        self.searches = 0
+
+    def _tick(self):
+        self.clock.sleep(self.key_time)
+        self.advance()
+
+    def advance(self):
+        if self.opening and self.clock() >= self.opening[1]:
+            self.chat, self.focused = self.opening[0], "composer"
+            self.fields["search"] = ""
+            self.opening = None
+
+    def hotkey(self, *keys):
+        self._tick()
+        if keys == self.search_keys:
+            if self.clock() >= self.ready_at:
+                self.focused, self.selected = "search", False
+        elif keys == ("ctrl", "a"):
+            self.selected = self.focused is not None
+        elif keys == ("ctrl", "c"):
+            if self.selected and self.fields.get(self.focused):
+                self.clipboard = self.fields[self.focused]
+        elif keys == ("ctrl", "v"):
+            if self.focused is not None:
+                text = "" if self.selected else self.fields[self.focused]
+                self.fields[self.focused] = text + self.clipboard
+                self.selected = False
+                if self.focused == "search":
+                    self.pasted_at = self.clock()
+                    self.searches += self.clipboard != PROBE
+
+    def press(self, key):
+        self._tick()
+        field = self.focused
+        if key == "backspace" and field is not None:
+            self.fields[field] = "" if self.selected else self.fields[field][:-1]
+            self.selected = False
+        elif key == "enter" and field == "search" and self.fields["search"]:
+            # Enter before the list re-filtered opens whatever was on top before
+            filtered = self.clock() - self.pasted_at >= self.results_after
+            chat = self.fields["search"] if filtered else "<stale result>"
+            self.opening = (chat, self.clock() + self.chat_after)
+        elif key == "enter" and field == "composer" and self.fields["composer"]:
+            self.sent.append((self.chat, self.fields["composer"]))
+            self.fields["composer"] = ""
+
+    def typewrite(self, text, interval=0.0):
+        self.typed.append(text)
+
+    def get_clipboard(self):
+        self._tick()
+        return self.clipboard
+
+    def set_clipboard(self, text):
+        self.clipboard = text
+
+    def window_titles(self, fragment):
+        return ["WhatsApp"] if self.clock() >= self.window_at else []
+
+    def focus(self, fragment):
+        return self.clock() >= self.window_at
+
+
+class FakeDom:
+    def __init__(self, ui):
+        self.ui = ui
+
+    def ready(self):
+        return self.ui.clock() >= self.ui.ready_at
+
+    def results_shown(self):
+        return bool(self.ui.fields["search"]) and self.ui.clock() - self.ui.pasted_at >= self.ui.results_after
+
+    def chat_open(self):
+        self.ui.advance()
+        return self.ui.focused == "composer"
+
+
+class TestWaitUntil(unittest.TestCase):
+    def test_returns_as_soon_as_condition_holds(self):
+        clock = VirtualClock()
+        self.assertTrue(wait_until(lambda: clock() >= 1.0, 10, clock=clock, sleep=clock.sleep))
+        # Backoff is capped, so the overshoot stays under one max interval
+        self.assertLess(clock(), 1.5)
+
+    def test_times_out_without_overshoot(self):
+        clock = VirtualClock()
+        self.assertFalse(wait_until(lambda: False, 3, clock=clock, sleep=clock.sleep))
+        self.assertAlmostEqual(clock(), 3.0)
+
+
+class TestWhatsAppUiFlow(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+
+    def _flow(self, ui, dom=None, keys=SEARCH_KEYS_WEB):
+        return WhatsAppUiFlow(ui, keys, dom=dom, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_each_step_ends_on_its_signal(self):
+        ui = FakeWhatsAppUI(self.clock, window_at=1.0, ready_at=4.0, chat_after=0.5)
+        flow = self._flow(ui)
+        timer = StepTimer(self.clock)
+
+        self.assertTrue(flow.wait_ready(45, timer))
+        flow.send("Rahul", "kal milte hain 👋", timer)
+
+        self.assertEqual(ui.sent, [("Rahul", "kal milte hain 👋")])
+        self.assertEqual(ui.typed, [])
+        self.assertEqual(list(timer.steps), ["window", "ready", "search", "chat", "send"])
+        self.assertLess(timer.steps["window"], 1.5)
+        self.assertLess(timer.steps["window"] + timer.steps["ready"], 4.8)
+        self.assertLess(timer.steps["chat"], 1.2)
+        self.assertLess(timer.steps["send"], 0.5)
+        # The fixed-sleep path spent 15 s on load alone
+        self.assertLess(timer.total, 7.0)
+
+    def test_clipboard_is_restored(self):
+        ui = FakeWhatsAppUI(self.clock)
+        ui.clipboard = "user's own clipboard"
+        flow = self._flow(ui)
+        flow.wait_ready(10)
+        flow.send("Mom", "on my way")
+        self.assertEqual(ui.sent, [("Mom", "on my way")])
+        self.assertEqual(ui.clipboard, "user's own clipboard")
+
+    def test_not_ready_gives_up_at_timeout(self):
+        ui = FakeWhatsAppUI(self.clock, ready_at=float("inf"))
+        self.assertFalse(self._flow(ui).wait_ready(5))
+        self.assertLess(self.clock(), 6.0)
+
+    def test_dom_signals_replace_the_settle_sleep(self):
+        ui = FakeWhatsAppUI(self.clock, results_after=0.1, chat_after=0.2)
+        flow = self._flow(ui, dom=FakeDom(ui))
+        timer = StepTimer(self.clock)
+        flow.wait_ready(10, timer)
+        flow.send("Rahul", "hi", timer)
+        self.assertEqual(ui.sent, [("Rahul", "hi")])
+        self.assertLess(timer.steps["search"], 0.35)
+
+    def test_slow_result_list_still_opens_the_right_chat(self):
+        ui = FakeWhatsAppUI(self.clock, results_after=0.3)
+        flow = self._flow(ui)
+        flow.wait_ready(10)
+        flow.send("Rahul", "hi")
+        self.assertEqual(ui.sent, [("Rahul", "hi")])
+
+    def test_one_session_for_many_messages(self):
+        ui = FakeWhatsAppUI(self.clock)
+        flow = self._flow(ui)
+        flow.wait_ready(10)
+        sent = []
+        timer = StepTimer(self.clock)
+        flow.send_many([("Rahul", "a"), ("Rahul", "b"), ("Priya", "c")], timer,
+                       on_sent=lambda contact, message: sent.append(contact))
+        self.assertEqual(ui.sent, [("Rahul", "a"), ("Rahul", "b"), ("Priya", "c")])
+        self.assertEqual(sent, ["Rahul", "Rahul", "Priya"])
+        # The open chat is reused: two searches for three messages
+        self.assertEqual(ui.searches, 2)
+
+    def test_never_pastes_when_the_chat_did_not_open(self):
+        ui = FakeWhatsAppUI(self.clock, chat_after=float("inf"))
+        ui.clipboard = "user's own clipboard"
+        flow = self._flow(ui)
+        flow.wait_ready(10)
+        with self.assertRaises(ChatNotOpenError):
+            flow.send_many([("Rahul", "private note"), ("Priya", "c")])
+        self.assertEqual(ui.sent, [])
+        self.assertNotIn("private note", ui.fields.values())
+        self.assertIsNone(flow.open_contact)
+        self.assertEqual(ui.clipboard, "user's own clipboard")
+
+
+class TestWhatsAppDesktopBackend(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.running = patch.object(whatsapp_desktop, "is_whatsapp_running", return_value=True)
+        self.running.start()
+
+    def tearDown(self):
+        self.running.stop()
+
+    def test_send_message_records_step_timings(self):
+        ui = FakeWhatsAppUI(self.clock, search_keys=SEARCH_KEYS_DESKTOP, ready_at=2.0)
+        desktop = WhatsAppDesktop(ui=ui, clock=self.clock, sleep=self.clock.sleep)
+        desktop.send_message("Priya", "meeting at 5")
+
+        self.assertEqual(ui.sent, [("Priya", "meeting at 5")])
+        self.assertTrue(whatsapp_desktop.WHATSAPP_READY)
+        self.assertEqual(list(desktop.last_timings), ["open", "window", "ready", "search", "chat", "send"])
+        # Ready at 2 s; the fixed path slept chat_open_delay (3 s) + 4.3 s more on top of that
+        self.assertLess(sum(desktop.last_timings.values()), 4.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,6 +73,8 @@ class WhatsAppAutomationSettings:
             "contact_min_length": 1,
             "contact_max_length": 100,
             "normalize_contact_names": True,
+            "contact_groups": {},  # e.g. {"team": ["Rahul", "Priya"]} for "message the team ..."
+            "contact_sources": [],  # contact exports (.vcf / .csv / .json) besides DATA/contacts
 
             # Window Management
             "bring_window_to_front": True,
@@ -83,11 +85,13 @@ class WhatsAppAutomationSettings:
             "ui_prime_delay": 0.3,  # seconds
             "search_clear_delay": 0.3,  # seconds
             "chat_open_delay": 1.2,  # seconds
+            "search_settle_delay": 0.35,  # seconds for the result list to re-filter
             "global_timeout": 120,  # seconds
 
             # Advanced Features
-            "enable_message_queue": False,
+            "enable_message_queue": True,  # voice commands return at once, the outbox sends
             "queue_max_size": 50,
+            "outbox_file": "whatsapp_outbox.json",
             "enable_scheduling": False,
             "enable_attachments": False,
 
@@ -98,13 +102,15 @@ class WhatsAppAutomationSettings:
             "log_pyautogui_actions": False,
 
             # Cache Configuration
-            "cache_contact_searches": False,
+            "cache_contact_searches": True,
             "contact_cache_duration": 300,  # seconds (5 min)
+            "contact_cache_size": 256,  # spoken names kept; least recently used dropped first
 
             # Error Handling
             "screenshot_on_failure": False,
             "save_failed_messages": True,
             "failed_messages_file": "failed_whatsapp_messages.json",
+            "failed_replay_max_age": 21600,  # seconds; older failed messages are dropped, not resent
 
             # Performance
             "parallel_message_sending": False,
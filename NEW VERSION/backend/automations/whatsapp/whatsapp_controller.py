@@ -211,15 +211,39 @@ class WhatsAppController:
         if not contact or not message:
             raise ValueError("Contact and message must be provided")
 
+        self.send_messages([(contact, message)])
+
+    def send_messages(self, items, on_sent=None):
+        """
+        Send several messages in one chat-navigation session
+        
+        Args:
+            items: (contact, message) pairs, sent in order
+            on_sent: Called with (contact, message) after each one left
+            
+        Raises:
+            WhatsAppControllerError: If a message could not be sent; the
+                ones before it were (on_sent tells which)
+        """
+        
+        if not items or not all(contact and message for contact, message in items):
+            raise ValueError("Contact and message must be provided")
+
         fallback_enabled = self.settings.fallback_enabled if self.settings else True
+        pending = list(items)
+
+        def sent(contact, message):
+            pending.pop(0)
+            if on_sent is not None:
+                on_sent(contact, message)
         
         try:
             # First attempt with selected backend
             if self.settings and self.settings.debug_mode:
                 backend_name = "Desktop" if self.use_desktop else "Web"
-                print(f"📤 Sending via WhatsApp {backend_name}...")
+                print(f"📤 Sending {len(pending)} message(s) via WhatsApp {backend_name}...")
             
-            self.backend.send_message(contact, message)
+            self.backend.send_messages(list(pending), sent)
             
             if self.settings and self.settings.debug_mode:
                 print("✅ Message sent successfully")
@@ -228,13 +252,13 @@ class WhatsAppController:
             if self.settings and self.settings.debug_mode:
                 print(f"❌ Primary method failed: {e}")
 
-            # If desktop failed and fallback enabled, try web
+            # If desktop failed and fallback enabled, try web with what is left
             if self.use_desktop and fallback_enabled:
                 if self.settings and self.settings.debug_mode:
                     print("🔄 Desktop failed, trying WhatsApp Web fallback...")
                 try:
                     web_backend = WhatsAppWeb()
-                    web_backend.send_message(contact, message)
+                    web_backend.send_messages(list(pending), sent)
                     
                     if self.settings and self.settings.debug_mode:
                         print("✅ Message sent successfully via Web fallback")
@@ -5,7 +5,6 @@ Enhanced WhatsApp Desktop automation with retry logic and error handling
 
 import subprocess
 import time
-import pyautogui
 import os
 import psutil
 from typing import Optional
@@ -19,6 +18,12 @@ from BACKEND.automations.whatsapp.whatsapp_state import (
     WHATSAPP_READY,
     WHATSAPP_DESKTOP_TIMEOUT
 )
+from BACKEND.automations.whatsapp.whatsapp_ui import (
+    SEARCH_KEYS_DESKTOP,
+    PyAutoGuiUI,
+    StepTimer,
+    WhatsAppUiFlow
+)
 
 
 
@@ -41,9 +46,21 @@ class WhatsAppDesktopError(Exception):
 class WhatsAppDesktop:
     """Enhanced WhatsApp Desktop controller with retry logic and error handling"""
 
-    def __init__(self):
+    def __init__(self, ui=None, clock=time.monotonic, sleep=time.sleep):
         self.settings = get_settings() if get_settings else None
         self._is_ready = False
+        self._ui = ui
+        self.clock = clock
+        self.sleep = sleep
+        self._flow = None
+        self.last_timings = {}
+
+    @property
+    def flow(self) -> WhatsAppUiFlow:
+        if self._flow is None:
+            self._flow = WhatsAppUiFlow(self._ui or PyAutoGuiUI(), SEARCH_KEYS_DESKTOP, self.settings,
+                                        clock=self.clock, sleep=self.sleep)
+        return self._flow
 
     def open(self):
         """Open WhatsApp Desktop with retry logic"""
@@ -60,7 +77,7 @@ class WhatsAppDesktop:
                     wait_time = retry_delay * (attempt + 1)
                     if settings and settings.debug_mode:
                         print(f"🔄 Retry {attempt + 1}/{max_retries} in {wait_time}s: {e}")
-                    time.sleep(wait_time)
+                    self.sleep(wait_time)
                 else:
                     raise WhatsAppDesktopError(f"Failed to open WhatsApp Desktop after {max_retries + 1} attempts: {e}")
 
@@ -117,14 +134,14 @@ class WhatsAppDesktop:
                 method()
                 
                 # Wait and check if launched
-                start_wait = time.time()
-                while time.time() - start_wait < launch_timeout:
+                start_wait = self.clock()
+                while self.clock() - start_wait < launch_timeout:
                     if is_whatsapp_running():
                         if self.settings and self.settings.debug_mode:
                             print(f"✅ WhatsApp launched via {method_name}")
-                        time.sleep(2)  # Extra stabilization time
+                        # No stabilization sleep: readiness is waited on next
                         return
-                    time.sleep(0.5)
+                    self.sleep(0.5)
                     
             except Exception as e:
                 if self.settings and self.settings.verbose_logging:
@@ -136,145 +153,98 @@ class WhatsAppDesktop:
     def _bring_to_front(self):
         """Bring WhatsApp window to front"""
         try:
-            import pygetwindow as gw
-            windows = gw.getWindowsWithTitle('WhatsApp')
-            if windows:
-                windows[0].activate()
-                time.sleep(1)
+            self.flow.ui.focus('WhatsApp')
         except Exception as e:
             if self.settings and self.settings.verbose_logging:
                 print(f"⚠️ Failed to bring window to front: {e}")
 
     def send_message(self, contact: str, message: str):
         """Send message with retry logic and error handling"""
+        self.send_messages([(contact, message)])
+
+    def send_messages(self, items, on_sent=None):
+        """
+        Send (contact, message) pairs in one session (one readiness check);
+        a retry resumes with the ones not sent yet
+        """
         
         global WHATSAPP_READY
         WHATSAPP_READY = False
-        
+
         # Validate inputs
-        if not contact or not message:
+        if not items or not all(contact and message for contact, message in items):
             raise ValueError("Contact and message must not be empty")
         
+        pending = list(items)
+
+        def sent(contact, message):
+            pending.pop(0)
+            if on_sent is not None:
+                on_sent(contact, message)
+
         settings = self.settings
         max_retries = settings.max_retries if settings else 2
         retry_delay = settings.retry_delay if settings else 3
         
         for attempt in range(max_retries + 1):
             try:
-                return self._send_message_internal(contact, message)
+                return self._send_message_internal(pending, sent)
             except Exception as e:
                 if attempt < max_retries:
                     wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
                     if settings and settings.debug_mode:
                         print(f"🔄 Message send retry {attempt + 1}/{max_retries} in {wait_time}s: {e}")
-                    time.sleep(wait_time)
+                    self.sleep(wait_time)
                 else:
                     raise WhatsAppDesktopError(f"Failed to send message after {max_retries + 1} attempts: {e}")
 
-    def _send_message_internal(self, contact: str, message: str):
-        """Internal method to send message"""
-        
+    def _send_message_internal(self, items, on_sent=None):
+        """Internal method to send messages"""
+        timer = StepTimer(self.clock)
+
         # Open WhatsApp
-        self.open()
-        
-        # Get load delay from settings
-        load_delay = 3
-        if self.settings and hasattr(self.settings, '_settings'):
-            load_delay = self.settings._settings.get("chat_open_delay", 3)
-        time.sleep(load_delay)
+        with timer.step("open"):
+            self.open()
 
-        # Wait until ready
-        if not self._wait_until_ready():
+        # Wait until ready (no fixed load delay: search taking input is the signal)
+        if not self._wait_until_ready(timer):
             raise WhatsAppDesktopError("WhatsApp Desktop not ready")
 
         global WHATSAPP_READY
         WHATSAPP_READY = True
         self._is_ready = True
         
-        # Send the message
-        self._send(contact, message)
+        # Send the messages
+        self._send(items, timer, on_sent)
+        self.last_timings = timer.steps
 
-    def _wait_until_ready(self) -> bool:
+    def _wait_until_ready(self, timer: StepTimer = None) -> bool:
         """Wait until WhatsApp is ready to receive input"""
         
         # Get timeout from settings
         timeout = self.settings.desktop_ready_timeout if self.settings else WHATSAPP_DESKTOP_TIMEOUT
-        start = time.time()
 
         if self.settings and self.settings.debug_mode:
             print("⏳ Waiting for WhatsApp Desktop to be ready...")
 
-        while time.time() - start < timeout:
-            try:
-                # Safe readiness check
-                pyautogui.click(100, 100)  # Click in safe corner
-                time.sleep(0.5)
-
-                # Try to open search
-                pyautogui.hotkey("ctrl", "f")
-                time.sleep(0.3)
-
-                # Clear any existing text
-                pyautogui.hotkey("ctrl", "a")
-                time.sleep(0.1)
-                pyautogui.press("backspace")
-
-                if self.settings and self.settings.debug_mode:
-                    print("✅ WhatsApp Desktop is ready")
-                return True
-
-            except Exception as e:
-                elapsed = int(time.time() - start)
-                if self.settings and self.settings.verbose_logging:
-                    print(f"⏳ Still waiting... ({elapsed}s / {timeout}s)")
-                time.sleep(1)
+        if self.flow.wait_ready(timeout, timer):
+            if self.settings and self.settings.debug_mode:
+                print("✅ WhatsApp Desktop is ready")
+            return True
 
         if self.settings and self.settings.debug_mode:
             print(f"❌ WhatsApp Desktop timeout after {timeout}s")
         return False
 
-    def _send(self, contact: str, message: str):
-        """Send message through WhatsApp Desktop with settings integration"""
+    def _send(self, items, timer: StepTimer = None, on_sent=None):
+        """Send message through WhatsApp Desktop: contact and message pasted, each step waits on a signal"""
         
         if self.settings and self.settings.debug_mode:
-            print(f"📤 Sending to {contact}: {message[:50]}...")
+            for contact, message in items:
+                print(f"📤 Sending to {contact}: {message[:50]}...")
 
-        # Get typing interval from settings
-        typing_interval = self.settings.typing_interval if self.settings else 0.05
-        
-        # Open search
-        pyautogui.hotkey("ctrl", "f")
-        time.sleep(0.5)
-
-        # Clear search field
-        pyautogui.hotkey("ctrl", "a")
-        time.sleep(0.1)
-        pyautogui.press("backspace")
-        time.sleep(0.3)
-
-        # Type contact
-        pyautogui.typewrite(contact, interval=typing_interval)
-        time.sleep(1)
-
-        # Select contact
-        pyautogui.press("enter")
-        time.sleep(1)
-
-        # Type and send message
-        # Use pyperclip for Unicode/Hinglish support
-        try:
-            import pyperclip
-            pyperclip.copy(message)
-            pyautogui.hotkey("ctrl", "v")
-        except ImportError:
-            # Fallback to typewrite
-            pyautogui.typewrite(message, interval=typing_interval)
-        
-        # Get send delay from settings
-        send_delay = self.settings.send_delay if self.settings else 0.5
-        time.sleep(send_delay)
-        
-        pyautogui.press("enter")
+        steps = self.flow.send_many(list(items), timer, on_sent)
 
         if self.settings and self.settings.debug_mode:
-            print("✅ Message sent successfully")
+            print("✅ Message sent successfully "
+                  f"({', '.join(f'{k} {v:.2f}s' for k, v in steps.items())})")
@@ -0,0 +1,275 @@
+# BACKEND/automations/whatsapp/whatsapp_outbox.py
+"""
+Persistent WhatsApp outbox
+
+Voice commands enqueue and return; one background worker does the sending:
+- messages to a contact that is still waiting are coalesced into one
+- a batch is delivered in one chat-navigation session (one readiness check,
+  a chat still open is not searched for again): everything from one bulk
+  command ("message the team ...") together, plus up to
+  max_parallel_messages other waiting contacts when parallel_message_sending
+- the queue is kept on disk, so a restart does not lose it
+- no retries here: the backend already retries (max_retries, resuming
+  after the last sent message) and falls back Desktop -> Web, so a second
+  layer would multiply UI runs per failure. What still fails goes to the
+  failed-messages file; it is only
+  resent when the user asks (replay_failed()), and messages older than
+  failed_replay_max_age are discarded rather than resent
+- every outcome is reported through notify(text)
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "DATA", "config")
+FAILED_REPLAY_MAX_AGE = 6 * 3600  # seconds
+
+
+class OutboxFullError(Exception):
+    """The outbox holds queue_max_size contacts already"""
+    pass
+
+
+def outbox_paths(settings=None):
+    """(queue file, failed-messages file) under DATA/config, names from settings"""
+    names = settings._settings if settings is not None else {}
+    return (os.path.join(DATA_DIR, names.get("outbox_file", "whatsapp_outbox.json")),
+            os.path.join(DATA_DIR, names.get("failed_messages_file", "failed_whatsapp_messages.json")))
+
+
+def _load(path: str) -> List[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            items = json.load(f)
+        return items if isinstance(items, list) else []
+    except Exception:
+        return []
+
+
+def _save(path: str, items: List[dict]):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(items, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ WhatsApp outbox could not write {path}: {e}")
+
+
+def _fresh_failed(path: str, max_age: float, now: float) -> List[dict]:
+    """Failed messages young enough to resend; older ones are dropped from the file"""
+    failed = _load(path)
+    fresh = [item for item in failed if now - item.get("failed_at", item.get("created", now)) <= max_age]
+    if len(fresh) != len(failed):
+        print(f"🗑️ Discarding {len(failed) - len(fresh)} failed WhatsApp message(s) too old to resend")
+        _save(path, fresh)
+    return fresh
+
+
+class WhatsAppOutbox:
+    """Queue + single delivery worker in front of WhatsAppController.send_messages"""
+
+    def __init__(self, deliver: Callable, settings=None, notify: Optional[Callable] = None,
+                 path: Optional[str] = None, failed_path: Optional[str] = None,
+                 coalesce_window: float = 0.3):
+        """
+        Args:
+            deliver: deliver(items, on_sent) sends (contact, message) pairs in
+                one session, with its own retries, and raises when one fails
+            settings: WhatsAppAutomationSettings (optional)
+            notify: Called with a status line per sent / failed message
+            coalesce_window: Seconds the worker lets a batch gather before sending
+        """
+        self.deliver = deliver
+        self.settings = settings
+        self.notify = notify
+        self.coalesce_window = coalesce_window
+        default_path, default_failed = outbox_paths(settings)
+        self.path = path or default_path
+        self.failed_path = failed_path or default_failed
+
+        self._pending: List[dict] = _load(self.path)  # in-flight items stay here until sent
+        self._in_flight: set = set()
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"queued": 0, "coalesced": 0, "sent": 0, "failed": 0, "sessions": 0, "replayed": 0}
+
+    def _setting(self, name: str, default):
+        if self.settings is None:
+            return default
+        return self.settings._settings.get(name, default)
+
+    # ------------------------
+    # Producer side
+    # ------------------------
+    def submit(self, contacts: List[str], message: str) -> List[str]:
+        """Queue message for each contact (one bulk group); returns the item ids"""
+        group = uuid.uuid4().hex[:8]
+        ids = []
+        with self._cond:
+            for contact in contacts:
+                waiting = next(
+                    (item for item in self._pending
+                     if item["id"] not in self._in_flight and item["contact"].lower() == contact.lower()),
+                    None,
+                )
+                if waiting is not None:
+                    waiting["message"] = f"{waiting['message']}\n{message}"
+                    self.stats["coalesced"] += 1
+                    ids.append(waiting["id"])
+                    continue
+
+                if len(self._pending) >= self._setting("queue_max_size", 50):
+                    self._save_pending()
+                    raise OutboxFullError(f"WhatsApp outbox is full ({len(self._pending)} waiting)")
+                item = {
+                    "id": uuid.uuid4().hex[:12],
+                    "contact": contact,
+                    "message": message,
+                    "group": group,
+                    "created": time.time(),
+                    "attempts": 0,
+                }
+                self._pending.append(item)
+                self.stats["queued"] += 1
+                ids.append(item["id"])
+            self._save_pending()
+            self._cond.notify()
+        return ids
+
+    def replay_failed(self) -> int:
+        """Move the failed messages back into the queue (on the user's request); returns how many"""
+        failed = _fresh_failed(self.failed_path, self._setting("failed_replay_max_age", FAILED_REPLAY_MAX_AGE),
+                               time.time())
+        if not failed:
+            return 0
+        with self._cond:
+            for item in failed:
+                item["attempts"] = 0
+                item.pop("error", None)
+                item.pop("failed_at", None)
+                self._pending.append(item)
+            self._save_pending()
+            _save(self.failed_path, [])
+            self.stats["replayed"] += len(failed)
+            self._cond.notify()
+        print(f"🔁 Replaying {len(failed)} failed WhatsApp message(s)")
+        return len(failed)
+
+    @staticmethod
+    def has_backlog(settings=None) -> bool:
+        """Messages a previous run queued but did not get to"""
+        return bool(_load(outbox_paths(settings)[0]))
+
+    @staticmethod
+    def failed_count(settings=None) -> int:
+        """Failed messages that could still be resent (stale ones are discarded)"""
+        max_age = settings._settings.get("failed_replay_max_age", FAILED_REPLAY_MAX_AGE) if settings else \
+            FAILED_REPLAY_MAX_AGE
+        return len(_fresh_failed(outbox_paths(settings)[1], max_age, time.time()))
+
+    # ------------------------
+    # Worker
+    # ------------------------
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="WhatsAppOutbox", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _take_batch(self) -> List[dict]:
+        with self._cond:
+            while not self._stop.is_set() and not self._waiting():
+                self._cond.wait()
+            if self._stop.is_set():
+                return []
+        # Let a burst of commands land in the same session
+        if self._stop.wait(self.coalesce_window):
+            return []
+
+        with self._cond:
+            waiting = self._waiting()
+            if not waiting:
+                return []
+            first = waiting[0]
+            batch = [item for item in waiting if item["group"] == first["group"]]
+            if self._setting("parallel_message_sending", False):
+                limit = max(len(batch), self._setting("max_parallel_messages", 3))
+                batch += [item for item in waiting if item not in batch][:limit - len(batch)]
+            self._in_flight.update(item["id"] for item in batch)
+            return batch
+
+    def _waiting(self) -> List[dict]:
+        return [item for item in self._pending if item["id"] not in self._in_flight]
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._take_batch()
+            if batch:
+                self._deliver(batch)
+
+    def _deliver(self, batch: List[dict]):
+        remaining = list(batch)
+        self.stats["sessions"] += 1
+
+        def sent(contact, message):
+            item = remaining.pop(0)
+            with self._cond:
+                self._pending.remove(item)
+                self._in_flight.discard(item["id"])
+                self._save_pending()
+            self.stats["sent"] += 1
+            self._notify(f"Message sent to {item['contact']}.")
+
+        try:
+            self.deliver([(item["contact"], item["message"]) for item in batch], sent)
+            return
+        except Exception as e:
+            error = str(e)
+            print(f"❌ WhatsApp outbox delivery failed: {error}")
+
+        # deliver() has retried already; what is left failed for good
+        with self._cond:
+            for item in remaining:
+                item["attempts"] += 1
+                self._in_flight.discard(item["id"])
+                self._pending.remove(item)
+                self._fail(item, error)
+            self._save_pending()
+
+    def _fail(self, item: dict, error: str):
+        self.stats["failed"] += 1
+        if self._setting("save_failed_messages", True):
+            failed = _load(self.failed_path)
+            failed.append({**item, "error": error, "failed_at": time.time()})
+            _save(self.failed_path, failed)
+        self._notify(f"Couldn't send the message to {item['contact']}: {error}")
+
+    def _save_pending(self):
+        _save(self.path, self._pending)
+
+    def _notify(self, text: str):
+        if self.notify is not None:
+            try:
+                self.notify(text)
+            except Exception as e:
+                print(f"⚠️ WhatsApp outbox notify failed: {e}")
+
+    def get_stats(self) -> Dict:
+        with self._cond:
+            return {**self.stats, "pending": len(self._pending), "in_flight": len(self._in_flight)}
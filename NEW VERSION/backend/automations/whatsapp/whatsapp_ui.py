@@ -0,0 +1,264 @@
+# BACKEND/automations/whatsapp/whatsapp_ui.py
+"""
+Event-driven waits for WhatsApp Web / Desktop UI automation
+
+Every step polls a cheap signal with bounded exponential backoff until it
+holds or the step's timeout runs out, instead of sleeping a fixed time:
+- window title: is a WhatsApp window there
+- clipboard round trip: select-all + copy on the focused field tells what
+  has focus (an empty composer, or the search box still holding the contact)
+- DOM state, when a driver channel to the page is available (DomSignals)
+Contact and message both go in by clipboard paste; nothing is typed per key.
+A message is only pasted once its chat is confirmed open (ChatNotOpenError
+otherwise, for the caller's retry).
+The user's clipboard is put back after each step that borrows it.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Never something a user would have on the clipboard or in a chat field
+PROBE = "\u2063synex\u2063"
+
+SEARCH_KEYS_WEB = ("ctrl", "alt", "/")
+SEARCH_KEYS_DESKTOP = ("ctrl", "f")
+WINDOW_TITLE = "WhatsApp"
+
+
+class ChatNotOpenError(Exception):
+    """The contact's chat could not be confirmed open; nothing was pasted"""
+    pass
+
+
+def wait_until(condition: Callable, timeout: float, clock: Callable = time.monotonic,
+               sleep: Callable = time.sleep, first: float = 0.05, max_interval: float = 0.5,
+               backoff: float = 1.6):
+    """Poll condition() until it is truthy (returned) or timeout passes (its last falsy value)"""
+    deadline = clock() + timeout
+    interval = first
+    while True:
+        value = condition()
+        if value:
+            return value
+        remaining = deadline - clock()
+        if remaining <= 0:
+            return value
+        sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+class StepTimer:
+    """Wall time per named step of one send"""
+
+    def __init__(self, clock: Callable = time.monotonic):
+        self.clock = clock
+        self.steps: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str):
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + self.clock() - started
+
+    @property
+    def total(self) -> float:
+        return sum(self.steps.values())
+
+
+class PyAutoGuiUI:
+    """The real desktop: pyautogui keys, pyperclip clipboard, pygetwindow titles"""
+
+    def __init__(self, key_settle: float = 0.03):
+        import pyautogui
+        import pygetwindow
+        import pyperclip
+        self._keys = pyautogui
+        self._windows = pygetwindow
+        self._clipboard = pyperclip
+        self.key_settle = key_settle  # instead of pyautogui's 0.1 s PAUSE after every call
+
+    def hotkey(self, *keys):
+        self._keys.hotkey(*keys, _pause=False)
+        time.sleep(self.key_settle)
+
+    def press(self, key: str):
+        self._keys.press(key, _pause=False)
+        time.sleep(self.key_settle)
+
+    def get_clipboard(self) -> str:
+        return self._clipboard.paste() or ""
+
+    def set_clipboard(self, text: str):
+        self._clipboard.copy(text)
+
+    def window_titles(self, fragment: str) -> List[str]:
+        return [w.title for w in self._windows.getWindowsWithTitle(fragment) if w.title]
+
+    def focus(self, fragment: str) -> bool:
+        windows = self._windows.getWindowsWithTitle(fragment)
+        if not windows:
+            return False
+        win = windows[0]
+        try:
+            if win.isMinimized:
+                win.restore()
+            win.activate()
+        except Exception:
+            pass
+        return True
+
+
+class DomSignals:
+    """Page state over a WebDriver / CDP channel to the WhatsApp Web tab, when there is one"""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def _query(self, selector: str) -> bool:
+        try:
+            return bool(self.driver.execute_script("return !!document.querySelector(arguments[0]);", selector))
+        except Exception:
+            return False
+
+    def ready(self) -> bool:
+        return self._query("#side")
+
+    def results_shown(self) -> bool:
+        return self._query("#pane-side [role='listitem'], #pane-side [role='row']")
+
+    def chat_open(self) -> bool:
+        return self._query("footer [contenteditable='true']")
+
+
+class WhatsAppUiFlow:
+    """Readiness + send steps shared by the Web and Desktop backends"""
+
+    def __init__(self, ui, search_keys: Tuple[str, ...], settings=None, dom: Optional[DomSignals] = None,
+                 clock: Callable = time.monotonic, sleep: Callable = time.sleep):
+        self.ui = ui
+        self.search_keys = search_keys
+        self.settings = settings
+        self.dom = dom
+        self.clock = clock
+        self.sleep = sleep
+        self.open_contact: Optional[str] = None  # chat the composer belongs to, while nothing else took focus
+
+    def _setting(self, name: str, default):
+        if self.settings is None:
+            return default
+        return self.settings._settings.get(name, default)
+
+    def _wait(self, condition: Callable, timeout: float):
+        return wait_until(condition, timeout, clock=self.clock, sleep=self.sleep)
+
+    @contextmanager
+    def _user_clipboard(self):
+        """The probes and pastes borrow the clipboard; give the user's back afterwards"""
+        saved = self.ui.get_clipboard()
+        try:
+            yield
+        finally:
+            self.ui.set_clipboard(saved)
+
+    # ------------------------
+    # Signals
+    # ------------------------
+    def window_present(self) -> bool:
+        return bool(self.ui.window_titles(WINDOW_TITLE))
+
+    def focused_text(self) -> str:
+        """Text of the focused field via the clipboard ("" when it is empty)"""
+        self.ui.set_clipboard(PROBE)
+        self.ui.hotkey("ctrl", "a")
+        self.ui.hotkey("ctrl", "c")
+        text = self.ui.get_clipboard()
+        return "" if text == PROBE else text
+
+    def search_ready(self) -> bool:
+        """Open search and check it takes input: paste the probe and read it back"""
+        if self.dom is not None and not self.dom.ready():
+            return False
+        self.ui.hotkey(*self.search_keys)
+        self.ui.hotkey("ctrl", "a")
+        self.ui.set_clipboard(PROBE)
+        self.ui.hotkey("ctrl", "v")
+        self.ui.set_clipboard("")  # only a field holding the probe can put it back
+        self.ui.hotkey("ctrl", "a")
+        self.ui.hotkey("ctrl", "c")
+        ok = self.ui.get_clipboard() == PROBE
+        self.ui.press("backspace")
+        return ok
+
+    # ------------------------
+    # Steps
+    # ------------------------
+    def wait_ready(self, timeout: float, timer: Optional[StepTimer] = None) -> bool:
+        timer = timer or StepTimer(self.clock)
+        deadline = self.clock() + timeout
+        self.open_contact = None  # the probe moves focus to search
+        with timer.step("window"):
+            if not self._wait(self.window_present, timeout):
+                return False
+            self.ui.focus(WINDOW_TITLE)
+        with timer.step("ready"), self._user_clipboard():
+            return bool(self._wait(self.search_ready, max(0.0, deadline - self.clock())))
+
+    def open_chat(self, contact: str, timer: Optional[StepTimer] = None) -> bool:
+        """Search for the contact and open the first hit; True once the composer has focus"""
+        timer = timer or StepTimer(self.clock)
+        with timer.step("search"):
+            self.ui.hotkey(*self.search_keys)
+            self.ui.hotkey("ctrl", "a")
+            self.ui.set_clipboard(contact)
+            self.ui.hotkey("ctrl", "v")
+            if self.dom is not None:
+                self._wait(self.dom.results_shown, self._setting("chat_open_delay", 1.2) * 2)
+            else:
+                # Nothing cheap tells when the result list has re-filtered
+                self.sleep(self._setting("search_settle_delay", 0.35))
+        with timer.step("chat"):
+            self.ui.press("enter")
+            signal = self.dom.chat_open if self.dom is not None else (lambda: self.focused_text() == "")
+            opened = bool(self._wait(signal, self._setting("chat_open_delay", 1.2) * 2))
+            self.open_contact = contact if opened else None
+            return opened
+
+    def send_text(self, message: str, timer: Optional[StepTimer] = None) -> bool:
+        """Paste and send; True once the composer is empty again (the message left)"""
+        timer = timer or StepTimer(self.clock)
+        with timer.step("send"):
+            self.ui.set_clipboard(message)
+            self.ui.hotkey("ctrl", "v")
+            self.ui.press("enter")
+            return bool(self._wait(lambda: self.focused_text() == "", 2.0))
+
+    def send(self, contact: str, message: str, timer: Optional[StepTimer] = None) -> Dict[str, float]:
+        """Open the chat and send, keeping the user's clipboard; returns the step timings"""
+        return self.send_many([(contact, message)], timer)
+
+    def send_many(self, items: List[Tuple[str, str]], timer: Optional[StepTimer] = None,
+                  on_sent: Optional[Callable] = None) -> Dict[str, float]:
+        """
+        Send (contact, message) pairs in order in one session: a chat that is
+        still open is not searched for again. on_sent(contact, message) runs
+        after each one left.
+        """
+        timer = timer or StepTimer(self.clock)
+        with self._user_clipboard():
+            for contact, message in items:
+                if contact != self.open_contact and not self.open_chat(contact, timer):
+                    # Never paste blind: focus may be on another chat or the search box
+                    self.ui.press("esc")
+                    raise ChatNotOpenError(f"Chat with {contact} did not open; nothing was sent to it")
+                if not self.send_text(message, timer):
+                    self._log("⚠️ Composer did not clear after send")
+                if on_sent is not None:
+                    on_sent(contact, message)
+        return timer.steps
+
+    def _log(self, text: str):
+        if self.settings is not None and self.settings.verbose_logging:
+            print(text)
@@ -4,11 +4,14 @@ Enhanced WhatsApp Web automation with retry logic and error handling
 """
 
 import time
-import pyautogui
-import pygetwindow as gw
-import ctypes
 
 from BACKEND.automations.whatsapp.browser_manager import open_whatsapp_web
+from BACKEND.automations.whatsapp.whatsapp_ui import (
+    SEARCH_KEYS_WEB,
+    PyAutoGuiUI,
+    StepTimer,
+    WhatsAppUiFlow
+)
 from BACKEND.automations.whatsapp.whatsapp_state import (
     WHATSAPP_READY,
     WHATSAPP_WEB_DELAY
@@ -28,191 +31,105 @@ class WhatsAppWebError(Exception):
 class WhatsAppWeb:
     """Enhanced WhatsApp Web controller with retry logic and error handling"""
 
-    def __init__(self):
+    def __init__(self, ui=None, dom=None, clock=time.monotonic, sleep=time.sleep):
         self.settings = get_settings() if get_settings else None
         self._is_ready = False
+        self._ui = ui
+        self.dom = dom  # DomSignals when a driver channel to the tab exists
+        self.clock = clock
+        self.sleep = sleep
+        self._flow = None
+        self.last_timings = {}
+
+    @property
+    def flow(self) -> WhatsAppUiFlow:
+        if self._flow is None:
+            self._flow = WhatsAppUiFlow(self._ui or PyAutoGuiUI(), SEARCH_KEYS_WEB, self.settings,
+                                        dom=self.dom, clock=self.clock, sleep=self.sleep)
+        return self._flow
 
     def send_message(self, contact: str, message: str):
         """Send message with retry logic and error handling"""
+        self.send_messages([(contact, message)])
+
+    def send_messages(self, items, on_sent=None):
+        """
+        Send (contact, message) pairs in one session (one readiness check);
+        a retry resumes with the ones not sent yet
+        """
         
         global WHATSAPP_READY
         WHATSAPP_READY = False
 
         # Validate inputs
-        if not contact or not message:
+        if not items or not all(contact and message for contact, message in items):
             raise ValueError("Contact and message must not be empty")
         
+        pending = list(items)
+
+        def sent(contact, message):
+            pending.pop(0)
+            if on_sent is not None:
+                on_sent(contact, message)
+
         settings = self.settings
         max_retries = settings.max_retries if settings else 2
         retry_delay = settings.retry_delay if settings else 3
         
         for attempt in range(max_retries + 1):
             try:
-                return self._send_message_internal(contact, message)
+                return self._send_message_internal(pending, sent)
             except Exception as e:
                 if attempt < max_retries:
                     wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
                     if settings and settings.debug_mode:
                         print(f"🔄 WhatsApp Web retry {attempt + 1}/{max_retries} in {wait_time}s: {e}")
-                    time.sleep(wait_time)
+                    self.sleep(wait_time)
                 else:
                     raise WhatsAppWebError(f"Failed to send message after {max_retries + 1} attempts: {e}")
 
-    def _send_message_internal(self, contact: str, message: str):
-        """Internal method to send message"""
-        
+    def _send_message_internal(self, items, on_sent=None):
+        """Internal method to send messages"""
+        timer = StepTimer(self.clock)
+
         # Open WhatsApp Web
-        open_whatsapp_web()
-        
-        # Get load delay from settings
-        load_delay = self.settings.web_load_delay if self.settings else WHATSAPP_WEB_DELAY
+        with timer.step("open"):
+            open_whatsapp_web()
+
+        # Wait until ready: a fresh browser gets web_load_delay on top of the
+        # ready timeout, but only as a budget; the wait ends as soon as search takes input
+        timeout = self.settings.web_ready_timeout if self.settings else 30
+        if not self._is_ready:
+            timeout += self.settings.web_load_delay if self.settings else WHATSAPP_WEB_DELAY
         if self.settings and self.settings.debug_mode:
-            print(f"⏳ Waiting {load_delay}s for WhatsApp Web to load...")
-        time.sleep(load_delay)
-
-        # Ensure keyboard focus
-        self._prime_ui()
-
-        # Wait until ready
-        if not self._wait_until_ready():
+            print(f"⏳ Waiting up to {timeout}s for WhatsApp Web to be ready...")
+        if not self.flow.wait_ready(timeout, timer):
+            self._is_ready = False
             raise WhatsAppWebError("WhatsApp Web not ready")
 
         global WHATSAPP_READY
         WHATSAPP_READY = True
         self._is_ready = True
         
-        # Send the message
-        self._send(contact, message)
+        # Send the messages
+        self._send(items, timer, on_sent)
+        self.last_timings = timer.steps
 
     # ----------------------------------
     # CORE SEND LOGIC (ENHANCED)
     # ----------------------------------
-    def _send(self, contact: str, message: str):
-        """Send message through WhatsApp Web with settings integration"""
+    def _send(self, items, timer: StepTimer = None, on_sent=None):
+        """Send message through WhatsApp Web: contact and message pasted, each step waits on a signal"""
         
         if not WHATSAPP_READY:
             raise WhatsAppWebError("WhatsApp Web is not ready")
 
         if self.settings and self.settings.debug_mode:
-            print(f"📤 Sending to {contact}: {message[:50]}...")
-
-        # Get typing interval from settings
-        typing_interval = self.settings.typing_interval if self.settings else 0.05
-        search_clear_delay = self.settings._settings.get("search_clear_delay", 0.3) if self.settings else 0.3
-        chat_open_delay = self.settings._settings.get("chat_open_delay", 1.2) if self.settings else 1.2
-
-        # Open search
-        pyautogui.hotkey("ctrl", "alt", "/")
-        time.sleep(0.6)
-
-        # Clear search box
-        pyautogui.hotkey("ctrl", "a")
-        time.sleep(0.1)
-        pyautogui.press("backspace")
-        time.sleep(search_clear_delay)
-
-        # Type contact name
-        pyautogui.typewrite(contact, interval=typing_interval)
-        time.sleep(1)
-
-        # Open chat
-        pyautogui.press("enter")
-        time.sleep(chat_open_delay)
-
-        # Type and send message
-        # Use pyperclip for Unicode/Hinglish support
-        try:
-            import pyperclip
-            pyperclip.copy(message)
-            pyautogui.hotkey("ctrl", "v")
-        except ImportError:
-            # Fallback to typewrite
-            pyautogui.typewrite(message, interval=typing_interval)
-        
-        # Get send delay from settings
-        send_delay = self.settings.send_delay if self.settings else 0.5
-        time.sleep(send_delay)
-        
-        pyautogui.press("enter")
-
-        if self.settings and self.settings.debug_mode:
-            print("✅ Message sent successfully via WhatsApp Web")
+            for contact, message in items:
+                print(f"📤 Sending to {contact}: {message[:50]}...")
 
-    # ----------------------------------
-    # WINDOW CONTROL
-    # ----------------------------------
-    def _bring_whatsapp_to_front(self):
-        """Bring WhatsApp Web window to front"""
-        try:
-            windows = (
-                gw.getWindowsWithTitle("WhatsApp")
-                or gw.getWindowsWithTitle("Microsoft Edge")
-                or gw.getWindowsWithTitle("Google Chrome")
-                or gw.getWindowsWithTitle("Brave")
-            )
-
-            if not windows:
-                if self.settings and self.settings.verbose_logging:
-                    print("⚠️ No WhatsApp window found")
-                return
-
-            win = windows[0]
-            hwnd = win._hWnd
-
-            user32 = ctypes.windll.user32
-            user32.ShowWindow(hwnd, 5)
-            user32.SetForegroundWindow(hwnd)
-            time.sleep(1)
-            
-            if self.settings and self.settings.debug_mode:
-                print("✅ WhatsApp window brought to front")
-        except Exception as e:
-            if self.settings and self.settings.verbose_logging:
-                print(f"⚠️ Failed to bring window to front: {e}")
+        steps = self.flow.send_many(list(items), timer, on_sent)
 
-    # ----------------------------------
-    # UI PRIME (SAFE CLICK)
-    # ----------------------------------
-    def _prime_ui(self):
-        """Prime UI with safe click"""
-        try:
-            ui_prime_delay = self.settings._settings.get("ui_prime_delay", 0.3) if self.settings else 0.3
-            w, h = pyautogui.size()
-            pyautogui.click(w // 2, h // 2)
-            time.sleep(ui_prime_delay)
-        except Exception as e:
-            if self.settings and self.settings.verbose_logging:
-                print(f"⚠️ UI prime failed: {e}")
-
-    def _wait_until_ready(self, timeout: int = None) -> bool:
-        """Wait until WhatsApp Web is ready to receive input"""
-        
-        if timeout is None:
-            timeout = self.settings.web_ready_timeout if self.settings else 30
-        
-        start = time.time()
-        
         if self.settings and self.settings.debug_mode:
-            print("⏳ Waiting for WhatsApp Web to be ready...")
-        
-        while time.time() - start < timeout:
-            try:
-                pyautogui.hotkey("ctrl", "alt", "/")
-                time.sleep(0.4)
-                pyautogui.hotkey("ctrl", "a")
-                time.sleep(0.1)
-                pyautogui.press("backspace")
-                
-                if self.settings and self.settings.debug_mode:
-                    print("✅ WhatsApp Web is ready")
-                return True
-            except Exception as e:
-                elapsed = int(time.time() - start)
-                if self.settings and self.settings.verbose_logging:
-                    print(f"⏳ Still waiting... ({elapsed}s / {timeout}s)")
-                time.sleep(1)
-        
-        if self.settings and self.settings.debug_mode:
-            print(f"❌ WhatsApp Web timeout after {timeout}s")
-        return False
-
+            print("✅ Message sent successfully via WhatsApp Web "
+                  f"({', '.join(f'{k} {v:.2f}s' for k, v in steps.items())})")
@@ -4,13 +4,17 @@ import ctypes
 import time
 
 
-def bring_window_to_front(win):
+def bring_window_to_front(win, timeout: float = 0.8):
+    """Raise the window and return once it is the foreground one (at most timeout)"""
     hwnd = win._hWnd
     user32 = ctypes.windll.user32
 
     user32.ShowWindow(hwnd, 5)
     user32.SetForegroundWindow(hwnd)
-    time.sleep(0.8)
+
+    deadline = time.monotonic() + timeout
+    while user32.GetForegroundWindow() != hwnd and time.monotonic() < deadline:
+        time.sleep(0.02)
 
 
 def find_whatsapp_tab():
@@ -0,0 +1,107 @@
+"""
+Unit tests for the YouTube player shim bridge
+Tests one-call dispatch, lazy shim install and async playback waits (fake driver)
+"""
+
+import unittest
+from types import SimpleNamespace
+from BACKEND.automations.youtube.yt_player import PLAYER_SHIM, YouTubePlayer
+from BACKEND.automations.youtube.yt_exceptions import YouTubePlayerError
+
+
+class FakeDriver:
+    """Counts round trips; the page "loses" the shim when navigated"""
+
+    def __init__(self):
+        self.shim = False
+        self.calls = []
+        self.cdp = []
+        self.script_timeouts = []
+        self.timeouts = SimpleNamespace(script=10)
+        self.volume = 100
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append("cdp")
+        self.cdp.append((cmd, params["source"]))
+
+    def execute_script(self, script, *args):
+        self.calls.append("script")
+        if script == PLAYER_SHIM:
+            self.shim = True
+            return None
+        if not self.shim:
+            return None
+        command, params = args
+        if command == "set_volume":
+            self.volume = round(params[0] * 100)
+        if command not in ("state", "set_volume", "pause"):
+            return {"error": f"unknown command: {command}"}
+        return {"ready": True, "paused": command == "pause", "volume": self.volume}
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        self.calls.append("async")
+        if args[0] == "fail":
+            raise TimeoutError("script timeout")
+        return {"ready": True, "paused": False, "query": args[0], "timeout_ms": args[-1]}
+
+    def navigate(self):
+        self.shim = False
+        self.calls.clear()
+
+
+class TestYouTubePlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = FakeDriver()
+        self.player = YouTubePlayer(self.driver)
+
+    def test_first_command_installs_shim(self):
+        state = self.player.pause()
+        self.assertTrue(state['paused'])
+        self.assertEqual(self.driver.calls, ["script", "cdp", "script", "script"])
+        self.assertEqual(self.driver.cdp[0][0], "Page.addScriptToEvaluateOnNewDocument")
+
+    def test_commands_are_one_round_trip(self):
+        self.player.pause()
+        self.driver.calls.clear()
+        self.assertEqual(self.player.set_volume(0.4)['volume'], 40)
+        self.assertEqual(self.player.state['volume'], 40)
+        self.assertEqual(self.driver.calls, ["script"])
+
+    def test_reinstall_after_reload_registers_once(self):
+        self.player.pause()
+        self.driver.navigate()
+        self.player.pause()
+        self.assertEqual(self.driver.calls, ["script", "script", "script"])
+        self.assertEqual(len(self.driver.cdp), 1)
+
+    def test_set_volume_is_clamped(self):
+        self.assertEqual(self.player.set_volume(7)['volume'], 100)
+        self.assertEqual(self.player.set_volume(-1)['volume'], 0)
+
+    def test_unknown_command_raises(self):
+        with self.assertRaises(YouTubePlayerError):
+            self.player.dispatch("rewind_time")
+
+    def test_play_query_is_one_async_call(self):
+        self.player.ensure()
+        self.driver.calls.clear()
+        state = self.player.play_query("lofi beats", timeout=12)
+        self.assertEqual(state['query'], "lofi beats")
+        self.assertEqual(state['timeout_ms'], 12000)
+        self.assertEqual(self.driver.calls, ["script", "async"])
+
+    def test_async_wait_restores_the_script_timeout(self):
+        self.player.play_query("jazz", timeout=12)
+        self.assertEqual(self.driver.script_timeouts, [14, 10])
+        with self.assertRaises(TimeoutError):
+            self.player.play_query("fail", timeout=5)
+        self.assertEqual(self.driver.timeouts.script, 10)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
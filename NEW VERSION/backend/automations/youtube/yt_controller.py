@@ -23,10 +23,18 @@ class YouTubeController:
     def __init__(self):
         self.session = YouTubeSession()
         self.settings = YouTubeAutomationSettings()
+        self._yt_player = None
 
     def _driver(self):
         return self.session.get_driver()
 
+    def _player(self):
+        """Player for the YouTube tab; rebuilt only when the session hands out a new browser"""
+        driver = self._driver()
+        if self._yt_player is None or self._yt_player.driver is not driver:
+            self._yt_player = YouTubePlayer(driver)
+        return self._yt_player
+
     def handle(self, intent: str, text: str):
         """
         Main entry point for intent-based YouTube automation
@@ -46,20 +54,24 @@ class YouTubeController:
             
             for attempt in range(max_retries):
                 try:
-                    # Handle play/search intents
-                    if intent in ["youtube_play", "youtube_search"]:
-                        return self._handle_play_search(intent, text)
-                    
-                    # Handle player control intents
-                    elif intent == "youtube_control":
-                        return self._handle_player_control(text)
-                    
-                    else:
-                        return f"Unknown YouTube intent: {intent}"
+                    # The browser is shared with Google: keep our tab focused until done
+                    with self.session.lease():
+                        # Handle play/search intents
+                        if intent in ["youtube_play", "youtube_search"]:
+                            return self._handle_play_search(intent, text)
+
+                        # Handle player control intents
+                        elif intent == "youtube_control":
+                            return self._handle_player_control(text)
+
+                        else:
+                            return f"Unknown YouTube intent: {intent}"
                 
                 except Exception as e:
                     error_msg = str(e)
                     print(f"❌ YouTube attempt {attempt + 1} failed: {error_msg}")
+                    # The browser may have crashed: drop it so the retry gets a fresh one
+                    self.session.report_failure()
                     
                     if attempt == max_retries - 1:
                         return f"Failed to execute YouTube command after {max_retries} attempts: {error_msg}"
@@ -213,77 +225,78 @@ class YouTubeController:
         search_only(self._driver(), query)
 
     def play(self, query: str):
-        search_and_play_first(self._driver(), query)
+        player = self._player()
+        search_and_play_first(player.driver, query, player=player)
 
     # -------- PLAYER CONTROLS --------
     def play_pause(self):
-        YouTubePlayer(self._driver()).play_pause()
+        self._player().play_pause()
 
     def pause(self):
-        YouTubePlayer(self._driver()).pause()
+        self._player().pause()
 
     def resume(self):
-        YouTubePlayer(self._driver()).play()
+        self._player().play()
 
     def stop(self):
-        YouTubePlayer(self._driver()).stop()
+        self._player().stop()
 
     def restart(self):
-        YouTubePlayer(self._driver()).restart()
+        self._player().restart()
 
     # -------- VOLUME --------
     def volume_up(self):
-        YouTubePlayer(self._driver()).volume_up()
+        self._player().volume_up()
 
     def volume_down(self):
-        YouTubePlayer(self._driver()).volume_down()
+        self._player().volume_down()
 
     def mute(self):
-        YouTubePlayer(self._driver()).mute()
+        self._player().mute()
 
     def unmute(self):
-        YouTubePlayer(self._driver()).unmute()
+        self._player().unmute()
 
     def set_volume(self, level: int):
         """Set volume to specific level (0-100)"""
-        YouTubePlayer(self._driver()).set_volume(level)
+        self._player().set_volume(level / 100)
 
     # -------- SEEK --------
     def seek_forward(self, seconds=10):
-        YouTubePlayer(self._driver()).seek(seconds)
+        self._player().seek(seconds)
 
     def seek_backward(self, seconds=10):
-        YouTubePlayer(self._driver()).seek(-seconds)
+        self._player().seek(-seconds)
 
     def seek_start(self):
-        YouTubePlayer(self._driver()).seek_to_start()
+        self._player().seek_to_start()
 
     def seek_end(self):
-        YouTubePlayer(self._driver()).seek_to_end()
+        self._player().seek_to_end()
 
     # -------- SPEED --------
     def speed_up(self):
-        YouTubePlayer(self._driver()).speed_up()
+        self._player().speed_up()
 
     def speed_down(self):
-        YouTubePlayer(self._driver()).speed_down()
+        self._player().speed_down()
 
     def set_speed(self, speed: float):
-        YouTubePlayer(self._driver()).set_speed(speed)
+        self._player().set_speed(speed)
 
     # -------- VIEW --------
     def fullscreen(self):
-        YouTubePlayer(self._driver()).fullscreen()
+        self._player().fullscreen()
 
     def exit_fullscreen(self):
-        YouTubePlayer(self._driver()).exit_fullscreen()
+        self._player().exit_fullscreen()
 
     def theater_mode(self):
-        YouTubePlayer(self._driver()).theater_mode()
+        self._player().theater_mode()
 
     # -------- CAPTIONS --------
     def captions(self):
-        YouTubePlayer(self._driver()).toggle_captions()
+        self._player().toggle_captions()
 
     def close(self):
         self.session.close()
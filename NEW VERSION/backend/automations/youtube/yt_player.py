@@ -1,160 +1,287 @@
 # BACKEND/automations/youtube/yt_player.py
+"""
+YouTube player control through a control shim injected into the YouTube tab.
+
+The shim (window.__synexYT) is installed once per page (and registered for
+every new document where the driver speaks CDP). Each command is then one
+short execute_script call into dispatch(command, args), which returns the
+player state in the same round trip. Waits run inside the page and finish
+on the video's own events ("playing") instead of sleeping.
+"""
+
+from BACKEND.automations.youtube.yt_exceptions import YouTubePlayerError
+
+PLAYER_SHIM = r"""
+(() => {
+  if (window.__synexYT) return;
+  const state = {lastEvent: '', lastPlaying: 0};
+  const video = () => document.querySelector('video.html5-main-video') || document.querySelector('video');
+  ['playing', 'pause', 'ended', 'error'].forEach(type => document.addEventListener(type, e => {
+    if (!e.target || e.target.tagName !== 'VIDEO') return;
+    state.lastEvent = type;
+    if (type === 'playing') state.lastPlaying = performance.now();
+  }, true));
+
+  const snapshot = (extra) => {
+    const v = video();
+    const s = {url: location.href, event: state.lastEvent, ready: !!v};
+    if (v) Object.assign(s, {
+      paused: v.paused, ended: v.ended, time: v.currentTime, duration: v.duration || 0,
+      volume: Math.round(v.volume * 100), muted: v.muted, rate: v.playbackRate
+    });
+    return Object.assign(s, extra || {});
+  };
+  const clamp = (x, lo, hi) => Math.min(hi, Math.max(lo, x));
+  const quiet = r => { if (r && r.catch) r.catch(() => {}); };
+
+  const commands = {
+    state: () => {},
+    play_pause: v => quiet(v.paused ? v.play() : v.pause()),
+    play: v => quiet(v.play()),
+    pause: v => v.pause(),
+    stop: v => { v.pause(); v.currentTime = 0; },
+    restart: v => { v.currentTime = 0; },
+    set_volume: (v, x) => { v.volume = clamp(x, 0, 1); if (x > 0) v.muted = false; },
+    volume_up: (v, s) => { v.volume = clamp(v.volume + s, 0, 1); },
+    volume_down: (v, s) => { v.volume = clamp(v.volume - s, 0, 1); },
+    mute: v => { v.muted = true; },
+    unmute: v => { v.muted = false; },
+    seek: (v, s) => { v.currentTime = clamp(v.currentTime + s, 0, v.duration || Infinity); },
+    seek_to_start: v => { v.currentTime = 0; },
+    seek_to_end: v => { v.currentTime = v.duration; },
+    set_speed: (v, r) => { v.playbackRate = clamp(r, 0.25, 2); },
+    speed_up: v => { v.playbackRate = Math.min(2, v.playbackRate + 0.25); },
+    speed_down: v => { v.playbackRate = Math.max(0.25, v.playbackRate - 0.25); },
+    fullscreen: v => quiet(v.requestFullscreen()),
+    exit_fullscreen: () => { if (document.fullscreenElement) quiet(document.exitFullscreen()); },
+    theater_mode: () => {
+      const el = document.querySelector('ytd-watch-flexy');
+      if (el) el.setAttribute('theater-requested_', '');
+    },
+    toggle_captions: () => {
+      const btn = document.querySelector('.ytp-subtitles-button');
+      if (btn) btn.click();
+    },
+  };
+  const PAGE_COMMANDS = new Set(['state', 'exit_fullscreen', 'theater_mode', 'toggle_captions']);
+
+  // Resolve once a video plays after `since` on a page other than startUrl
+  const whenPlaying = (since, startUrl, deadline, done) => {
+    const ok = () => {
+      const v = video();
+      return state.lastPlaying > since && location.href !== startUrl && v && !v.paused;
+    };
+    if (ok()) return done(snapshot());
+    let timer;
+    const onPlaying = () => { if (ok()) finish(snapshot()); };
+    const finish = (result) => {
+      document.removeEventListener('playing', onPlaying, true);
+      clearTimeout(timer);
+      done(result);
+    };
+    document.addEventListener('playing', onPlaying, true);
+    timer = setTimeout(() => finish(snapshot({timeout: true})), Math.max(0, deadline - performance.now()));
+  };
+
+  const firstResult = () => document.querySelector('ytd-search ytd-video-renderer a#video-title');
+  const sameQuery = (a, b) => (a || '').trim().toLowerCase().replace(/\s+/g, ' ') ===
+                              (b || '').trim().toLowerCase().replace(/\s+/g, ' ');
+
+  window.__synexYT = {
+    dispatch(command, args) {
+      const fn = commands[command];
+      if (!fn) return snapshot({error: 'unknown command: ' + command});
+      const v = video();
+      if (!v && !PAGE_COMMANDS.has(command)) return snapshot({error: 'no video'});
+      try { fn(v, ...(args || [])); } catch (e) { return snapshot({error: String(e)}); }
+      return snapshot();
+    },
+
+    clickAndPlay(link, timeoutMs, done) {
+      const since = performance.now();
+      const startUrl = location.href;
+      link.click();
+      whenPlaying(since, startUrl, since + timeoutMs, done);
+    },
+
+    // Search in-app (no page load), open the first video, resolve when it plays
+    playQuery(query, timeoutMs, done) {
+      const deadline = performance.now() + timeoutMs;
+      const input = document.querySelector('input#search, input[name="search_query"]');
+      if (!input) return done(snapshot({error: 'no search box'}));
+      const before = firstResult();
+      const prevHref = before ? before.href : '';
+      const prevQuery = new URLSearchParams(location.search).get('search_query');
+
+      input.focus();
+      input.value = query;
+      input.dispatchEvent(new Event('input', {bubbles: true}));
+      const button = document.querySelector(
+        '#search-icon-legacy, button.ytSearchboxComponentSearchButton, button[aria-label="Search"]');
+      if (button) button.click();
+      else input.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', keyCode: 13, bubbles: true}));
+
+      const tick = () => {
+        const link = firstResult();
+        const shown = new URLSearchParams(location.search).get('search_query');
+        if (location.pathname === '/results' && sameQuery(shown, query) && link &&
+            (link.href !== prevHref || sameQuery(prevQuery, query))) {
+          return this.clickAndPlay(link, Math.max(0, deadline - performance.now()), done);
+        }
+        if (performance.now() > deadline) return done(snapshot({error: 'no results'}));
+        setTimeout(tick, 50);
+      };
+      tick();
+    },
+  };
+})();
+"""
+
+_DISPATCH = "return window.__synexYT ? window.__synexYT.dispatch(arguments[0], arguments[1]) : null;"
+_PLAY_QUERY = "window.__synexYT.playQuery(arguments[0], arguments[1], arguments[arguments.length - 1]);"
+_CLICK_AND_PLAY = "window.__synexYT.clickAndPlay(arguments[0], arguments[1], arguments[arguments.length - 1]);"
+
+# WebDriver's script timeout when the session never set one
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
 class YouTubePlayer:
+    """Player commands for one driver; keep the instance, it remembers the shim is registered"""
+
     def __init__(self, driver):
         self.driver = driver
+        self.state = {}
+        self._registered = False
+
+    # ------------------
+    # SHIM
+    # ------------------
+    def _install(self):
+        if not self._registered:
+            self._registered = True
+            try:
+                # Chromium: re-injected into every document this tab loads
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PLAYER_SHIM})
+            except Exception:
+                pass
+        self.driver.execute_script(PLAYER_SHIM)
+
+    def dispatch(self, command: str, *args) -> dict:
+        """Run one player command; returns the player state after it"""
+        state = self.driver.execute_script(_DISPATCH, command, list(args))
+        if state is None:
+            # Page (re)loaded without the shim
+            self._install()
+            state = self.driver.execute_script(_DISPATCH, command, list(args))
+        self.state = state or {}
+        error = self.state.get("error")
+        if error and error.startswith("unknown command"):
+            raise YouTubePlayerError(error)
+        return self.state
+
+    def ensure(self):
+        return self.dispatch("state")
+
+    def _script_timeout(self) -> float:
+        try:
+            return self.driver.timeouts.script
+        except Exception:
+            return DEFAULT_SCRIPT_TIMEOUT
+
+    def _run_async(self, script: str, timeout: float, *args) -> dict:
+        # The driver is pooled: put its script timeout back for the next user
+        previous = self._script_timeout()
+        self.driver.set_script_timeout(timeout + 2)
+        try:
+            self.state = self.driver.execute_async_script(script, *args, int(timeout * 1000)) or {}
+        finally:
+            self.driver.set_script_timeout(previous)
+        return self.state
+
+    def play_query(self, query: str, timeout: float = 15) -> dict:
+        """In-app search, open the first result and return once it is playing (one call)"""
+        self.ensure()
+        return self._run_async(_PLAY_QUERY, timeout, query)
+
+    def click_and_play(self, element, timeout: float = 15) -> dict:
+        """Click a video link and return once it is playing"""
+        self.ensure()
+        return self._run_async(_CLICK_AND_PLAY, timeout, element)
 
     # ------------------
     # PLAYBACK
     # ------------------
     def play_pause(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.paused ? v.play() : v.pause();
-        """)
+        return self.dispatch("play_pause")
 
     def pause(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.pause();
-        """)
+        return self.dispatch("pause")
 
     def play(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.play();
-        """)
+        return self.dispatch("play")
 
     def stop(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.pause();
-            v.currentTime = 0;
-        """)
+        return self.dispatch("stop")
 
     def restart(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.currentTime = 0;
-        """)
+        return self.dispatch("restart")
 
     # ------------------
     # VOLUME
     # ------------------
     def set_volume(self, value: float):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.volume = arguments[0];
-        """, max(0.0, min(1.0, value)))
+        return self.dispatch("set_volume", max(0.0, min(1.0, value)))
 
     def volume_up(self, step=0.1):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.volume = Math.min(1, v.volume + arguments[0]);
-        """, step)
+        return self.dispatch("volume_up", step)
 
     def volume_down(self, step=0.1):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.volume = Math.max(0, v.volume - arguments[0]);
-        """, step)
+        return self.dispatch("volume_down", step)
 
     def mute(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.muted = true;
-        """)
+        return self.dispatch("mute")
 
     def unmute(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.muted = false;
-        """)
+        return self.dispatch("unmute")
 
     # ------------------
     # SEEKING
     # ------------------
     def seek(self, seconds: int):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.currentTime += arguments[0];
-        """, seconds)
+        return self.dispatch("seek", seconds)
 
     def seek_to_start(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.currentTime = 0;
-        """)
+        return self.dispatch("seek_to_start")
 
     def seek_to_end(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.currentTime = v.duration;
-        """)
+        return self.dispatch("seek_to_end")
 
     # ------------------
     # SPEED
     # ------------------
     def set_speed(self, speed: float):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.playbackRate = arguments[0];
-        """, speed)
+        return self.dispatch("set_speed", speed)
 
     def speed_up(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.playbackRate = Math.min(2, v.playbackRate + 0.25);
-        """)
+        return self.dispatch("speed_up")
 
     def speed_down(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.playbackRate = Math.max(0.25, v.playbackRate - 0.25);
-        """)
+        return self.dispatch("speed_down")
 
     # ------------------
     # VIEW MODES
     # ------------------
     def fullscreen(self):
-        self.driver.execute_script("""
-            const v = document.querySelector('video');
-            if (!v) return;
-            v.requestFullscreen();
-        """)
+        return self.dispatch("fullscreen")
 
     def exit_fullscreen(self):
-        self.driver.execute_script("""
-            if (document.fullscreenElement) document.exitFullscreen();
-        """)
+        return self.dispatch("exit_fullscreen")
 
     def theater_mode(self):
-        self.driver.execute_script("""
-            const el = document.querySelector('ytd-watch-flexy');
-            if (!el) return;
-            el.setAttribute('theater-requested_', '');
-        """)
+        return self.dispatch("theater_mode")
 
     # ------------------
     # CAPTIONS
     # ------------------
     def toggle_captions(self):
-        self.driver.execute_script("""
-            const btn = document.querySelector('.ytp-subtitles-button');
-            if (btn) btn.click();
-        """)
+        return self.dispatch("toggle_captions")
@@ -7,7 +7,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from urllib.parse import quote_plus
 
 try:
     from BACKEND.automations.youtube.youtube_automation_config import get_settings
@@ -15,6 +15,7 @@ except ImportError:
     get_settings = None
 
 from BACKEND.automations.youtube.yt_exceptions import YouTubeSearchError
+from BACKEND.automations.youtube.yt_player import YouTubePlayer
 
 
 def search_only(driver, query: str):
@@ -50,26 +51,35 @@ def search_only(driver, query: str):
         )
 
 
-def search_and_play_first(driver, query: str):
-    # ALWAYS force YouTube search URL
-    driver.get(
-        f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
-    )
+def search_and_play_first(driver, query: str, player=None):
+    """
+    Plays the first video for query; returns the player state once it plays.
+
+    Fast path: in-app search through the player shim, one async call that
+    returns on the video's "playing" event. Falls back to loading the results
+    URL (e.g. the tab is not on YouTube yet) and clicking the first video.
+    """
+    player = player or YouTubePlayer(driver)
+    timeout = get_settings().search_timeout if get_settings else 20
+
+    try:
+        state = player.play_query(query, timeout)
+        if not state.get("error"):
+            if state.get("timeout"):
+                print(f"⚠️ '{query}' opened but did not start playing within {timeout}s")
+            return state
+        print(f"🔄 In-app search unavailable ({state['error']}), loading results page")
+    except Exception as e:
+        print(f"🔄 In-app search failed ({e}), loading results page")
 
-    first_video = WebDriverWait(driver, 20).until(
+    driver.get(f"https://www.youtube.com/results?search_query={quote_plus(query)}")
+
+    first_video = WebDriverWait(driver, timeout).until(
         EC.presence_of_element_located(
             (By.CSS_SELECTOR, "ytd-video-renderer a#video-title")
         )
     )
-
-    driver.execute_script(
-        "arguments[0].scrollIntoView({block: 'center'});",
-        first_video
-    )
-
-    driver.execute_script(
-        "arguments[0].click();",
-        first_video
-    )
-
-    time.sleep(2)
+    state = player.click_and_play(first_video, timeout)
+    if state.get("timeout"):
+        print(f"⚠️ '{query}' opened but did not start playing within {timeout}s")
+    return state
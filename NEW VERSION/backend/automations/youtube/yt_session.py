@@ -1,53 +1,31 @@
 # BACKEND/automations/youtube/yt_session.py
-from BACKEND.automations.browser.browser_factory import create_browser
-from selenium.common.exceptions import (
-    WebDriverException,
-    InvalidSessionIdException
-)
+from BACKEND.automations.browser.browser_pool import BrowserPool
+
+TAB = "youtube"
 
 
 class YouTubeSession:
+    """
+    The YouTube tab of the shared browser (see BrowserPool).
+    No health round trip per call; report_failure() checks the browser after a failed command.
+    """
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.driver = None
+            cls._instance.pool = BrowserPool()
         return cls._instance
 
-    def _create_driver(self):
-        self.driver = create_browser()
-        try:
-            self.driver.set_page_load_timeout(15)
-        except Exception:
-            pass
-        self.driver.get("https://www.youtube.com")
-
     def get_driver(self):
-        """
-        Always returns a VALID driver.
-        Recreates driver if browser was closed or crashed.
-        """
-        try:
-            if self.driver is None:
-                raise WebDriverException("Driver not initialized")
-
-            if not self.driver.window_handles:
-                raise WebDriverException("No active window")
-            # 🔥 This line is CRITICAL
-            _ = self.driver.current_url
-
-            return self.driver
-
-        except (WebDriverException, InvalidSessionIdException):
-            # Browser was closed / crashed / disconnected
-            self._create_driver()
-            return self.driver
+        return self.pool.driver(TAB)
+
+    def lease(self):
+        """Hold the shared browser for one command"""
+        return self.pool.lease()
+
+    def report_failure(self):
+        self.pool.check()
 
     def close(self):
-        try:
-            if self.driver:
-                self.driver.quit()
-        except Exception:
-            pass
-        self.driver = None
+        self.pool.close_tab(TAB)
@@ -0,0 +1,108 @@
+# BACKEND/benchmarks/bench_brain_learn.py
+"""
+JarvisBrain.learn() latency benchmark.
+
+Usage:
+    python -m BACKEND.benchmarks.bench_brain_learn [--sizes 1000 10000 100000] [--legacy]
+
+For each store size N the brain is pre-loaded with N learned patterns, then
+`learn()` and `predict()` are timed for fresh corrections. With --legacy the
+old behaviour (rewrite intents.json + full GridSearchCV) is timed once at the
+smallest size for comparison.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from BACKEND.core.brain.model import JarvisBrain
+
+INTENTS = ["open_item", "close_item", "check_time", "greet", "youtube_play", "google_search"]
+WORDS = [
+    "open", "close", "play", "search", "time", "hello", "chrome", "music", "song",
+    "video", "news", "weather", "kholo", "chalao", "batao", "jarvis", "please", "now",
+]
+
+
+def _phrase(rng, i):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))) + f" {i}"
+
+
+def _dataset(rng, n):
+    data = {intent: [] for intent in INTENTS}
+    for i in range(n):
+        data[rng.choice(INTENTS)].append(_phrase(rng, i))
+    return data
+
+
+def bench_size(n, samples, rng):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        data_path = os.path.join(temp_dir, "intents.json")
+        with open(data_path, "w", encoding="utf-8") as f:
+            json.dump(_dataset(rng, 60), f)
+
+        with redirect_stdout(StringIO()):
+            brain = JarvisBrain(data_path, os.path.join(temp_dir, "model.pkl"), retrain_delay=None)
+        brain.memory.add_many((_phrase(rng, i), rng.choice(INTENTS)) for i in range(n))
+
+        learn_ms, predict_ms = [], []
+        with redirect_stdout(StringIO()):
+            for i in range(samples):
+                text = _phrase(rng, n + i)
+                t0 = time.perf_counter()
+                brain.learn(text, rng.choice(INTENTS))
+                learn_ms.append((time.perf_counter() - t0) * 1000)
+
+                t0 = time.perf_counter()
+                brain.predict(_phrase(rng, -i))
+                predict_ms.append((time.perf_counter() - t0) * 1000)
+
+        return statistics.median(learn_ms), max(learn_ms), statistics.median(predict_ms)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def bench_legacy(n, rng):
+    temp_dir = tempfile.mkdtemp()
+    try:
+        data_path = os.path.join(temp_dir, "intents.json")
+        with open(data_path, "w", encoding="utf-8") as f:
+            json.dump(_dataset(rng, n), f)
+        with redirect_stdout(StringIO()):
+            brain = JarvisBrain(data_path, os.path.join(temp_dir, "model.pkl"), retrain_delay=None)
+            t0 = time.perf_counter()
+            brain._merge_journal()
+            brain.train_initial_model()
+        return (time.perf_counter() - t0) * 1000
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JarvisBrain.learn() latency benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'patterns':>9} {'learn p50 ms':>13} {'learn max ms':>13} {'predict p50 ms':>15}")
+    for n in args.sizes:
+        p50, worst, predict_p50 = bench_size(n, args.samples, rng)
+        print(f"{n:>9} {p50:>13.3f} {worst:>13.3f} {predict_p50:>15.3f}")
+
+    if args.legacy:
+        n = min(args.sizes)
+        print(f"\nLegacy full retrain at {n} patterns: {bench_legacy(n, rng):.0f} ms per learn()")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# BACKEND/benchmarks/bench_command_rules.py
+"""
+Per-command preprocessing cost: legacy Hinglish normalizer + keyword scans
+vs the compiled rule engine.
+
+Usage:
+    python -m BACKEND.benchmarks.bench_command_rules [--runs 2000] [--file commands.txt]
+
+--file takes one command per line (e.g. exported from the GUI chat log);
+without it a built-in corpus of typical commands is used. Preprocessing =
+normalization, wake word, gesture parse and the browser/battery fast paths,
+i.e. everything Synex does to a command before the intent model.
+"""
+
+import argparse
+import re
+import statistics
+import time
+
+from BACKEND.core.language.rules import SYNEX_RULES, RuleEngine, normalize_hinglish
+
+COMMANDS = [
+    "open youtube",
+    "youtube kholo",
+    "youtube pe arijit ke gaane chalao",
+    "play believer on youtube",
+    "search best laptops 2026 on google",
+    "google pe weather dhundho",
+    "send a message to rahul saying i am late",
+    "rahul ko message bhej do ki main late hun",
+    "what's the weather in mumbai",
+    "mausam batao",
+    "battery status",
+    "is the charger plugged in",
+    "check internet speed",
+    "what is my ip address",
+    "scroll down",
+    "next tab",
+    "close tab",
+    "chrome band karo",
+    "go back",
+    "refresh the page",
+    "gesture mode on",
+    "gesture control off",
+    "hey jarvis",
+    "wake up synex",
+    "what time is it",
+    "volume up",
+    "volume kam karo",
+    "goodbye",
+    "hello",
+    "notepad open kar do",
+    "open github website",
+    "new tab",
+    "previous tab",
+    "scroll to the bottom",
+    "set a meeting tomorrow at 5 pm",
+    "refresh contacts",
+    "मौसम कैसा है",
+    "जाग जाओ",
+]
+
+
+# ================================
+# LEGACY (pre-rule-engine Synex methods)
+# ================================
+def legacy_normalize(text):
+    t = text.lower()
+    phrase_rules = [
+        (r"\b(open|kholo|khol)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "open"),
+        (r"\b(search|dhundho|dhundo|khojo)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "search"),
+        (r"\b(play|chalao|bajao|bjao)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "play"),
+        (r"\b(close|band)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "close"),
+        (r"\b(send|bhejo|bhej do)\b", "send"),
+        (r"\b(batao|tell)\b", "tell"),
+        (r"\b(dikhao|dikhaao|dikhayo|show)\b", "show"),
+    ]
+    for pattern, repl in phrase_rules:
+        t = re.sub(pattern, repl, t, flags=re.IGNORECASE)
+    word_rules = {
+        "kholo": "open", "khol": "open", "band": "close", "bnd": "close",
+        "dhundho": "search", "dhundo": "search", "khojo": "search",
+        "chalao": "play", "bajao": "play", "bjao": "play", "bhejo": "send",
+        "batao": "tell", "dikhao": "show", "gaana": "song", "gaane": "songs",
+    }
+    t = " ".join(word_rules.get(tok, tok) for tok in t.split())
+    return re.sub(r"\b(kro|karo|kar do|kr do|krdo|kardo|krna|karna)\b", "", t, flags=re.IGNORECASE)
+
+
+def legacy_wake(t):
+    phrases = ["jarvis", "jarvish", "jaarvis", "jervis", "synex", "wake up", "wakeup", "wake",
+               "vek ap", "vek up", "वेक अप", "वेक", "जागो", "जाग जाओ"]
+    return any(p in t for p in phrases)
+
+
+def legacy_gesture(t):
+    if "gesture" not in t:
+        return None
+    if any(k in t for k in ["on", "enable", "start", "activate"]):
+        return "on"
+    if any(k in t for k in ["off", "disable", "stop", "deactivate"]):
+        return "off"
+    return "toggle"
+
+
+def legacy_battery(t):
+    if any(w in t for w in ["battery", "charge", "charging", "charger", "power"]):
+        if any(w in t for w in ["plug", "plugged", "plugged in", "on charge", "charging", "charger"]):
+            return "check_battery_plug"
+        return "check_battery_percentage"
+    return None
+
+
+def legacy_browser(t):
+    if any(w in t for w in ["search", "google"]):
+        q = t.replace("search", "", 1).replace("on google", "").replace("google", "", 1).strip()
+        if q:
+            return "google_search", q
+    if "open" in t or "website" in t:
+        name = t.replace("open", "", 1).replace("website", "", 1).strip()
+        if name:
+            return "open_item", name
+    if "close tab" in t or "close" in t:
+        return "close_item", None
+    for keys, intent in (
+        (("new tab", "open new tab"), "browser_new_tab"), (("next tab",), "browser_next_tab"),
+        (("previous tab", "prev tab"), "browser_previous_tab"), (("back",), "browser_back"),
+        (("forward",), "browser_forward"), (("refresh", "reload"), "browser_refresh"),
+        (("scroll down",), "browser_scroll_down"), (("scroll up",), "browser_scroll_up"),
+        (("scroll top",), "browser_scroll_top"), (("scroll bottom",), "browser_scroll_bottom"),
+    ):
+        if any(k in t for k in keys):
+            return intent, None
+    return None, None
+
+
+def legacy_preprocess(text):
+    t = " ".join(legacy_normalize(" ".join(text.split())).split())
+    legacy_wake(t)
+    legacy_gesture(t)
+    legacy_battery(t)
+    legacy_browser(t)
+    return t
+
+
+# ================================
+# RULE ENGINE
+# ================================
+RULES = RuleEngine(SYNEX_RULES)
+
+
+def rules_preprocess(text):
+    t = " ".join(normalize_hinglish(" ".join(text.split())).split())
+    hits = RULES.scan(t)
+    RULES.match(t, group="wake", hits=hits)
+    RULES.match(t, group="gesture", hits=hits)
+    RULES.match(t, hits=hits)
+    return t
+
+
+def bench(fn, commands, runs):
+    per_command = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for text in commands:
+            fn(text)
+        per_command.append((time.perf_counter() - t0) * 1e6 / len(commands))
+    return statistics.median(per_command), min(per_command)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Command preprocessing micro-benchmark")
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--file", help="newline separated commands")
+    args = parser.parse_args()
+
+    commands = COMMANDS
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            commands = [line.strip() for line in f if line.strip()]
+
+    # Warm-up (compiles the legacy regexes into re's cache)
+    for text in commands:
+        legacy_preprocess(text)
+        rules_preprocess(text)
+
+    print(f"{len(commands)} commands, {args.runs} runs")
+    print(f"{'implementation':<16} {'p50 us/cmd':>11} {'best us/cmd':>12}")
+    for name, fn in (("legacy", legacy_preprocess), ("rule engine", rules_preprocess)):
+        p50, best = bench(fn, commands, args.runs)
+        print(f"{name:<16} {p50:>11.2f} {best:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# BACKEND/benchmarks/bench_gesture_classifier.py
+"""
+Per-frame classification + smoothing cost and accuracy over a landmark replay:
+legacy dist()-based rules + shared-deque smoother vs vectorized features with
+the rule / learned classifiers and the per-instance O(1) smoother.
+
+Usage:
+    python -m BACKEND.benchmarks.bench_gesture_classifier [--frames 3000] [--noise 0.003] [--file session.npz]
+
+--file takes an .npz with `points` (N, 21, 3) and `labels` (N,) recorded
+from the camera; without it a synthetic session is generated. The learned
+model is always trained on a separate synthetic session.
+"""
+
+import argparse
+import statistics
+import time
+from collections import deque
+
+import numpy as np
+
+from BACKEND.gestures.config import GESTURE_BUFFER_SIZE, V_SIGN_MIN_SPREAD_RATIO
+from BACKEND.gestures.detection.gesture_classifier import ModelGestureClassifier, RuleGestureClassifier
+from BACKEND.gestures.detection.gesture_smoother import GestureSmoother
+from BACKEND.gestures.detection.landmark_features import extract_features, feature_vector
+from BACKEND.gestures.detection.synthetic_hands import as_landmarks, synthetic_session
+
+
+# ================================
+# LEGACY (pre-vectorization classifier + smoother)
+# ================================
+def dist(a, b):
+    return ((a.x - b.x) ** 2 + (a.y - b.y) ** 2) ** 0.5
+
+
+def legacy_classify(lm):
+    wrist = lm.landmark[0]
+
+    def finger_up(tip, pip):
+        return dist(lm.landmark[tip], wrist) > dist(lm.landmark[pip], wrist)
+
+    index_up = finger_up(8, 6)
+    middle_up = finger_up(12, 10)
+    ring_up = finger_up(16, 14)
+    pinky_up = finger_up(20, 18)
+    thumb_open = dist(lm.landmark[4], lm.landmark[17]) > dist(lm.landmark[3], lm.landmark[17])
+    thumb_closed = not thumb_open
+
+    if index_up and thumb_closed and not (middle_up or ring_up or pinky_up):
+        return "INDEX_ONLY"
+    if index_up and middle_up and not ring_up and not pinky_up:
+        hand_size = dist(lm.landmark[0], lm.landmark[9])
+        if hand_size > 0 and dist(lm.landmark[8], lm.landmark[12]) / hand_size >= V_SIGN_MIN_SPREAD_RATIO:
+            return "V_SIGN"
+        return "TWO_FINGER_CLOSE"
+    if not (index_up or middle_up or ring_up or pinky_up or thumb_open):
+        return "FIST"
+    if thumb_open and index_up and not (middle_up or ring_up or pinky_up):
+        if dist(lm.landmark[4], lm.landmark[8]) > 0.025:
+            return "VOLUME_PINCH"
+    return "NONE"
+
+
+legacy_buffer = deque(maxlen=GESTURE_BUFFER_SIZE)
+
+
+def legacy_smooth(raw):
+    legacy_buffer.append(raw)
+    if len(legacy_buffer) < GESTURE_BUFFER_SIZE:
+        return "STABILIZING"
+    best = max(set(legacy_buffer), key=legacy_buffer.count)
+    return best if legacy_buffer.count(best) > GESTURE_BUFFER_SIZE * 0.8 else "TRANSITIONING"
+
+
+# ================================
+# RUNNERS
+# ================================
+def run_legacy(landmarks, points):
+    legacy_buffer.clear()
+    raw, smoothed = [], []
+    for lm in landmarks:
+        r = legacy_classify(lm)
+        raw.append(r)
+        smoothed.append(legacy_smooth(r))
+    return raw, smoothed
+
+
+def make_runner(classifier):
+    """Live path: one landmark object -> array conversion per frame."""
+
+    def run(landmarks, points):
+        smoother = GestureSmoother()
+        raw, smoothed = [], []
+        for lm in landmarks:
+            r = classifier.classify(extract_features(lm))
+            raw.append(r)
+            smoothed.append(smoother.update(r))
+        return raw, smoothed
+
+    return run
+
+
+def make_batch_runner(classifier):
+    """Replay path: the whole (N, 21, 3) sequence classified in one call."""
+
+    def run(landmarks, points):
+        smoother = GestureSmoother()
+        raw = classifier.classify_batch(points).tolist()
+        return raw, [smoother.update(r) for r in raw]
+
+    return run
+
+
+def accuracy(predicted, labels):
+    return float(np.mean([p == t for p, t in zip(predicted, labels)]))
+
+
+def steady(smoothed, labels):
+    """(accuracy over frames with a settled gesture, fraction of frames settled)"""
+    pairs = [(s, t) for s, t in zip(smoothed, labels) if s not in ("STABILIZING", "TRANSITIONING")]
+    if not pairs:
+        return 0.0, 0.0
+    return accuracy(*zip(*pairs)), len(pairs) / len(smoothed)
+
+
+def flicker(smoothed):
+    """Changes of the emitted output per 100 frames, drop-outs included (lower = steadier)."""
+    changes = sum(a != b for a, b in zip(smoothed, smoothed[1:]))
+    return 100.0 * changes / max(1, len(smoothed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture classification replay benchmark")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--noise", type=float, default=0.006)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--file", help=".npz with points (N, 21, 3) and labels (N,)")
+    args = parser.parse_args()
+
+    if args.file:
+        data = np.load(args.file, allow_pickle=False)
+        points, labels = data["points"], [str(l) for l in data["labels"]]
+    else:
+        points, labels = synthetic_session(frames=args.frames, seed=1, noise=args.noise)
+
+    train_points, train_labels = synthetic_session(frames=3000, seed=99, noise=args.noise)
+    model = ModelGestureClassifier.train(feature_vector(train_points), train_labels)
+
+    # MediaPipe hands us landmark objects; conversion is part of the per-frame cost
+    landmarks = [as_landmarks(p) for p in points]
+
+    print(f"{len(landmarks)} frames, {args.runs} runs")
+    print(
+        f"{'implementation':<22} {'p50 us/frame':>13} {'raw acc':>8} "
+        f"{'steady acc':>11} {'settled':>8} {'flicker/100':>12}"
+    )
+    for name, fn in (
+        ("legacy", run_legacy),
+        ("vectorized rules", make_runner(RuleGestureClassifier())),
+        ("learned model", make_runner(model)),
+        ("rules, batch replay", make_batch_runner(RuleGestureClassifier())),
+        ("model, batch replay", make_batch_runner(model)),
+    ):
+        times = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            raw, smoothed = fn(landmarks, points)
+            times.append((time.perf_counter() - t0) * 1e6 / len(landmarks))
+        steady_acc, settled = steady(smoothed, labels)
+        print(
+            f"{name:<22} {statistics.median(times):>13.2f} {accuracy(raw, labels):>8.3f} "
+            f"{steady_acc:>11.3f} {settled:>8.3f} {flicker(smoothed):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# BACKEND/benchmarks/bench_gesture_replay.py
+"""
+Headless gesture hot-path benchmark: replays a recording through the real
+GestureManager with recording action sinks (no pycaw / pyautogui / ctypes).
+
+Usage:
+    python -m BACKEND.benchmarks.bench_gesture_replay [--file session.npz] [--mode landmarks|frames]
+        [--runs 3] [--realtime] [--budget-ms 2.0]
+
+1. Deterministic replay (ReplayClock, one frame at a time): per-stage
+   latency, gesture decision latency per labelled gesture, action counts;
+   every run must produce identical decisions.
+2. Threaded pipeline (grab / infer / render threads): end-to-end FPS and
+   per-stage latency, as when the webcam drives it.
+
+Without --file a labelled synthetic landmark session is used. --mode frames
+needs a recording with camera frames (GestureRecorder(keep_frames=True)) and
+MediaPipe. With --budget-ms the exit code is 1 when the p95 per-frame cost
+exceeds the budget or decisions differ between runs, so it can gate a release.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from BACKEND.gestures.actions import RecordingActions
+from BACKEND.gestures.gesture_manager import GestureManager
+from BACKEND.gestures.replay import (
+    GestureRecording,
+    LandmarkReplayStream,
+    ReplayCameraStream,
+    ReplayClock,
+    decision_latencies,
+    replay,
+    synthetic_recording,
+)
+
+
+def make_stream(recording, mode, realtime):
+    cls = LandmarkReplayStream if mode == "landmarks" else ReplayCameraStream
+    return cls(recording, realtime=realtime)
+
+
+def deterministic_run(recording, mode):
+    clock = ReplayClock()
+    actions = RecordingActions(clock)
+    manager = GestureManager(
+        camera=make_stream(recording, mode, realtime=False),
+        actions=actions,
+        clock=clock,
+        active=True,
+        on_frame=lambda frame: None,
+    )
+    result = replay(manager, recording, clock, landmark_only=(mode == "landmarks"))
+    decisions = result.events + [(e.time, e.action, e.args) for e in actions.events]
+    return result, actions, decisions
+
+
+def threaded_run(recording, mode, realtime):
+    manager = GestureManager(
+        camera=make_stream(recording, mode, realtime),
+        actions=RecordingActions(),
+        active=True,
+        on_frame=lambda frame: None,
+    )
+    t0 = time.perf_counter()
+    manager.run()
+    elapsed = time.perf_counter() - t0
+    return manager.get_stats(), elapsed
+
+
+def pct(values, q):
+    return float(np.percentile(values, q)) if len(values) else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture replay benchmark")
+    parser.add_argument("--file", help="recording .npz (GestureRecorder / GestureRecording.save)")
+    parser.add_argument("--frames", type=int, default=1800, help="synthetic session length")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=("landmarks", "frames"), default="landmarks")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--realtime", action="store_true", help="pace the threaded run to the recorded timestamps")
+    parser.add_argument("--budget-ms", type=float, help="fail if p95 per-frame cost exceeds this")
+    args = parser.parse_args()
+
+    recording = GestureRecording.load(args.file) if args.file else synthetic_recording(args.frames, seed=args.seed)
+    print(f"{len(recording)} frames, {recording.duration:.1f} s recorded, mode={args.mode}")
+
+    # ---------- deterministic replay ----------
+    runs = [deterministic_run(recording, args.mode) for _ in range(args.runs)]
+    deterministic = all(decisions == runs[0][2] for _, _, decisions in runs[1:])
+    infer = np.concatenate([r.infer_ms for r, _, _ in runs])
+    render = np.concatenate([r.render_ms for r, _, _ in runs])
+    frame = infer + render
+
+    print(f"\n{'stage':<10} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, values in (("inference", infer), ("render", render), ("frame", frame)):
+        print(f"{name:<10} {pct(values, 50):>8.3f} {pct(values, 95):>8.3f} {values.max():>8.3f}")
+
+    result, actions, _ = runs[0]
+    if recording.labels is not None:
+        print(f"\n{'gesture':<18} {'segments':>8} {'detected':>9} {'p50 ms':>8} {'max ms':>8}")
+        for gesture, entry in sorted(decision_latencies(recording, result.events).items()):
+            lat = np.array(entry["latencies"]) * 1000.0
+            p50 = f"{np.median(lat):>8.0f}" if len(lat) else f"{'-':>8}"
+            worst = f"{lat.max():>8.0f}" if len(lat) else f"{'-':>8}"
+            print(f"{gesture:<18} {entry['segments']:>8} {entry['detected']:>9} {p50} {worst}")
+
+    counts = Counter(e.action for e in actions.events)
+    print("\nactions: " + (", ".join(f"{k}={v}" for k, v in sorted(counts.items())) or "none"))
+    print(f"deterministic over {args.runs} runs: {'yes' if deterministic else 'NO'}")
+
+    # ---------- threaded pipeline ----------
+    stats, elapsed = threaded_run(recording, args.mode, args.realtime)
+    rendered = stats["render"]["frames"]
+    print(f"\nthreaded pipeline: {rendered} frames rendered in {elapsed:.2f} s ({rendered / elapsed:.0f} FPS)")
+    print(f"{'stage':<12} {'latency ms':>11} {'frames':>8}")
+    for name in ("capture", "inference", "render", "end_to_end"):
+        print(f"{name:<12} {stats[name]['latency_ms']:>11.3f} {stats[name]['frames']:>8}")
+    print(f"dropped: capture={stats['dropped']['capture']} inference={stats['dropped']['inference']}")
+
+    failed = not deterministic
+    if args.budget_ms is not None and pct(frame, 95) > args.budget_ms:
+        print(f"\nFAIL: p95 frame cost {pct(frame, 95):.3f} ms > budget {args.budget_ms} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
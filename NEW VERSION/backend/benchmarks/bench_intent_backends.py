@@ -0,0 +1,91 @@
+# BACKEND/benchmarks/bench_intent_backends.py
+"""
+Intent classifier latency benchmark (PyTorch vs int8 ONNX).
+
+Usage:
+    python -m BACKEND.benchmarks.bench_intent_backends [--runs 50] [--batch 8]
+
+Reports load time, single-utterance latency (p50/p95) and per-item cost
+when batching, for every backend that is available on this machine.
+"""
+
+import argparse
+import statistics
+import time
+
+from BACKEND.core.brain.intent_backends import MODEL_DIR, create_backend, onnx_available
+
+COMMANDS = [
+    "open youtube",
+    "volume up",
+    "battery status",
+    "what's the weather in mumbai",
+    "send a message to rahul saying i am late",
+    "youtube pe arijit ke gaane chalao",
+    "search best laptops 2026 on google",
+    "check internet speed",
+    "scroll down",
+    "what time is it",
+]
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def bench_backend(name: str, runs: int, batch: int):
+    t0 = time.perf_counter()
+    backend = create_backend(name, MODEL_DIR)
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    # Warm-up
+    backend.predict_batch(COMMANDS[:2])
+
+    single = []
+    for i in range(runs):
+        text = COMMANDS[i % len(COMMANDS)]
+        t0 = time.perf_counter()
+        backend.predict_batch([text])
+        single.append((time.perf_counter() - t0) * 1000)
+
+    batched = []
+    texts = [COMMANDS[i % len(COMMANDS)] for i in range(batch)]
+    for _ in range(max(1, runs // batch)):
+        t0 = time.perf_counter()
+        backend.predict_batch(texts)
+        batched.append((time.perf_counter() - t0) * 1000 / batch)
+
+    return {
+        "backend": name,
+        "load_ms": load_ms,
+        "p50_ms": statistics.median(single),
+        "p95_ms": _percentile(single, 95),
+        "batched_per_item_ms": statistics.median(batched),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Intent backend latency benchmark")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=8)
+    args = parser.parse_args()
+
+    names = ["torch"]
+    if onnx_available(MODEL_DIR):
+        names.append("onnx")
+    else:
+        print("⚠️ ONNX model not exported, benchmarking PyTorch only")
+
+    print(f"{'backend':<8} {'load ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'batch/item ms':>14}")
+    for name in names:
+        r = bench_backend(name, args.runs, args.batch)
+        print(
+            f"{r['backend']:<8} {r['load_ms']:>9.0f} {r['p50_ms']:>8.2f} "
+            f"{r['p95_ms']:>8.2f} {r['batched_per_item_ms']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
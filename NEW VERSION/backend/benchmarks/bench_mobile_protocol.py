@@ -0,0 +1,140 @@
+# BACKEND/benchmarks/bench_mobile_protocol.py
+"""
+Mobile hub wire protocol benchmark: JSON text frames vs msgpack binary
+frames (with and without zlib) on a notification-heavy message mix.
+
+Usage:
+    python -m BACKEND.benchmarks.bench_mobile_protocol [--clients 4] [--messages 5000] [--seed 0]
+
+Every message is broadcast to all simulated clients and decoded on the
+other end, as the hub and the Android app would. "json (legacy)" is what
+send_json did before (json.dumps per client); the other rows go through
+ProtocolSession, encoding each body once per broadcast like ClientManager.
+Reported per message: server CPU (encode for all clients), client CPU
+(decode, one client) and bytes on the wire per client.
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+
+from BACKEND.mobile_hub.core.framing import (
+    KIND_MESSAGE,
+    PROTOCOL_JSON,
+    PROTOCOL_MSGPACK,
+    ProtocolSession,
+    encode_body,
+)
+
+APPS = ("WhatsApp", "Gmail", "Telegram", "Instagram", "Calendar", "Phone")
+WORDS = ("ok", "see", "you", "at", "the", "meeting", "tomorrow", "call", "me", "when", "free",
+         "sent", "a", "photo", "reminder", "🙂", "ça", "va", "delivery", "arriving", "today")
+
+
+def _text(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _notification(rng):
+    return {
+        "app": rng.choice(APPS),
+        "package": f"com.example.{rng.choice(APPS).lower()}",
+        "title": _text(rng, rng.randint(1, 3)),
+        "body": _text(rng, rng.randint(4, 30)),
+        "posted_at": 1767261600000 + rng.randint(0, 10**7),
+        "key": str(uuid.UUID(int=rng.getrandbits(128))),
+    }
+
+
+def message_mix(count, seed=0):
+    """Roughly what a phone sends/receives: mostly notifications, some syncs, heartbeats, commands."""
+    rng = random.Random(seed)
+    out = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.6:
+            msg_type, payload = "notification", _notification(rng)
+        elif roll < 0.7:
+            msg_type, payload = "notification_sync", {"items": [_notification(rng) for _ in range(rng.randint(5, 40))]}
+        elif roll < 0.85:
+            msg_type, payload = "heartbeat_ack", {}
+        else:
+            msg_type, payload = "response", {"status": "success", "message": _text(rng, 6), "data": None}
+        out.append({
+            "type": msg_type,
+            "payload": payload,
+            "timestamp": f"2026-01-01T10:{i // 60 % 60:02d}:{i % 60:02d}.000000",
+            "message_id": str(uuid.UUID(int=rng.getrandbits(128))),
+        })
+    return out
+
+
+def run_legacy(messages, clients):
+    send = recv = 0.0
+    size = 0
+    for message in messages:
+        t0 = time.perf_counter()
+        frames = [json.dumps(message) for _ in range(clients)]
+        t1 = time.perf_counter()
+        json.loads(frames[0])
+        t2 = time.perf_counter()
+        send += t1 - t0
+        recv += t2 - t1
+        size += len(frames[0].encode())
+    return send, recv, size
+
+
+def run_sessions(messages, clients, version, compression):
+    servers = [ProtocolSession(version, compression) for _ in range(clients)]
+    phone = ProtocolSession(version, compression)
+    send = recv = 0.0
+    size = 0
+    for message in messages:
+        t0 = time.perf_counter()
+        if version == PROTOCOL_JSON:
+            frames = [s.encode_message(message) for s in servers]
+        else:
+            flags, body = encode_body(message, compression)
+            frames = [s.frame(KIND_MESSAGE, flags, body) for s in servers]
+        t1 = time.perf_counter()
+        if version == PROTOCOL_JSON:
+            decoded = phone.decode_text(frames[0])
+        else:
+            _, decoded = phone.decode_binary(frames[0])
+        t2 = time.perf_counter()
+        send += t1 - t0
+        recv += t2 - t1
+        size += len(frames[0].encode()) if isinstance(frames[0], str) else len(frames[0])
+    assert decoded["message_id"] == messages[-1]["message_id"]
+    return send, recv, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mobile hub protocol benchmark")
+    parser.add_argument("--clients", type=int, default=4, help="simulated connected phones")
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    messages = message_mix(args.messages, args.seed)
+    n = len(messages)
+    print(f"{n} messages x {args.clients} clients")
+
+    rows = [
+        ("json (legacy)", lambda: run_legacy(messages, args.clients)),
+        ("json (v1)", lambda: run_sessions(messages, args.clients, PROTOCOL_JSON, False)),
+        ("msgpack (v2)", lambda: run_sessions(messages, args.clients, PROTOCOL_MSGPACK, False)),
+        ("msgpack+zlib (v2)", lambda: run_sessions(messages, args.clients, PROTOCOL_MSGPACK, True)),
+    ]
+    print(f"\n{'encoding':<18} {'server us/msg':>14} {'client us/msg':>14} {'bytes/msg':>10} {'vs legacy':>10}")
+    baseline = None
+    for name, run in rows:
+        send, recv, size = run()
+        baseline = baseline or size
+        print(f"{name:<18} {send / n * 1e6:>14.1f} {recv / n * 1e6:>14.1f} {size / n:>10.0f} {size / baseline:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# BACKEND/benchmarks/bench_recognition_fanout.py
+"""
+Sequential vs parallel multi-language recognition, against local stubs.
+
+Usage:
+    python -m BACKEND.benchmarks.bench_recognition_fanout [--runs 5]
+
+The stub replays typical per-language round-trip times so the numbers show
+the pipeline cost (fan-out, early cancellation, translation skipping)
+without depending on the network.
+"""
+
+import argparse
+import statistics
+import time
+
+from BACKEND.core.language.detector import needs_translation
+from BACKEND.core.listener.recognizers import LANGUAGES, ParallelRecognizer, StubRecognizer
+from BACKEND.core.listener.vad import Utterance
+
+TRANSLATE_SECONDS = 0.25
+
+# {language: (text, round trip seconds, confidence)}
+SCENARIOS = {
+    "english": {
+        "en-IN": ("what is the weather today", 0.35, 0.93),
+        "en-US": ("what is the weather today", 0.33, 0.91),
+        "hi-IN": ("वट इज द वेदर", 0.40, 0.41),
+    },
+    "hindi": {
+        "en-IN": ("", 0.35, None),
+        "en-US": ("", 0.33, None),
+        "hi-IN": ("आज मौसम कैसा है", 0.40, 0.88),
+    },
+    "hinglish": {
+        "en-IN": ("bhai aaj mausam kaisa hai", 0.36, 0.72),
+        "en-US": ("by I just mouse um", 0.34, 0.38),
+        "hi-IN": ("भाई आज मौसम कैसा है", 0.41, 0.86),
+    },
+}
+
+
+def translate_stub(text):
+    time.sleep(TRANSLATE_SECONDS)
+    return text
+
+
+def sequential(backend, utterance):
+    """The old SpeechListener.listen loop: en-IN, then en-US, then hi-IN."""
+    for language in LANGUAGES:
+        text, _ = backend.recognize_language(utterance, language)
+        if text:
+            return text
+    return ""
+
+
+def old_to_english(text):
+    # Translated everything except NO_TRANSLATE keyword sentences
+    return translate_stub(text)
+
+
+def new_to_english(text):
+    return translate_stub(text) if needs_translation(text) else text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recognition fan-out benchmark (stubbed)")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    utterance = Utterance(pcm=b"\0\0" * 16000)
+    print(f"{'scenario':<10} {'sequential ms':>14} {'parallel ms':>12} {'winner':>8}")
+    for name, results in SCENARIOS.items():
+        backend = StubRecognizer(results)
+        recognizer = ParallelRecognizer(backend)
+
+        seq, par = [], []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            old_to_english(sequential(backend, utterance))
+            seq.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            new_to_english(recognizer.recognize(utterance))
+            par.append((time.perf_counter() - t0) * 1000)
+
+        print(
+            f"{name:<10} {statistics.median(seq):>14.0f} {statistics.median(par):>12.0f} "
+            f"{recognizer.last_language:>8}"
+        )
+        recognizer.shutdown()
+
+
+if __name__ == "__main__":
+    main()
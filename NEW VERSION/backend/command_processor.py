@@ -13,6 +13,7 @@ from automations.calendar.meeting_flow import MeetingFlowHandler
 from automations.calendar.management_flow import CalendarManagementFlow
 
 from core.brain.model import JarvisBrain
+from core.language.rules import PROCESSOR_RULES, RuleEngine
 from core.brain.learner import JarvisLearner
 from automations.system.app_launcher import AppLauncher
 from automations.weather.weather_controller import WeatherController
@@ -20,6 +21,10 @@ from automations.automation_controller import AutomationController
 from automations.system.system_controller import SystemController
 
 
+# Keyword intents that skip the model, compiled once
+KEYWORD_RULES = RuleEngine(PROCESSOR_RULES)
+
+
 class CommandProcessor:
     """
     Processes user commands and dispatches them to appropriate automation modules.
@@ -122,45 +127,32 @@ class CommandProcessor:
         Main entry point for command processing.
         """
         text_lower = text.lower()
+        hits = KEYWORD_RULES.scan(text_lower)
+        cancel_flow, _ = KEYWORD_RULES.match(text_lower, group="flow", hits=hits)
         
         # 0. Check for Active Conversation Flows (e.g. Meeting Setup)
         if self.meeting_flow.active:
             # Check for cancellation
-            if any(w in text_lower for w in ["cancel", "stop", "exit", "never mind", "rehne do", "band karo", "abort", "cancel it", "discard"]):
+            if cancel_flow:
                 self.meeting_flow.reset()
                 return "Meeting scheduling cancelled."
             return self._handle_calendar(text)
             
         if self.management_flow and self.management_flow.active:
             # Check for cancellation
-            if any(w in text_lower for w in ["cancel", "stop", "exit", "never mind", "rehne do", "band karo", "abort", "cancel it", "discard"]):
+            if cancel_flow:
                 self.management_flow.reset()
                 return "Calendar management cancelled."
             return self.management_flow.handle(text)
 
-        # 1. AI Intent Prediction
-        intent, confidence = self.brain.predict(text)
-        # 0. Pre-processing for specific command patterns (Regex Fallback)
-        import re
-        if re.search(r"send (whatsapp|email) to", text_lower):
-            intent = "whatsapp_message" if "whatsapp" in text_lower else "email_message"
-            confidence = 1.0
-            print(f"DEBUG: Regex Match - Intent: {intent}")
-        elif re.search(r"\b(mute|unmute|silence|quiet|shant|chup)\b", text_lower):
-            intent = "volume_mute"
-            confidence = 1.0
-        elif re.search(r"\b(volume up|increase volume|volume badhao|awaaz badhao|loud)\b", text_lower):
-            intent = "volume_up"
+        # 1. Keyword fast path, otherwise the AI Brain detects the intent
+        intent, _ = KEYWORD_RULES.match(text_lower, hits=hits)
+        if intent:
             confidence = 1.0
-        elif re.search(r"\b(volume down|decrease volume|volume kam karo|awaaz kam karo|dheere)\b", text_lower):
-            intent = "volume_down"
-            confidence = 1.0
-        elif re.search(r"\b(brightness|chamak)\b", text_lower):
-            intent = "brightness_control"
-            confidence = 1.0
-        # 1. Use AI Brain to detect intent
-        intent, confidence = self.brain.predict(text)
-        print(f"AI Intent: {intent} ({confidence:.2f})")
+            print(f"Keyword Intent: {intent}")
+        else:
+            intent, confidence = self.brain.predict(text)
+            print(f"AI Intent: {intent} ({confidence:.2f})")
 
         # 2. Handle Routing
         social_intents = ["greet", "wellbeing", "identity", "capabilities", "status_update", "goodbye"]
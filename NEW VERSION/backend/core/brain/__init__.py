@@ -1,2 +1,10 @@
 # Path: d:\New folder (2) - JARVIS\backend\core\brain\__init__.py
-from .model import JarvisBrain
+# JarvisBrain pulls in scikit-learn; resolve it lazily so importing
+# BACKEND.core.brain.<module> stays cheap during startup.
+
+
+def __getattr__(name):
+    if name == "JarvisBrain":
+        from .model import JarvisBrain
+        return JarvisBrain
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
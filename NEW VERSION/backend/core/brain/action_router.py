@@ -1,20 +1,11 @@
 # BACKEND/core/brain/action_router.py
+import threading
 import traceback
 import time
 from datetime import datetime
-from BACKEND.automations.battery.battery_controller import BatteryController
-from BACKEND.automations.network.check_ip import check_ip_address
-from BACKEND.automations.network.check_speed import check_internet_speed
 
-from BACKEND.automations.youtube.yt_controller import YouTubeController
-
-from BACKEND.automations.google.google_controller import GoogleController
-from BACKEND.automations.google.google_session import GoogleBlockedError
-
-from BACKEND.automations.weather.weather_controller import WeatherController
-
-from BACKEND.automations.whatsapp.whatsapp_controller import WhatsAppController
-from BACKEND.automations.whatsapp.message_parser import parse_whatsapp_message
+# Automation controllers pull in selenium / pyautogui / requests stacks, so
+# they are imported and constructed on first use rather than at startup.
 
 
 class ActionRouter:
@@ -23,18 +14,77 @@ class ActionRouter:
     intent → automation execution
     """
 
-    def __init__(self, speaker):
+    # Fixed replies, pre-rendered into the speech audio cache at startup
+    CANNED_RESPONSES = (
+        "Hello! How can I help you today?",
+        "Sorry, I didn't understand that command.",
+        "What should I open?",
+        "I couldn't open that item.",
+        "I couldn't close that item.",
+        "What should I search on Google?",
+        "Which website should I open?",
+        "Opened a new tab.",
+        "Closed the active tab.",
+        "Switched to the next tab.",
+        "Switched to the previous tab.",
+        "Went back.",
+        "Went forward.",
+        "Refreshed the page.",
+        "Scrolled down.",
+        "Scrolled up.",
+        "Scrolled to the top.",
+        "Scrolled to the bottom.",
+        "You are connected to the internet.",
+        "Contacts refreshed.",
+        "There are no failed WhatsApp messages to resend.",
+        "Charger is plugged in.",
+        "Charger is unplugged.",
+    )
+
+    def __init__(self, speaker, notify=None):
         self.speaker = speaker
-        self.battery = BatteryController(speaker)
-        self.google = GoogleController()
-        self.weather = WeatherController()
+        self.notify = notify  # status of work that finishes after the reply (WhatsApp outbox)
+        self._battery = None  # Lazy initialization
+        self._google = None  # Lazy initialization
+        self._weather = None  # Lazy initialization
         self.whatsapp_controller = None  # Lazy initialization
+        self._whatsapp_outbox = None  # Lazy initialization
+        self._contacts = None  # Lazy initialization
         self.youtube_controller = None  # Lazy initialization
+        self._init_lock = threading.Lock()
+
+    @property
+    def battery(self):
+        if self._battery is None:
+            with self._init_lock:
+                if self._battery is None:
+                    from BACKEND.automations.battery.battery_controller import BatteryController
+                    self._battery = BatteryController(self.speaker)
+        return self._battery
+
+    @property
+    def google(self):
+        if self._google is None:
+            with self._init_lock:
+                if self._google is None:
+                    from BACKEND.automations.google.google_controller import GoogleController
+                    self._google = GoogleController()
+        return self._google
+
+    @property
+    def weather(self):
+        if self._weather is None:
+            with self._init_lock:
+                if self._weather is None:
+                    from BACKEND.automations.weather.weather_controller import WeatherController
+                    self._weather = WeatherController()
+        return self._weather
 
     def _get_youtube_controller(self):
         """Lazy initialization of YouTube controller"""
         if self.youtube_controller is None:
             try:
+                from BACKEND.automations.youtube.yt_controller import YouTubeController
                 self.youtube_controller = YouTubeController()
             except Exception as e:
                 print(f"❌ YouTube controller initialization failed: {e}")
@@ -45,12 +95,58 @@ class ActionRouter:
         """Lazy initialization of WhatsApp controller"""
         if self.whatsapp_controller is None:
             try:
+                from BACKEND.automations.whatsapp.whatsapp_controller import WhatsAppController
                 self.whatsapp_controller = WhatsAppController()
             except Exception as e:
                 print(f"❌ WhatsApp controller initialization failed: {e}")
                 raise
         return self.whatsapp_controller
 
+    @property
+    def whatsapp_outbox(self):
+        if self._whatsapp_outbox is None:
+            with self._init_lock:
+                if self._whatsapp_outbox is None:
+                    from BACKEND.automations.whatsapp.whatsapp_automation_config import get_settings
+                    from BACKEND.automations.whatsapp.whatsapp_outbox import WhatsAppOutbox
+                    self._whatsapp_outbox = WhatsAppOutbox(
+                        self._deliver_whatsapp, get_settings(), notify=self.notify
+                    ).start()
+        return self._whatsapp_outbox
+
+    @property
+    def contacts(self):
+        if self._contacts is None:
+            with self._init_lock:
+                if self._contacts is None:
+                    from BACKEND.automations.whatsapp.contact_index import ContactIndex
+                    from BACKEND.automations.whatsapp.whatsapp_automation_config import get_settings
+                    contacts = ContactIndex(get_settings())
+                    contacts.refresh()
+                    self._contacts = contacts
+        return self._contacts
+
+    def resume_whatsapp_outbox(self):
+        """
+        At boot: start the outbox when a previous run left messages queued.
+        Failed messages are not resent on their own; the user is told and
+        asks for it (whatsapp_resend_failed).
+        """
+        from BACKEND.automations.whatsapp.whatsapp_automation_config import get_settings
+        from BACKEND.automations.whatsapp.whatsapp_outbox import WhatsAppOutbox
+        settings = get_settings()
+        failed = WhatsAppOutbox.failed_count(settings)
+        if failed and self.notify is not None:
+            self.notify(f"{failed} WhatsApp message(s) from earlier couldn't be sent. "
+                        "Say 'resend failed WhatsApp messages' to try again.")
+        if WhatsAppOutbox.has_backlog(settings):
+            return self.whatsapp_outbox
+        return None
+
+    def shutdown(self):
+        if self._whatsapp_outbox is not None:
+            self._whatsapp_outbox.stop()
+
     def handle(self, intent: str, text: str):
         print(f"🎯 Handling intent: {intent}")
 
@@ -73,6 +169,12 @@ class ActionRouter:
             if intent == "whatsapp_send_message":
                 return self._handle_whatsapp_message(text)
 
+            if intent == "whatsapp_resend_failed":
+                count = self.whatsapp_outbox.replay_failed()
+                if not count:
+                    return "There are no failed WhatsApp messages to resend."
+                return f"Resending {count} failed WhatsApp message(s)."
+
             # =================================================
             # 🌦 WEATHER (ML-DRIVEN, SPEAKABLE)
             # =================================================
@@ -90,9 +192,12 @@ class ActionRouter:
             # =================================================
             # 🌐 GOOGLE AUTOMATION (ML ONLY)
             # =================================================
-            google_response = self._handle_google_automation(intent, text)
-            if google_response is not None:
-                return google_response
+            if intent.startswith(("google_", "browser_")):
+                # Shared browser with YouTube: hold it so no other command switches tabs mid-way
+                with self.google.session.lease():
+                    google_response = self._handle_google_automation(intent, text)
+                if google_response is not None:
+                    return google_response
 
             # =================================================
             # 🌐 NETWORK
@@ -121,6 +226,7 @@ class ActionRouter:
                 return "Login setup is not configured yet."
 
             if intent == "refresh_contacts":
+                print(f"📇 {self.contacts.refresh()} contacts indexed")
                 return "Contacts refreshed."
 
             if intent == "open_item":
@@ -132,14 +238,16 @@ class ActionRouter:
                 if not name:
                     return "What should I open?"
                 try:
-                    self.google.open_site(name)
+                    with self.google.session.lease():
+                        self.google.open_site(name)
                     return f"Opening {name}."
                 except Exception:
                     return "I couldn't open that item."
 
             if intent == "close_item":
                 try:
-                    self.google.close_tab()
+                    with self.google.session.lease():
+                        self.google.close_tab()
                     return "Closed the active tab."
                 except Exception:
                     return "I couldn't close that item."
@@ -172,29 +280,82 @@ class ActionRouter:
             return f"YouTube automation failed: {error_msg}"
 
     def _handle_whatsapp_message(self, text: str):
-        """Handle WhatsApp message sending with retry logic"""
-        max_retries = 2
+        """Queue a WhatsApp message (outbox) and reply at once; status follows via notify"""
+        from BACKEND.automations.whatsapp.message_parser import parse_whatsapp_message, split_recipients
+        from BACKEND.automations.whatsapp.whatsapp_automation_config import get_settings
 
-        for attempt in range(max_retries):
-            try:
-                # Parse message
-                contact, message = parse_whatsapp_message(text)
+        # Parse message
+        contact, message = parse_whatsapp_message(text)
+
+        if not contact:
+            return "I couldn't understand who to message. Please say something like 'Send a message to John saying Hello'"
 
-                if not contact:
-                    return "I couldn't understand who to message. Please say something like 'Send a message to John saying Hello'"
+        if not message:
+            return f"What would you like me to send to {contact}?"
 
-                if not message:
-                    return f"What would you like me to send to {contact}?"
+        settings = get_settings()
+        recipients = split_recipients(contact, settings._settings.get("contact_groups"))
+        recipients, question = self._resolve_contacts(recipients)
+        if question:
+            return question
+        names = recipients[0] if len(recipients) == 1 else f"{', '.join(recipients[:-1])} and {recipients[-1]}"
 
-                print(f"📱 Attempt {attempt + 1}: Sending to {contact}")
+        if not settings._settings.get("enable_message_queue", True):
+            return self._send_whatsapp_now(recipients, message, names)
+
+        from BACKEND.automations.whatsapp.whatsapp_outbox import OutboxFullError
+        try:
+            self.whatsapp_outbox.submit(recipients, message)
+        except OutboxFullError as e:
+            print(f"❌ {e}")
+            return "Too many WhatsApp messages are still waiting to be sent. Please try again in a moment."
+        print(f"📱 Queued WhatsApp message for {names}")
+        return f"Sending your message to {names}."
+
+    def _resolve_contacts(self, names):
+        """
+        Spoken names -> WhatsApp chat names via the contact index, before any
+        UI work. Returns (chats, None), or (None, question) when a name fits
+        several contacts. Names the index does not know are passed through
+        (group chats, or no contact list yet).
+        """
+        chats = []
+        for name in names:
+            resolution = self.contacts.resolve(name)
+            if resolution.status == "ambiguous":
+                options = [c.name for c in resolution.candidates[:3]]
+                listed = options[0] if len(options) == 1 else f"{', '.join(options[:-1])} or {options[-1]}"
+                return None, f"Which {name} do you mean: {listed}?"
+            chat = resolution.chat if resolution.status == "resolved" else name
+            if chat not in chats:
+                chats.append(chat)
+        return chats, None
+
+    def _deliver_whatsapp(self, items, on_sent):
+        """Outbox worker: one controller session for the batch"""
+        try:
+            self._get_whatsapp_controller().send_messages(items, on_sent)
+        except Exception:
+            # Fresh backend detection for the next attempt
+            self.whatsapp_controller = None
+            raise
+
+    def _send_whatsapp_now(self, recipients, message, names):
+        """Blocking send with retry logic (enable_message_queue off)"""
+        max_retries = 2
+        pending = [(recipient, message) for recipient in recipients]
+
+        for attempt in range(max_retries):
+            try:
+                print(f"📱 Attempt {attempt + 1}: Sending to {names}")
 
                 # Get WhatsApp controller (may trigger detection)
                 wa = self._get_whatsapp_controller()
 
-                # Send message
-                wa.send_message(contact, message)
+                # Send message(s) in one session; a retry skips the ones sent
+                wa.send_messages(list(pending), lambda contact, text: pending.pop(0))
 
-                return f"Message sent to {contact} successfully."
+                return f"Message sent to {names} successfully."
 
             except Exception as e:
                 error_msg = str(e)
@@ -284,38 +445,46 @@ class ActionRouter:
                 self.google.scroll_bottom()
                 return "Scrolled to the bottom."
 
-            # Handle other Google intents
+            # Handle other Google intents (names only, so unrelated intents
+            # never construct the browser controller)
             google_actions = {
-                "google_scroll_down": (self.google.scroll_down, None),
-                "google_scroll_up": (self.google.scroll_up, None),
-                "google_scroll_top": (self.google.scroll_top, None),
-                "google_scroll_bottom": (self.google.scroll_bottom, None),
-                "google_new_tab": (self.google.new_tab, None),
-                "google_close_tab": (self.google.close_tab, None),
-                "google_next_tab": (self.google.next_tab, None),
-                "google_previous_tab": (self.google.previous_tab, None),
-                "google_back": (self.google.back, None),
-                "google_forward": (self.google.forward, None),
-                "google_refresh": (self.google.refresh, None),
+                "google_scroll_down": "scroll_down",
+                "google_scroll_up": "scroll_up",
+                "google_scroll_top": "scroll_top",
+                "google_scroll_bottom": "scroll_bottom",
+                "google_new_tab": "new_tab",
+                "google_close_tab": "close_tab",
+                "google_next_tab": "next_tab",
+                "google_previous_tab": "previous_tab",
+                "google_back": "back",
+                "google_forward": "forward",
+                "google_refresh": "refresh",
             }
 
             if intent in google_actions:
-                action, response = google_actions[intent]
-                action()
-                return response
-
-        except GoogleBlockedError:
-            return (
-                "Google has temporarily blocked automation. "
-                "Please solve the captcha and try again."
-            )
+                getattr(self.google, google_actions[intent])()
+                return None
+
         except Exception as e:
+            from BACKEND.automations.google.google_session import GoogleBlockedError
+
+            if isinstance(e, GoogleBlockedError):
+                return (
+                    "Google has temporarily blocked automation. "
+                    "Please solve the captcha and try again."
+                )
             return f"Google automation failed: {str(e)}"
 
         return None
 
     def _handle_network_automation(self, intent: str):
         """Handle network-related queries"""
+        if intent not in ("check_internet_speed", "check_online_status", "check_ip"):
+            return None
+
+        from BACKEND.automations.network.check_ip import check_ip_address
+        from BACKEND.automations.network.check_speed import check_internet_speed
+
         try:
             if intent == "check_internet_speed":
                 return check_internet_speed(self.speaker)
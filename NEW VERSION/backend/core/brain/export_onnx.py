@@ -0,0 +1,70 @@
+# BACKEND/core/brain/export_onnx.py
+"""
+Export intent_xlm_roberta_1 to ONNX and quantize it to int8.
+
+Usage:
+    python -m BACKEND.core.brain.export_onnx [--model-dir PATH] [--keep-fp32]
+
+Writes `model.int8.onnx` next to the PyTorch weights. IntentClassifier picks
+it up automatically (SYNEX_INTENT_BACKEND=auto).
+"""
+
+import argparse
+import os
+
+from BACKEND.core.brain.intent_backends import MODEL_DIR, ONNX_MODEL_FILE, load_tokenizer
+
+FP32_MODEL_FILE = "model.fp32.onnx"
+
+
+def export(model_dir: str = MODEL_DIR, keep_fp32: bool = False, opset: int = 17) -> str:
+    import torch
+    from transformers import AutoModelForSequenceClassification
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    fp32_path = os.path.join(model_dir, FP32_MODEL_FILE)
+    int8_path = os.path.join(model_dir, ONNX_MODEL_FILE)
+
+    print(f"📦 Loading {model_dir}")
+    tokenizer = load_tokenizer(model_dir)
+    model = AutoModelForSequenceClassification.from_pretrained(
+        model_dir,
+        local_files_only=True
+    )
+    model.eval()
+
+    sample = tokenizer(["open youtube", "battery status"], return_tensors="pt", padding=True)
+
+    print(f"🔁 Exporting to {fp32_path}")
+    torch.onnx.export(
+        model,
+        (sample["input_ids"], sample["attention_mask"]),
+        fp32_path,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["logits"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "logits": {0: "batch"},
+        },
+        opset_version=opset,
+        do_constant_folding=True,
+    )
+
+    print(f"🗜  Quantizing to {int8_path}")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+
+    if not keep_fp32:
+        os.remove(fp32_path)
+
+    print("✅ ONNX export complete")
+    return int8_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the intent model to int8 ONNX")
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--keep-fp32", action="store_true")
+    parser.add_argument("--opset", type=int, default=17)
+    args = parser.parse_args()
+    export(args.model_dir, keep_fp32=args.keep_fp32, opset=args.opset)
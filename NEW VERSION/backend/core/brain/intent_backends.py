@@ -0,0 +1,203 @@
+# BACKEND/core/brain/intent_backends.py
+"""
+Inference backends for the transformer intent classifier.
+
+Both backends expose the same surface:
+
+    backend.predict_batch(["open youtube", "volume up"])
+    -> [("youtube_control", 0.97), ("volume_up", 0.91)]
+
+- TorchIntentBackend: the original PyTorch path (reference / fallback).
+- OnnxIntentBackend:  int8-quantized ONNX Runtime export, CPU-friendly.
+
+Heavy imports (torch, transformers, onnxruntime) are done lazily inside the
+backend constructors so importing this module stays cheap.
+"""
+
+import json
+import os
+
+BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+MODEL_DIR = os.path.join(BACKEND_ROOT, "DATA", "models", "intent_xlm_roberta_1")
+
+# File produced by core/brain/export_onnx.py
+ONNX_MODEL_FILE = "model.int8.onnx"
+
+# Upper bound on tokens per utterance; voice commands are short
+MAX_SEQ_LENGTH = 64
+
+
+def load_label_map(model_dir: str = MODEL_DIR) -> dict:
+    """Load label_map.json ({label: id}) from the model folder."""
+    label_map_path = os.path.join(model_dir, "label_map.json")
+    if not os.path.isfile(label_map_path):
+        raise RuntimeError(
+            f"Label map not found: {label_map_path}."
+        )
+    with open(label_map_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_tokenizer(model_dir: str = MODEL_DIR):
+    """Load the fast (Rust) tokenizer, falling back to the slow one if unavailable."""
+    from transformers import AutoTokenizer
+
+    try:
+        return AutoTokenizer.from_pretrained(
+            model_dir,
+            use_fast=True,
+            local_files_only=True
+        )
+    except Exception as e:
+        print(f"⚠️ Fast tokenizer unavailable ({e}), using slow tokenizer")
+        return AutoTokenizer.from_pretrained(
+            model_dir,
+            use_fast=False,
+            fix_mistral_regex=True,
+            local_files_only=True
+        )
+
+
+def _softmax(logits):
+    import numpy as np
+
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+class TorchIntentBackend:
+    """Reference PyTorch inference over the fine-tuned XLM-RoBERTa model."""
+
+    name = "torch"
+
+    def __init__(self, model_dir: str = MODEL_DIR):
+        import torch
+        from transformers import AutoModelForSequenceClassification
+
+        self._torch = torch
+        self.model_dir = model_dir
+        self.label_map = load_label_map(model_dir)
+        self.id_to_label = {v: k for k, v in self.label_map.items()}
+        self.tokenizer = load_tokenizer(model_dir)
+        self.model = AutoModelForSequenceClassification.from_pretrained(
+            model_dir,
+            local_files_only=True
+        )
+        self.model.eval()
+
+    def predict_batch(self, texts):
+        if not texts:
+            return []
+
+        torch = self._torch
+        inputs = self.tokenizer(
+            list(texts),
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=MAX_SEQ_LENGTH
+        )
+
+        with torch.inference_mode():
+            outputs = self.model(**inputs)
+
+        probs = torch.softmax(outputs.logits, dim=1)
+        confidence, pred = torch.max(probs, dim=1)
+
+        return [
+            (self.id_to_label[p], c)
+            for p, c in zip(pred.tolist(), confidence.tolist())
+        ]
+
+
+class OnnxIntentBackend:
+    """int8-quantized ONNX Runtime inference (see export_onnx.py)."""
+
+    name = "onnx"
+
+    def __init__(self, model_dir: str = MODEL_DIR, num_threads: int = 0):
+        import onnxruntime as ort
+
+        onnx_path = os.path.join(model_dir, ONNX_MODEL_FILE)
+        if not os.path.isfile(onnx_path):
+            raise RuntimeError(
+                f"ONNX model not found: {onnx_path}. "
+                "Run `python -m BACKEND.core.brain.export_onnx` first."
+            )
+
+        self.model_dir = model_dir
+        self.label_map = load_label_map(model_dir)
+        self.id_to_label = {v: k for k, v in self.label_map.items()}
+        self.tokenizer = load_tokenizer(model_dir)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            onnx_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def predict_batch(self, texts):
+        if not texts:
+            return []
+
+        encoded = self.tokenizer(
+            list(texts),
+            return_tensors="np",
+            padding=True,
+            truncation=True,
+            max_length=MAX_SEQ_LENGTH
+        )
+        feeds = {
+            name: value.astype("int64")
+            for name, value in encoded.items()
+            if name in self._input_names
+        }
+
+        logits = self.session.run(None, feeds)[0]
+        probs = _softmax(logits)
+        preds = probs.argmax(axis=1)
+
+        return [
+            (self.id_to_label[int(p)], float(probs[row, p]))
+            for row, p in enumerate(preds)
+        ]
+
+
+def onnx_available(model_dir: str = MODEL_DIR) -> bool:
+    """True when onnxruntime is installed and an exported model exists."""
+    if not os.path.isfile(os.path.join(model_dir, ONNX_MODEL_FILE)):
+        return False
+    try:
+        import onnxruntime  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_backend(name: str = "auto", model_dir: str = MODEL_DIR):
+    """
+    Build an inference backend.
+
+    name: "onnx", "torch" or "auto" (ONNX when exported, otherwise PyTorch).
+    """
+    name = (name or "auto").lower()
+
+    if name == "onnx":
+        return OnnxIntentBackend(model_dir)
+    if name == "torch":
+        return TorchIntentBackend(model_dir)
+    if name != "auto":
+        raise ValueError(f"Unknown intent backend: {name}")
+
+    if onnx_available(model_dir):
+        try:
+            return OnnxIntentBackend(model_dir)
+        except Exception as e:
+            print(f"⚠️ ONNX backend failed to load ({e}), falling back to PyTorch")
+    return TorchIntentBackend(model_dir)
@@ -0,0 +1,128 @@
+# BACKEND/core/brain/intent_batcher.py
+"""
+Micro-batching front-end for intent inference.
+
+Voice, the mobile MessageRouter and the GUI queue can all ask for a
+prediction at the same time. Instead of running one forward pass per
+utterance, callers submit text and a single worker thread groups whatever
+arrived within `max_wait_ms` (up to `max_batch_size`) into one
+`predict_batch` call.
+
+A lone caller only pays the wait window once, which is kept small.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+
+class IntentBatcher:
+    def __init__(self, predict_batch, max_batch_size: int = 16, max_wait_ms: float = 2.0):
+        self._predict_batch = predict_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+
+        # Stats
+        self.batches = 0
+        self.items = 0
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name="IntentBatcher",
+            daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue text for classification; resolves to (label, confidence)."""
+        future = Future()
+        if self._stopped.is_set():
+            future.set_exception(RuntimeError("IntentBatcher is stopped"))
+            return future
+        self._queue.put((text, future))
+        return future
+
+    def predict(self, text: str, timeout: float = None):
+        """Blocking helper around submit()."""
+        return self.submit(text).result(timeout=timeout)
+
+    def stop(self):
+        self._stopped.set()
+        self._queue.put(None)
+        if self._worker.is_alive() and self._worker is not threading.current_thread():
+            self._worker.join(timeout=1.0)
+
+    def get_stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": (self.items / self.batches) if self.batches else 0.0,
+        }
+
+    # ------------------------
+    # Worker
+    # ------------------------
+    def _collect(self, first):
+        batch = [first]
+        deadline = None
+        while len(batch) < self.max_batch_size:
+            try:
+                # Drain anything already queued without waiting
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                if self.max_wait <= 0:
+                    break
+                now = time.monotonic()
+                if deadline is None:
+                    deadline = now + self.max_wait
+                remaining = deadline - now
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = self._collect(first)
+            # Skip callers that cancelled while waiting
+            batch = [(t, f) for t, f in batch if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            texts = [t for t, _ in batch]
+            futures = [f for _, f in batch]
+
+            try:
+                results = self._predict_batch(texts)
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.items += len(texts)
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+        # Fail anything left behind after stop()
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].set_exception(RuntimeError("IntentBatcher is stopped"))
@@ -0,0 +1,189 @@
+# BACKEND/core/brain/intent_cache.py
+"""
+Two-tier cache for intent predictions.
+
+Tier 1: in-memory LRU keyed on the normalized command text.
+Tier 2: optional JSON file so the hot set survives restarts.
+
+Entries are tagged with a fingerprint of the model folder (file names,
+sizes and mtimes, including label_map.json). When the model is retrained
+or swapped the fingerprint changes and the whole cache is dropped.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from BACKEND.core.brain.intent_backends import BACKEND_ROOT, MODEL_DIR
+
+CACHE_FILE = os.path.join(BACKEND_ROOT, "DATA", "cache", "intent_cache.json")
+
+
+def normalize_key(text: str) -> str:
+    """Cache key for a command (callers already pass Synex._clean_text output)."""
+    if not text:
+        return ""
+    return " ".join(str(text).lower().split())
+
+
+def model_fingerprint(model_dir: str = MODEL_DIR) -> str:
+    """Cheap stat-based fingerprint of the model folder."""
+    if not os.path.isdir(model_dir):
+        return "missing"
+    parts = []
+    try:
+        with os.scandir(model_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                parts.append(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}")
+    except OSError:
+        return "unreadable"
+    return "|".join(parts)
+
+
+class IntentCache:
+    def __init__(
+        self,
+        max_size: int = 512,
+        model_dir: str = MODEL_DIR,
+        cache_file: str = None,
+        persist: bool = False,
+        check_interval: float = 5.0,
+    ):
+        self.max_size = max(1, int(max_size))
+        self.model_dir = model_dir
+        self.cache_file = cache_file or CACHE_FILE
+        self.persist = persist
+        self.check_interval = check_interval
+
+        self._entries = OrderedDict()  # key -> (label, confidence)
+        self._lock = threading.Lock()
+        self._fingerprint = model_fingerprint(model_dir)
+        self._last_check = time.monotonic()
+        self._dirty = False
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        if self.persist:
+            self.load()
+
+    # ------------------------
+    # Lookup
+    # ------------------------
+    def get(self, text: str):
+        """Return (label, confidence) or None."""
+        key = normalize_key(text)
+        self._maybe_invalidate()
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, text: str, label: str, confidence: float):
+        key = normalize_key(text)
+        if not key:
+            return
+        with self._lock:
+            self._entries[key] = (label, float(confidence))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ------------------------
+    # Invalidation
+    # ------------------------
+    def _maybe_invalidate(self):
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+        self.check_model()
+
+    def check_model(self) -> bool:
+        """Drop all entries if the model folder changed. Returns True if invalidated."""
+        fingerprint = model_fingerprint(self.model_dir)
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return False
+            self._fingerprint = fingerprint
+            self._entries.clear()
+            self._dirty = True
+            self.invalidations += 1
+        print("🧹 Intent cache invalidated (model changed)")
+        return True
+
+    # ------------------------
+    # Disk tier
+    # ------------------------
+    def load(self):
+        try:
+            if not os.path.isfile(self.cache_file):
+                return
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("fingerprint") != self._fingerprint:
+                return
+            with self._lock:
+                for key, label, confidence in data.get("entries", [])[-self.max_size:]:
+                    self._entries[key] = (label, float(confidence))
+                self._dirty = False
+        except Exception as e:
+            print(f"⚠️ Failed to load intent cache: {e}")
+
+    def save(self):
+        if not self.persist:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "fingerprint": self._fingerprint,
+                "entries": [[k, v[0], v[1]] for k, v in self._entries.items()],
+            }
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_path = self.cache_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            print(f"⚠️ Failed to save intent cache: {e}")
+
+    # ------------------------
+    # Stats
+    # ------------------------
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "persistent": self.persist,
+        }
@@ -1,12 +1,18 @@
 # BACKEND/core/brain/intent_classifier.py
 
-import json
 import os
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
 
-BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-MODEL_DIR = os.path.join(BACKEND_ROOT, "DATA", "models", "intent_xlm_roberta_1")
+from BACKEND.core.brain.intent_backends import MODEL_DIR, create_backend
+from BACKEND.core.brain.intent_batcher import IntentBatcher
+from BACKEND.core.brain.intent_cache import IntentCache
+
+# "auto" = int8 ONNX when exported, otherwise PyTorch
+INTENT_BACKEND = os.getenv("SYNEX_INTENT_BACKEND", "auto")
+
+# Cache repeated commands ("volume up", "open youtube", ...)
+INTENT_CACHE_SIZE = 512
+INTENT_CACHE_PERSIST = os.getenv("SYNEX_INTENT_CACHE_PERSIST", "1") == "1"
+
 
 class IntentClassifier:
     _instance = None
@@ -16,51 +22,73 @@ class IntentClassifier:
             cls._instance = super(IntentClassifier, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(
+        self,
+        backend=None,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 2.0,
+        cache: IntentCache = None,
+    ):
         if getattr(self, "_initialized", False):
             return
         self._initialized = True
 
-        if not os.path.isdir(MODEL_DIR):
-            raise RuntimeError(
-                f"Intent model folder not found: {MODEL_DIR}. "
-                "Please ensure models are available."
-            )
+        if backend is None:
+            if not os.path.isdir(MODEL_DIR):
+                raise RuntimeError(
+                    f"Intent model folder not found: {MODEL_DIR}. "
+                    "Please ensure models are available."
+                )
+            backend = create_backend(INTENT_BACKEND, MODEL_DIR)
 
-        label_map_path = os.path.join(MODEL_DIR, "label_map.json")
-        if not os.path.isfile(label_map_path):
-            raise RuntimeError(
-                f"Label map not found: {label_map_path}."
-            )
+        self.backend = backend
+        self.label_map = backend.label_map
+        self.id_to_label = backend.id_to_label
+        print(f"🧠 Intent backend: {getattr(backend, 'name', type(backend).__name__)}")
 
-        self.tokenizer = AutoTokenizer.from_pretrained(
-            MODEL_DIR,
-            use_fast=False,
-            fix_mistral_regex=True,
-            local_files_only=True
-        )
-        self.model = AutoModelForSequenceClassification.from_pretrained(
-            MODEL_DIR,
-            local_files_only=True
+        # Requests from voice, mobile and GUI share forward passes
+        self.batcher = IntentBatcher(
+            backend.predict_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms
         )
-        self.model.eval()
 
-        with open(label_map_path, "r", encoding="utf-8") as f:
-            self.label_map = json.load(f)
-
-        self.id_to_label = {v: k for k, v in self.label_map.items()}
+        if cache is None:
+            cache = IntentCache(
+                max_size=INTENT_CACHE_SIZE,
+                model_dir=getattr(backend, "model_dir", MODEL_DIR),
+                persist=INTENT_CACHE_PERSIST
+            )
+        self.cache = cache
 
     def predict(self, text: str):
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True
-        )
+        cached = self.cache.get(text)
+        if cached is not None:
+            return cached
+
+        label, confidence = self.batcher.predict(text)
+        self.cache.put(text, label, confidence)
+        return label, confidence
+
+    def predict_batch(self, texts):
+        """Classify several utterances in one forward pass."""
+        texts = list(texts)
+        results = [self.cache.get(t) for t in texts]
+        missing = [i for i, r in enumerate(results) if r is None]
+
+        if missing:
+            fresh = self.backend.predict_batch([texts[i] for i in missing])
+            for i, (label, confidence) in zip(missing, fresh):
+                self.cache.put(texts[i], label, confidence)
+                results[i] = (label, confidence)
 
-        with torch.no_grad():
-            outputs = self.model(**inputs)
+        return results
 
-        probs = torch.softmax(outputs.logits, dim=1)
-        confidence, pred = torch.max(probs, dim=1)
+    def get_cache_stats(self) -> dict:
+        stats = self.cache.get_stats()
+        stats["batcher"] = self.batcher.get_stats()
+        return stats
 
-        return self.id_to_label[pred.item()], confidence.item()
+    def shutdown(self):
+        self.batcher.stop()
+        self.cache.save()
@@ -4,25 +4,17 @@ import os
 from core.brain.model import JarvisBrain
 
 class JarvisLearner:
-    def __init__(self, brain: JarvisBrain, feedback_path="backend/core/brain/data/feedback.json"):
+    def __init__(self, brain: JarvisBrain, feedback_path="backend/core/brain/data/feedback.jsonl"):
         self.brain = brain
         self.feedback_path = os.path.abspath(feedback_path)
-        
-        if not os.path.exists(self.feedback_path):
-            with open(self.feedback_path, 'w') as f:
-                json.dump([], f)
+        os.makedirs(os.path.dirname(self.feedback_path), exist_ok=True)
 
     def collect_feedback(self, text, suggested_intent):
-        """Stores new data for future training"""
-        with open(self.feedback_path, 'r') as f:
-            data = json.load(f)
-            
-        data.append({"text": text, "intent": suggested_intent})
-        
-        with open(self.feedback_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Stores new data for future training (append-only, one JSON object per line)"""
+        with open(self.feedback_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"text": text, "intent": suggested_intent}, ensure_ascii=False) + "\n")
             
-        # Immediately 'reinforce' the brain
+        # Immediately 'reinforce' the brain (online memory; full retrain runs in background)
         self.brain.learn(text, suggested_intent)
 
     def handle_unknown(self, text):
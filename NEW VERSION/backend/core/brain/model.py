@@ -2,6 +2,7 @@
 import json
 import os
 import pickle
+import threading
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.svm import SVC
@@ -9,15 +10,29 @@ from sklearn.pipeline import Pipeline
 from sklearn.model_selection import GridSearchCV, train_test_split
 from sklearn.metrics import classification_report
 
+from .online_memory import OnlineIntentMemory
+
 class JarvisBrain:
-    def __init__(self, data_path="backend/core/brain/data/intents.json", model_path="backend/core/brain/data/jarvis_model.pkl"):
+    def __init__(self, data_path="backend/core/brain/data/intents.json", model_path="backend/core/brain/data/jarvis_model.pkl", retrain_delay=30.0):
         # Use absolute paths to avoid issues when running from different directories
         self.data_path = os.path.abspath(data_path)
         self.model_path = os.path.abspath(model_path)
         self.model = None
+
+        # Learned corrections: applied instantly in memory, journaled to disk,
+        # folded into intents.json + the SVM by a background retrain
+        self.journal_path = os.path.splitext(self.data_path)[0] + ".learned.jsonl"
+        self.memory = OnlineIntentMemory()
+        self.retrain_delay = retrain_delay  # None = never retrain in background
+        self._model_lock = threading.Lock()
+        self._journal_lock = threading.Lock()
+        self._retrain_timer = None
+        self._retrain_thread = None
+        self._retrain_pending = False
         
         # Ensure data directory exists
         os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
+        self._load_journal()
         
         if os.path.exists(self.model_path):
             self.load_model()
@@ -34,6 +49,12 @@ class JarvisBrain:
 
         with open(self.data_path, 'r', encoding='utf-8') as f:
             intents = json.load(f)
+
+        # Include corrections not merged into intents.json yet
+        for text, intent in self.memory.items():
+            intents.setdefault(intent, [])
+            if text not in [p.lower() for p in intents[intent]]:
+                intents[intent].append(text)
         
         X = []
         y = []
@@ -68,63 +89,151 @@ class JarvisBrain:
         grid_search.fit(X_train, y_train)
 
         print(f"Best parameters found: {grid_search.best_params_}")
-        self.model = grid_search.best_estimator_
+        model = grid_search.best_estimator_
 
         # Print evaluation report
-        y_pred = self.model.predict(X_test)
+        y_pred = model.predict(X_test)
         print("\nClassification Report:")
         print(classification_report(y_test, y_pred, zero_division=0))
 
         # Re-train on full dataset with best parameters
         # Merge X and y into a single training set
         print("Finalizing model on full dataset...")
-        self.model.fit(X, y)
+        model.fit(X, y)
+
+        # Swap only the finished model so concurrent predict() never sees a half-fitted one
+        with self._model_lock:
+            self.model = model
         self.save_model()
         print("Brain model trained and optimized successfully.")
 
     def save_model(self):
-        with open(self.model_path, 'wb') as f:
+        """Write the model to a temp file and atomically replace the old one."""
+        tmp_path = self.model_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
             pickle.dump(self.model, f)
+        os.replace(tmp_path, self.model_path)
 
     def load_model(self):
         try:
             with open(self.model_path, 'rb') as f:
-                self.model = pickle.load(f)
+                model = pickle.load(f)
+            with self._model_lock:
+                self.model = model
         except Exception as e:
             print(f"Error loading model: {e}. Retraining...")
             self.train_initial_model()
 
     def predict(self, text):
         """Predicts the intent and returns (intent, confidence)"""
-        if self.model is None:
-            return "unknown", 0.0
+        learned = self.memory.predict(text)
+        model = self.model
+
+        if model is None:
+            return learned if learned else ("unknown", 0.0)
             
         text = text.lower()
-        probs = self.model.predict_proba([text])[0]
+        probs = model.predict_proba([text])[0]
         max_idx = np.argmax(probs)
         confidence = probs[max_idx]
-        intent = self.model.classes_[max_idx]
+        intent = model.classes_[max_idx]
+
+        # A close learned correction beats a less confident SVM guess
+        if learned and learned[1] >= confidence:
+            return learned
         
         return intent, confidence
 
     def learn(self, text, correct_intent):
-        """Continuous learning: Adds new data and retrains"""
+        """Continuous learning: applies the correction immediately, retrains later"""
         print(f"Learning: '{text}' -> {correct_intent}")
-        
+
+        if not self.memory.add(text, correct_intent):
+            return
+
+        with self._journal_lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"text": text, "intent": correct_intent}, ensure_ascii=False) + "\n")
+
+        self.schedule_retrain()
+
+    # ------------------------
+    # Background retraining
+    # ------------------------
+    def _load_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        with self._journal_lock:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.memory.add(entry["text"], entry["intent"])
+
+    def schedule_retrain(self):
+        """Debounced: retrain once corrections stop arriving for retrain_delay seconds."""
+        if self.retrain_delay is None:
+            return
+        if self._retrain_timer is not None:
+            self._retrain_timer.cancel()
+        self._retrain_timer = threading.Timer(self.retrain_delay, self._start_retrain)
+        self._retrain_timer.daemon = True
+        self._retrain_timer.start()
+
+    def _start_retrain(self):
+        if self._retrain_thread is not None and self._retrain_thread.is_alive():
+            self._retrain_pending = True
+            return
+        self._retrain_thread = threading.Thread(target=self._retrain_worker, daemon=True)
+        self._retrain_thread.start()
+
+    def _retrain_worker(self):
+        while True:
+            self._retrain_pending = False
+            try:
+                self._merge_journal()
+                self.train_initial_model()
+            except Exception as e:
+                print(f"Background retrain failed: {e}")
+            if not self._retrain_pending:
+                break
+
+    def _merge_journal(self):
+        """Fold learned corrections into intents.json (atomic rewrite)."""
+        if not os.path.exists(self.data_path):
+            return
         with open(self.data_path, 'r', encoding='utf-8') as f:
             intents = json.load(f)
-            
-        if correct_intent not in intents:
-            intents[correct_intent] = []
-            
-        if text.lower() not in [p.lower() for p in intents[correct_intent]]:
-            intents[correct_intent].append(text)
-            
-            with open(self.data_path, 'w', encoding='utf-8') as f:
+
+        changed = False
+        for text, intent in self.memory.items():
+            patterns = intents.setdefault(intent, [])
+            if text not in [p.lower() for p in patterns]:
+                patterns.append(text)
+                changed = True
+
+        if changed:
+            tmp_path = self.data_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(intents, f, indent=2)
-            
-            # Retrain with optimization
-            self.train_initial_model()
+            os.replace(tmp_path, self.data_path)
+
+    def wait_for_retrain(self, timeout=None):
+        """Block until a scheduled/running retrain finishes (tests, shutdown)."""
+        if self._retrain_timer is not None and self._retrain_timer.is_alive():
+            self._retrain_timer.cancel()
+            self._start_retrain()
+        if self._retrain_thread is not None:
+            self._retrain_thread.join(timeout)
+
+    def shutdown(self):
+        if self._retrain_timer is not None:
+            self._retrain_timer.cancel()
 
 if __name__ == "__main__":
     # Test training
@@ -0,0 +1,126 @@
+# Path: d:\New folder (2) - JARVIS\backend\core\brain\online_memory.py
+"""
+Online intent memory: instant learning for JarvisBrain.
+
+Every corrected phrase is hashed into a character n-gram vector and stored
+next to its intent. Prediction is an exact-match lookup followed by a
+cosine nearest-neighbour search over the stored vectors. Learning is O(1):
+no vocabulary to rebuild, no model to refit, new intents just work.
+
+Rows are kept in fixed-size sparse blocks so adding a pattern never copies
+the whole store; blocks are periodically merged so a lookup stays a single
+sparse matrix-vector product.
+"""
+
+import threading
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+BLOCK_SIZE = 1024
+# Merge blocks into one matrix once this many have accumulated
+MAX_BLOCKS = 8
+
+
+def normalize_pattern(text: str) -> str:
+    return " ".join(str(text).lower().split())
+
+
+class OnlineIntentMemory:
+    def __init__(self, similarity_threshold: float = 0.8, n_features: int = 2 ** 18):
+        self.similarity_threshold = similarity_threshold
+        self.vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=(2, 4),
+            n_features=n_features,
+            alternate_sign=False,
+            norm="l2"
+        )
+        self._lock = threading.Lock()
+        self._index = {}       # normalized text -> row
+        self._labels = []      # row -> intent
+        self._blocks = []      # full CSR blocks of BLOCK_SIZE rows
+        self._pending = []     # rows not yet folded into a block
+
+    def __len__(self):
+        return len(self._labels)
+
+    def add(self, text: str, intent: str) -> bool:
+        """Remember text -> intent. Returns False if nothing changed."""
+        key = normalize_pattern(text)
+        if not key:
+            return False
+
+        with self._lock:
+            row = self._index.get(key)
+            if row is not None:
+                if self._labels[row] == intent:
+                    return False
+                # Correction of an earlier correction: relabel in place
+                self._labels[row] = intent
+                return True
+
+            vector = self.vectorizer.transform([key])
+            self._index[key] = len(self._labels)
+            self._labels.append(intent)
+            self._pending.append(vector)
+            if len(self._pending) >= BLOCK_SIZE:
+                self._blocks.append(sparse.vstack(self._pending, format="csr"))
+                self._pending = []
+                if len(self._blocks) >= MAX_BLOCKS:
+                    self._blocks = [sparse.vstack(self._blocks, format="csr")]
+            return True
+
+    def add_many(self, pairs):
+        for text, intent in pairs:
+            self.add(text, intent)
+
+    def lookup(self, text: str):
+        """Exact match on the normalized text."""
+        row = self._index.get(normalize_pattern(text))
+        if row is None:
+            return None
+        return self._labels[row]
+
+    def nearest(self, text: str):
+        """Return (intent, similarity) of the closest stored pattern, or (None, 0.0)."""
+        key = normalize_pattern(text)
+        if not key or not self._labels:
+            return None, 0.0
+
+        with self._lock:
+            row = self._index.get(key)
+            if row is not None:
+                return self._labels[row], 1.0
+
+            blocks = list(self._blocks)
+            if self._pending:
+                blocks.append(sparse.vstack(self._pending, format="csr"))
+            labels = list(self._labels)
+
+        # Dense query: CSR x dense vector is much faster than sparse x sparse
+        query = self.vectorizer.transform([key]).toarray().ravel()
+        best_row, best_score, offset = -1, 0.0, 0
+        for block in blocks:
+            scores = block.dot(query)
+            if scores.size:
+                idx = int(np.argmax(scores))
+                if scores[idx] > best_score:
+                    best_row, best_score = offset + idx, float(scores[idx])
+            offset += block.shape[0]
+
+        if best_row < 0:
+            return None, 0.0
+        return labels[best_row], best_score
+
+    def predict(self, text: str):
+        """(intent, similarity) if a stored pattern is close enough, else None."""
+        intent, score = self.nearest(text)
+        if intent is None or score < self.similarity_threshold:
+            return None
+        return intent, score
+
+    def items(self):
+        with self._lock:
+            return [(text, self._labels[row]) for text, row in self._index.items()]
@@ -0,0 +1,163 @@
+# BACKEND/core/brain/tests/test_intent_backends.py
+"""
+Unit tests for intent inference backends and micro-batching
+"""
+
+import importlib.util
+import os
+import threading
+import unittest
+
+from BACKEND.core.brain.intent_backends import MODEL_DIR, onnx_available
+from BACKEND.core.brain.intent_batcher import IntentBatcher
+from BACKEND.core.brain.intent_cache import IntentCache
+from BACKEND.core.brain.intent_classifier import IntentClassifier
+
+
+class FakeBackend:
+    name = "fake"
+
+    def __init__(self, delay_event=None):
+        self.label_map = {"greet": 0, "youtube_play": 1}
+        self.id_to_label = {0: "greet", 1: "youtube_play"}
+        self.calls = []
+        self._delay_event = delay_event
+
+    def predict_batch(self, texts):
+        if self._delay_event is not None:
+            self._delay_event.wait(timeout=1.0)
+        self.calls.append(list(texts))
+        return [
+            ("youtube_play" if "youtube" in t else "greet", 0.9)
+            for t in texts
+        ]
+
+
+class TestIntentBatcher(unittest.TestCase):
+    def test_single_predict(self):
+        backend = FakeBackend()
+        batcher = IntentBatcher(backend.predict_batch, max_wait_ms=0)
+        try:
+            self.assertEqual(batcher.predict("open youtube", timeout=1.0), ("youtube_play", 0.9))
+        finally:
+            batcher.stop()
+
+    def test_concurrent_requests_share_a_batch(self):
+        gate = threading.Event()
+        backend = FakeBackend(delay_event=gate)
+        batcher = IntentBatcher(backend.predict_batch, max_batch_size=8, max_wait_ms=0)
+        try:
+            # First request occupies the worker, the rest queue up behind it
+            first = batcher.submit("hello")
+            futures = [batcher.submit(f"play youtube {i}") for i in range(5)]
+            gate.set()
+
+            self.assertEqual(first.result(timeout=1.0)[0], "greet")
+            for future in futures:
+                self.assertEqual(future.result(timeout=1.0)[0], "youtube_play")
+
+            self.assertLess(len(backend.calls), 6)
+            self.assertEqual(sum(len(c) for c in backend.calls), 6)
+        finally:
+            batcher.stop()
+
+    def test_max_batch_size_respected(self):
+        gate = threading.Event()
+        backend = FakeBackend(delay_event=gate)
+        batcher = IntentBatcher(backend.predict_batch, max_batch_size=2, max_wait_ms=0)
+        try:
+            futures = [batcher.submit(f"hi {i}") for i in range(5)]
+            gate.set()
+            for future in futures:
+                future.result(timeout=1.0)
+            self.assertTrue(all(len(c) <= 2 for c in backend.calls))
+        finally:
+            batcher.stop()
+
+    def test_backend_error_propagates(self):
+        def failing(texts):
+            raise ValueError("boom")
+
+        batcher = IntentBatcher(failing, max_wait_ms=0)
+        try:
+            with self.assertRaises(ValueError):
+                batcher.predict("hello", timeout=1.0)
+        finally:
+            batcher.stop()
+
+    def test_submit_after_stop_fails(self):
+        batcher = IntentBatcher(FakeBackend().predict_batch)
+        batcher.stop()
+        with self.assertRaises(RuntimeError):
+            batcher.submit("hello").result(timeout=1.0)
+
+
+class TestIntentClassifierBackend(unittest.TestCase):
+    def setUp(self):
+        IntentClassifier._instance = None
+
+    def tearDown(self):
+        if IntentClassifier._instance is not None:
+            IntentClassifier._instance.shutdown()
+        IntentClassifier._instance = None
+
+    def test_predict_and_predict_batch(self):
+        clf = IntentClassifier(backend=FakeBackend(), cache=IntentCache(persist=False))
+        self.assertEqual(clf.predict("open youtube"), ("youtube_play", 0.9))
+        self.assertEqual(
+            clf.predict_batch(["hi", "youtube"]),
+            [("greet", 0.9), ("youtube_play", 0.9)]
+        )
+        self.assertEqual(clf.id_to_label[1], "youtube_play")
+
+
+HAS_TORCH = importlib.util.find_spec("torch") is not None
+
+
+@unittest.skipUnless(
+    HAS_TORCH and os.path.isdir(MODEL_DIR) and onnx_available(MODEL_DIR),
+    "requires torch, onnxruntime and an exported intent model"
+)
+class TestOnnxTorchParity(unittest.TestCase):
+    SAMPLES = [
+        "open youtube",
+        "volume up",
+        "battery status",
+        "what's the weather in delhi",
+        "send a message to rahul saying hello",
+        "youtube pe gaana chalao",
+        "search python tutorials on google",
+        "what time is it",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        from BACKEND.core.brain.intent_backends import OnnxIntentBackend, TorchIntentBackend
+
+        cls.torch_backend = TorchIntentBackend(MODEL_DIR)
+        cls.onnx_backend = OnnxIntentBackend(MODEL_DIR)
+
+    def test_labels_match(self):
+        torch_out = self.torch_backend.predict_batch(self.SAMPLES)
+        onnx_out = self.onnx_backend.predict_batch(self.SAMPLES)
+        agree = sum(t[0] == o[0] for t, o in zip(torch_out, onnx_out))
+        # int8 may flip a borderline sample, never the bulk of them
+        self.assertGreaterEqual(agree / len(self.SAMPLES), 0.85)
+
+    def test_confidence_close(self):
+        torch_out = self.torch_backend.predict_batch(self.SAMPLES)
+        onnx_out = self.onnx_backend.predict_batch(self.SAMPLES)
+        for (t_label, t_conf), (o_label, o_conf) in zip(torch_out, onnx_out):
+            if t_label == o_label:
+                self.assertAlmostEqual(t_conf, o_conf, delta=0.1)
+
+    def test_batch_matches_single(self):
+        batched = self.onnx_backend.predict_batch(self.SAMPLES)
+        for text, (label, conf) in zip(self.SAMPLES, batched):
+            single_label, single_conf = self.onnx_backend.predict_batch([text])[0]
+            self.assertEqual(label, single_label)
+            self.assertAlmostEqual(conf, single_conf, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
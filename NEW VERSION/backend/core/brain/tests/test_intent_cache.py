@@ -0,0 +1,123 @@
+# BACKEND/core/brain/tests/test_intent_cache.py
+"""
+Unit tests for the intent prediction cache
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from BACKEND.core.brain.intent_cache import IntentCache, model_fingerprint, normalize_key
+from BACKEND.core.brain.intent_classifier import IntentClassifier
+
+
+class CountingBackend:
+    name = "counting"
+
+    def __init__(self, model_dir):
+        self.model_dir = model_dir
+        self.label_map = {"volume_up": 0}
+        self.id_to_label = {0: "volume_up"}
+        self.calls = 0
+
+    def predict_batch(self, texts):
+        self.calls += 1
+        return [("volume_up", 0.8) for _ in texts]
+
+
+class TestIntentCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_dir = os.path.join(self.temp_dir, "model")
+        os.makedirs(self.model_dir)
+        self.label_map = os.path.join(self.model_dir, "label_map.json")
+        with open(self.label_map, "w") as f:
+            json.dump({"volume_up": 0}, f)
+        self.cache_file = os.path.join(self.temp_dir, "intent_cache.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _cache(self, **kwargs):
+        kwargs.setdefault("model_dir", self.model_dir)
+        kwargs.setdefault("cache_file", self.cache_file)
+        return IntentCache(**kwargs)
+
+    def test_normalize_key(self):
+        self.assertEqual(normalize_key("  Volume   UP "), "volume up")
+        self.assertEqual(normalize_key(None), "")
+
+    def test_hit_miss_counters(self):
+        cache = self._cache()
+        self.assertIsNone(cache.get("volume up"))
+        cache.put("volume up", "volume_up", 0.9)
+        self.assertEqual(cache.get("Volume  up"), ("volume_up", 0.9))
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 1)
+
+    def test_lru_eviction(self):
+        cache = self._cache(max_size=2)
+        cache.put("a", "x", 0.5)
+        cache.put("b", "x", 0.5)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", "x", 0.5)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_invalidated_when_label_map_changes(self):
+        cache = self._cache(check_interval=0)
+        cache.put("volume up", "volume_up", 0.9)
+
+        with open(self.label_map, "w") as f:
+            json.dump({"volume_up": 0, "volume_down": 1}, f)
+        os.utime(self.label_map, ns=(0, 12345))
+
+        self.assertIsNone(cache.get("volume up"))
+        self.assertEqual(cache.invalidations, 1)
+
+    def test_disk_persistence(self):
+        cache = self._cache(persist=True)
+        cache.put("open youtube", "youtube_control", 0.95)
+        cache.save()
+
+        reloaded = self._cache(persist=True)
+        self.assertEqual(reloaded.get("open youtube"), ("youtube_control", 0.95))
+
+    def test_disk_entries_dropped_for_other_model(self):
+        cache = self._cache(persist=True)
+        cache.put("open youtube", "youtube_control", 0.95)
+        cache.save()
+
+        with open(os.path.join(self.model_dir, "model.int8.onnx"), "wb") as f:
+            f.write(b"new weights")
+
+        reloaded = self._cache(persist=True)
+        self.assertEqual(len(reloaded), 0)
+
+    def test_fingerprint_missing_dir(self):
+        self.assertEqual(model_fingerprint(os.path.join(self.temp_dir, "nope")), "missing")
+
+    def test_classifier_uses_cache(self):
+        IntentClassifier._instance = None
+        backend = CountingBackend(self.model_dir)
+        clf = IntentClassifier(backend=backend, cache=self._cache())
+        try:
+            for _ in range(3):
+                self.assertEqual(clf.predict("volume up"), ("volume_up", 0.8))
+            self.assertEqual(backend.calls, 1)
+
+            clf.predict_batch(["volume up", "volume down"])
+            self.assertEqual(backend.calls, 2)
+            self.assertEqual(clf.get_cache_stats()["hits"], 3)
+        finally:
+            clf.shutdown()
+            IntentClassifier._instance = None
+
+
+if __name__ == "__main__":
+    unittest.main()
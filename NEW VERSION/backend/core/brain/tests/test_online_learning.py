@@ -0,0 +1,118 @@
+# BACKEND/core/brain/tests/test_online_learning.py
+"""
+Unit tests for JarvisBrain online learning and background retraining
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from BACKEND.core.brain import online_memory
+from BACKEND.core.brain.model import JarvisBrain
+from BACKEND.core.brain.online_memory import OnlineIntentMemory
+
+INTENTS = {
+    "open_item": ["open chrome", "open notepad", "launch calculator", "open settings", "open file explorer", "launch spotify"],
+    "check_time": ["what time is it", "tell me the time", "current time", "time please", "what is the time now", "samay kya hai"],
+    "greet": ["hello", "hi there", "good morning", "hey jarvis", "namaste", "hello jarvis"],
+}
+
+
+class TestOnlineIntentMemory(unittest.TestCase):
+    def test_exact_and_nearest(self):
+        memory = OnlineIntentMemory(similarity_threshold=0.6)
+        memory.add("play lofi beats", "youtube_play")
+        memory.add("battery kitna hai", "check_battery_percentage")
+
+        self.assertEqual(memory.predict("Play  LOFI beats"), ("youtube_play", 1.0))
+        intent, score = memory.predict("play lofi beat")
+        self.assertEqual(intent, "youtube_play")
+        self.assertLess(score, 1.0)
+        self.assertIsNone(memory.predict("completely unrelated words"))
+
+    def test_relabel(self):
+        memory = OnlineIntentMemory()
+        self.assertTrue(memory.add("open it", "open_item"))
+        self.assertFalse(memory.add("open it", "open_item"))
+        self.assertTrue(memory.add("open it", "close_item"))
+        self.assertEqual(memory.lookup("open it"), "close_item")
+        self.assertEqual(len(memory), 1)
+
+    def test_blocks_fold(self):
+        with patch.object(online_memory, "BLOCK_SIZE", 4), patch.object(online_memory, "MAX_BLOCKS", 3):
+            memory = OnlineIntentMemory()
+            for i in range(10):
+                memory.add(f"command number {i}", f"intent_{i}")
+            self.assertEqual(len(memory._blocks), 2)
+            for i in range(10, 14):
+                memory.add(f"command number {i}", f"intent_{i}")
+            self.assertEqual(len(memory._blocks), 1)
+            self.assertEqual(memory._blocks[0].shape[0], 12)
+            self.assertEqual(memory.nearest("command number 7"), ("intent_7", 1.0))
+            self.assertEqual(memory.nearest("command number 9"), ("intent_9", 1.0))
+
+
+class TestJarvisBrainLearning(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_path = os.path.join(self.temp_dir, "intents.json")
+        self.model_path = os.path.join(self.temp_dir, "jarvis_model.pkl")
+        with open(self.data_path, "w", encoding="utf-8") as f:
+            json.dump(INTENTS, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _brain(self, retrain_delay=None):
+        with patch("builtins.print"):
+            return JarvisBrain(self.data_path, self.model_path, retrain_delay=retrain_delay)
+
+    def test_learn_applies_immediately_without_rewriting_dataset(self):
+        brain = self._brain()
+        mtime = os.path.getmtime(self.data_path)
+
+        with patch("builtins.print"):
+            brain.learn("fire up the music app", "open_item")
+
+        self.assertEqual(brain.predict("fire up the music app"), ("open_item", 1.0))
+        self.assertEqual(os.path.getmtime(self.data_path), mtime)
+        self.assertTrue(os.path.exists(brain.journal_path))
+
+    def test_journal_reloaded_on_restart(self):
+        brain = self._brain()
+        with patch("builtins.print"):
+            brain.learn("kitne baje hain", "check_time")
+
+        restarted = self._brain()
+        self.assertEqual(restarted.predict("kitne baje hain"), ("check_time", 1.0))
+
+    def test_background_retrain_merges_and_swaps_model(self):
+        brain = self._brain(retrain_delay=0)
+        old_model = brain.model
+
+        with patch("builtins.print"):
+            brain.learn("kitne baje hain", "check_time")
+            brain.wait_for_retrain(timeout=60)
+
+        with open(self.data_path, "r", encoding="utf-8") as f:
+            intents = json.load(f)
+        self.assertIn("kitne baje hain", intents["check_time"])
+        self.assertIsNot(brain.model, old_model)
+        self.assertFalse(os.path.exists(self.model_path + ".tmp"))
+
+    def test_learn_latency_independent_of_model(self):
+        brain = self._brain()
+        start = time.perf_counter()
+        with patch("builtins.print"):
+            for i in range(200):
+                brain.learn(f"custom phrase {i}", "greet")
+        # No refit per call: 200 corrections stay far below a single GridSearchCV
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,467 @@
+# BACKEND/core/command_pipeline.py
+"""
+Staged command pipeline for Synex.
+
+Every command goes through four stages connected by bounded asyncio queues:
+
+    ingest -> normalize -> classify -> dispatch[family]
+
+    pipeline = CommandPipeline(normalize, classify, dispatch, respond)
+    pipeline.start()
+    pipeline.submit({"text": "open youtube", "source": "text"})
+
+The event loop runs on its own thread; the stage callbacks are plain
+blocking functions executed on thread pools, so model inference or a
+Selenium page load never stalls the loop. Dispatch goes to one bounded
+executor per automation family (whatsapp, youtube, browser, network,
+system). A slow speed test or WhatsApp retry only occupies its own family;
+"stop" or "what time is it" keep flowing through the system pool.
+
+Back-pressure: submit() waits (or gives up) when the ingest queue is full,
+and a command whose family queue is full is rejected right away instead of
+blocking the commands behind it.
+
+Cancellation: queued commands are dropped; a running command cannot be
+interrupted from outside its thread, so it is marked cancelled, its
+cancel_event is set for handlers that poll it, and its result is not
+spoken.
+"""
+
+import asyncio
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from colorama import Fore
+
+QUEUE_SIZE = int(os.getenv("SYNEX_PIPELINE_QUEUE", "16"))
+
+# family -> (workers, queue size). Browser-driven families are single worker:
+# a Selenium session is not thread-safe. youtube and browser share one browser
+# (BrowserPool); each command holds BrowserPool.lease() while it runs.
+FAMILIES = {
+    "whatsapp": (1, 4),
+    "youtube": (1, 4),
+    "browser": (1, 8),
+    "network": (1, 2),
+    "system": (4, 16),
+}
+DEFAULT_FAMILY = "system"
+
+NETWORK_INTENTS = ("check_internet_speed", "check_online_status", "check_ip")
+BROWSER_INTENTS = ("open_item", "close_item")
+
+
+def family_for_intent(intent: Optional[str]) -> str:
+    """Map an intent label to the executor family that runs it."""
+    if not intent:
+        return DEFAULT_FAMILY
+    if intent.startswith("whatsapp_") or intent == "send_whatsapp_message":
+        return "whatsapp"
+    if intent.startswith("youtube_"):
+        return "youtube"
+    if intent.startswith(("google_", "browser_")) or intent in BROWSER_INTENTS:
+        return "browser"
+    if intent in NETWORK_INTENTS:
+        return "network"
+    return DEFAULT_FAMILY
+
+
+@dataclass
+class Command:
+    """One input travelling through the pipeline."""
+    id: int
+    text: str
+    source: str = "text"
+    intent: Optional[str] = None
+    confidence: float = 0.0
+    payload: Any = None
+    hits: frozenset = frozenset()  # keyword hits, filled by the normalize stage
+    family: str = DEFAULT_FAMILY
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.perf_counter)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def as_dict(self) -> dict:
+        now = time.perf_counter()
+        return {
+            "id": self.id,
+            "text": self.text,
+            "intent": self.intent,
+            "family": self.family,
+            "status": self.status,
+            "age_ms": round((now - self.submitted_at) * 1000, 1),
+        }
+
+
+class _StageStats:
+    def __init__(self):
+        self.processed = 0
+        self.dropped = 0
+        self.total_seconds = 0.0
+
+    def record(self, seconds: float):
+        self.processed += 1
+        self.total_seconds += seconds
+
+    def as_dict(self, queue: Optional[asyncio.Queue]) -> dict:
+        avg = (self.total_seconds / self.processed * 1000) if self.processed else 0.0
+        return {
+            "depth": queue.qsize() if queue is not None else 0,
+            "capacity": queue.maxsize if queue is not None else 0,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "avg_ms": round(avg, 2),
+        }
+
+
+class _Family:
+    def __init__(self, name: str, workers: int, queue_size: int):
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"synex-{name}")
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "workers": self.workers,
+            "depth": self.queue.qsize() if self.queue is not None else 0,
+            "capacity": self.queue_size,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+        }
+
+
+class CommandPipeline:
+    """
+    normalize(cmd) -> bool      runs in order on one thread; False = handled/dropped
+    classify(cmd) -> bool       fills cmd.intent / cmd.payload; False = dropped
+    dispatch(cmd) -> result     runs on the family executor
+    respond(cmd, result)        called after dispatch unless the command was cancelled
+    on_error(cmd, exc)          any stage raised
+    on_reject(cmd)              family queue full (back-pressure)
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[Command], bool],
+        classify: Callable[[Command], bool],
+        dispatch: Callable[[Command], Any],
+        respond: Callable[[Command, Any], None],
+        on_error: Optional[Callable[[Command, BaseException], None]] = None,
+        on_reject: Optional[Callable[[Command], None]] = None,
+        family_of: Callable[[Command], str] = lambda cmd: family_for_intent(cmd.intent),
+        families: Optional[Dict[str, tuple]] = None,
+        queue_size: int = QUEUE_SIZE,
+        classify_workers: int = 2,
+    ):
+        self._normalize = normalize
+        self._classify = classify
+        self._dispatch = dispatch
+        self._respond = respond
+        self._on_error = on_error
+        self._on_reject = on_reject
+        self._family_of = family_of
+        self.queue_size = queue_size
+        self.classify_workers = classify_workers
+
+        families = families or FAMILIES
+        if DEFAULT_FAMILY not in families:
+            families = dict(families, **{DEFAULT_FAMILY: FAMILIES[DEFAULT_FAMILY]})
+        self._families = {name: _Family(name, w, q) for name, (w, q) in families.items()}
+
+        self._normalize_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synex-normalize")
+        self._classify_executor = ThreadPoolExecutor(
+            max_workers=classify_workers, thread_name_prefix="synex-classify"
+        )
+        self._stats = {name: _StageStats() for name in ("ingest", "normalize", "classify")}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._active: Dict[int, Command] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._workers = []
+
+    # ------------------------
+    # Lifecycle
+    # ------------------------
+    def start(self):
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run_loop, name="synex-pipeline", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def _run_loop(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._queues["ingest"] = asyncio.Queue(self.queue_size)
+        self._queues["classify"] = asyncio.Queue(self.queue_size)
+        self._workers.append(loop.create_task(self._normalize_worker()))
+        for _ in range(self.classify_workers):
+            self._workers.append(loop.create_task(self._classify_worker()))
+        for family in self._families.values():
+            family.queue = asyncio.Queue(family.queue_size)
+            for _ in range(family.workers):
+                self._workers.append(loop.create_task(self._dispatch_worker(family)))
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def stop(self, timeout: float = 2.0):
+        """Cancel everything and stop the loop. Running handlers finish in the background."""
+        if self._loop is None:
+            return
+        self.cancel_all()
+
+        async def _halt():
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            asyncio.get_running_loop().stop()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_halt(), self._loop)
+        except RuntimeError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        for executor in [self._normalize_executor, self._classify_executor] + [
+            f.executor for f in self._families.values()
+        ]:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._loop = None
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------
+    # Ingest (thread-safe)
+    # ------------------------
+    def submit(self, item, source: str = "text", timeout: Optional[float] = None) -> Optional[Command]:
+        """
+        Queue a raw input (text or {"text", "source"} dict).
+
+        timeout=None waits for room, timeout=0 fails immediately when the
+        ingest queue is full. Returns the Command, or None when refused.
+        """
+        if not self.running:
+            raise RuntimeError("Command pipeline is not running")
+        if isinstance(item, dict):
+            text, source = item.get("text", ""), item.get("source", source)
+        else:
+            text = str(item)
+        cmd = Command(id=next(self._ids), text=text, source=source)
+
+        future = asyncio.run_coroutine_threadsafe(self._ingest(cmd, timeout), self._loop)
+        if not future.result():
+            with self._lock:
+                self._stats["ingest"].dropped += 1
+            return None
+        return cmd
+
+    async def _ingest(self, cmd: Command, timeout: Optional[float]) -> bool:
+        queue = self._queues["ingest"]
+        if timeout == 0:
+            try:
+                queue.put_nowait(cmd)
+            except asyncio.QueueFull:
+                return False
+        else:
+            try:
+                await asyncio.wait_for(queue.put(cmd), timeout)
+            except asyncio.TimeoutError:
+                return False
+        self._track(cmd)
+        return True
+
+    def _track(self, cmd: Command):
+        with self._lock:
+            self._active[cmd.id] = cmd
+            self._stats["ingest"].record(0.0)
+
+    def _finish(self, cmd: Command, status: str, family: Optional[_Family] = None):
+        with self._lock:
+            if family is not None:
+                if cmd.status in ("running", "cancelling"):
+                    family.running -= 1
+                counter = {"done": "completed"}.get(status, status)
+                setattr(family, counter, getattr(family, counter) + 1)
+            cmd.status = status
+            cmd.finished_at = time.perf_counter()
+            self._active.pop(cmd.id, None)
+            if not self._active:
+                self._idle.notify_all()
+
+    # ------------------------
+    # Stages
+    # ------------------------
+    async def _run_stage(self, name: str, executor, fn, cmd: Command):
+        started = time.perf_counter()
+        try:
+            return await self._loop.run_in_executor(executor, fn, cmd)
+        finally:
+            with self._lock:
+                self._stats[name].record(time.perf_counter() - started)
+
+    async def _normalize_worker(self):
+        ingest, classify = self._queues["ingest"], self._queues["classify"]
+        while True:
+            cmd = await ingest.get()
+            if cmd.cancelled:
+                self._finish(cmd, "cancelled")
+                continue
+            cmd.status = "normalizing"
+            try:
+                keep = await self._run_stage("normalize", self._normalize_executor, self._normalize, cmd)
+            except Exception as e:
+                self._fail(cmd, e)
+                continue
+            if not keep:
+                self._finish(cmd, "done")
+                continue
+            cmd.status = "classifying"
+            await classify.put(cmd)
+
+    async def _classify_worker(self):
+        classify = self._queues["classify"]
+        while True:
+            cmd = await classify.get()
+            if cmd.cancelled:
+                self._finish(cmd, "cancelled")
+                continue
+            try:
+                keep = await self._run_stage("classify", self._classify_executor, self._classify, cmd)
+            except Exception as e:
+                self._fail(cmd, e)
+                continue
+            if not keep:
+                self._finish(cmd, "done")
+                continue
+
+            cmd.family = self._family_of(cmd)
+            family = self._families.get(cmd.family) or self._families[DEFAULT_FAMILY]
+            cmd.family = family.name
+            try:
+                family.queue.put_nowait(cmd)
+                cmd.status = "queued"
+            except asyncio.QueueFull:
+                self._finish(cmd, "rejected", family)
+                print(Fore.MAGENTA + f"🛡️  {family.name} queue full, rejecting: {cmd.text}")
+                if self._on_reject:
+                    self._call_soon(self._on_reject, cmd)
+
+    async def _dispatch_worker(self, family: _Family):
+        while True:
+            cmd = await family.queue.get()
+            if cmd.cancelled:
+                self._finish(cmd, "cancelled", family)
+                continue
+            with self._lock:
+                family.running += 1
+                cmd.status = "running"
+            cmd.started_at = time.perf_counter()
+            await self._loop.run_in_executor(family.executor, self._execute, cmd, family)
+
+    def _execute(self, cmd: Command, family: _Family):
+        """Family thread: dispatch then respond, unless cancelled meanwhile."""
+        try:
+            result = self._dispatch(cmd)
+            if cmd.cancelled:
+                print(Fore.YELLOW + f"⏹  Dropped result of cancelled command: {cmd.text}")
+                self._finish(cmd, "cancelled", family)
+                return
+            self._respond(cmd, result)
+            self._finish(cmd, "done", family)
+        except Exception as e:
+            self._fail(cmd, e, family)
+
+    def _fail(self, cmd: Command, exc: BaseException, family: Optional[_Family] = None):
+        self._finish(cmd, "failed", family)
+        if self._on_error and not cmd.cancelled:
+            self._call_soon(self._on_error, cmd, exc)
+
+    def _call_soon(self, fn, *args):
+        # Callbacks may speak / touch the GUI; keep them off the event loop
+        try:
+            self._normalize_executor.submit(fn, *args)
+        except RuntimeError:
+            pass  # pipeline stopped
+
+    # ------------------------
+    # Cancellation
+    # ------------------------
+    def cancel(self, command_id: int) -> bool:
+        with self._lock:
+            cmd = self._active.get(command_id)
+            if cmd is None:
+                return False
+            cmd.cancel_event.set()
+            if cmd.status == "running":
+                # The worker that owns it does the final bookkeeping
+                cmd.status = "cancelling"
+        return True
+
+    def cancel_all(self, family: Optional[str] = None, exclude: Optional[int] = None) -> int:
+        """Cancel queued and running commands (optionally one family). Returns the count."""
+        with self._lock:
+            targets = [
+                c.id for c in self._active.values()
+                if (family is None or c.family == family) and c.id != exclude
+            ]
+        return sum(self.cancel(cid) for cid in targets)
+
+    # ------------------------
+    # Introspection
+    # ------------------------
+    def active(self) -> list:
+        with self._lock:
+            return [c.as_dict() for c in self._active.values()]
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no command is in flight."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._active, timeout)
+
+    def get_metrics(self) -> dict:
+        with self._lock:
+            stages = {
+                "ingest": self._stats["ingest"].as_dict(self._queues.get("ingest")),
+                "normalize": self._stats["normalize"].as_dict(None),
+                "classify": self._stats["classify"].as_dict(self._queues.get("classify")),
+            }
+            in_flight = len(self._active)
+        return {
+            "stages": stages,
+            "families": {name: f.as_dict() for name, f in self._families.items()},
+            "in_flight": in_flight,
+        }
@@ -4,7 +4,11 @@ Language Module
 Handles language detection and processing.
 """
 
-from .detector import detect_language
+from .detector import detect_language, detect_script, is_hinglish, needs_translation
+from .translator import MTranslateTranslator
 from .validator import is_meaningful_command
 
-__all__ = ['detect_language', 'is_meaningful_command']
+__all__ = [
+    'detect_language', 'detect_script', 'is_hinglish', 'needs_translation',
+    'MTranslateTranslator', 'is_meaningful_command'
+]
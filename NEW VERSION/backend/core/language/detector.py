@@ -1,9 +1,61 @@
 # Path: d:\New folder (2) - JARVIS\backend\core\language\detector.py
 """
 Language Detector Module
-Detects whether text is Hindi (Hinglish) or English based on keyword analysis.
+Detects whether text is Hindi (Hinglish) or English based on keyword analysis,
+and which script it is written in. Only Devanagari text needs a translation
+round trip: English and romanized Hinglish go to the intent model as-is.
 """
 
+# Common Hindi words often used in Hinglish
+HINDI_KEYWORDS = frozenset([
+    "kya", "kaise", "karo", "haan", "nahin", "namaste", "tum", "aap",
+    "hal", "kahan", "kab", "kyon", "theek", "accha", "bura", "karta",
+    "karti", "bol", "sun", "samajh", "hindi", "bhai", "dost", "yaar"
+])
+
+DEVANAGARI_START = "\u0900"
+DEVANAGARI_END = "\u097F"
+
+
+def devanagari_ratio(text):
+    """Share of letters in the text that are Devanagari (0.0 - 1.0)."""
+    letters = devanagari = 0
+    for ch in text or "":
+        if DEVANAGARI_START <= ch <= DEVANAGARI_END:
+            devanagari += 1
+            letters += 1
+        elif ch.isalpha():
+            letters += 1
+    return devanagari / letters if letters else 0.0
+
+
+def detect_script(text):
+    """Returns 'devanagari', 'latin', 'mixed' or 'none'."""
+    ratio = devanagari_ratio(text)
+    if ratio == 0.0:
+        return "latin" if any(ch.isalpha() for ch in text or "") else "none"
+    if ratio >= 0.9:
+        return "devanagari"
+    return "mixed"
+
+
+def is_hinglish(text):
+    """Romanized Hindi (Latin script with Hindi keywords)."""
+    return detect_script(text) == "latin" and detect_language(text) == "hi"
+
+
+def needs_translation(text):
+    """True only if the text contains Devanagari that the pipeline cannot read."""
+    return detect_script(text) in ("devanagari", "mixed")
+
+
+def script_matches_language(text, language):
+    """Does a recognition result look like the language it was requested in?"""
+    script = detect_script(text)
+    if str(language).lower().startswith("hi"):
+        return script in ("devanagari", "mixed") or is_hinglish(text)
+    return script == "latin"
+
 
 def detect_language(text):
     """
@@ -12,19 +64,16 @@ def detect_language(text):
     """
     if not text:
         return "en"
-    
+
+    if devanagari_ratio(text) > 0:
+        return "hi"
+
     text = text.lower()
-    # Common Hindi words often used in Hinglish
-    hindi_keywords = [
-        "kya", "kaise", "karo", "haan", "nahin", "namaste", "tum", "aap", 
-        "hal", "kahan", "kab", "kyon", "theek", "accha", "bura", "karta", 
-        "karti", "bol", "sun", "samajh", "hindi", "bhai", "dost", "yaar"
-    ]
-    
+
     # Check for presence of Hindi keywords
     words = text.split()
     for word in words:
-        if word in hindi_keywords:
+        if word in HINDI_KEYWORDS:
             return "hi"
             
     # Default to English if no clear Hindi keywords found
@@ -0,0 +1,218 @@
+# Path: d:\New folder (2) - JARVIS\backend\core\language\rules.py
+"""
+Command Rules Module
+Precompiled Hinglish normalization and keyword fast-path intents.
+
+Everything is driven by the declarative tables below. At import time the
+tables are compiled into two regexes: one that rewrites Hinglish verbs and
+drops filler words in a single substitution, and one alternation of every
+rule keyword that collects all keyword hits in a single scan. Rules are then
+evaluated against the set of hits, so adding a keyword or intent never adds
+another pass over the text.
+
+Keywords match whole words (Latin or Devanagari); multi-word keywords also
+count as hits for the keywords they start with ("close tab" -> "close").
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Optional, Tuple
+
+# ================================
+# NORMALIZATION TABLE
+# ================================
+# Hinglish verb -> English verb
+WORD_MAP = {
+    "kholo": "open",
+    "khol": "open",
+    "band": "close",
+    "bnd": "close",
+    "dhundho": "search",
+    "dhundo": "search",
+    "khojo": "search",
+    "chalao": "play",
+    "bajao": "play",
+    "bjao": "play",
+    "bhejo": "send",
+    "bhej do": "send",
+    "batao": "tell",
+    "dikhao": "show",
+    "dikhaao": "show",
+    "dikhayo": "show",
+    "gaana": "song",
+    "gaane": "songs",
+}
+
+# "karo"-style helpers that carry no meaning for the intent model
+FILLERS = ("kro", "karo", "kar do", "kr do", "krdo", "kardo", "krna", "karna")
+
+# Letters that make up a word: \w plus the Devanagari block (its vowel
+# signs are not \w, so plain \b breaks inside Hindi words)
+_WORD_CHAR = r"[\w\u0900-\u097F]"
+
+
+def _alternation(words) -> str:
+    # Longest first so "kar do" wins over "kar", "close tab" over "close"
+    return "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+
+
+def _whole_words(words) -> str:
+    return rf"(?<!{_WORD_CHAR})(?:{_alternation(words)})(?!{_WORD_CHAR})"
+
+
+class HinglishNormalizer:
+    """Maps Hinglish verbs to English and strips fillers in one substitution."""
+
+    def __init__(self, word_map=None, fillers=FILLERS):
+        self.word_map = dict(WORD_MAP if word_map is None else word_map)
+        for filler in fillers:
+            self.word_map[filler] = ""
+        self._pattern = re.compile(_whole_words(self.word_map))
+
+    def _replace(self, match) -> str:
+        return self.word_map[match.group(0)]
+
+    def normalize(self, text: str) -> str:
+        if not text:
+            return ""
+        return self._pattern.sub(self._replace, text.lower())
+
+
+# ================================
+# RULE TABLE
+# ================================
+@dataclass(frozen=True)
+class Rule:
+    """
+    Fires when any keyword of `any_of` was hit and, if `also` is given, any
+    keyword of `also` too. `payload(text)` extracts the argument; when
+    `requires_payload` is set an empty payload means the rule does not fire.
+    """
+    intent: str
+    any_of: Tuple[str, ...]
+    also: Tuple[str, ...] = ()
+    payload: Optional[Callable[[str], Optional[str]]] = None
+    requires_payload: bool = False
+    group: str = "fast_path"
+
+
+def _search_query(text: str) -> str:
+    return (
+        text
+        .replace("search", "", 1)
+        .replace("on google", "")
+        .replace("google", "", 1)
+        .strip()
+    )
+
+
+def _open_name(text: str) -> str:
+    return (
+        text
+        .replace("open", "", 1)
+        .replace("website", "", 1)
+        .strip()
+    )
+
+
+BATTERY_WORDS = ("battery", "charge", "charging", "charger", "power")
+PLUG_WORDS = ("plug", "plugged", "plugged in", "on charge", "charging", "charger")
+
+WAKE_PHRASES = (
+    "jarvis", "jarvish", "jaarvis", "jervis", "synex",
+    "wake up", "wakeup", "wake", "vek ap", "vek up",
+    "वेक अप", "वेक", "जागो", "जाग जाओ",
+)
+
+# Synex main loop: evaluated in order within a group, first match wins
+SYNEX_RULES = (
+    # Browser
+    Rule("google_search", ("search", "searching", "google"), payload=_search_query, requires_payload=True),
+    Rule("open_item", ("open", "website"), payload=_open_name, requires_payload=True),
+    Rule("close_item", ("close",)),
+    Rule("browser_new_tab", ("new tab",)),
+    Rule("browser_next_tab", ("next tab",)),
+    Rule("browser_previous_tab", ("previous tab", "prev tab")),
+    Rule("browser_back", ("back",)),
+    Rule("browser_forward", ("forward",)),
+    Rule("browser_refresh", ("refresh", "reload")),
+    Rule("browser_scroll_down", ("scroll down",)),
+    Rule("browser_scroll_up", ("scroll up",)),
+    Rule("browser_scroll_top", ("scroll top",)),
+    Rule("browser_scroll_bottom", ("scroll bottom",)),
+    # Battery
+    Rule("check_battery_plug", BATTERY_WORDS, also=PLUG_WORDS),
+    Rule("check_battery_percentage", BATTERY_WORDS),
+    # Wake word (voice input while asleep)
+    Rule("wake", WAKE_PHRASES, group="wake"),
+    # Gesture mode toggles
+    Rule("on", ("gesture",), also=("on", "enable", "start", "activate"), group="gesture"),
+    Rule("off", ("gesture",), also=("off", "disable", "stop", "deactivate"), group="gesture"),
+    Rule("toggle", ("gesture",), group="gesture"),
+)
+
+FLOW_CANCEL_WORDS = (
+    "cancel", "stop", "exit", "never mind", "rehne do", "band karo", "abort", "cancel it", "discard",
+)
+
+# Legacy CommandProcessor: keyword intents that skip the model
+PROCESSOR_RULES = (
+    Rule("whatsapp_message", ("send whatsapp to",)),
+    Rule("email_message", ("send email to",)),
+    Rule("volume_mute", ("mute", "unmute", "silence", "quiet", "shant", "chup")),
+    Rule("volume_up", ("volume up", "increase volume", "volume badhao", "awaaz badhao", "loud")),
+    Rule("volume_down", ("volume down", "decrease volume", "volume kam karo", "awaaz kam karo", "dheere")),
+    Rule("brightness_control", ("brightness", "chamak")),
+    Rule("cancel_flow", FLOW_CANCEL_WORDS, group="flow"),
+)
+
+
+class RuleEngine:
+    """All keywords of a rule table compiled into one scanning regex."""
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        keywords = {kw for rule in self.rules for kw in rule.any_of + rule.also}
+        # A multi-word keyword also implies the keywords it starts with
+        self._implied = {
+            kw: frozenset(k for k in keywords if kw == k or kw.startswith(k + " "))
+            for kw in keywords
+        }
+        # Lookahead so overlapping keywords at different positions are all seen
+        self._pattern = re.compile(
+            rf"(?<!{_WORD_CHAR})(?=({_alternation(keywords)})(?!{_WORD_CHAR}))"
+        )
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Every keyword present in the (already lowercased) text."""
+        if not text:
+            return frozenset()
+        hits = set()
+        for match in self._pattern.finditer(text):
+            hits |= self._implied[match.group(1)]
+        return frozenset(hits)
+
+    def match(self, text: str, group: str = "fast_path", hits: Optional[FrozenSet[str]] = None):
+        """First rule of `group` that fires -> (intent, payload), else (None, None)."""
+        if hits is None:
+            hits = self.scan(text)
+        if not hits:
+            return None, None
+        for rule in self.rules:
+            if rule.group != group or hits.isdisjoint(rule.any_of):
+                continue
+            if rule.also and hits.isdisjoint(rule.also):
+                continue
+            payload = rule.payload(text) if rule.payload else None
+            if rule.requires_payload and not payload:
+                continue
+            return rule.intent, payload
+        return None, None
+
+
+_normalizer = HinglishNormalizer()
+
+
+def normalize_hinglish(text: str) -> str:
+    """Lowercase, map Hinglish verbs to English and drop filler words."""
+    return _normalizer.normalize(text)
@@ -0,0 +1,48 @@
+# BACKEND/core/language/tests/test_detector.py
+"""
+Unit tests for script / Hinglish detection
+"""
+
+import unittest
+
+from BACKEND.core.language.detector import (
+    detect_language,
+    detect_script,
+    is_hinglish,
+    needs_translation,
+    script_matches_language,
+)
+
+
+class TestDetector(unittest.TestCase):
+    def test_detect_script(self):
+        self.assertEqual(detect_script("समय क्या है"), "devanagari")
+        self.assertEqual(detect_script("youtube पर गाना चलाओ"), "mixed")
+        self.assertEqual(detect_script("open chrome"), "latin")
+        self.assertEqual(detect_script("123 ?"), "none")
+        self.assertEqual(detect_script(""), "none")
+
+    def test_language_and_hinglish(self):
+        self.assertEqual(detect_language("समय क्या है"), "hi")
+        self.assertEqual(detect_language("bhai time kya hai"), "hi")
+        self.assertEqual(detect_language("what is the time"), "en")
+        self.assertTrue(is_hinglish("bhai time kya hai"))
+        self.assertFalse(is_hinglish("what is the time"))
+        self.assertFalse(is_hinglish("समय क्या है"))
+
+    def test_needs_translation(self):
+        self.assertTrue(needs_translation("समय क्या है"))
+        self.assertTrue(needs_translation("chrome खोलो"))
+        self.assertFalse(needs_translation("samay kya hai"))
+        self.assertFalse(needs_translation("open chrome"))
+
+    def test_script_matches_language(self):
+        self.assertTrue(script_matches_language("समय क्या है", "hi-IN"))
+        self.assertTrue(script_matches_language("samay kya hai", "hi-IN"))
+        self.assertFalse(script_matches_language("open chrome", "hi-IN"))
+        self.assertTrue(script_matches_language("open chrome", "en-IN"))
+        self.assertFalse(script_matches_language("समय क्या है", "en-US"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# BACKEND/core/language/tests/test_rules.py
+"""
+Unit tests for the compiled Hinglish normalizer and keyword rule engine
+"""
+
+import unittest
+
+from BACKEND.core.language.rules import (
+    PROCESSOR_RULES,
+    SYNEX_RULES,
+    Rule,
+    RuleEngine,
+    normalize_hinglish,
+)
+
+
+def clean(text):
+    return " ".join(normalize_hinglish(text).split())
+
+
+class TestNormalizer(unittest.TestCase):
+    def test_verbs_and_fillers(self):
+        self.assertEqual(clean("YouTube kholo"), "youtube open")
+        self.assertEqual(clean("chrome open kar do"), "chrome open")
+        self.assertEqual(clean("arijit ke gaane chalao"), "arijit ke songs play")
+        self.assertEqual(clean("rahul ko message bhej do"), "rahul ko message send")
+        self.assertEqual(clean("notepad band karo"), "notepad close")
+        self.assertEqual(clean("mausam batao"), "mausam tell")
+
+    def test_whole_words_only(self):
+        # "band" inside "bandwidth", "karo" inside "karol bagh" are left alone
+        self.assertEqual(clean("check bandwidth"), "check bandwidth")
+        self.assertEqual(clean("weather in karol bagh"), "weather in karol bagh")
+        self.assertEqual(clean(""), "")
+
+
+class TestRuleEngine(unittest.TestCase):
+    def setUp(self):
+        self.rules = RuleEngine(SYNEX_RULES)
+
+    def test_browser_fast_paths(self):
+        self.assertEqual(self.rules.match("search best laptops on google"), ("google_search", "best laptops"))
+        self.assertEqual(self.rules.match("open github website"), ("open_item", "github"))
+        self.assertEqual(self.rules.match("close tab"), ("close_item", None))
+        self.assertEqual(self.rules.match("next tab"), ("browser_next_tab", None))
+        self.assertEqual(self.rules.match("scroll down"), ("browser_scroll_down", None))
+        # "search" with nothing to search falls through to later rules
+        self.assertEqual(self.rules.match("search"), (None, None))
+
+    def test_battery_and_precedence(self):
+        self.assertEqual(self.rules.match("battery status")[0], "check_battery_percentage")
+        self.assertEqual(self.rules.match("is the charger plugged in")[0], "check_battery_plug")
+        self.assertEqual(self.rules.match("is laptop on charge")[0], "check_battery_plug")
+        # Browser rules come first in the table
+        self.assertEqual(self.rules.match("open battery settings")[0], "open_item")
+
+    def test_no_substring_false_positives(self):
+        self.assertEqual(self.rules.match("give feedback"), (None, None))
+        self.assertEqual(self.rules.match("what is the weather today"), (None, None))
+
+    def test_wake_and_gesture_groups(self):
+        self.assertEqual(self.rules.match("hey jarvis", group="wake")[0], "wake")
+        self.assertEqual(self.rules.match("जाग जाओ", group="wake")[0], "wake")
+        self.assertIsNone(self.rules.match("open youtube", group="wake")[0])
+
+        self.assertEqual(self.rules.match("gesture mode on", group="gesture")[0], "on")
+        self.assertEqual(self.rules.match("gesture control off", group="gesture")[0], "off")
+        self.assertEqual(self.rules.match("gesture mode", group="gesture")[0], "toggle")
+        self.assertIsNone(self.rules.match("turn on wifi", group="gesture")[0])
+
+    def test_scan_reports_implied_keywords(self):
+        hits = self.rules.scan("close tab and scroll down")
+        self.assertTrue({"close", "scroll down"} <= hits)
+        self.assertEqual(self.rules.match("close tab", hits=hits)[0], "close_item")
+
+    def test_processor_rules(self):
+        rules = RuleEngine(PROCESSOR_RULES)
+        self.assertEqual(rules.match("send whatsapp to mom")[0], "whatsapp_message")
+        self.assertEqual(rules.match("volume kam karo")[0], "volume_down")
+        self.assertEqual(rules.match("awaaz badhao")[0], "volume_up")
+        self.assertEqual(rules.match("mute")[0], "volume_mute")
+        self.assertEqual(rules.match("never mind", group="flow")[0], "cancel_flow")
+        self.assertIsNone(rules.match("stopwatch", group="flow")[0])
+
+    def test_custom_table(self):
+        rules = RuleEngine([Rule("lights_on", ("lights",), also=("on",))])
+        self.assertEqual(rules.match("lights on")[0], "lights_on")
+        self.assertIsNone(rules.match("lights off")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+# Path: d:\New folder (2) - JARVIS\backend\core\language\translator.py
+"""
+Translator Module
+Default text translator used by the speech listener. Anything callable as
+translator(text) -> str can be injected instead (e.g. a local stub for
+benchmarks or an offline model).
+"""
+
+
+class MTranslateTranslator:
+    def __init__(self, target="en-us"):
+        self.target = target
+        self.calls = 0
+
+    def __call__(self, text):
+        from mtranslate import translate
+
+        self.calls += 1
+        return translate(text, self.target)
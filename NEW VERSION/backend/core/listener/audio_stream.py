@@ -0,0 +1,262 @@
+# BACKEND/core/listener/audio_stream.py
+"""
+Continuous capture pipeline for voice input.
+
+    source (mic / WAV) -> ring buffer -> VAD + segmenter -> utterance queue
+
+MicrophoneStream keeps ONE input stream open for the lifetime of the
+listener; its audio callback only copies frames into a bounded ring buffer
+(oldest frames are dropped if the consumer falls behind). SpeechPipeline
+runs the segmenter on its own thread and publishes Utterances, which the
+caller hands to a recognizer.
+
+replay_wav() drives the same segmenter from a WAV file so end-of-speech to
+text latency can be measured offline.
+"""
+
+import collections
+import os
+import queue
+import threading
+import time
+import wave
+from typing import Callable, Optional
+
+import numpy as np
+
+from BACKEND.core.listener.vad import FRAME_BYTES, FRAME_SAMPLES, SAMPLE_RATE, UtteranceSegmenter
+
+
+class RingBuffer:
+    """Bounded frame buffer: producer never blocks, oldest frames are dropped."""
+
+    def __init__(self, max_frames: int = 200):
+        self._frames = collections.deque(maxlen=max_frames)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, frame: bytes):
+        with self._cond:
+            if len(self._frames) == self._frames.maxlen:
+                self.dropped += 1
+            self._frames.append(frame)
+            self._cond.notify()
+
+    def get(self, timeout: float = None) -> Optional[bytes]:
+        with self._cond:
+            if not self._frames and not self._cond.wait_for(lambda: self._frames, timeout):
+                return None
+            return self._frames.popleft()
+
+    def clear(self):
+        with self._cond:
+            self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+
+# ================================
+# SOURCES
+# ================================
+class MicrophoneStream:
+    """One persistent 16 kHz mono int16 input stream (sounddevice)."""
+
+    def __init__(self, device_index: int = None, ring_frames: int = 200):
+        self.device_index = device_index
+        self.buffer = RingBuffer(ring_frames)
+        self._stream = None
+
+    def start(self):
+        if self._stream is not None:
+            return
+        import sounddevice as sd
+
+        def callback(indata, frames, time_info, status):
+            self.buffer.put(bytes(indata))
+
+        self._stream = sd.RawInputStream(
+            samplerate=SAMPLE_RATE,
+            blocksize=FRAME_SAMPLES,
+            dtype="int16",
+            channels=1,
+            device=self.device_index,
+            callback=callback
+        )
+        self._stream.start()
+
+    def read(self, timeout: float = 0.1) -> Optional[bytes]:
+        return self.buffer.get(timeout)
+
+    def stop(self):
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            finally:
+                self._stream = None
+
+
+def read_wav_frames(path: str):
+    """Yield FRAME_BYTES frames from a WAV, down-mixed/resampled to 16 kHz int16."""
+    with wave.open(path, "rb") as f:
+        channels, width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+        raw = f.readframes(f.getnframes())
+
+    if width != 2:
+        raise ValueError(f"{os.path.basename(path)}: only 16-bit PCM WAV is supported")
+    samples = np.frombuffer(raw, dtype=np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        positions = np.arange(0, len(samples), rate / SAMPLE_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    pcm = samples.astype(np.int16).tobytes()
+
+    for offset in range(0, len(pcm) - FRAME_BYTES + 1, FRAME_BYTES):
+        yield pcm[offset:offset + FRAME_BYTES]
+
+
+class WavFileSource:
+    """Replays a WAV through the pipeline, optionally at real-time pace."""
+
+    def __init__(self, path: str, realtime: bool = False):
+        self.path = path
+        self.realtime = realtime
+        self._frames = None
+        self._next_at = None
+        self.finished = False
+
+    def start(self):
+        self._frames = read_wav_frames(self.path)
+        self._next_at = time.monotonic()
+
+    def read(self, timeout: float = 0.1) -> Optional[bytes]:
+        if self.realtime:
+            delay = self._next_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_at += FRAME_SAMPLES / SAMPLE_RATE
+        frame = next(self._frames, None)
+        if frame is None:
+            self.finished = True
+            time.sleep(min(timeout, 0.01))
+        return frame
+
+    def stop(self):
+        self._frames = iter(())
+
+
+# ================================
+# PIPELINE
+# ================================
+class SpeechPipeline:
+    """Runs segmentation on a background thread, publishing Utterances."""
+
+    def __init__(self, source, segmenter: UtteranceSegmenter = None, on_utterance: Callable = None):
+        self.source = source
+        self.segmenter = segmenter or UtteranceSegmenter()
+        self.on_utterance = on_utterance
+        self.utterances = queue.Queue(maxsize=16)
+        self._stop = threading.Event()
+        self._thread = None
+        self.error = None
+
+    @property
+    def in_speech(self) -> bool:
+        return self.segmenter.in_speech
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.source.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SynexSpeechPipeline", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                frame = self.source.read(timeout=0.1)
+                if frame is None:
+                    if getattr(self.source, "finished", False):
+                        self._publish(self.segmenter.flush())
+                        break
+                    continue
+                self._publish(self.segmenter.push(frame))
+        except Exception as e:
+            self.error = e
+            print(f"[SPEECH PIPELINE ERROR] {type(e).__name__}: {e}")
+
+    def _publish(self, utterance):
+        if utterance is None:
+            return
+        utterance.wall_detected = time.monotonic()
+        if self.on_utterance is not None:
+            self.on_utterance(utterance)
+            return
+        if self.utterances.full():
+            try:
+                self.utterances.get_nowait()  # nobody is listening: keep the newest
+            except queue.Empty:
+                pass
+        self.utterances.put(utterance)
+
+    def next_utterance(self, timeout: float = None, since: float = None):
+        """Next utterance that ended after `since` (monotonic), or None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                utterance = self.utterances.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            # Drop speech that finished before the caller started listening
+            # (e.g. our own TTS while the mic was gated)
+            if since is None or utterance.wall_end >= since:
+                return utterance
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.source.stop()
+
+
+def replay_wav(path: str, recognize: Callable = None, segmenter: UtteranceSegmenter = None):
+    """
+    Feed a WAV file through VAD + segmentation (faster than real time) and
+    optionally recognize each utterance.
+
+    Returns one dict per utterance with its boundaries, the text and
+    end-of-speech -> text latency: the segmenter's hangover (audio time)
+    plus the recognizer's wall time.
+    """
+    segmenter = segmenter or UtteranceSegmenter()
+    results = []
+
+    def handle(utterance):
+        if utterance is None:
+            return
+        t0 = time.perf_counter()
+        text = recognize(utterance) if recognize else None
+        recognize_ms = (time.perf_counter() - t0) * 1000
+        endpoint_ms = (utterance.detected_time - utterance.end_time) * 1000
+        results.append({
+            "start": round(utterance.start_time, 3),
+            "end": round(utterance.end_time, 3),
+            "text": text,
+            "endpoint_ms": endpoint_ms,
+            "recognize_ms": recognize_ms,
+            "latency_ms": endpoint_ms + recognize_ms,
+        })
+
+    for frame in read_wav_frames(path):
+        handle(segmenter.push(frame))
+    handle(segmenter.flush())
+    return results
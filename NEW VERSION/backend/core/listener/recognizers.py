@@ -0,0 +1,181 @@
+# BACKEND/core/listener/recognizers.py
+"""
+Pluggable speech recognizers for the capture pipeline.
+
+A recognizer is any object with recognize(utterance) -> str, returning ""
+when nothing was understood and raising RecognitionError when the service
+itself failed. Utterances are 16 kHz mono int16 PCM (see vad.Utterance).
+
+Per-language backends implement
+    recognize_language(utterance, language, cancel_event) -> (text, confidence)
+and ParallelRecognizer fans one utterance out to all candidate languages
+at once. A result wins as soon as it is confident (high confidence and in
+the script of its language) or every higher-priority language came back
+empty; the remaining requests are cancelled.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+
+from BACKEND.core.language.detector import script_matches_language
+
+LANGUAGES = ("en-IN", "en-US", "hi-IN")
+
+
+class RecognitionError(RuntimeError):
+    """The recognition service failed (network, quota, ...)."""
+
+
+class GoogleRecognizer:
+    """Google Web Speech backend (speech_recognition), one language per call."""
+
+    def __init__(self, operation_timeout: float = 8.0):
+        import speech_recognition as sr
+
+        self._sr = sr
+        self.recognizer = sr.Recognizer()
+        self.recognizer.operation_timeout = operation_timeout
+
+    def recognize_language(self, utterance, language, cancel_event=None):
+        sr = self._sr
+        audio = sr.AudioData(utterance.pcm, utterance.sample_rate, 2)
+        try:
+            response = self.recognizer.recognize_google(audio, language=language, show_all=True)
+        except sr.UnknownValueError:
+            return "", None
+        except sr.RequestError as e:
+            raise RecognitionError(str(e)) from e
+
+        if not isinstance(response, dict) or not response.get("alternative"):
+            return "", None
+        best = response["alternative"][0]
+        return best.get("transcript", "").lower(), best.get("confidence")
+
+
+class StubRecognizer:
+    """
+    Local stand-in for benchmarks/tests.
+    results: {language: (text, delay_seconds, confidence)}
+    """
+
+    def __init__(self, results: dict):
+        self.results = results
+        self.calls = []
+        self.cancelled = []
+
+    def recognize_language(self, utterance, language, cancel_event=None):
+        self.calls.append(language)
+        text, delay, confidence = self.results.get(language, ("", 0.0, None))
+        if isinstance(text, Exception):
+            time.sleep(delay)
+            raise text
+        if cancel_event is not None and cancel_event.wait(delay):
+            self.cancelled.append(language)
+            return "", None
+        if cancel_event is None:
+            time.sleep(delay)
+        return text, confidence
+
+
+class ParallelRecognizer:
+    def __init__(
+        self,
+        backend,
+        languages=LANGUAGES,
+        min_confidence: float = 0.75,
+        timeout: float = 10.0,
+        max_workers: int = None,
+    ):
+        self.backend = backend
+        self.languages = tuple(languages)
+        self.min_confidence = min_confidence
+        self.timeout = timeout
+        # Headroom for requests that are still finishing after a cancel
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(self.languages) * 2,
+            thread_name_prefix="SynexASR"
+        )
+
+        # Stats
+        self.last_language = None
+        self.last_latency_ms = None
+        self.cancelled = 0
+
+    def _confident(self, language, text, confidence) -> bool:
+        if confidence is None or confidence < self.min_confidence:
+            return False
+        return script_matches_language(text, language)
+
+    def _pick(self, results, final: bool):
+        """(language, text) once a winner is known, else None."""
+        for language in self.languages:
+            result = results.get(language)
+            if result and result[0] and self._confident(language, *result):
+                return language, result[0]
+
+        for language in self.languages:
+            if language not in results:
+                if not final:
+                    return None  # a higher-priority language is still running
+                continue
+            result = results[language]
+            if result and result[0]:
+                return language, result[0]
+        return None
+
+    def recognize(self, utterance) -> str:
+        t0 = time.perf_counter()
+        cancel = threading.Event()
+        futures = {
+            self._executor.submit(self.backend.recognize_language, utterance, language, cancel): language
+            for language in self.languages
+        }
+        results = {}
+        errors = []
+        winner = None
+
+        try:
+            for future in as_completed(futures, timeout=self.timeout):
+                language = futures[future]
+                try:
+                    results[language] = future.result()
+                except RecognitionError as e:
+                    errors.append(e)
+                    results[language] = None
+                    continue
+                winner = self._pick(results, final=False)
+                if winner:
+                    break
+        except FuturesTimeout:
+            pass
+        finally:
+            cancel.set()
+            for future, language in futures.items():
+                if language not in results:
+                    future.cancel()
+                    self.cancelled += 1
+
+        if winner is None:
+            winner = self._pick(results, final=True)
+        self.last_latency_ms = (time.perf_counter() - t0) * 1000
+
+        if winner is None:
+            self.last_language = None
+            if errors and len(errors) == len(self.languages):
+                raise errors[0]
+            return ""
+        self.last_language = winner[0]
+        return winner[1]
+
+    def get_stats(self) -> dict:
+        return {
+            "languages": list(self.languages),
+            "last_language": self.last_language,
+            "last_latency_ms": self.last_latency_ms,
+            "cancelled": self.cancelled,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,25 +1,38 @@
 # BACKEND/core/listener/speech_listener.py
 import os
-import speech_recognition as sr
-from mtranslate import translate
+import time
 from colorama import Fore, init
 
+from BACKEND.core.language.detector import needs_translation
+from BACKEND.core.language.translator import MTranslateTranslator
+from BACKEND.core.listener.audio_stream import MicrophoneStream, SpeechPipeline
+from BACKEND.core.listener.recognizers import GoogleRecognizer, ParallelRecognizer, RecognitionError
+from BACKEND.core.listener.vad import UtteranceSegmenter
+
 init(autoreset=True)
 
 
 class SpeechListener:
-    def __init__(self):
-        self.recognizer = sr.Recognizer()
+    """
+    Listens on one persistent microphone stream.
+
+    Frames flow through VAD + utterance segmentation continuously (see
+    audio_stream.SpeechPipeline); listen() just waits for the next utterance
+    and hands it to the recognizer, so there is no per-call microphone
+    reopen or ambient-noise calibration.
+
+    The default recognizer queries en-IN / en-US / hi-IN in parallel and
+    only Devanagari results are sent to the translator.
+    """
+
+    def __init__(self, recognizer=None, source=None, segmenter=None, translator=None):
+        self._recognizer = recognizer
+        self.translator = translator or MTranslateTranslator()
+        self._source = source
+        self._segmenter = segmenter
+        self.pipeline = None
         self._failures = 0
 
-        # 🔑 KEY IMPROVEMENTS
-        self.recognizer.energy_threshold = 3000
-        self.recognizer.dynamic_energy_threshold = True
-
-        # Allow thinking pauses
-        self.recognizer.pause_threshold = 1.2
-        self.recognizer.non_speaking_duration = 0.8
-
         # Optional device selection via env
         try:
             device_env = os.getenv("MIC_DEVICE_INDEX")
@@ -27,12 +40,29 @@ class SpeechListener:
         except Exception:
             self.device_index = None
 
-    def _reset_recognizer(self):
-        self.recognizer = sr.Recognizer()
-        self.recognizer.energy_threshold = 3000
-        self.recognizer.dynamic_energy_threshold = True
-        self.recognizer.pause_threshold = 1.2
-        self.recognizer.non_speaking_duration = 0.8
+    @property
+    def recognizer(self):
+        if self._recognizer is None:
+            self._recognizer = ParallelRecognizer(GoogleRecognizer())
+        return self._recognizer
+
+    def _ensure_pipeline(self):
+        if self.pipeline is not None and self.pipeline.is_running():
+            return self.pipeline
+        source = self._source or MicrophoneStream(self.device_index)
+        # Allow thinking pauses, but endpoint well before the old 1.2s
+        segmenter = self._segmenter or UtteranceSegmenter(hangover_ms=800)
+        self.pipeline = SpeechPipeline(source, segmenter)
+        self.pipeline.start()
+        return self.pipeline
+
+    def _reset_pipeline(self):
+        if self.pipeline is not None:
+            try:
+                self.pipeline.stop()
+            except Exception:
+                pass
+        self.pipeline = None
 
     def _to_english(self, text: str) -> str:
         """Return English text. Translate Hindi to English."""
@@ -54,20 +84,34 @@ class SpeechListener:
         if any(word in text.lower() for word in NO_TRANSLATE_KEYWORDS):
             return text  # 🔥 KEEP ORIGINAL
 
-        # If the text contains Hindi characters, translate to English
-        if any('\u0900' <= ch <= '\u097F' for ch in text):
-            try:
-                return translate(text, "en-us")
-            except Exception as e:
-                print(Fore.RED + f"[Translation Error] {e}")
-                return text
+        # English and romanized Hinglish are understood as-is; only
+        # Devanagari needs the translation round trip
+        if not needs_translation(text):
+            return text
 
         try:
-            return translate(text, "en-us")
+            return self.translator(text)
         except Exception as e:
             print(Fore.RED + f"[Translation Error] {e}")
             return text
 
+    def _wait_for_utterance(self, pipeline, since, timeout, phrase_time_limit):
+        """Next utterance, or None if nobody started speaking within timeout."""
+        pipeline.segmenter.max_utterance_s = phrase_time_limit
+        deadline = since + timeout
+        hard_deadline = deadline + phrase_time_limit + 1.0
+        while True:
+            utterance = pipeline.next_utterance(timeout=0.1, since=since)
+            if utterance is not None:
+                return utterance
+            if pipeline.error is not None:
+                raise OSError(f"Audio stream stopped: {pipeline.error}")
+            if not pipeline.is_running():
+                return None  # closed by stop()
+            now = time.monotonic()
+            if (now > deadline and not pipeline.in_speech) or now > hard_deadline:
+                return None
+
     def listen(self, timeout=6, phrase_time_limit=8, max_attempts=3) -> str:
         """
         Listens once and returns recognized English text.
@@ -76,63 +120,52 @@ class SpeechListener:
         attempts = 0
         while attempts < max_attempts:
             try:
-                with sr.Microphone(device_index=self.device_index) as source:
-                    print(Fore.LIGHTGREEN_EX + "🎙 Listening...")
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
-
-                    try:
-                        audio = self.recognizer.listen(
-                            source,
-                            timeout=timeout,
-                            phrase_time_limit=phrase_time_limit
-                        )
-
-                        print(Fore.LIGHTYELLOW_EX + "🧠 Recognizing...")
-
-                        raw_text = ""
-                        for lang in ("en-IN", "en-US", "hi-IN"):
-                            try:
-                                raw_text = self.recognizer.recognize_google(
-                                    audio,
-                                    language=lang
-                                ).lower()
-                                if raw_text:
-                                    break
-                            except sr.UnknownValueError:
-                                continue
-
-                        if not raw_text:
-                            self._failures += 1
-                            if self._failures >= 3:
-                                self._failures = 0
-                                self._reset_recognizer()
-                            return ""
-
-                        english = self._to_english(raw_text)
-                        print(Fore.BLUE + f"🎧 Heard: {english}")
+                pipeline = self._ensure_pipeline()
+                since = time.monotonic()
+                print(Fore.LIGHTGREEN_EX + "🎙 Listening...")
+
+                utterance = self._wait_for_utterance(pipeline, since, timeout, phrase_time_limit)
+                if utterance is None:
+                    print(Fore.RED + "⏱ Listening timeout")
+                    self._failures += 1
+                    return ""
+
+                print(Fore.LIGHTYELLOW_EX + "🧠 Recognizing...")
+                try:
+                    raw_text = self.recognizer.recognize(utterance)
+                except RecognitionError as e:
+                    print(Fore.RED + f"🌐 Speech API error: {e}")
+                    self._failures += 1
+                    return ""
+
+                if not raw_text:
+                    print(Fore.RED + "❓ Could not understand audio")
+                    self._failures += 1
+                    if self._failures >= 3:
+                        # Re-open the stream and re-learn the noise floor
                         self._failures = 0
-                        return english.strip()
-
-                    except sr.WaitTimeoutError:
-                        print(Fore.RED + "⏱ Listening timeout")
-                        self._failures += 1
-                        return ""
-
-                    except sr.UnknownValueError:
-                        print(Fore.RED + "❓ Could not understand audio")
-                        self._failures += 1
-                        attempts += 1
-                        continue
-
-                    except sr.RequestError as e:
-                        print(Fore.RED + f"🌐 Speech API error: {e}")
-                        self._failures += 1
-                        return ""
+                        self._reset_pipeline()
+                    return ""
+
+                english = self._to_english(raw_text.lower())
+                print(Fore.BLUE + f"🎧 Heard: {english}")
+                self._failures = 0
+                return english.strip()
+
             except OSError as e:
                 print(Fore.RED + f"🎤 Microphone error: {e}")
+                self._reset_pipeline()
                 return "__MIC_BUSY__"
-            except Exception:
+            except Exception as e:
+                if type(e).__name__ == "PortAudioError":
+                    print(Fore.RED + f"🎤 Microphone error: {e}")
+                    self._reset_pipeline()
+                    return "__MIC_BUSY__"
                 attempts += 1
                 continue
 
         return ""
+
+    def close(self):
+        """Release the microphone stream."""
+        self._reset_pipeline()
@@ -0,0 +1,116 @@
+# BACKEND/core/listener/tests/test_parallel_recognizer.py
+"""
+Unit tests for parallel multi-language recognition and translation skipping
+"""
+
+import time
+import unittest
+
+from BACKEND.core.listener.recognizers import ParallelRecognizer, RecognitionError, StubRecognizer
+from BACKEND.core.listener.speech_listener import SpeechListener
+from BACKEND.core.listener.vad import Utterance
+
+UTTERANCE = Utterance(pcm=b"\0\0" * 1600)
+
+
+class CountingTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return "what is the time"
+
+
+class TestParallelRecognizer(unittest.TestCase):
+    def _recognizer(self, results, **kwargs):
+        backend = StubRecognizer(results)
+        recognizer = ParallelRecognizer(backend, **kwargs)
+        self.addCleanup(recognizer.shutdown)
+        return backend, recognizer
+
+    def test_languages_run_concurrently(self):
+        backend, recognizer = self._recognizer({
+            "en-IN": ("", 0.2, None),
+            "en-US": ("", 0.2, None),
+            "hi-IN": ("समय क्या है", 0.2, None),
+        })
+        start = time.perf_counter()
+        self.assertEqual(recognizer.recognize(UTTERANCE), "समय क्या है")
+        self.assertLess(time.perf_counter() - start, 0.45)
+        self.assertEqual(recognizer.last_language, "hi-IN")
+
+    def test_confident_result_wins_and_cancels_rest(self):
+        backend, recognizer = self._recognizer({
+            "en-IN": ("some time", 1.0, 0.4),
+            "en-US": ("", 1.0, None),
+            "hi-IN": ("समय क्या है", 0.05, 0.92),
+        })
+        start = time.perf_counter()
+        self.assertEqual(recognizer.recognize(UTTERANCE), "समय क्या है")
+        self.assertLess(time.perf_counter() - start, 0.5)
+        time.sleep(0.05)
+        self.assertEqual(sorted(backend.cancelled), ["en-IN", "en-US"])
+
+    def test_priority_order_when_not_confident(self):
+        backend, recognizer = self._recognizer({
+            "en-IN": ("open notepad", 0.15, None),
+            "en-US": ("open note pad", 0.01, None),
+            "hi-IN": ("", 0.01, None),
+        })
+        # en-US finished first but en-IN is preferred and still running
+        self.assertEqual(recognizer.recognize(UTTERANCE), "open notepad")
+
+    def test_top_priority_result_returns_immediately(self):
+        backend, recognizer = self._recognizer({
+            "en-IN": ("open notepad", 0.01, None),
+            "en-US": ("", 1.0, None),
+            "hi-IN": ("", 1.0, None),
+        })
+        start = time.perf_counter()
+        self.assertEqual(recognizer.recognize(UTTERANCE), "open notepad")
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_script_mismatch_is_not_confident(self):
+        backend, recognizer = self._recognizer({
+            "en-IN": ("samay kya hai", 0.2, None),
+            "en-US": ("", 0.2, None),
+            "hi-IN": ("some random english", 0.01, 0.99),
+        })
+        self.assertEqual(recognizer.recognize(UTTERANCE), "samay kya hai")
+
+    def test_errors(self):
+        backend, recognizer = self._recognizer({
+            "en-IN": (RecognitionError("quota"), 0.0, None),
+            "en-US": ("open chrome", 0.05, None),
+            "hi-IN": ("", 0.05, None),
+        })
+        self.assertEqual(recognizer.recognize(UTTERANCE), "open chrome")
+
+        backend, recognizer = self._recognizer({
+            lang: (RecognitionError("offline"), 0.0, None) for lang in ("en-IN", "en-US", "hi-IN")
+        })
+        with self.assertRaises(RecognitionError):
+            recognizer.recognize(UTTERANCE)
+
+    def test_nothing_understood(self):
+        backend, recognizer = self._recognizer({})
+        self.assertEqual(recognizer.recognize(UTTERANCE), "")
+
+
+class TestTranslationSkipping(unittest.TestCase):
+    def test_only_devanagari_is_translated(self):
+        translator = CountingTranslator()
+        listener = SpeechListener(recognizer=object(), translator=translator)
+
+        self.assertEqual(listener._to_english("what is the time"), "what is the time")
+        self.assertEqual(listener._to_english("samay kya hai"), "samay kya hai")
+        self.assertEqual(listener._to_english("youtube पर गाना चलाओ"), "youtube पर गाना चलाओ")
+        self.assertEqual(translator.calls, [])
+
+        self.assertEqual(listener._to_english("समय क्या है"), "what is the time")
+        self.assertEqual(translator.calls, ["समय क्या है"])
+
+
+if __name__ == "__main__":
+    unittest.main()
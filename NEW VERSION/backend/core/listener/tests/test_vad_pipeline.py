@@ -0,0 +1,143 @@
+# BACKEND/core/listener/tests/test_vad_pipeline.py
+"""
+Unit tests for VAD, utterance segmentation and the WAV replay harness
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import wave
+from unittest.mock import patch
+
+import numpy as np
+
+from BACKEND.core.listener.audio_stream import RingBuffer, SpeechPipeline, WavFileSource, replay_wav
+from BACKEND.core.listener.speech_listener import SpeechListener
+from BACKEND.core.listener.vad import SAMPLE_RATE, EnergyVAD, UtteranceSegmenter
+
+
+def synth(segments, noise=100.0, seed=0):
+    """segments: [(seconds, tone_amplitude or 0)] -> int16 samples"""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for seconds, amplitude in segments:
+        n = int(seconds * SAMPLE_RATE)
+        t = np.arange(n) / SAMPLE_RATE
+        signal = rng.normal(0, noise, n)
+        if amplitude:
+            signal += amplitude * np.sin(2 * np.pi * 220 * t)
+        parts.append(signal)
+    return np.clip(np.concatenate(parts), -32768, 32767).astype(np.int16)
+
+
+def write_wav(path, samples, rate=SAMPLE_RATE, channels=1):
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.tobytes())
+
+
+class FakeRecognizer:
+    def __init__(self, text="open notepad"):
+        self.text = text
+        self.calls = 0
+
+    def recognize(self, utterance):
+        self.calls += 1
+        return self.text
+
+
+class TestSegmentation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _wav(self, name, samples, **kwargs):
+        path = os.path.join(self.temp_dir, name)
+        write_wav(path, samples, **kwargs)
+        return path
+
+    def test_two_utterances_with_boundaries(self):
+        path = self._wav("two.wav", synth([(0.5, 0), (1.0, 6000), (1.0, 0), (0.8, 6000), (0.6, 0)]))
+        results = replay_wav(path, FakeRecognizer().recognize, UtteranceSegmenter(hangover_ms=600))
+
+        self.assertEqual(len(results), 2)
+        self.assertAlmostEqual(results[0]["start"], 0.5, delta=0.06)
+        self.assertAlmostEqual(results[0]["end"], 1.5, delta=0.06)
+        self.assertAlmostEqual(results[1]["start"], 2.5, delta=0.06)
+        self.assertAlmostEqual(results[1]["end"], 3.3, delta=0.06)
+        for result in results:
+            self.assertEqual(result["text"], "open notepad")
+            self.assertAlmostEqual(result["endpoint_ms"], 600, delta=31)
+
+    def test_noise_floor_adapts_to_loud_background(self):
+        # Steady fan noise well above the static minimum is not speech
+        vad = EnergyVAD()
+        path = self._wav("fan.wav", synth([(2.0, 0)], noise=1500))
+        self.assertEqual(replay_wav(path, segmenter=UtteranceSegmenter(vad=vad)), [])
+        self.assertGreater(vad.noise_floor, 1000)
+
+        path = self._wav("fan_speech.wav", synth([(1.0, 0), (0.8, 12000), (1.0, 0)], noise=1500))
+        self.assertEqual(len(replay_wav(path)), 1)
+
+    def test_short_clicks_ignored_and_long_speech_split(self):
+        path = self._wav("click.wav", synth([(0.5, 0), (0.15, 8000), (1.0, 0)]))
+        self.assertEqual(replay_wav(path), [])
+
+        path = self._wav("long.wav", synth([(0.3, 0), (5.0, 6000), (0.5, 0)]))
+        results = replay_wav(path, segmenter=UtteranceSegmenter(max_utterance_s=2.0))
+        self.assertGreaterEqual(len(results), 2)
+
+    def test_stereo_44k_input_is_resampled(self):
+        mono = synth([(0.5, 0), (1.0, 6000), (0.8, 0)])
+        stretched = np.interp(np.arange(0, len(mono), SAMPLE_RATE / 44100), np.arange(len(mono)), mono)
+        stereo = np.repeat(stretched.astype(np.int16), 2)
+        path = self._wav("stereo.wav", stereo, rate=44100, channels=2)
+        self.assertEqual(len(replay_wav(path)), 1)
+
+    def test_ring_buffer_drops_oldest(self):
+        ring = RingBuffer(max_frames=3)
+        for i in range(5):
+            ring.put(bytes([i]))
+        self.assertEqual(ring.dropped, 2)
+        self.assertEqual(ring.get(timeout=0), bytes([2]))
+        self.assertEqual(len(ring), 2)
+
+
+class TestSpeechPipeline(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "cmd.wav")
+        write_wav(self.path, synth([(0.3, 0), (0.6, 6000), (0.8, 0)]))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_pipeline_publishes_utterances(self):
+        pipeline = SpeechPipeline(WavFileSource(self.path), UtteranceSegmenter(hangover_ms=300))
+        pipeline.start()
+        utterance = pipeline.next_utterance(timeout=2.0)
+        pipeline.stop()
+        self.assertIsNotNone(utterance)
+        self.assertAlmostEqual(utterance.duration, 0.3 + 0.6 + 0.3, delta=0.1)
+
+    def test_listener_uses_persistent_stream(self):
+        recognizer = FakeRecognizer()
+        listener = SpeechListener(
+            recognizer=recognizer,
+            source=WavFileSource(self.path, realtime=True),
+            segmenter=UtteranceSegmenter(hangover_ms=300),
+            translator=lambda text: text
+        )
+        with patch("builtins.print"):
+            self.assertEqual(listener.listen(timeout=2), "open notepad")
+        self.assertEqual(recognizer.calls, 1)
+        listener.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
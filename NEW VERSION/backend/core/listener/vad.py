@@ -0,0 +1,194 @@
+# BACKEND/core/listener/vad.py
+"""
+Frame-level voice activity detection and utterance segmentation.
+
+Audio is processed as 16 kHz mono int16 frames of FRAME_MS. EnergyVAD
+measures the noise floor over the first 300 ms of the stream and then
+tracks it with an EMA over silent frames. This replaces the old per-call
+adjust_for_ambient_noise(duration=1): calibration happens once when the
+stream opens and then continuously, instead of blocking every listen().
+
+UtteranceSegmenter turns the frame stream into utterances: a short
+pre-roll is kept so the first syllable is not clipped, speech starts after
+a few consecutive voiced frames and ends after a hangover of silence.
+"""
+
+import collections
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+FRAME_BYTES = FRAME_SAMPLES * 2  # int16
+
+
+def frame_rms(frame: bytes) -> float:
+    samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+    if samples.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(samples * samples)))
+
+
+class EnergyVAD:
+    """Energy detector with an adaptive noise floor."""
+
+    def __init__(
+        self,
+        threshold_ratio: float = 3.0,
+        min_energy: float = 300.0,
+        noise_alpha: float = 0.05,
+        speech_alpha: float = 0.0005,
+        initial_noise: float = 200.0,
+        calibration_ms: int = 300,
+        frame_ms: int = FRAME_MS,
+    ):
+        self.threshold_ratio = threshold_ratio
+        self.min_energy = min_energy
+        self.noise_alpha = noise_alpha
+        self.speech_alpha = speech_alpha
+        self.noise_floor = initial_noise
+        self.calibration_frames = max(0, calibration_ms // frame_ms)
+        self._calibration = []
+
+    @property
+    def threshold(self) -> float:
+        return max(self.min_energy, self.noise_floor * self.threshold_ratio)
+
+    def is_speech(self, frame: bytes) -> bool:
+        energy = frame_rms(frame)
+
+        # First frames after the stream opens only measure the room
+        if len(self._calibration) < self.calibration_frames:
+            self._calibration.append(energy)
+            if len(self._calibration) == self.calibration_frames:
+                self.noise_floor = float(np.median(self._calibration))
+            return False
+
+        speech = energy > self.threshold
+        # Silence moves the floor quickly; "speech" only creeps it up, so a
+        # sentence barely shifts it but a fan switched on mid-session does
+        alpha = self.speech_alpha if speech else self.noise_alpha
+        self.noise_floor += alpha * (energy - self.noise_floor)
+        return speech
+
+
+@dataclass
+class Utterance:
+    pcm: bytes
+    sample_rate: int = SAMPLE_RATE
+    start_time: float = 0.0      # stream seconds of the first voiced frame
+    end_time: float = 0.0        # stream seconds of the last voiced frame
+    detected_time: float = 0.0   # stream seconds when the end was detected
+    wall_detected: float = field(default_factory=time.monotonic)
+    truncated: bool = False      # hit max_utterance_s
+
+    @property
+    def duration(self) -> float:
+        return len(self.pcm) / 2.0 / self.sample_rate
+
+    @property
+    def wall_end(self) -> float:
+        """Wall-clock (monotonic) time the speaker actually stopped."""
+        return self.wall_detected - (self.detected_time - self.end_time)
+
+
+class UtteranceSegmenter:
+    def __init__(
+        self,
+        vad: Optional[EnergyVAD] = None,
+        frame_ms: int = FRAME_MS,
+        pre_roll_ms: int = 300,
+        start_ms: int = 90,
+        hangover_ms: int = 600,
+        min_utterance_ms: int = 250,
+        max_utterance_s: float = 8.0,
+    ):
+        self.vad = vad or EnergyVAD()
+        self.frame_ms = frame_ms
+        self.pre_roll = collections.deque(maxlen=max(1, pre_roll_ms // frame_ms))
+        self.start_frames = max(1, start_ms // frame_ms)
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.min_frames = max(1, min_utterance_ms // frame_ms)
+        self.max_utterance_s = max_utterance_s
+
+        self._frames = []
+        self._voiced_run = 0
+        self._silence_run = 0
+        self._voiced_total = 0
+        self._start_index = 0
+        self._last_voiced_index = 0
+        self._index = 0
+        self.in_speech = False
+
+    def reset(self):
+        self.pre_roll.clear()
+        self._frames = []
+        self._voiced_run = 0
+        self._silence_run = 0
+        self._voiced_total = 0
+        self.in_speech = False
+
+    def _t(self, index: int) -> float:
+        return index * self.frame_ms / 1000.0
+
+    def push(self, frame: bytes) -> Optional[Utterance]:
+        """Feed one frame; returns an Utterance when one just ended."""
+        index = self._index
+        self._index += 1
+        speech = self.vad.is_speech(frame)
+
+        if not self.in_speech:
+            self.pre_roll.append(frame)
+            self._voiced_run = self._voiced_run + 1 if speech else 0
+            if self._voiced_run >= self.start_frames:
+                self.in_speech = True
+                self._frames = list(self.pre_roll)
+                self.pre_roll.clear()
+                self._start_index = index - self._voiced_run + 1
+                self._last_voiced_index = index
+                self._voiced_total = self._voiced_run
+                self._silence_run = 0
+            return None
+
+        self._frames.append(frame)
+        if speech:
+            self._silence_run = 0
+            self._voiced_total += 1
+            self._last_voiced_index = index
+        else:
+            self._silence_run += 1
+
+        too_long = self._t(len(self._frames)) >= self.max_utterance_s
+        if self._silence_run >= self.hangover_frames or too_long:
+            return self._finish(index, truncated=too_long and self._silence_run < self.hangover_frames)
+        return None
+
+    def flush(self) -> Optional[Utterance]:
+        """End of stream: close an open utterance."""
+        if not self.in_speech:
+            return None
+        return self._finish(self._index - 1, truncated=False)
+
+    def _finish(self, index: int, truncated: bool) -> Optional[Utterance]:
+        frames = self._frames
+        voiced = self._voiced_total
+        start, last_voiced = self._start_index, self._last_voiced_index
+        self._frames = []
+        self._voiced_run = 0
+        self._silence_run = 0
+        self._voiced_total = 0
+        self.in_speech = False
+
+        if voiced < self.min_frames:
+            return None  # click / cough
+        return Utterance(
+            pcm=b"".join(frames),
+            start_time=self._t(start),
+            end_time=self._t(last_voiced + 1),
+            detected_time=self._t(index + 1),
+            truncated=truncated,
+        )
@@ -49,3 +49,5 @@ class VoiceListener:
 
     def stop(self):
         self._stopped = True
+        # Release the persistent mic stream until listening is re-enabled
+        self.speech.close()
@@ -0,0 +1,224 @@
+# BACKEND/core/speaker/audio_cache.py
+"""
+Content-addressed cache of synthesized speech.
+
+Rendered audio is stored as DATA/cache/tts/<sha1>.<ext>, where the hash
+covers (text, voice, rate), so a voice or rate change never plays stale
+audio. The index is an LRU kept in memory and persisted to index.json;
+once the total size exceeds max_bytes the least recently played files
+are deleted.
+
+Phrases are rendered on their second miss (or up front via prewarm), so
+one-off sentences never cost disk space.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+CACHE_DIR = os.path.join(BACKEND_ROOT, "DATA", "cache", "tts")
+MAX_CACHE_BYTES = int(os.getenv("SYNEX_TTS_CACHE_MB", "50")) * 1024 * 1024
+
+
+def normalize_text(text: str) -> str:
+    # Case is kept: it can change how the engine reads acronyms
+    return " ".join(str(text or "").split())
+
+
+def audio_key(text: str, voice: str, rate) -> str:
+    raw = f"{normalize_text(text)}\x1f{voice}\x1f{rate}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class SpeechAudioCache:
+    def __init__(
+        self,
+        cache_dir: str = CACHE_DIR,
+        max_bytes: int = MAX_CACHE_BYTES,
+        render_after: int = 2,
+        ext: str = "wav",
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max(1, int(max_bytes))
+        self.render_after = max(1, int(render_after))
+        self.ext = ext
+        self.index_file = os.path.join(cache_dir, "index.json")
+
+        self._entries = OrderedDict()  # key -> size in bytes (LRU order)
+        self._misses = {}              # key -> miss count (not yet rendered)
+        self._rendering = set()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._dirty = False
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.load()
+
+    # ------------------------
+    # Lookup
+    # ------------------------
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{self.ext}")
+
+    def get(self, key: str):
+        """Path of the cached audio, or None."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                self._misses[key] = self._misses.get(key, 0) + 1
+                if len(self._misses) > 4096:
+                    self._misses.clear()
+                return None
+            path = self.path_for(key)
+            if not os.path.isfile(path):
+                # Deleted behind our back
+                self._total_bytes -= self._entries.pop(key)
+                self._dirty = True
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self.hits += 1
+            return path
+
+    def __contains__(self, key: str):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ------------------------
+    # Rendering
+    # ------------------------
+    def should_render(self, key: str, force: bool = False) -> bool:
+        """Claim key for rendering if it is hot enough and not cached or in flight."""
+        with self._lock:
+            if key in self._entries or key in self._rendering:
+                return False
+            if not force and self._misses.get(key, 0) < self.render_after:
+                return False
+            self._rendering.add(key)
+            return True
+
+    def render_path(self, key: str) -> str:
+        """Temporary path the renderer writes to; commit() moves it in place."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return os.path.join(self.cache_dir, f"{key}.part.{self.ext}")
+
+    def commit(self, key: str, rendered_path: str = None) -> bool:
+        """Register a rendered file (moving it from render_path if given)."""
+        path = self.path_for(key)
+        try:
+            if rendered_path and rendered_path != path:
+                os.replace(rendered_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"⚠️ Failed to cache speech audio: {e}")
+            self.discard(key)
+            return False
+
+        with self._lock:
+            self._rendering.discard(key)
+            self._misses.pop(key, None)
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._dirty = True
+            evicted = self._evict_locked()
+
+        for old_key in evicted:
+            self._remove_file(old_key)
+        return True
+
+    def discard(self, key: str):
+        """Give up on an in-flight render."""
+        with self._lock:
+            self._rendering.discard(key)
+        try:
+            os.remove(os.path.join(self.cache_dir, f"{key}.part.{self.ext}"))
+        except OSError:
+            pass
+
+    def _evict_locked(self):
+        evicted = []
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _remove_file(self, key: str):
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+            self._dirty = True
+        for key in keys:
+            self._remove_file(key)
+
+    # ------------------------
+    # Disk index
+    # ------------------------
+    def load(self):
+        try:
+            if not os.path.isfile(self.index_file):
+                return
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            with self._lock:
+                for key in data.get("entries", []):
+                    path = self.path_for(key)
+                    if os.path.isfile(path):
+                        size = os.path.getsize(path)
+                        self._entries[key] = size
+                        self._total_bytes += size
+                evicted = self._evict_locked()
+            for key in evicted:
+                self._remove_file(key)
+        except Exception as e:
+            print(f"⚠️ Failed to load speech cache index: {e}")
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"entries": list(self._entries)}
+            self._dirty = False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self.index_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            print(f"⚠️ Failed to save speech cache index: {e}")
+
+    # ------------------------
+    # Stats
+    # ------------------------
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "rendering": len(self._rendering),
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
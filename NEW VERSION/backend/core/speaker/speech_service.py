@@ -44,12 +44,27 @@ class SpeechService:
             return
         self.queue.put(text)
 
+    def prewarm(self, phrases) -> int:
+        """Pre-render canned responses so they play back instantly"""
+        return self.tts.prewarm(phrases)
+
     def interrupt(self):
+        # Drop queued utterances too, not just the current sentence
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.queue.task_done()
+            if item is None:
+                self.queue.put(None)  # keep the shutdown sentinel
+                break
         self.tts.stop()
 
     def shutdown(self):
         try:
             self.queue.put(None)
+            self.tts.shutdown()
             if self.worker.is_alive():
                 self.worker.join(timeout=2)
         except Exception:
@@ -0,0 +1,84 @@
+# BACKEND/core/speaker/tests/test_audio_cache.py
+"""
+Unit tests for the content-addressed speech audio cache
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from BACKEND.core.speaker.audio_cache import SpeechAudioCache, audio_key
+
+
+class TestSpeechAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def _render(self, cache, key, size=100):
+        self.assertTrue(cache.should_render(key, force=True))
+        path = cache.render_path(key)
+        with open(path, "wb") as f:
+            f.write(b"\0" * size)
+        self.assertTrue(cache.commit(key, path))
+
+    def test_key_covers_voice_and_rate(self):
+        base = audio_key("Going to sleep.", "voice-a", 180)
+        self.assertEqual(base, audio_key("  Going to   sleep. ", "voice-a", 180))
+        self.assertNotEqual(base, audio_key("Going to sleep.", "voice-b", 180))
+        self.assertNotEqual(base, audio_key("Going to sleep.", "voice-a", 200))
+
+    def test_render_after_second_miss(self):
+        cache = SpeechAudioCache(cache_dir=self.cache_dir, render_after=2)
+        key = audio_key("Scrolled down.", "v", 1)
+        self.assertIsNone(cache.get(key))
+        self.assertFalse(cache.should_render(key))
+        self.assertIsNone(cache.get(key))
+        self.assertTrue(cache.should_render(key))
+        # Already in flight
+        self.assertFalse(cache.should_render(key))
+
+        with open(cache.render_path(key), "wb") as f:
+            f.write(b"\0" * 10)
+        self.assertTrue(cache.commit(key, cache.render_path(key)))
+        path = cache.get(key)
+        self.assertTrue(os.path.isfile(path))
+        self.assertFalse(os.path.exists(cache.render_path(key)))
+
+    def test_lru_eviction_by_size(self):
+        cache = SpeechAudioCache(cache_dir=self.cache_dir, max_bytes=250)
+        self._render(cache, "a")
+        self._render(cache, "b")
+        cache.get("a")  # a is now most recently used
+        self._render(cache, "c")
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertFalse(os.path.exists(cache.path_for("b")))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+        self.assertEqual(cache.get_stats()["bytes"], 200)
+
+    def test_index_persists_and_drops_missing_files(self):
+        cache = SpeechAudioCache(cache_dir=self.cache_dir)
+        self._render(cache, "a")
+        self._render(cache, "b")
+        cache.save()
+        os.remove(cache.path_for("b"))
+
+        reloaded = SpeechAudioCache(cache_dir=self.cache_dir)
+        self.assertEqual(len(reloaded), 1)
+        self.assertIsNotNone(reloaded.get("a"))
+        self.assertIsNone(reloaded.get("b"))
+
+    def test_discard_clears_in_flight(self):
+        cache = SpeechAudioCache(cache_dir=self.cache_dir)
+        self.assertTrue(cache.should_render("a", force=True))
+        cache.discard("a")
+        self.assertTrue(cache.should_render("a", force=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
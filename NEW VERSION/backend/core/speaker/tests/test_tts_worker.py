@@ -0,0 +1,154 @@
+# BACKEND/core/speaker/tests/test_tts_worker.py
+"""
+Unit tests for the persistent speech worker (stub backend, no audio needed)
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from BACKEND.core.brain.state_manager import AudioState, StateManager
+from BACKEND.core.speaker.audio_cache import SpeechAudioCache
+from BACKEND.core.speaker.tts_engine import TTSEngine
+from BACKEND.core.speaker.tts_worker import TTSWorkerClient, split_sentences
+
+
+class TestSplitSentences(unittest.TestCase):
+    def test_split(self):
+        self.assertEqual(
+            split_sentences("Hello there. How are you?  Fine! Theek hai।  Bye"),
+            ["Hello there.", "How are you?", "Fine!", "Theek hai।", "Bye"]
+        )
+        self.assertEqual(split_sentences("   "), [])
+
+
+class TestTTSWorkerClient(unittest.TestCase):
+    def _client(self, cache=None, **options):
+        client = TTSWorkerClient(backend="stub", backend_options=options, cache=cache)
+        self.addCleanup(client.shutdown)
+        return client
+
+    def _cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, True)
+        return SpeechAudioCache(cache_dir=cache_dir)
+
+    def _wait_rendered(self, cache, count, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while len(cache) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(cache), count)
+
+    def test_worker_is_reused(self):
+        client = self._client()
+        with patch("builtins.print"):
+            self.assertTrue(client.speak("First sentence. Second sentence."))
+            pid = client._process.pid
+            self.assertTrue(client.speak("Another one."))
+        self.assertEqual(client._process.pid, pid)
+        self.assertEqual(client.restarts, 0)
+        # Warm worker: first audio starts almost immediately
+        self.assertLess(client.last_time_to_first_audio, 0.1)
+
+    def test_interrupt_stops_current_and_queued_sentences(self):
+        client = self._client(chars_per_second=20)  # ~2s per sentence
+        client.wait_ready()
+        interrupt = threading.Event()
+        threading.Timer(0.2, interrupt.set).start()
+
+        start = time.perf_counter()
+        completed = client.speak("This is a long sentence. And another long one.", interrupt)
+        self.assertFalse(completed)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+        # Worker stays usable after an interrupt
+        self.assertTrue(client.speak("ok."))
+
+    def test_crashed_worker_is_restarted(self):
+        client = self._client()
+        with patch("builtins.print"):
+            client.wait_ready()
+            pid = client._process.pid
+            client._process.kill()
+            client._process.join()
+            self.assertTrue(client.speak("Still talking."))
+        self.assertGreaterEqual(client.restarts, 1)
+        self.assertNotEqual(client._process.pid, pid)
+
+
+    def test_prewarmed_phrases_play_from_cache(self):
+        cache = self._cache()
+        client = self._client(cache=cache)
+        self.assertEqual(client.prewarm(["Gesture mode activated.", "Going to sleep. Bye."]), 3)
+        self._wait_rendered(cache, 3)
+        # Already cached: nothing new to render
+        self.assertEqual(client.prewarm(["Gesture mode activated."]), 0)
+
+        self.assertTrue(client.speak("Gesture mode activated."))
+        self.assertEqual(client.cache_plays, 1)
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_repeated_sentence_rendered_on_second_miss(self):
+        cache = self._cache()
+        client = self._client(cache=cache)
+        self.assertTrue(client.speak("Battery is at 20 percent."))
+        time.sleep(0.1)
+        self.assertEqual(len(cache), 0)
+
+        self.assertTrue(client.speak("Battery is at 20 percent."))
+        self._wait_rendered(cache, 1)
+        self.assertTrue(client.speak("Battery is at 20 percent."))
+        self.assertEqual(client.cache_plays, 1)
+
+    def test_interrupt_cached_playback(self):
+        cache = self._cache()
+        client = self._client(cache=cache, chars_per_second=20)
+        client.prewarm(["This cached sentence takes two seconds."])
+        self._wait_rendered(cache, 1)
+
+        interrupt = threading.Event()
+        threading.Timer(0.2, interrupt.set).start()
+        start = time.perf_counter()
+        self.assertFalse(client.speak("This cached sentence takes two seconds.", interrupt))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(client.cache_plays, 1)
+
+
+class TestTTSEngine(unittest.TestCase):
+    def test_state_transitions_and_interrupt(self):
+        state = StateManager()
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, True)
+        with patch("builtins.print"):
+            engine = TTSEngine(
+                state,
+                backend="stub",
+                backend_options={"chars_per_second": 20},
+                cache=SpeechAudioCache(cache_dir=cache_dir)
+            )
+        self.addCleanup(engine.shutdown)
+
+        seen = []
+        done = threading.Event()
+
+        def speak():
+            with patch("builtins.print"):
+                seen.append(engine.speak_blocking("Please wait while I read a long answer."))
+            done.set()
+
+        threading.Thread(target=speak, daemon=True).start()
+        time.sleep(0.3)
+        self.assertTrue(engine.is_speaking())
+        self.assertEqual(state.state, AudioState.SPEAKING)
+
+        state.interrupt()
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual(seen, [False])
+        self.assertEqual(state.state, AudioState.IDLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,14 +4,33 @@ import subprocess
 import os
 import sys
 from BACKEND.core.brain.state_manager import AudioState
+from BACKEND.core.speaker.audio_cache import SpeechAudioCache
+from BACKEND.core.speaker.tts_worker import DEFAULT_BACKEND, TTSWorkerClient, TTSWorkerError
+
+TTS_CACHE_ENABLED = os.getenv("SYNEX_TTS_CACHE", "1").lower() not in ("0", "false", "no")
 
 
 class TTSEngine:
     """
-    Thread-safe TTS engine using subprocess to avoid pyttsx3 threading issues.
+    Thread-safe TTS engine backed by a persistent speech worker process.
+
+    The worker is spawned once (in the background, at construction) and
+    keeps pyttsx3 initialised, so each utterance only costs a pipe message.
+    Text is streamed sentence by sentence and StateManager.interrupt_event
+    cuts playback short. If the worker cannot be started at all we fall
+    back to the old one-subprocess-per-utterance path.
+
+    Repeated sentences are rendered once into SpeechAudioCache and played
+    straight from disk afterwards.
     """
 
-    def __init__(self, state_manager):
+    def __init__(
+        self,
+        state_manager,
+        backend: str = DEFAULT_BACKEND,
+        backend_options: dict = None,
+        cache: SpeechAudioCache = None,
+    ):
         self.state_manager = state_manager
         self._lock = threading.Lock()
         self._is_speaking = False
@@ -19,15 +38,28 @@ class TTSEngine:
             os.path.dirname(__file__),
             "simple_tts.py"
         )
-        print(f"[TTS] Using subprocess mode with script: {self.tts_script}")
+
+        if cache is None and TTS_CACHE_ENABLED:
+            cache = SpeechAudioCache()
+        self.cache = cache
+
+        self.worker = TTSWorkerClient(backend=backend, backend_options=backend_options, cache=cache)
+        self._use_worker = True
+        try:
+            # Spawn now so the first utterance does not pay the startup cost
+            self.worker.start()
+            print(f"[TTS] Persistent speech worker started ({backend})")
+        except Exception as e:
+            self._use_worker = False
+            print(f"[TTS] Worker unavailable ({e}), using subprocess mode: {self.tts_script}")
 
     # -----------------------------
     # PUBLIC API
     # -----------------------------
-    def speak_blocking(self, text: str):
-        """Speak text using subprocess (avoids pyttsx3 threading issues)"""
+    def speak_blocking(self, text: str) -> bool:
+        """Speak text; returns False if interrupted or failed"""
         if not text or not text.strip():
-            return
+            return True
 
         with self._lock:
             try:
@@ -35,35 +67,71 @@ class TTSEngine:
                 self.state_manager.set_state(AudioState.SPEAKING)
                 print(f"[TTS] Speaking: {text[:50]}...")
 
-                # Call simple_tts.py in a subprocess
-                result = subprocess.run(
-                    [sys.executable, self.tts_script, text],
-                    capture_output=True,
-                    text=True,
-                    timeout=15
-                )
-                
-                if result.returncode == 0:
-                    print("[TTS] Speech completed")
-                else:
-                    print(f"[TTS ERROR] subprocess returned {result.returncode}")
-                    if result.stderr:
-                        print(f"[TTS] stderr: {result.stderr}")
-                
-            except subprocess.TimeoutExpired:
-                print("[TTS ERROR] subprocess timeout")
+                if self._use_worker:
+                    try:
+                        completed = self.worker.speak(text, self.state_manager.interrupt_event)
+                        print("[TTS] Speech completed" if completed else "[TTS] Speech interrupted")
+                        return completed
+                    except TTSWorkerError as e:
+                        print(f"[TTS ERROR] {e}, switching to subprocess mode")
+                        self._use_worker = False
+
+                return self._speak_subprocess(text)
+
             except Exception as e:
                 print(f"[TTS ERROR] {type(e).__name__}: {e}")
+                return False
 
             finally:
                 self._is_speaking = False
                 self.state_manager.set_state(AudioState.IDLE)
 
+    def _speak_subprocess(self, text: str) -> bool:
+        """Legacy path: one interpreter per utterance (simple_tts.py)"""
+        try:
+            result = subprocess.run(
+                [sys.executable, self.tts_script, text],
+                capture_output=True,
+                text=True,
+                timeout=15
+            )
+        except subprocess.TimeoutExpired:
+            print("[TTS ERROR] subprocess timeout")
+            return False
+
+        if result.returncode == 0:
+            print("[TTS] Speech completed")
+            return True
+
+        print(f"[TTS ERROR] subprocess returned {result.returncode}")
+        if result.stderr:
+            print(f"[TTS] stderr: {result.stderr}")
+        return False
+
     def stop(self):
-        """Stop speaking"""
-        with self._lock:
-            self._is_speaking = False
-            self.state_manager.set_state(AudioState.IDLE)
+        """Stop speaking (safe to call while speak_blocking runs)"""
+        self.state_manager.interrupt()
+        self.worker.stop()
 
     def is_speaking(self):
         return self._is_speaking
+
+    def prewarm(self, phrases) -> int:
+        """Render canned phrases into the audio cache in the background"""
+        if not self._use_worker:
+            return 0
+        try:
+            return self.worker.prewarm(phrases)
+        except TTSWorkerError as e:
+            print(f"[TTS] Prewarm skipped: {e}")
+            return 0
+
+    def get_cache_stats(self) -> dict:
+        stats = self.cache.get_stats() if self.cache is not None else {}
+        stats["cache_plays"] = self.worker.cache_plays
+        stats["worker_restarts"] = self.worker.restarts
+        return stats
+
+    def shutdown(self):
+        self.state_manager.interrupt()
+        self.worker.shutdown()
@@ -0,0 +1,546 @@
+# BACKEND/core/speaker/tts_worker.py
+"""
+Persistent speech worker process.
+
+The old path started a fresh Python interpreter per sentence
+(simple_tts.py), paying interpreter startup + pyttsx3 import +
+pyttsx3.init() every time. Here a single long-lived process owns the TTS
+engine and receives sentences over a multiprocessing Pipe.
+
+Protocol (dicts over the pipe):
+    parent -> worker  {"op": "speak", "id": n, "text": "..."}
+                      {"op": "play", "id": n, "path": "..."}   # cached audio
+                      {"op": "render", "key": k, "text": "...", "path": "..."}
+                      {"op": "stop"}       # abort current + queued sentences
+                      {"op": "shutdown"}
+    worker -> parent  {"op": "ready", "backend": name, "voice": v, "rate": r,
+                       "playback": bool}
+                      {"op": "started", "id": n}
+                      {"op": "done", "id": n, "interrupted": bool}
+                      {"op": "error", "id": n, "error": "..."}
+                      {"op": "rendered", "key": k, "path": "..."}
+                      {"op": "render_failed", "key": k, "error": "..."}
+
+Renders are low priority: they only run while no sentence is waiting.
+
+Backends are pluggable so the worker runs on Linux CI without audio:
+    "pyttsx3" - real speech (sapi5 on Windows)
+    "stub"    - simulates playback time, no audio device needed
+"""
+
+import multiprocessing
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import wave
+
+from BACKEND.core.speaker.audio_cache import audio_key
+
+DEFAULT_BACKEND = os.getenv("SYNEX_TTS_BACKEND", "pyttsx3")
+
+# Split on sentence ends (incl. Devanagari danda) so playback can start
+# after the first sentence and be interrupted between sentences.
+_SENTENCE_END = re.compile(r"(?<=[.!?।])\s+")
+
+
+def split_sentences(text: str):
+    parts = [p.strip() for p in _SENTENCE_END.split(text or "")]
+    return [p for p in parts if p]
+
+
+def wav_duration(path: str) -> float:
+    with wave.open(path, "rb") as f:
+        return f.getnframes() / float(f.getframerate() or 1)
+
+
+# ================================
+# BACKENDS (run inside the worker)
+# ================================
+class Pyttsx3Backend:
+    name = "pyttsx3"
+
+    def __init__(self, rate: int = 180, voice_index: int = 0):
+        import pyttsx3
+
+        driver = "sapi5" if sys.platform == "win32" else None
+        self.engine = pyttsx3.init(driver) if driver else pyttsx3.init()
+        self.engine.setProperty("rate", rate)
+        self.rate = rate
+        self.voice = "default"
+        voices = self.engine.getProperty("voices")
+        if voices:
+            self.voice = voices[min(voice_index, len(voices) - 1)].id
+            self.engine.setProperty("voice", self.voice)
+        self._should_stop = None
+        # Checked between words: the only safe place to call engine.stop()
+        self.engine.connect("started-word", self._on_word)
+
+        # Cached files are played with winsound on Windows; elsewhere only
+        # if pygame is around (it is already a project dependency)
+        self._mixer = None
+        self.playback = sys.platform == "win32"
+        if not self.playback:
+            try:
+                import pygame
+
+                pygame.mixer.init()
+                self._mixer = pygame.mixer
+                self.playback = True
+            except Exception:
+                pass
+
+    def _on_word(self, name, location, length):
+        if self._should_stop and self._should_stop():
+            self.engine.stop()
+
+    def speak(self, text, should_stop):
+        self._should_stop = should_stop
+        self.engine.say(text)
+        self.engine.runAndWait()
+        return should_stop()
+
+    def render(self, text, path):
+        self._should_stop = None
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+
+    def play_file(self, path, should_stop):
+        if self._mixer is not None:
+            self._mixer.music.load(path)
+            self._mixer.music.play()
+            while self._mixer.music.get_busy():
+                if should_stop():
+                    self._mixer.music.stop()
+                    return True
+                time.sleep(0.01)
+            return False
+
+        import winsound
+
+        deadline = time.monotonic() + wav_duration(path)
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+        while time.monotonic() < deadline:
+            if should_stop():
+                winsound.PlaySound(None, 0)
+                return True
+            time.sleep(0.01)
+        return False
+
+
+class StubBackend:
+    """Simulated playback for tests/headless boxes."""
+
+    name = "stub"
+    voice = "stub"
+    playback = True
+
+    def __init__(self, chars_per_second: float = 2000.0):
+        self.chars_per_second = chars_per_second
+        self.rate = chars_per_second
+
+    def _wait(self, seconds, should_stop):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            if should_stop():
+                return True
+            time.sleep(0.002)
+        return False
+
+    def speak(self, text, should_stop):
+        return self._wait(len(text) / self.chars_per_second, should_stop)
+
+    def render(self, text, path):
+        # Silent 8 kHz WAV as long as the sentence would take to say
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(8000)
+            f.writeframes(b"\x00\x00" * int(8000 * len(text) / self.chars_per_second))
+
+    def play_file(self, path, should_stop):
+        return self._wait(wav_duration(path), should_stop)
+
+
+BACKENDS = {
+    "pyttsx3": Pyttsx3Backend,
+    "stub": StubBackend,
+}
+
+
+def worker_main(conn, backend_name: str = DEFAULT_BACKEND, backend_options: dict = None):
+    """Entry point of the speech worker process."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        backend = BACKENDS[backend_name](**(backend_options or {}))
+    except Exception as e:
+        conn.send({"op": "fatal", "error": f"{type(e).__name__}: {e}"})
+        return
+
+    jobs = queue.Queue()
+    renders = queue.Queue()
+    stop_flag = threading.Event()
+    send_lock = threading.Lock()
+
+    def send(msg):
+        with send_lock:
+            conn.send(msg)
+
+    waiting = [0]
+    waiting_lock = threading.Lock()
+
+    def speech_waiting(delta=0):
+        with waiting_lock:
+            waiting[0] += delta
+            return waiting[0]
+
+    def reader():
+        # Separate thread so "stop" is seen while a sentence is playing
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                jobs.put(None)
+                return
+            op = msg.get("op")
+            if op in ("speak", "play"):
+                speech_waiting(1)
+                jobs.put(msg)
+            elif op == "render":
+                renders.put(msg)
+                jobs.put({"op": "wake"})
+            elif op == "stop":
+                stop_flag.set()
+                # Drop sentences queued behind the current one
+                keep = []
+                while True:
+                    try:
+                        pending = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if pending is None or pending["op"] == "wake":
+                        keep.append(pending)
+                    else:
+                        speech_waiting(-1)
+                        send({"op": "done", "id": pending["id"], "interrupted": True})
+                jobs.put({"op": "reset"})
+                for pending in keep:
+                    jobs.put(pending)
+            elif op == "shutdown":
+                stop_flag.set()
+                jobs.put(None)
+                return
+
+    threading.Thread(target=reader, daemon=True).start()
+    send({
+        "op": "ready",
+        "backend": backend.name,
+        "voice": backend.voice,
+        "rate": backend.rate,
+        "playback": backend.playback,
+    })
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        op = job.get("op")
+        if op == "reset":
+            stop_flag.clear()
+            continue
+
+        if op == "wake":
+            if speech_waiting() > 0:
+                # A sentence is queued behind us: render after it
+                jobs.put(job)
+                continue
+            try:
+                render = renders.get_nowait()
+            except queue.Empty:
+                continue
+            try:
+                backend.render(render["text"], render["path"])
+                send({"op": "rendered", "key": render["key"], "path": render["path"]})
+            except Exception as e:
+                send({"op": "render_failed", "key": render["key"], "error": f"{type(e).__name__}: {e}"})
+            continue
+
+        speech_waiting(-1)
+        send({"op": "started", "id": job["id"]})
+        try:
+            if op == "play":
+                interrupted = backend.play_file(job["path"], stop_flag.is_set)
+            else:
+                interrupted = backend.speak(job["text"], stop_flag.is_set)
+            send({"op": "done", "id": job["id"], "interrupted": bool(interrupted)})
+        except Exception as e:
+            send({"op": "error", "id": job["id"], "error": f"{type(e).__name__}: {e}"})
+
+
+# ================================
+# CLIENT (runs in the main process)
+# ================================
+class TTSWorkerError(RuntimeError):
+    pass
+
+
+class TTSWorkerClient:
+    """Owns the worker process; restarts it if it crashes."""
+
+    def __init__(
+        self,
+        backend: str = DEFAULT_BACKEND,
+        backend_options: dict = None,
+        cache=None,
+        ready_timeout: float = 15.0,
+        sentence_timeout: float = 30.0,
+        max_restarts: int = 3,
+    ):
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self.cache = cache
+        self.ready_timeout = ready_timeout
+        self.sentence_timeout = sentence_timeout
+        self.max_restarts = max_restarts
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._events = queue.Queue()
+        self._ready = threading.Event()
+        self._ready_info = {}
+        self._start_error = None
+        self._lock = threading.Lock()        # one utterance at a time
+        self._send_lock = threading.Lock()   # Connection.send is not thread-safe
+        self._start_lock = threading.Lock()
+        self._next_id = 0
+
+        # Metrics
+        self.restarts = 0
+        self.last_time_to_first_audio = None
+        self.cache_plays = 0
+
+    # ------------------------
+    # Process lifecycle
+    # ------------------------
+    def start(self):
+        """Spawn the worker (non-blocking); wait_ready() to block."""
+        with self._start_lock:
+            parent_conn, child_conn = self._ctx.Pipe()
+            self._ready.clear()
+            self._ready_info = {}
+            self._start_error = None
+            self._events = queue.Queue()
+            self._process = self._ctx.Process(
+                target=worker_main,
+                args=(child_conn, self.backend, self.backend_options),
+                name="SynexTTSWorker",
+                daemon=True
+            )
+            self._process.start()
+            child_conn.close()
+            self._conn = parent_conn
+            threading.Thread(
+                target=self._read_loop,
+                args=(parent_conn, self._events),
+                name="SynexTTSReader",
+                daemon=True
+            ).start()
+
+    def _read_loop(self, conn, events):
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                events.put({"op": "dead"})
+                return
+            op = msg.get("op")
+            if op == "ready":
+                self._ready_info = msg
+                self._ready.set()
+            elif op == "fatal":
+                self._start_error = msg.get("error")
+                self._ready.set()
+            elif op == "rendered":
+                if self.cache is not None:
+                    self.cache.commit(msg["key"], msg["path"])
+            elif op == "render_failed":
+                print(f"[TTS] Render failed: {msg.get('error')}")
+                if self.cache is not None:
+                    self.cache.discard(msg["key"])
+            else:
+                events.put(msg)
+
+    def wait_ready(self, timeout: float = None):
+        if self._process is None:
+            self.start()
+        timeout = self.ready_timeout if timeout is None else timeout
+        if not self._ready.wait(timeout):
+            raise TTSWorkerError("Speech worker did not become ready")
+        if self._start_error:
+            raise TTSWorkerError(f"Speech worker failed: {self._start_error}")
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def restart(self):
+        self.restarts += 1
+        print(f"[TTS] Restarting speech worker ({self.restarts})")
+        self._kill()
+        self.start()
+
+    def _kill(self):
+        try:
+            if self._conn is not None:
+                self._conn.close()
+        except Exception:
+            pass
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=2)
+        self._process = None
+        self._conn = None
+        self._ready.clear()
+
+    def shutdown(self):
+        try:
+            if self._conn is not None and self.is_alive():
+                self._send({"op": "shutdown"})
+                self._process.join(timeout=2)
+        except Exception:
+            pass
+        self._kill()
+        if self.cache is not None:
+            self.cache.save()
+
+    def _send(self, msg):
+        with self._send_lock:
+            self._conn.send(msg)
+
+    # ------------------------
+    # Cache
+    # ------------------------
+    def _cache_key(self, sentence: str):
+        return audio_key(sentence, self._ready_info.get("voice"), self._ready_info.get("rate"))
+
+    def _use_cache(self) -> bool:
+        return self.cache is not None and bool(self._ready_info.get("playback"))
+
+    def _request_render(self, key: str, sentence: str, force: bool = False) -> bool:
+        if not self.cache.should_render(key, force=force):
+            return False
+        try:
+            self._send({"op": "render", "key": key, "text": sentence, "path": self.cache.render_path(key)})
+            return True
+        except (OSError, BrokenPipeError):
+            self.cache.discard(key)
+            return False
+
+    def prewarm(self, phrases) -> int:
+        """Render canned phrases in the background; returns how many were queued."""
+        if self.cache is None:
+            return 0
+        self.wait_ready()
+        if not self._use_cache():
+            return 0
+        queued = 0
+        for phrase in phrases:
+            for sentence in split_sentences(phrase):
+                if self._request_render(self._cache_key(sentence), sentence, force=True):
+                    queued += 1
+        return queued
+
+    # ------------------------
+    # Speaking
+    # ------------------------
+    def stop(self):
+        """Abort the current utterance (safe from any thread)."""
+        try:
+            if self._conn is not None and self.is_alive():
+                self._send({"op": "stop"})
+        except (OSError, BrokenPipeError):
+            pass
+
+    def speak(self, text: str, interrupt_event: threading.Event = None) -> bool:
+        """
+        Speak text sentence by sentence. Returns True if fully spoken,
+        False if interrupted. Restarts a crashed worker and retries.
+        """
+        sentences = split_sentences(text)
+        if not sentences:
+            return True
+
+        with self._lock:
+            for attempt in range(self.max_restarts + 1):
+                try:
+                    self.wait_ready()
+                    return self._speak_sentences(sentences, interrupt_event)
+                except (EOFError, OSError, BrokenPipeError, TTSWorkerError) as e:
+                    print(f"[TTS] Worker failure: {type(e).__name__}: {e}")
+                    if attempt >= self.max_restarts:
+                        raise TTSWorkerError("Speech worker keeps crashing") from e
+                    self.restart()
+        return False
+
+    def _speak_sentences(self, sentences, interrupt_event):
+        ids = []
+        renders = []
+        use_cache = self._use_cache()
+        t0 = time.perf_counter()
+        for sentence in sentences:
+            self._next_id += 1
+            ids.append(self._next_id)
+            path = None
+            if use_cache:
+                key = self._cache_key(sentence)
+                path = self.cache.get(key)
+                if path is None:
+                    renders.append((key, sentence))
+            if path:
+                self.cache_plays += 1
+                self._send({"op": "play", "id": self._next_id, "path": path})
+            else:
+                self._send({"op": "speak", "id": self._next_id, "text": sentence})
+
+        # Queued behind the sentences, rendered while the worker is idle
+        for key, sentence in renders:
+            self._request_render(key, sentence)
+
+        events = self._events
+        pending = set(ids)
+        interrupted = False
+        stop_sent = False
+        first_started = False
+        deadline = time.monotonic() + self.sentence_timeout * len(sentences)
+
+        while pending:
+            if interrupt_event is not None and interrupt_event.is_set() and not stop_sent:
+                self._send({"op": "stop"})
+                stop_sent = True
+                interrupted = True
+
+            try:
+                msg = events.get(timeout=0.01)
+            except queue.Empty:
+                if not self.is_alive():
+                    raise TTSWorkerError("Speech worker died")
+                if time.monotonic() > deadline:
+                    raise TTSWorkerError("Speech worker timed out")
+                continue
+
+            op = msg.get("op")
+            if op == "dead":
+                raise TTSWorkerError("Speech worker died")
+            if op == "started" and not first_started and msg.get("id") in pending:
+                first_started = True
+                self.last_time_to_first_audio = time.perf_counter() - t0
+            elif op in ("done", "error") and msg.get("id") in pending:
+                pending.discard(msg["id"])
+                if op == "error":
+                    print(f"[TTS ERROR] {msg.get('error')}")
+                if msg.get("interrupted"):
+                    interrupted = True
+
+        return not interrupted
@@ -2,6 +2,8 @@
 """
 Speaker Module - Text-to-Speech Engine
 Handles text-to-speech synthesis using Microsoft Edge TTS.
+Rendered MP3s are kept in the shared speech audio cache, so repeated
+phrases skip the edge-tts round trip entirely.
 """
 
 import edge_tts
@@ -9,6 +11,8 @@ import pygame
 import asyncio
 import os
 
+from ..speaker.audio_cache import CACHE_DIR, SpeechAudioCache, audio_key
+
 
 class SpeakEngine:
     def __init__(self):
@@ -18,6 +22,12 @@ class SpeakEngine:
         # en-US-ChristopherNeural: Proper deep, professional male English voice
         self.hindi_voice = "hi-IN-MadhurNeural"
         self.english_voice = "en-US-ChristopherNeural"
+        self.rate = "+0%"
+        self.cache = SpeechAudioCache(
+            cache_dir=os.path.join(CACHE_DIR, "edge"),
+            render_after=1,
+            ext="mp3"
+        )
         
         # Higher buffer (2048) to reduce CPU overhead
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
@@ -30,11 +40,26 @@ class SpeakEngine:
         """
         print(f"Speaking ({language}): {text}")
         voice = self.hindi_voice if language == "hi" else self.english_voice
-        communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(self.output_file)
-        
+        key = audio_key(text, voice, self.rate)
+        audio_file = self.cache.get(key)
+
+        if audio_file is None:
+            audio_file = self.output_file
+            if self.cache.should_render(key):
+                try:
+                    part_file = self.cache.render_path(key)
+                    await edge_tts.Communicate(text, voice, rate=self.rate).save(part_file)
+                    if self.cache.commit(key, part_file):
+                        audio_file = self.cache.path_for(key)
+                        self.cache.save()
+                except Exception as e:
+                    self.cache.discard(key)
+                    print(f"Speech cache unavailable: {e}")
+            if audio_file == self.output_file:
+                await edge_tts.Communicate(text, voice, rate=self.rate).save(self.output_file)
+
         try:
-            pygame.mixer.music.load(self.output_file)
+            pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
             
             # Wait for playback to finish
@@ -46,9 +71,9 @@ class SpeakEngine:
         except Exception as e:
             print(f"Error playing audio: {e}")
             
-        # Clean up the file
+        # Clean up the temporary file (cached audio stays)
         try:
-            if os.path.exists(self.output_file):
+            if audio_file == self.output_file and os.path.exists(self.output_file):
                 os.remove(self.output_file)
         except PermissionError:
             pass  # Sometimes file is still locked briefly
@@ -0,0 +1,208 @@
+# BACKEND/core/startup.py
+"""
+Startup orchestrator for Synex.
+
+Components are declared as stages with dependencies:
+
+    startup.add("speech", make_speech, critical=True)
+    startup.add("router", make_router, deps=("speech",))
+    startup.start()          # returns once critical stages are ready
+    router = startup.wait("router")
+
+Independent stages load in parallel on a thread pool. A stage is only
+submitted once all of its dependencies finished, so pool threads never sit
+blocked on each other. Each stage records its own timing.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
+
+from colorama import Fore
+
+
+class StartupError(RuntimeError):
+    """Raised when a stage (or one of its dependencies) failed to load."""
+
+
+@dataclass
+class StartupStage:
+    name: str
+    factory: Callable
+    deps: Tuple[str, ...] = ()
+    critical: bool = False
+    future: Future = field(default_factory=Future)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class StartupOrchestrator:
+    def __init__(self, max_workers: int = 4, verbose: bool = True):
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self._stages = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._started_at = None
+
+    # ------------------------
+    # Declaration
+    # ------------------------
+    def add(self, name: str, factory: Callable, deps=(), critical: bool = False):
+        if name in self._stages:
+            raise ValueError(f"Duplicate startup stage: {name}")
+        self._stages[name] = StartupStage(name, factory, tuple(deps), critical)
+        return self
+
+    def _validate(self):
+        for stage in self._stages.values():
+            for dep in stage.deps:
+                if dep not in self._stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        # Cycle check (DFS)
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup dependency cycle at '{name}'")
+            visiting.add(name)
+            for dep in self._stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._stages:
+            visit(name)
+
+    # ------------------------
+    # Execution
+    # ------------------------
+    def start(self, wait_critical: bool = True):
+        """Kick off all stages; block until critical ones are ready."""
+        self._validate()
+        self._started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="SynexStartup"
+        )
+
+        for stage in self._stages.values():
+            if not stage.deps:
+                self._submit(stage)
+
+        if wait_critical:
+            for stage in self._stages.values():
+                if stage.critical:
+                    self.wait(stage.name)
+        return self
+
+    def _submit(self, stage: StartupStage):
+        self._executor.submit(self._run_stage, stage)
+
+    def _run_stage(self, stage: StartupStage):
+        stage.started_at = time.perf_counter()
+        try:
+            result = stage.factory()
+        except BaseException as e:
+            stage.finished_at = time.perf_counter()
+            if self.verbose:
+                print(Fore.RED + f"❌ {stage.name} failed after {stage.duration:.2f}s: {e}")
+            stage.future.set_exception(e)
+        else:
+            stage.finished_at = time.perf_counter()
+            if self.verbose:
+                print(Fore.GREEN + f"⏱  {stage.name} ready in {stage.duration:.2f}s")
+            stage.future.set_result(result)
+        self._schedule_dependents(stage)
+
+    def _schedule_dependents(self, finished: StartupStage):
+        skipped = []
+        with self._lock:
+            for stage in self._stages.values():
+                if finished.name not in stage.deps or stage.started_at is not None:
+                    continue
+                deps = [self._stages[d] for d in stage.deps]
+                if not all(d.future.done() for d in deps):
+                    continue
+
+                # Claim the stage so it is scheduled exactly once
+                stage.started_at = time.perf_counter()
+                failed = [d.name for d in deps if d.future.exception() is not None]
+                if failed:
+                    stage.finished_at = stage.started_at
+                    stage.future.set_exception(
+                        StartupError(f"{stage.name} skipped: dependency {', '.join(failed)} failed")
+                    )
+                    skipped.append(stage)
+                else:
+                    self._submit(stage)
+
+        # Propagate failures down the graph
+        for stage in skipped:
+            self._schedule_dependents(stage)
+
+    # ------------------------
+    # Access
+    # ------------------------
+    def wait(self, name: str, timeout: float = None):
+        """Block until a stage is ready and return its result."""
+        stage = self._stages[name]
+        try:
+            return stage.future.result(timeout=timeout)
+        except (StartupError, FuturesTimeout):
+            raise
+        except Exception as e:
+            raise StartupError(f"{name} failed to load: {e}") from e
+
+    def is_ready(self, name: str) -> bool:
+        stage = self._stages.get(name)
+        return bool(stage and stage.future.done() and stage.future.exception() is None)
+
+    def is_failed(self, name: str) -> bool:
+        stage = self._stages.get(name)
+        return bool(stage and stage.future.done() and stage.future.exception() is not None)
+
+    def wait_all(self, timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for stage in self._stages.values():
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            try:
+                stage.future.result(timeout=remaining)
+            except Exception:
+                if not stage.future.done():
+                    return False
+        return True
+
+    def timings(self) -> dict:
+        """Per-stage status and duration in milliseconds."""
+        report = {}
+        for stage in self._stages.values():
+            if stage.future.done():
+                status = "failed" if stage.future.exception() is not None else "ready"
+            elif stage.started_at is not None:
+                status = "loading"
+            else:
+                status = "pending"
+            duration = stage.duration
+            report[stage.name] = {
+                "status": status,
+                "ms": round(duration * 1000, 1) if duration is not None else None,
+                "deps": list(stage.deps),
+            }
+        return report
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,168 @@
+# BACKEND/core/tests/test_command_pipeline.py
+"""
+Unit tests for the staged command pipeline (per-family executors,
+cancellation, back-pressure)
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from BACKEND.core.command_pipeline import CommandPipeline, family_for_intent
+
+
+class Harness:
+    """Stage callbacks where the command text is the intent and 'slow_*' blocks."""
+
+    def __init__(self, slow_seconds=0.5):
+        self.slow_seconds = slow_seconds
+        self.release = threading.Event()
+        self.responses = []
+        self.rejected = []
+        self.errors = []
+        self.lock = threading.Lock()
+
+    def normalize(self, cmd):
+        return cmd.text != "drop"
+
+    def classify(self, cmd):
+        cmd.intent = cmd.text.replace("slow_", "").split()[0]
+        return True
+
+    def dispatch(self, cmd):
+        if cmd.text == "boom":
+            raise ValueError("boom")
+        if cmd.text.startswith("slow_"):
+            self.release.wait(self.slow_seconds)
+        return f"done {cmd.text}"
+
+    def respond(self, cmd, result):
+        with self.lock:
+            self.responses.append((result, time.perf_counter()))
+
+    def pipeline(self, **kwargs):
+        pipeline = CommandPipeline(
+            self.normalize, self.classify, self.dispatch, self.respond,
+            on_error=lambda cmd, e: self.errors.append(str(e)),
+            on_reject=lambda cmd: self.rejected.append(cmd.text),
+            **kwargs
+        ).start()
+        return pipeline
+
+    def results(self):
+        with self.lock:
+            return [r for r, _ in self.responses]
+
+
+class TestFamilies(unittest.TestCase):
+    def test_family_for_intent(self):
+        self.assertEqual(family_for_intent("whatsapp_send_message"), "whatsapp")
+        self.assertEqual(family_for_intent("send_whatsapp_message"), "whatsapp")
+        self.assertEqual(family_for_intent("youtube_play"), "youtube")
+        self.assertEqual(family_for_intent("google_search"), "browser")
+        self.assertEqual(family_for_intent("open_item"), "browser")
+        self.assertEqual(family_for_intent("check_internet_speed"), "network")
+        self.assertEqual(family_for_intent("check_time"), "system")
+        self.assertEqual(family_for_intent(None), "system")
+
+
+class TestCommandPipeline(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("builtins.print")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.harness = Harness()
+
+    def _pipeline(self, **kwargs):
+        pipeline = self.harness.pipeline(**kwargs)
+        self.addCleanup(pipeline.stop)
+        return pipeline
+
+    def test_slow_family_does_not_block_others(self):
+        pipeline = self._pipeline()
+        t0 = time.perf_counter()
+        pipeline.submit("slow_check_internet_speed")
+        pipeline.submit("check_time")
+        deadline = time.time() + 1.0
+        while "done check_time" not in self.harness.results() and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.harness.results(), ["done check_time"])
+        self.assertLess(time.perf_counter() - t0, 0.3)
+        metrics = pipeline.get_metrics()
+        self.assertEqual(metrics["families"]["network"]["running"], 1)
+
+        self.harness.release.set()
+        self.assertTrue(pipeline.wait_idle(timeout=2.0))
+        self.assertEqual(len(self.harness.results()), 2)
+
+    def test_single_worker_family_runs_in_order(self):
+        pipeline = self._pipeline()
+        for i in range(3):
+            pipeline.submit(f"slow_youtube_play {i}")
+        self.harness.release.set()
+        self.assertTrue(pipeline.wait_idle(timeout=2.0))
+        self.assertEqual(
+            self.harness.results(),
+            [f"done slow_youtube_play {i}" for i in range(3)]
+        )
+        self.assertEqual(pipeline.get_metrics()["families"]["youtube"]["completed"], 3)
+
+    def test_cancel_drops_queued_and_mutes_running(self):
+        pipeline = self._pipeline()
+        running = pipeline.submit("slow_whatsapp_send_message a")
+        queued = pipeline.submit("slow_whatsapp_send_message b")
+        time.sleep(0.1)
+
+        self.assertEqual(pipeline.cancel_all(family="whatsapp"), 2)
+        self.assertTrue(running.cancel_event.is_set())
+        self.harness.release.set()
+        self.assertTrue(pipeline.wait_idle(timeout=2.0))
+
+        self.assertEqual(self.harness.results(), [])
+        self.assertEqual(running.status, "cancelled")
+        self.assertEqual(queued.status, "cancelled")
+        self.assertEqual(pipeline.get_metrics()["families"]["whatsapp"]["cancelled"], 2)
+
+    def test_family_queue_full_rejects(self):
+        pipeline = self._pipeline(families={"network": (1, 1)})
+        for i in range(3):
+            pipeline.submit(f"slow_check_ip {i}")
+        time.sleep(0.2)
+        # one running, one queued, one rejected
+        self.assertEqual(self.harness.rejected, ["slow_check_ip 2"])
+        self.assertEqual(pipeline.get_metrics()["families"]["network"]["rejected"], 1)
+        self.harness.release.set()
+        self.assertTrue(pipeline.wait_idle(timeout=2.0))
+
+    def test_ingest_back_pressure(self):
+        gate = threading.Event()
+        self.harness.normalize = lambda cmd: gate.wait(2.0)
+        pipeline = self._pipeline(queue_size=2)
+
+        accepted = [pipeline.submit(f"check_time {i}", timeout=0) for i in range(5)]
+        # one in normalize, two waiting in the ingest queue
+        self.assertEqual([c is not None for c in accepted], [True, True, True, False, False])
+        self.assertEqual(pipeline.get_metrics()["stages"]["ingest"]["dropped"], 2)
+        self.assertIsNone(pipeline.submit("check_time 5", timeout=0.05))
+
+        gate.set()
+        self.assertTrue(pipeline.wait_idle(timeout=2.0))
+        self.assertEqual(len(self.harness.results()), 3)
+
+    def test_dropped_and_failing_commands(self):
+        pipeline = self._pipeline()
+        pipeline.submit("drop")
+        pipeline.submit("boom")
+        self.assertTrue(pipeline.wait_idle(timeout=2.0))
+        time.sleep(0.05)
+        self.assertEqual(self.harness.results(), [])
+        self.assertEqual(self.harness.errors, ["boom"])
+        metrics = pipeline.get_metrics()
+        self.assertEqual(metrics["stages"]["normalize"]["processed"], 2)
+        self.assertEqual(metrics["families"]["system"]["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# BACKEND/core/tests/test_startup.py
+"""
+Unit tests for the staged startup orchestrator and lazy ActionRouter
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import TimeoutError as FuturesTimeout
+from unittest.mock import patch
+
+from BACKEND.core.startup import StartupError, StartupOrchestrator
+
+
+class TestStartupOrchestrator(unittest.TestCase):
+    def _orchestrator(self, **kwargs):
+        return StartupOrchestrator(verbose=False, **kwargs)
+
+    def test_independent_stages_run_in_parallel(self):
+        startup = self._orchestrator(max_workers=4)
+        for name in ("a", "b", "c"):
+            startup.add(name, lambda: time.sleep(0.2) or True)
+
+        t0 = time.perf_counter()
+        startup.start()
+        self.assertTrue(startup.wait_all(timeout=2.0))
+        self.assertLess(time.perf_counter() - t0, 0.5)
+        startup.shutdown()
+
+    def test_dependencies_run_after_their_deps(self):
+        order = []
+        lock = threading.Lock()
+
+        def stage(name, delay=0.0):
+            def run():
+                time.sleep(delay)
+                with lock:
+                    order.append(name)
+                return name
+            return run
+
+        startup = self._orchestrator()
+        startup.add("speech", stage("speech", 0.05))
+        startup.add("router", stage("router"), deps=("speech",))
+        startup.add("battery", stage("battery"), deps=("speech", "router"))
+        startup.start()
+
+        self.assertEqual(startup.wait("battery", timeout=2.0), "battery")
+        self.assertEqual(order, ["speech", "router", "battery"])
+        startup.shutdown()
+
+    def test_critical_stage_ready_when_start_returns(self):
+        startup = self._orchestrator()
+        startup.add("speech", lambda: time.sleep(0.05) or "speech", critical=True)
+        startup.add("model", lambda: time.sleep(0.5) or "model")
+        startup.start()
+
+        self.assertTrue(startup.is_ready("speech"))
+        self.assertFalse(startup.is_ready("model"))
+        self.assertEqual(startup.timings()["model"]["status"], "loading")
+        startup.wait("model", timeout=2.0)
+        startup.shutdown()
+
+    def test_failure_propagates_to_dependents(self):
+        def boom():
+            raise RuntimeError("no microphone")
+
+        startup = self._orchestrator()
+        startup.add("listener", boom)
+        startup.add("voice_loop", lambda: True, deps=("listener",))
+        startup.add("wake_word", lambda: True, deps=("voice_loop",))
+        startup.add("model", lambda: "ok")
+        startup.start()
+
+        with self.assertRaises(StartupError):
+            startup.wait("listener", timeout=1.0)
+        with self.assertRaises(StartupError):
+            startup.wait("wake_word", timeout=1.0)
+        self.assertEqual(startup.wait("model", timeout=1.0), "ok")
+        self.assertTrue(startup.is_failed("voice_loop"))
+        startup.shutdown()
+
+    def test_wait_timeout_is_not_a_stage_failure(self):
+        release = threading.Event()
+        startup = self._orchestrator()
+        startup.add("model", lambda: release.wait(2.0) and "model")
+        startup.start()
+
+        with self.assertRaises(FuturesTimeout):
+            startup.wait("model", timeout=0.05)
+        release.set()
+        self.assertEqual(startup.wait("model", timeout=2.0), "model")
+        startup.shutdown()
+
+    def test_timings_reported(self):
+        startup = self._orchestrator()
+        startup.add("a", lambda: time.sleep(0.05))
+        startup.start()
+        startup.wait_all(timeout=1.0)
+
+        timing = startup.timings()["a"]
+        self.assertEqual(timing["status"], "ready")
+        self.assertGreaterEqual(timing["ms"], 40)
+        startup.shutdown()
+
+    def test_invalid_graphs_rejected(self):
+        startup = self._orchestrator()
+        startup.add("a", lambda: None, deps=("missing",))
+        with self.assertRaises(ValueError):
+            startup.start()
+
+        startup = self._orchestrator()
+        startup.add("a", lambda: None, deps=("b",))
+        startup.add("b", lambda: None, deps=("a",))
+        with self.assertRaises(ValueError):
+            startup.start()
+
+
+class TestLazyActionRouter(unittest.TestCase):
+    def test_controllers_not_built_for_unrelated_intents(self):
+        from BACKEND.core.brain.action_router import ActionRouter
+
+        router = ActionRouter(speaker=None)
+        self.assertIsNone(router._google)
+
+        with patch("builtins.print"):
+            response = router.handle("check_time", "what time is it")
+
+        self.assertTrue(response.startswith("The time is"))
+        self.assertIsNone(router._google)
+        self.assertIsNone(router.youtube_controller)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# BACKEND/gestures/actions.py
+"""
+Action sinks: where gesture decisions end up.
+
+- SystemActions: the real desktop side effects (lock screen, master
+  volume via pycaw, alt-tab via pyautogui). Windows-only libraries are
+  imported when needed, so the gesture stack imports on any box.
+- RecordingActions: records (time, action, args) instead of acting, for
+  replays, tests and benchmarks on headless machines.
+"""
+
+import ctypes
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+
+class SystemActions:
+    def __init__(self):
+        # Resolved on the constructing thread, as the module-level import used to
+        # (pycaw's COM objects come from the thread that initialized COM)
+        self._volume = self._load_endpoint_volume()
+
+    @staticmethod
+    def _load_endpoint_volume():
+        try:
+            from pycaw.pycaw import AudioUtilities
+
+            return AudioUtilities.GetSpeakers().EndpointVolume
+        except Exception:
+            return None
+
+    @property
+    def volume_available(self) -> bool:
+        return self._volume is not None
+
+    def lock_screen(self):
+        ctypes.windll.user32.LockWorkStation()
+
+    def set_volume(self, level: float):
+        if self._volume is None:
+            return
+        try:
+            self._volume.SetMasterVolumeLevelScalar(level, None)
+        except Exception:
+            pass
+
+    def hotkey(self, *keys):
+        import pyautogui
+
+        pyautogui.hotkey(*keys)
+
+
+@dataclass
+class ActionEvent:
+    time: float
+    action: str
+    args: Tuple = ()
+
+
+class RecordingActions:
+    """Same interface as SystemActions; nothing leaves the process."""
+
+    volume_available = True
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.events: List[ActionEvent] = []
+
+    def _record(self, action, *args):
+        self.events.append(ActionEvent(self.clock(), action, args))
+
+    def lock_screen(self):
+        self._record("lock_screen")
+
+    def set_volume(self, level: float):
+        self._record("set_volume", round(float(level), 3))
+
+    def hotkey(self, *keys):
+        self._record("hotkey", *keys)
+
+    def of(self, action: str) -> List[ActionEvent]:
+        return [e for e in self.events if e.action == action]
@@ -1,9 +1,13 @@
 # BACKEND/gestures/camera/camera_stream.py
+import time
+
 import cv2
 
 class CameraStream:
     def __init__(self, index=0):
         self.cap = cv2.VideoCapture(index)
+        # Keep the driver queue short: the pipeline only wants the newest frame
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
     def read(self):
         return self.cap.read()
@@ -11,3 +15,42 @@ class CameraStream:
     def release(self):
         self.cap.release()
         cv2.destroyAllWindows()
+
+
+class RecordedCameraStream:
+    """
+    Drop-in CameraStream that plays a recorded video file.
+
+    realtime=True paces read() to the file's frame rate like a webcam would,
+    so frame dropping / latency behave as they do live; realtime=False
+    returns frames as fast as they decode.
+    """
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise FileNotFoundError(f"Cannot open recording: {path}")
+        fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_interval = 1.0 / fps
+        self._next_frame_at = None
+
+    def read(self):
+        if self.realtime:
+            now = time.perf_counter()
+            if self._next_frame_at is None:
+                self._next_frame_at = now
+            elif now < self._next_frame_at:
+                time.sleep(self._next_frame_at - now)
+            self._next_frame_at += self.frame_interval
+
+        ok, frame = self.cap.read()
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read()
+        return ok, frame
+
+    def release(self):
+        self.cap.release()
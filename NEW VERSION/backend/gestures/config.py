@@ -5,7 +5,6 @@ from collections import deque
 # GESTURE BUFFER
 # =============================
 GESTURE_BUFFER_SIZE = 15
-gesture_buffer = deque(maxlen=GESTURE_BUFFER_SIZE)
 
 # =============================
 # HOLD TIMINGS
@@ -1,53 +1,160 @@
 # BACKEND/gestures/detection/gesture_classifier.py
+"""
+Raw (per-frame) gesture classification over vectorized hand features.
+
+Classifiers are interchangeable: anything with classify(HandFeatures) -> str.
+classify_batch(points) does the same over a whole (N, 21, 3) replay.
+- RuleGestureClassifier: the hand-tuned finger-state rules (default)
+- ModelGestureClassifier: a small linear model trained on feature_vector(),
+  e.g. from recorded landmark sessions
+"""
+
+import os
+
+import numpy as np
+
 from BACKEND.gestures.config import V_SIGN_MIN_SPREAD_RATIO
+from BACKEND.gestures.detection.landmark_features import (
+    D_HAND,
+    D_PINCH,
+    D_THUMB_IP,
+    D_THUMB_TIP,
+    D_V_GAP,
+    extract_features,
+    feature_vector,
+    pair_distances,
+)
 
 
 def dist(a, b):
     return ((a.x - b.x) ** 2 + (a.y - b.y) ** 2) ** 0.5
 
 
-def classify_raw_gesture(lm):
-    l = lm.landmark
-
-    index_up = dist(l[8], l[0]) > dist(l[6], l[0])
-    middle_up = dist(l[12], l[0]) > dist(l[10], l[0])
-    ring_up = dist(l[16], l[0]) > dist(l[14], l[0])
-    pinky_up = dist(l[20], l[0]) > dist(l[18], l[0])
-
-    # 👇 Thumb OPEN means far from palm
-    thumb_open = dist(l[4], l[17]) > dist(l[3], l[17])
-    thumb_closed = not thumb_open
-
-    # ==========================================
-    # ☝️ INDEX ONLY (SWIPE MODE)
-    # Thumb MUST be closed
-    # ==========================================
-    if index_up and thumb_closed and not any([middle_up, ring_up, pinky_up]):
-        return "INDEX_ONLY"
-
-    # ==========================================
-    # ✌️ V SIGN (MODE TOGGLE)
-    # ==========================================
-    if index_up and middle_up and not ring_up and not pinky_up:
-        hand_size = dist(l[9], l[0])
-        gap = dist(l[8], l[12])
-        if hand_size > 0 and (gap / hand_size) >= V_SIGN_MIN_SPREAD_RATIO:
-            return "V_SIGN"
-        else:
-            return "TWO_FINGER_CLOSE"
-
-    # ==========================================
-    # ✊ FIST (LOCK)
-    # ==========================================
-    if not any([index_up, middle_up, ring_up, pinky_up, thumb_open]):
-        return "FIST"
-
-    # ==========================================
-    # 🔊 VOLUME PINCH
-    # Thumb MUST be OPEN
-    # ==========================================
-    if thumb_open and index_up and not any([middle_up, ring_up, pinky_up]):
-        if dist(l[4], l[8]) > 0.025:
-            return "VOLUME_PINCH"
-
-    return "NONE"
+class RuleGestureClassifier:
+    def classify(self, f):
+        index_up, middle_up, ring_up, pinky_up = f.fingers_up
+
+        # 👇 Thumb OPEN means far from palm
+        thumb_open = f.thumb_open
+        thumb_closed = not thumb_open
+
+        # ==========================================
+        # ☝️ INDEX ONLY (SWIPE MODE)
+        # Thumb MUST be closed
+        # ==========================================
+        if index_up and thumb_closed and not (middle_up or ring_up or pinky_up):
+            return "INDEX_ONLY"
+
+        # ==========================================
+        # ✌️ V SIGN (MODE TOGGLE)
+        # ==========================================
+        if index_up and middle_up and not ring_up and not pinky_up:
+            hand_size = f.hand_size
+            if hand_size > 0 and (f.v_gap / hand_size) >= V_SIGN_MIN_SPREAD_RATIO:
+                return "V_SIGN"
+            else:
+                return "TWO_FINGER_CLOSE"
+
+        # ==========================================
+        # ✊ FIST (LOCK)
+        # ==========================================
+        if not (index_up or middle_up or ring_up or pinky_up or thumb_open):
+            return "FIST"
+
+        # ==========================================
+        # 🔊 VOLUME PINCH
+        # Thumb MUST be OPEN
+        # ==========================================
+        if thumb_open and index_up and not (middle_up or ring_up or pinky_up):
+            if f.pinch > 0.025:
+                return "VOLUME_PINCH"
+
+        return "NONE"
+
+    def classify_batch(self, points):
+        """Same rules over a (N, 21, 3) landmark sequence -> (N,) labels."""
+        d = pair_distances(points)
+        index_up, middle_up, ring_up, pinky_up = (d[:, :4] > d[:, 4:8]).T
+        thumb_open = d[:, D_THUMB_TIP] > d[:, D_THUMB_IP]
+        others_up = middle_up | ring_up | pinky_up
+
+        two_up = index_up & middle_up & ~ring_up & ~pinky_up
+        hand_size = d[:, D_HAND]
+        spread = np.divide(d[:, D_V_GAP], hand_size, out=np.zeros_like(hand_size), where=hand_size > 0)
+        return np.select(
+            [
+                index_up & ~thumb_open & ~others_up,
+                two_up & (spread >= V_SIGN_MIN_SPREAD_RATIO),
+                two_up,
+                ~(index_up | others_up | thumb_open),
+                thumb_open & index_up & ~others_up & (d[:, D_PINCH] > 0.025),
+            ],
+            ["INDEX_ONLY", "V_SIGN", "TWO_FINGER_CLOSE", "FIST", "VOLUME_PINCH"],
+            "NONE",
+        )
+
+
+class ModelGestureClassifier:
+    """
+    Linear softmax model over feature_vector(). Inference is one small
+    matrix product in NumPy; scikit-learn is only needed to train().
+    Frames whose best class scores below `min_confidence` are "NONE".
+    """
+
+    def __init__(self, coef, intercept, labels, min_confidence=0.6):
+        self.coef = np.asarray(coef, dtype=np.float32)
+        self.intercept = np.asarray(intercept, dtype=np.float32)
+        self.labels = np.asarray(labels)
+        self.min_confidence = min_confidence
+
+    @classmethod
+    def train(cls, vectors, labels, min_confidence=0.6):
+        from sklearn.linear_model import LogisticRegression
+
+        model = LogisticRegression(max_iter=2000, C=10.0)
+        model.fit(np.asarray(vectors), np.asarray(labels))
+        if len(model.classes_) < 3:
+            raise ValueError("need at least 3 gesture classes to train")
+        return cls(model.coef_, model.intercept_, model.classes_, min_confidence=min_confidence)
+
+    @classmethod
+    def load(cls, path, min_confidence=0.6):
+        data = np.load(path, allow_pickle=False)
+        return cls(data["coef"], data["intercept"], data["labels"], min_confidence=min_confidence)
+
+    def save(self, path):
+        np.savez(path, coef=self.coef, intercept=self.intercept, labels=self.labels)
+
+    def _predict(self, vectors):
+        scores = vectors @ self.coef.T + self.intercept
+        scores -= scores.max(axis=-1, keepdims=True)
+        proba = np.exp(scores)
+        proba /= proba.sum(axis=-1, keepdims=True)
+        best = proba.argmax(axis=-1)
+        confident = np.take_along_axis(proba, best[..., None], axis=-1)[..., 0] >= self.min_confidence
+        return np.where(confident, self.labels[best], "NONE")
+
+    def classify(self, f):
+        return str(self._predict(f.vector()))
+
+    def classify_batch(self, points):
+        return self._predict(feature_vector(points))
+
+
+DEFAULT_CLASSIFIER = RuleGestureClassifier()
+
+
+def load_classifier(path=None):
+    """Trained model from `path` / SYNEX_GESTURE_MODEL (.npz), else the rules."""
+    path = path or os.getenv("SYNEX_GESTURE_MODEL")
+    if not path:
+        return DEFAULT_CLASSIFIER
+    try:
+        return ModelGestureClassifier.load(path)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"⚠️ Gesture model '{path}' not loaded ({e}), using rules")
+        return DEFAULT_CLASSIFIER
+
+
+def classify_raw_gesture(lm, classifier=DEFAULT_CLASSIFIER):
+    return classifier.classify(extract_features(lm))
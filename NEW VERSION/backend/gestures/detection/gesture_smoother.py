@@ -1,10 +1,52 @@
 # BACKEND/gestures/detection/gesture_smoother.py
-from BACKEND.gestures.config import gesture_buffer, GESTURE_BUFFER_SIZE
+"""
+Majority-vote smoothing of raw gestures with hysteresis.
 
-def smooth_gesture(raw):
-    gesture_buffer.append(raw)
-    if len(gesture_buffer) < GESTURE_BUFFER_SIZE:
-        return "STABILIZING"
+Running vote counts make every update O(1): only the label that just came
+in can newly cross the enter threshold, and only the current stable label
+needs re-checking against the (lower) exit threshold.
+"""
+
+from collections import deque
+
+from BACKEND.gestures.config import GESTURE_BUFFER_SIZE
+
+
+class GestureSmoother:
+    def __init__(self, size=GESTURE_BUFFER_SIZE, enter_ratio=0.8, exit_ratio=0.7):
+        self.size = size
+        self.enter_count = size * enter_ratio  # must be exceeded to switch
+        self.exit_count = size * exit_ratio    # stable label kept while >= this
+        self._buffer = deque()
+        self._counts = {}
+        self.stable = None
+
+    def update(self, raw):
+        buffer, counts = self._buffer, self._counts
+        if len(buffer) == self.size:
+            old = buffer.popleft()
+            counts[old] -= 1
+        buffer.append(raw)
+        counts[raw] = counts.get(raw, 0) + 1
+
+        if len(buffer) < self.size:
+            return "STABILIZING"
 
-    best = max(set(gesture_buffer), key=gesture_buffer.count)
-    return best if gesture_buffer.count(best) > GESTURE_BUFFER_SIZE * 0.8 else "TRANSITIONING"
+        if raw != self.stable and counts[raw] > self.enter_count:
+            self.stable = raw
+        elif self.stable is not None and counts.get(self.stable, 0) < self.exit_count:
+            self.stable = None
+        return self.stable if self.stable is not None else "TRANSITIONING"
+
+    def reset(self):
+        self._buffer.clear()
+        self._counts.clear()
+        self.stable = None
+
+
+_default_smoother = GestureSmoother()
+
+
+def smooth_gesture(raw):
+    """Module-level smoother kept for scripts; GestureManager owns its own."""
+    return _default_smoother.update(raw)
@@ -5,11 +5,21 @@ import mediapipe as mp
 mp_hands = mp.solutions.hands
 mp_draw = mp.solutions.drawing_utils
 
+# The ROI tracker re-acquires the hand itself, so MediaPipe's own tracking
+# threshold can sit at its default instead of forcing palm detection often
 hands = mp_hands.Hands(
     max_num_hands=1,
     min_detection_confidence=0.8,
-    min_tracking_confidence=0.8
+    min_tracking_confidence=0.5
 )
 
 # ✅ EXPORT THIS CONSTANT
 HAND_CONNECTIONS = mp_hands.HAND_CONNECTIONS
+
+
+def detect_hand(rgb):
+    """Landmarks of the first hand in an RGB image (normalized to it), or None."""
+    result = hands.process(rgb)
+    if not result.multi_hand_landmarks:
+        return None
+    return result.multi_hand_landmarks[0]
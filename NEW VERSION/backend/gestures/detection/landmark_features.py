@@ -0,0 +1,113 @@
+# BACKEND/gestures/detection/landmark_features.py
+"""
+Vectorized hand features from the 21 MediaPipe landmarks.
+
+Landmarks are converted once per frame to a (21, 3) array; every distance
+the gesture rules need is then computed in a single array op over a fixed
+table of landmark pairs. All functions also accept stacked (N, 21, 3)
+sequences, which is what replay benchmarks and classifier training use.
+"""
+
+import numpy as np
+
+WRIST = 0
+THUMB_IP, THUMB_TIP = 3, 4
+INDEX_PIP, INDEX_TIP = 6, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP = 9, 10, 12
+RING_PIP, RING_TIP = 14, 16
+PINKY_MCP, PINKY_PIP, PINKY_TIP = 17, 18, 20
+
+# Hand skeleton edges (same topology as mediapipe's HAND_CONNECTIONS), for
+# drawing without importing MediaPipe
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
+# (a, b) landmark pairs whose distances drive the rules. Order matters:
+#   0-3  index/middle/ring/pinky tip -> wrist
+#   4-7  index/middle/ring/pinky PIP -> wrist
+#   8-9  thumb tip / thumb IP -> pinky base
+#   10   hand size (middle MCP -> wrist)
+#   11   index-middle tip gap (V sign spread)
+#   12   thumb-index tip gap (pinch)
+PAIRS = np.array([
+    (INDEX_TIP, WRIST), (MIDDLE_TIP, WRIST), (RING_TIP, WRIST), (PINKY_TIP, WRIST),
+    (INDEX_PIP, WRIST), (MIDDLE_PIP, WRIST), (RING_PIP, WRIST), (PINKY_PIP, WRIST),
+    (THUMB_TIP, PINKY_MCP), (THUMB_IP, PINKY_MCP),
+    (MIDDLE_MCP, WRIST),
+    (INDEX_TIP, MIDDLE_TIP),
+    (THUMB_TIP, INDEX_TIP),
+])
+_A, _B = PAIRS[:, 0].copy(), PAIRS[:, 1].copy()
+D_THUMB_TIP, D_THUMB_IP, D_HAND, D_V_GAP, D_PINCH = 8, 9, 10, 11, 12
+
+# 20 landmark->wrist distances + thumb/gap distances, all divided by hand size
+FEATURE_SIZE = 20 + 4
+
+
+def landmarks_to_array(lm) -> np.ndarray:
+    """MediaPipe NormalizedLandmarkList (or anything with .landmark[i].x/y/z) -> (21, 3)."""
+    if isinstance(lm, np.ndarray):
+        return lm
+    return np.fromiter([c for p in lm.landmark for c in (p.x, p.y, p.z)], np.float64, 63).reshape(21, 3)
+
+
+def pair_distances(points: np.ndarray) -> np.ndarray:
+    """(..., 21, 3) -> (..., len(PAIRS)) 2D distances."""
+    x, y = points[..., 0], points[..., 1]
+    return np.hypot(x.take(_A, axis=-1) - x.take(_B, axis=-1), y.take(_A, axis=-1) - y.take(_B, axis=-1))
+
+
+def feature_vector(points: np.ndarray) -> np.ndarray:
+    """(..., 21, 3) -> (..., FEATURE_SIZE) scale-invariant features for learned classifiers."""
+    xy = points[..., :2]
+    wrist = np.sqrt(((xy[..., 1:, :] - xy[..., :1, :]) ** 2).sum(axis=-1))
+    d = pair_distances(points)
+    scale = d[..., D_HAND:D_HAND + 1]
+    scale = np.where(scale > 0, scale, 1.0)
+    extra = d[..., [D_THUMB_TIP, D_THUMB_IP, D_V_GAP, D_PINCH]]
+    return (np.concatenate([wrist, extra], axis=-1) / scale).astype(np.float32)
+
+
+class HandFeatures:
+    """Per-frame features. Distances are computed once and kept as floats for the rules."""
+
+    __slots__ = ("points", "distances")
+
+    def __init__(self, points: np.ndarray):
+        self.points = points
+        self.distances = pair_distances(points).tolist()
+
+    @property
+    def fingers_up(self):
+        """index, middle, ring, pinky: tip further from the wrist than the PIP joint."""
+        d = self.distances
+        return d[0] > d[4], d[1] > d[5], d[2] > d[6], d[3] > d[7]
+
+    @property
+    def thumb_open(self) -> bool:
+        """Thumb tip further from the pinky base than the thumb IP joint."""
+        return self.distances[D_THUMB_TIP] > self.distances[D_THUMB_IP]
+
+    @property
+    def hand_size(self) -> float:
+        return self.distances[D_HAND]
+
+    @property
+    def v_gap(self) -> float:
+        return self.distances[D_V_GAP]
+
+    @property
+    def pinch(self) -> float:
+        return self.distances[D_PINCH]
+
+    def vector(self) -> np.ndarray:
+        return feature_vector(self.points)
+
+
+def extract_features(lm) -> HandFeatures:
+    return HandFeatures(landmarks_to_array(lm))
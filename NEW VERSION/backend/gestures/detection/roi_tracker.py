@@ -0,0 +1,184 @@
+# BACKEND/gestures/detection/roi_tracker.py
+"""
+Region-of-interest tracking around the hand for cheaper landmark inference.
+
+    tracker = RoiTracker(detect_hand)
+    lm = tracker.process(frame_bgr)     # landmarks in full-frame coordinates
+
+- Tracking: after a detection, only a padded square around the last
+  landmarks is cropped, downscaled to `roi_size` and sent to the detector.
+  Landmarks are mapped back to full-frame normalized coordinates in place.
+- Lost: after `lost_after` misses inside the ROI the search widens to the
+  whole frame (downscaled to `full_size`).
+- Idle: when no hand was seen for `idle_after` seconds, inference only runs
+  every `idle_interval` seconds; frames in between are skipped.
+
+get_stats() exposes the per-frame inference cost and mode counts for tuning.
+"""
+
+import time
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+try:
+    import cv2
+except ImportError:  # headless test boxes without OpenCV
+    cv2 = None
+
+# x0, y0, x1, y1 in pixels
+Box = Tuple[int, int, int, int]
+
+
+def _resize(image, max_side: int):
+    h, w = image.shape[:2]
+    scale = max_side / max(h, w)
+    if scale >= 1.0:
+        return np.ascontiguousarray(image)
+    size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    if cv2 is not None:
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    ys = (np.arange(size[1]) / scale).astype(int)
+    xs = (np.arange(size[0]) / scale).astype(int)
+    return np.ascontiguousarray(image[ys][:, xs])
+
+
+def _bgr_to_rgb(image):
+    if cv2 is not None:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return np.ascontiguousarray(image[..., ::-1])
+
+
+def landmark_box(lm, width: int, height: int, padding: float, min_side: float) -> Box:
+    """Padded square pixel box around normalized landmarks, clamped to the frame."""
+    xs = [p.x for p in lm.landmark]
+    ys = [p.y for p in lm.landmark]
+    cx = (min(xs) + max(xs)) / 2 * width
+    cy = (min(ys) + max(ys)) / 2 * height
+    side = max((max(xs) - min(xs)) * width, (max(ys) - min(ys)) * height)
+    side = max(side * (1 + 2 * padding), min_side * min(width, height))
+    side = min(side, width, height)
+
+    x0 = int(min(max(cx - side / 2, 0), width - side))
+    y0 = int(min(max(cy - side / 2, 0), height - side))
+    return x0, y0, x0 + int(side), y0 + int(side)
+
+
+class RoiTracker:
+    def __init__(
+        self,
+        detect: Callable,
+        padding: float = 0.35,
+        min_side: float = 0.25,
+        roi_size: int = 256,
+        full_size: int = 480,
+        lost_after: int = 2,
+        idle_after: float = 1.5,
+        idle_interval: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        detect(rgb_image) -> landmarks (object with .landmark[i].x/.y,
+        normalized to the image it was given) or None.
+        """
+        self.detect = detect
+        self.padding = padding
+        self.min_side = min_side
+        self.roi_size = roi_size
+        self.full_size = full_size
+        self.lost_after = lost_after
+        self.idle_after = idle_after
+        self.idle_interval = idle_interval
+        self.clock = clock
+
+        self.roi: Optional[Box] = None
+        self._misses = 0
+        self._last_seen = None
+        self._started = None
+        self._last_inference = None
+
+        self.frames = {"roi": 0, "full": 0, "skipped": 0}
+        self.last_cost_ms = 0.0
+        self.avg_cost_ms = 0.0
+        self.last_input_pixels = 0
+
+    # ------------------------
+    # Public
+    # ------------------------
+    @property
+    def idle(self) -> bool:
+        if self.roi is not None or self._started is None:
+            return False
+        since = self._started if self._last_seen is None else self._last_seen
+        return (self.clock() - since) >= self.idle_after
+
+    def process(self, frame_bgr):
+        """Landmarks for this frame in full-frame normalized coordinates, or None."""
+        now = self.clock()
+        if self._started is None:
+            self._started = now
+        if self.idle and self._last_inference is not None:
+            if (now - self._last_inference) < self.idle_interval:
+                self.frames["skipped"] += 1
+                return None
+
+        height, width = frame_bgr.shape[:2]
+        box = self.roi or (0, 0, width, height)
+        mode = "roi" if self.roi else "full"
+        x0, y0, x1, y1 = box
+
+        t0 = time.perf_counter()
+        crop = frame_bgr[y0:y1, x0:x1]
+        image = _bgr_to_rgb(_resize(crop, self.roi_size if self.roi else self.full_size))
+        lm = self.detect(image)
+        self._record_cost(time.perf_counter() - t0, image)
+        self.frames[mode] += 1
+        self._last_inference = now
+
+        if lm is None:
+            self._misses += 1
+            if self.roi is not None and self._misses >= self.lost_after:
+                self.roi = None  # widen to the full frame
+            return None
+
+        self._map_to_frame(lm, box, width, height)
+        self._misses = 0
+        self._last_seen = now
+        self.roi = landmark_box(lm, width, height, self.padding, self.min_side)
+        return lm
+
+    def reset(self):
+        self.roi = None
+        self._misses = 0
+        self._last_seen = None
+        self._started = None
+        self._last_inference = None
+
+    def get_stats(self) -> dict:
+        return {
+            "mode": "roi" if self.roi else ("idle" if self.idle else "full"),
+            "roi": self.roi,
+            "frames": dict(self.frames),
+            "inference_ms": round(self.last_cost_ms, 2),
+            "avg_inference_ms": round(self.avg_cost_ms, 2),
+            "input_pixels": self.last_input_pixels,
+        }
+
+    # ------------------------
+    # Internals
+    # ------------------------
+    def _record_cost(self, seconds: float, image):
+        self.last_cost_ms = seconds * 1000.0
+        runs = self.frames["roi"] + self.frames["full"]
+        self.avg_cost_ms = self.last_cost_ms if runs == 0 else 0.9 * self.avg_cost_ms + 0.1 * self.last_cost_ms
+        self.last_input_pixels = image.shape[0] * image.shape[1]
+
+    @staticmethod
+    def _map_to_frame(lm, box: Box, width: int, height: int):
+        """Crop-normalized -> frame-normalized, in place (works on MediaPipe protos)."""
+        x0, y0, x1, y1 = box
+        sx, sy = (x1 - x0) / width, (y1 - y0) / height
+        ox, oy = x0 / width, y0 / height
+        for p in lm.landmark:
+            p.x = ox + p.x * sx
+            p.y = oy + p.y * sy
@@ -0,0 +1,95 @@
+# BACKEND/gestures/detection/synthetic_hands.py
+"""
+Synthetic hand landmark poses for tests, classifier training and benchmarks.
+
+make_hand("V_SIGN", rng) -> (21, 3) landmarks of an upright right hand in
+normalized image coordinates, jittered and randomly scaled / shifted.
+synthetic_session() strings held poses together like a real recording.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+POSES = ("INDEX_ONLY", "V_SIGN", "TWO_FINGER_CLOSE", "FIST", "VOLUME_PINCH", "NONE")
+
+_WRIST = (0.5, 0.8)
+# Finger base x and which landmark indices (MCP, PIP, DIP, TIP) belong to it
+_FINGERS = {
+    "index": (0.45, (5, 6, 7, 8)),
+    "middle": (0.50, (9, 10, 11, 12)),
+    "ring": (0.54, (13, 14, 15, 16)),
+    "pinky": (0.58, (17, 18, 19, 20)),
+}
+_UP_Y = (0.60, 0.50, 0.45, 0.40)
+_CURLED_Y = (0.60, 0.52, 0.58, 0.62)
+
+_THUMB_OPEN = ((0.46, 0.75), (0.42, 0.70), (0.37, 0.65), (0.32, 0.60))
+_THUMB_CLOSED = ((0.46, 0.75), (0.44, 0.70), (0.45, 0.66), (0.53, 0.64))
+
+# pose -> (fingers up, thumb open, index/middle tip x offsets)
+_POSE_SPEC = {
+    "INDEX_ONLY": ({"index"}, False, (0.0, 0.0)),
+    "V_SIGN": ({"index", "middle"}, False, (-0.04, 0.04)),
+    "TWO_FINGER_CLOSE": ({"index", "middle"}, False, (0.02, -0.02)),
+    "FIST": (set(), False, (0.0, 0.0)),
+    "VOLUME_PINCH": ({"index"}, True, (0.0, 0.0)),
+    "NONE": ({"index", "middle", "ring", "pinky"}, True, (-0.02, 0.02)),
+}
+
+
+def make_hand(pose, rng=None, noise=0.003, scale=None, shift=None):
+    rng = rng if rng is not None else np.random.default_rng()
+    up, thumb_open, (index_dx, middle_dx) = _POSE_SPEC[pose]
+
+    pts = np.zeros((21, 3), dtype=np.float32)
+    pts[0, :2] = _WRIST
+    for i, xy in enumerate(_THUMB_OPEN if thumb_open else _THUMB_CLOSED, start=1):
+        pts[i, :2] = xy
+    for name, (x, idx) in _FINGERS.items():
+        ys = _UP_Y if name in up else _CURLED_Y
+        dx = index_dx if name == "index" else middle_dx if name == "middle" else 0.0
+        for k, (j, y) in enumerate(zip(idx, ys)):
+            pts[j, :2] = (x + dx * k / 3, y)
+
+    # Size / position around the wrist (random unless given), then per-landmark jitter
+    scale = rng.uniform(0.7, 1.3) if scale is None else scale
+    shift = rng.uniform(-0.15, 0.15, size=2) if shift is None else np.asarray(shift)
+    pts[:, :2] = (pts[:, :2] - _WRIST) * scale + _WRIST + shift
+    pts[:, :2] += rng.normal(0.0, noise * scale, size=(21, 2))
+    return pts
+
+
+def synthetic_session(frames=600, seed=0, hold=(8, 40), noise=0.003, steady=False, poses=POSES):
+    """
+    (frames, 21, 3) landmark sequence of held poses and its per-frame labels.
+    steady=True keeps the hand in place during a hold (only jitter), except
+    INDEX_ONLY holds, which drift sideways like a swipe.
+    """
+    rng = np.random.default_rng(seed)
+    points, labels = [], []
+    while len(labels) < frames:
+        pose = poses[rng.integers(len(poses))]
+        n = int(rng.integers(*hold))
+        scale = shift = None
+        drift = 0.0
+        if steady:
+            scale = rng.uniform(0.7, 1.3)
+            shift = rng.uniform(-0.1, 0.1, size=2)
+            if pose == "INDEX_ONLY":
+                drift = rng.choice([-1.0, 1.0]) * rng.uniform(0.2, 0.3)
+        for i in range(n):
+            if steady:
+                # Drift only in the second half of the hold (hold to arm, then swipe)
+                moved = drift * max(0.0, (i / n - 0.5) * 2)
+                frame_shift = shift + (moved, 0.0)
+            else:
+                frame_shift = None
+            points.append(make_hand(pose, rng, noise, scale=scale, shift=frame_shift))
+            labels.append(pose)
+    return np.stack(points[:frames]), labels[:frames]
+
+
+def as_landmarks(points):
+    """(21, 3) array -> MediaPipe-like object with .landmark[i].x/.y/.z."""
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points])
@@ -0,0 +1,210 @@
+# BACKEND/gestures/frame_pipeline.py
+"""
+Three-stage capture -> inference -> render pipeline for the gesture camera.
+
+    grabber thread   camera.read() as fast as the camera delivers
+         | LatestSlot (1 frame, stale frames dropped)
+    inference thread infer(frame) -> result   (MediaPipe, classification)
+         | LatestSlot
+    render stage     render(packet) on the caller's thread (OpenCV windows
+                     must stay on one thread), emits status / preview
+
+Each stage only ever works on the newest item, so a slow inference never
+builds up a backlog: latency stays ~1 frame and the camera keeps running at
+its native rate. Per-stage latency and FPS are tracked in PipelineStats.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+class LatestSlot:
+    """Single-slot hand-off between two threads. put() overwrites."""
+
+    def __init__(self):
+        self._item = None
+        self._has_item = False
+        self._closed = False
+        self.dropped = 0
+        self._cond = threading.Condition()
+
+    def put(self, item):
+        with self._cond:
+            if self._has_item:
+                self.dropped += 1
+            self._item = item
+            self._has_item = True
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        """Newest item, or None on timeout / once closed and drained."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._has_item or self._closed, timeout):
+                return None
+            if not self._has_item:
+                return None
+            item, self._item, self._has_item = self._item, None, False
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+class StageStats:
+    """Exponential moving average of stage latency plus a 1 s FPS window."""
+
+    def __init__(self, alpha: float = 0.1):
+        self.alpha = alpha
+        self.latency_ms = 0.0
+        self.fps = 0.0
+        self.count = 0
+        self._window_start = time.perf_counter()
+        self._window_count = 0
+
+    def record(self, seconds: float):
+        ms = seconds * 1000.0
+        self.latency_ms = ms if self.count == 0 else (1 - self.alpha) * self.latency_ms + self.alpha * ms
+        self.count += 1
+        self._window_count += 1
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.fps = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+
+    def as_dict(self) -> dict:
+        return {"fps": round(self.fps, 1), "latency_ms": round(self.latency_ms, 2), "frames": self.count}
+
+
+@dataclass
+class FramePacket:
+    seq: int
+    frame: Any
+    captured_at: float
+    result: Any = None
+    inferred_at: Optional[float] = None
+
+
+class FramePipeline:
+    """
+    camera: object with read() -> (ok, frame) and release()
+    infer(frame) -> result           runs on the inference thread
+    render(packet) -> bool           runs on the thread calling run(); False stops
+    """
+
+    def __init__(
+        self,
+        camera,
+        infer: Callable[[Any], Any],
+        render: Callable[[FramePacket], bool],
+        poll_interval: float = 0.05,
+    ):
+        self.camera = camera
+        self.infer = infer
+        self.render = render
+        self.poll_interval = poll_interval
+
+        self.frames = LatestSlot()
+        self.results = LatestSlot()
+        self.capture_stats = StageStats()
+        self.infer_stats = StageStats()
+        self.render_stats = StageStats()
+        self.end_to_end = StageStats()
+
+        self._running = False
+        self._threads = []
+        self.error: Optional[BaseException] = None
+
+    # ------------------------
+    # Stages
+    # ------------------------
+    def _grab_loop(self):
+        seq = 0
+        try:
+            while self._running:
+                t0 = time.perf_counter()
+                ok, frame = self.camera.read()
+                if not ok:
+                    break
+                self.capture_stats.record(time.perf_counter() - t0)
+                seq += 1
+                self.frames.put(FramePacket(seq, frame, time.perf_counter()))
+        except Exception as e:
+            self.error = e
+        finally:
+            self.frames.close()
+
+    def _infer_loop(self):
+        try:
+            while self._running:
+                packet = self.frames.get(timeout=self.poll_interval)
+                if packet is None:
+                    if self.frames.closed:
+                        break
+                    continue
+                t0 = time.perf_counter()
+                packet.result = self.infer(packet.frame)
+                packet.inferred_at = time.perf_counter()
+                self.infer_stats.record(packet.inferred_at - t0)
+                self.results.put(packet)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.results.close()
+
+    # ------------------------
+    # Lifecycle
+    # ------------------------
+    def run(self):
+        """Start the grabber / inference threads and render until stopped or out of frames."""
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._grab_loop, name="gesture-grab", daemon=True),
+            threading.Thread(target=self._infer_loop, name="gesture-infer", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        try:
+            while self._running:
+                packet = self.results.get(timeout=self.poll_interval)
+                if packet is None:
+                    if self.results.closed:
+                        break
+                    continue
+                t0 = time.perf_counter()
+                keep_going = self.render(packet)
+                done = time.perf_counter()
+                self.render_stats.record(done - t0)
+                self.end_to_end.record(done - packet.captured_at)
+                if keep_going is False:
+                    break
+        finally:
+            self.stop()
+        if self.error is not None:
+            raise self.error
+
+    def stop(self, timeout: float = 1.0):
+        self._running = False
+        self.frames.close()
+        self.results.close()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=timeout)
+
+    def get_stats(self) -> dict:
+        return {
+            "capture": self.capture_stats.as_dict(),
+            "inference": self.infer_stats.as_dict(),
+            "render": self.render_stats.as_dict(),
+            "end_to_end": self.end_to_end.as_dict(),
+            "dropped": {"capture": self.frames.dropped, "inference": self.results.dropped},
+        }
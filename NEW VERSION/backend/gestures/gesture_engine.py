@@ -1,9 +1,8 @@
 # BACKEND/gestures/gesture_engine.py
 import time
-import ctypes
 import numpy as np
-from pycaw.pycaw import AudioUtilities
 
+from BACKEND.gestures.actions import SystemActions
 from BACKEND.gestures.config import (
     HOLD_TIME_V,
     HOLD_TIME_LOCK,
@@ -12,16 +11,13 @@ from BACKEND.gestures.config import (
 )
 from BACKEND.gestures.detection.gesture_classifier import dist
 
-try:
-    devices = AudioUtilities.GetSpeakers()
-    volume = devices.EndpointVolume
-except Exception:
-    volume = None
-
 
 class GestureEngine:
-    def __init__(self):
+    def __init__(self, actions=None, clock=time.time):
         self.active = False
+        # SystemActions live; RecordingActions + a replay clock for tests / benchmarks
+        self.actions = actions or SystemActions()
+        self.clock = clock
 
         # ---- V SIGN STATE ----
         self.v_start = None
@@ -32,7 +28,7 @@ class GestureEngine:
         self.fist_triggered = False
 
     def update(self, gesture, lm):
-        now = time.time()
+        now = self.clock()
 
         # =================================================
         # ✌️ V SIGN — MODE TOGGLE (EXCLUSIVE OWNER)
@@ -43,7 +39,8 @@ class GestureEngine:
             self.fist_triggered = False
 
             if not self.v_triggered:
-                self.v_start = self.v_start or now
+                if self.v_start is None:
+                    self.v_start = now
                 elapsed = now - self.v_start
 
                 if elapsed >= HOLD_TIME_V:
@@ -71,11 +68,12 @@ class GestureEngine:
         # =================================================
         if gesture == "FIST":
             if not self.fist_triggered:
-                self.fist_start = self.fist_start or now
+                if self.fist_start is None:
+                    self.fist_start = now
                 elapsed = now - self.fist_start
 
                 if elapsed >= HOLD_TIME_LOCK:
-                    ctypes.windll.user32.LockWorkStation()
+                    self.actions.lock_screen()
                     self.fist_triggered = True
 
                 return elapsed / HOLD_TIME_LOCK, None
@@ -90,7 +88,7 @@ class GestureEngine:
         # 🔊 VOLUME PINCH — CONTINUOUS
         # =================================================
         if gesture == "VOLUME_PINCH" and lm:
-            if volume is None:
+            if not self.actions.volume_available:
                 return 0.0, None
             wrist = lm.landmark[0]
             mid = lm.landmark[9]
@@ -103,10 +101,7 @@ class GestureEngine:
                 0, 1
             )
 
-            try:
-                volume.SetMasterVolumeLevelScalar(vol, None)
-            except Exception:
-                pass
+            self.actions.set_volume(vol)
             return 0.0, int(vol * 100)
 
         return 0.0, None
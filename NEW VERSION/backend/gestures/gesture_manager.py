@@ -5,11 +5,15 @@ import cv2
 import time
 
 from BACKEND.gestures.camera.camera_stream import CameraStream
-from BACKEND.gestures.detection.hand_tracker import hands, mp_draw, HAND_CONNECTIONS
-from BACKEND.gestures.detection.gesture_classifier import classify_raw_gesture
-from BACKEND.gestures.detection.gesture_smoother import smooth_gesture
+from BACKEND.gestures.frame_pipeline import FramePipeline
+from BACKEND.gestures.actions import SystemActions
+from BACKEND.gestures.detection.roi_tracker import RoiTracker
+from BACKEND.gestures.detection.gesture_classifier import load_classifier
+from BACKEND.gestures.detection.gesture_smoother import GestureSmoother
+from BACKEND.gestures.detection.landmark_features import HAND_CONNECTIONS, extract_features
 from BACKEND.gestures.gesture_engine import GestureEngine
 from BACKEND.gestures.gestures.index_swipe import IndexSwipeController
+from BACKEND.gestures.replay import LandmarkFrame, LandmarkReplayStream
 from BACKEND.gestures.ui.overlay import draw_volume_ui
 from BACKEND.gestures.ui.hud import draw_status
 
@@ -36,11 +40,33 @@ class GestureManager:
         toggle_hold_seconds=2.0,
         frame_interval=0.1,
         status_interval=0.2,
+        camera=None,
+        classifier=None,
+        actions=None,
+        clock=time.time,
+        recorder=None,
+        tracker=None,
     ):
-        self.engine = GestureEngine()
+        # Side effects go through `actions` (RecordingActions for replays) and all
+        # hold / swipe timing reads `clock` (a ReplayClock makes replays deterministic)
+        self.actions = actions or SystemActions()
+        self.clock = clock
+        self.engine = GestureEngine(self.actions, clock)
         self.engine.active = active
-        self.camera = CameraStream()
-        self.index_swipe = IndexSwipeController()
+        # Any object with read() / release(), e.g. RecordedCameraStream / ReplayCameraStream
+        self.camera = camera or CameraStream()
+        self.pipeline = None
+        if tracker is None and not isinstance(self.camera, LandmarkReplayStream):
+            # MediaPipe is only loaded when real frames need landmarks
+            from BACKEND.gestures.detection.hand_tracker import detect_hand
+
+            tracker = RoiTracker(detect_hand)
+        self.tracker = tracker
+        self.recorder = recorder
+        # Rules unless a trained model is passed / set via SYNEX_GESTURE_MODEL
+        self.classifier = classifier or load_classifier()
+        self.smoother = GestureSmoother()
+        self.index_swipe = IndexSwipeController(self.actions, clock)
         self.on_exit = on_exit
         self.on_toggle = on_toggle
         self.on_status = on_status
@@ -55,9 +81,6 @@ class GestureManager:
         self.status_interval = status_interval
         self._last_frame_emit = 0.0
         self._last_status_emit = 0.0
-        self._fps_frames = 0
-        self._fps_last_time = time.time()
-        self._fps = 0.0
         self._last_gesture_event = "NONE"
         self._last_status_active = None
         self._last_status_gesture = None
@@ -92,10 +115,9 @@ class GestureManager:
         Draws neon-style connections and points.
         """
         try:
-            display = frame.copy()
-            h, w, _ = display.shape
+            h, w, _ = frame.shape
 
-            overlay = display.copy()
+            overlay = frame.copy()
             line_color = (255, 205, 100)  # warm neon
             point_color = (0, 240, 255)   # cyan neon
             thick = 2
@@ -115,9 +137,8 @@ class GestureManager:
                 py = int(p.y * h)
                 cv2.circle(overlay, (px, py), circ_r, point_color, -1, cv2.LINE_AA)
 
-            # Blend overlay
-            display = cv2.addWeighted(overlay, 0.75, display, 0.25, 0)
-            return display
+            # Blend overlay (writes a new array, the source frame is untouched)
+            return cv2.addWeighted(overlay, 0.75, frame, 0.25, 0)
         except Exception:
             return None
 
@@ -130,182 +151,212 @@ class GestureManager:
 
     def stop(self):
         self.running = False
+        if self.pipeline:
+            self.pipeline.stop()
+
+    def get_stats(self):
+        """Per-stage FPS / latency (ms) and dropped frame counts"""
+        if not self.pipeline:
+            return {}
+        stats = self.pipeline.get_stats()
+        if self.tracker is not None:
+            stats["detector"] = self.tracker.get_stats()
+        return stats
 
     def run(self):
-        WINDOW_NAME = "Gesture System"
+        """Blocks until stopped: grabber + inference threads, render on this thread."""
+        self.pipeline = FramePipeline(self.camera, self._infer, self._render)
         try:
-            while self.running:
-                now = time.time()
-                ret, frame = self.camera.read()
-                if not ret:
-                    break
-
-                frame = cv2.flip(frame, 1)
-                frame_width = frame.shape[1]
-
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                result = hands.process(rgb)
-
-                gesture = "NONE"
-                lock_progress = 0.0
-                volume_percent = None
-                swipe_text = None
-
-                preview_frame = None
-
-                if result.multi_hand_landmarks:
-                    lm = result.multi_hand_landmarks[0]
-
-                    mp_draw.draw_landmarks(frame, lm, HAND_CONNECTIONS)
-
-                    raw = classify_raw_gesture(lm)
-                    gesture = smooth_gesture(raw)
-
-                    # Build hand-only cropped preview
-                    hand_crop = self._compute_hand_crop(frame, lm)
-                    if hand_crop is not None:
-                        self._last_hand_crop = hand_crop
-                        preview_frame = hand_crop
-                    else:
-                        preview_frame = frame
-
-                    # =================================
-                    # ✌️ V SIGN (HOLD TO TOGGLE MODE)
-                    # =================================
-                    if raw == "V_SIGN" or gesture == "V_SIGN":
-                        now = time.time()
-                        if self._v_sign_start is None:
-                            self._v_sign_start = now
-                        elif (now - self._v_sign_start) >= self.toggle_hold_seconds:
-                            if not self._v_sign_triggered:
-                                self._v_sign_triggered = True
-                                self._v_sign_start = None
-                                if self.on_toggle:
-                                    self.on_toggle()
-                    else:
-                        self._v_sign_start = None
-                        self._v_sign_triggered = False
-
-                    # =================================
-                    # ☝️ INDEX HOLD → SWIPE MODE
-                    # =================================
-                    if raw == "INDEX_ONLY" and self.engine.active:
-                        swipe_text, _ = self.index_swipe.update(lm, frame_width)
-                    else:
-                        self.index_swipe.reset()
-
-                    if self.engine.active:
-                        # =================================
-                        # ✊ FIST → LOCK
-                        # =================================
-                        if gesture == "FIST":
-                            lock_progress, _ = self.engine.update("FIST", lm)
-
-                        # =================================
-                        # 🔊 VOLUME PINCH
-                        # =================================
-                        if gesture == "VOLUME_PINCH":
-                            _, volume_percent = self.engine.update("VOLUME_PINCH", lm)
-
-                    # ---------- VOLUME UI ----------
-                    if volume_percent is not None:
-                        draw_volume_ui(
-                            frame,
-                            lm.landmark[4],
-                            lm.landmark[8],
-                            volume_percent
-                        )
-
-                    # ---------- LOCK UI ----------
-                    if raw == "FIST" and lock_progress > 0:
-                        h, w, _ = frame.shape
-                        cv2.putText(
-                            frame,
-                            f"LOCKING {int(lock_progress * 100)}%",
-                            (w // 2 - 150, h // 2),
-                            cv2.FONT_HERSHEY_SIMPLEX,
-                            1.2,
-                            (0, 0, 255),
-                            3
-                        )
-
-                    # ---------- SWIPE PROMPT ----------
-                    if swipe_text:
-                        h, w, _ = frame.shape
-                        cv2.rectangle(frame, (0, h - 70), (w, h), (25, 25, 25), -1)
-                        cv2.putText(
-                            frame,
-                            swipe_text,
-                            (w // 2 - 200, h - 25),
-                            cv2.FONT_HERSHEY_SIMPLEX,
-                            1.0,
-                            (0, 255, 255),
-                            3
-                        )
-
-                else:
-                    self._last_hand_crop = None
-                    preview_frame = self._build_no_hand_frame(frame)
-
-                # Emit gesture event updates
-                if self.on_event and gesture not in ("NONE", "TRANSITIONING"):
-                    if gesture != self._last_gesture_event:
-                        self._last_gesture_event = gesture
-                        self.on_event(gesture)
-
-                # FPS tracking
-                self._fps_frames += 1
-                if now - self._fps_last_time >= 1.0:
-                    self._fps = self._fps_frames / (now - self._fps_last_time)
-                    self._fps_frames = 0
-                    self._fps_last_time = now
-
-                # Emit status updates
-                should_emit_status = False
-                if self.engine.active != self._last_status_active:
-                    should_emit_status = True
-                if gesture != self._last_status_gesture and gesture not in ("NONE", "TRANSITIONING"):
-                    should_emit_status = True
-                if self.engine.active and (now - self._last_status_emit) >= self.status_interval:
-                    should_emit_status = True
-
-                if self.on_status and should_emit_status:
-                    self._last_status_emit = now
-                    self._last_status_active = self.engine.active
-                    self._last_status_gesture = gesture
-                    self.on_status(self.engine.active, gesture, self._fps)
-
-                # Emit preview frames (always, even when inactive)
-                # This ensures the UI panel shows live camera feed
-                if self.on_frame and (now - self._last_frame_emit) >= self.frame_interval:
-                    self._last_frame_emit = now
-                    # Prefer cropped hand preview when available, otherwise fallback frame
-                    if preview_frame is not None:
-                        to_emit = preview_frame
-                    elif self._last_hand_crop is not None:
-                        to_emit = self._last_hand_crop
-                    else:
-                        to_emit = frame
-                    self.on_frame(to_emit)
-
-                if self.show_ui:
-                    draw_status(frame, self.engine.active, gesture)
-                    cv2.imshow(WINDOW_NAME, frame)
-
-                # Move window once (after first frame)
-                if self.show_ui and not hasattr(self, "_window_positioned"):
-                    h, w, _ = frame.shape
-                    move_window_bottom_right(WINDOW_NAME, w, h)
-                    self._window_positioned = True
-
-                if self.show_ui:
-                    if cv2.waitKey(1) & 0xFF == ord("q"):
-                        break
-                else:
-                    time.sleep(0.01)
+            self.pipeline.run()
         finally:
             self.camera.release()
             cv2.destroyAllWindows()
 
             if self.on_exit:
                 self.on_exit()
+
+    # ================================
+    # INFERENCE STAGE (worker thread)
+    # ================================
+    def _infer(self, frame):
+        if isinstance(frame, LandmarkFrame):
+            # Landmark-only replay: no flip, no MediaPipe
+            return self._classify(frame.image, frame.landmarks)
+
+        raw_frame = frame
+        frame = cv2.flip(frame, 1)
+        # Crops / downscales before the colour conversion and MediaPipe
+        lm = self.tracker.process(frame)
+        if self.recorder is not None:
+            self.recorder.record(raw_frame, lm)
+        return self._classify(frame, lm)
+
+    def _classify(self, frame, lm):
+        if lm is None:
+            return frame, None, None
+        return frame, lm, self.classifier.classify(extract_features(lm))
+
+    # ================================
+    # RENDER / EMIT STAGE
+    # ================================
+    def _render(self, packet):
+        WINDOW_NAME = "Gesture System"
+        if not self.running:
+            return False
+
+        now = self.clock()
+        frame, lm, raw = packet.result
+        frame_width = frame.shape[1]
+
+        gesture = "NONE"
+        lock_progress = 0.0
+        volume_percent = None
+        swipe_text = None
+
+        emit_frame = self.on_frame and (now - self._last_frame_emit) >= self.frame_interval
+        preview_frame = None
+
+        if lm is not None:
+            if self.show_ui:
+                from BACKEND.gestures.detection.hand_tracker import mp_draw
+
+                mp_draw.draw_landmarks(frame, lm, HAND_CONNECTIONS)
+
+            gesture = self.smoother.update(raw)
+
+            # Styled hand preview, only built when it is about to be emitted
+            if emit_frame:
+                hand_crop = self._compute_hand_crop(frame, lm)
+                if hand_crop is not None:
+                    self._last_hand_crop = hand_crop
+                    preview_frame = hand_crop
+                else:
+                    preview_frame = frame
+
+            # =================================
+            # ✌️ V SIGN (HOLD TO TOGGLE MODE)
+            # =================================
+            if raw == "V_SIGN" or gesture == "V_SIGN":
+                if self._v_sign_start is None:
+                    self._v_sign_start = now
+                elif (now - self._v_sign_start) >= self.toggle_hold_seconds:
+                    if not self._v_sign_triggered:
+                        self._v_sign_triggered = True
+                        self._v_sign_start = None
+                        if self.on_toggle:
+                            self.on_toggle()
+            else:
+                self._v_sign_start = None
+                self._v_sign_triggered = False
+
+            # =================================
+            # ☝️ INDEX HOLD → SWIPE MODE
+            # =================================
+            if raw == "INDEX_ONLY" and self.engine.active:
+                swipe_text, _ = self.index_swipe.update(lm, frame_width)
+            else:
+                self.index_swipe.reset()
+
+            if self.engine.active:
+                # =================================
+                # ✊ FIST → LOCK
+                # =================================
+                if gesture == "FIST":
+                    lock_progress, _ = self.engine.update("FIST", lm)
+
+                # =================================
+                # 🔊 VOLUME PINCH
+                # =================================
+                if gesture == "VOLUME_PINCH":
+                    _, volume_percent = self.engine.update("VOLUME_PINCH", lm)
+
+            # ---------- VOLUME UI ----------
+            if volume_percent is not None:
+                draw_volume_ui(
+                    frame,
+                    lm.landmark[4],
+                    lm.landmark[8],
+                    volume_percent
+                )
+
+            # ---------- LOCK UI ----------
+            if raw == "FIST" and lock_progress > 0:
+                h, w, _ = frame.shape
+                cv2.putText(
+                    frame,
+                    f"LOCKING {int(lock_progress * 100)}%",
+                    (w // 2 - 150, h // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    1.2,
+                    (0, 0, 255),
+                    3
+                )
+
+            # ---------- SWIPE PROMPT ----------
+            if swipe_text:
+                h, w, _ = frame.shape
+                cv2.rectangle(frame, (0, h - 70), (w, h), (25, 25, 25), -1)
+                cv2.putText(
+                    frame,
+                    swipe_text,
+                    (w // 2 - 200, h - 25),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    1.0,
+                    (0, 255, 255),
+                    3
+                )
+
+        else:
+            self._last_hand_crop = None
+            if emit_frame:
+                preview_frame = self._build_no_hand_frame(frame)
+
+        # Emit gesture event updates
+        if self.on_event and gesture not in ("NONE", "TRANSITIONING"):
+            if gesture != self._last_gesture_event:
+                self._last_gesture_event = gesture
+                self.on_event(gesture)
+
+        # Emit status updates
+        should_emit_status = False
+        if self.engine.active != self._last_status_active:
+            should_emit_status = True
+        if gesture != self._last_status_gesture and gesture not in ("NONE", "TRANSITIONING"):
+            should_emit_status = True
+        if self.engine.active and (now - self._last_status_emit) >= self.status_interval:
+            should_emit_status = True
+
+        if self.on_status and should_emit_status:
+            self._last_status_emit = now
+            self._last_status_active = self.engine.active
+            self._last_status_gesture = gesture
+            stats = self.get_stats()
+            fps = stats["render"]["fps"] if "render" in stats else 0.0  # no pipeline in replay()
+            self.on_status(self.engine.active, gesture, fps, stats)
+
+        # Emit preview frames (always, even when inactive)
+        # This ensures the UI panel shows live camera feed
+        if emit_frame:
+            self._last_frame_emit = now
+            # Prefer cropped hand preview when available, otherwise fallback frame
+            if preview_frame is not None:
+                to_emit = preview_frame
+            elif self._last_hand_crop is not None:
+                to_emit = self._last_hand_crop
+            else:
+                to_emit = frame
+            self.on_frame(to_emit)
+
+        if self.show_ui:
+            draw_status(frame, self.engine.active, gesture)
+            cv2.imshow(WINDOW_NAME, frame)
+
+            # Move window once (after first frame)
+            if not hasattr(self, "_window_positioned"):
+                h, w, _ = frame.shape
+                move_window_bottom_right(WINDOW_NAME, w, h)
+                self._window_positioned = True
+
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                return False
+        return True
@@ -1,11 +1,14 @@
 import time
-import pyautogui
+
+from BACKEND.gestures.actions import SystemActions
 
 HOLD_TIME = 1.0
 MIN_SWIPE_DISTANCE = 0.15   # normalized screen width
 
 class IndexSwipeController:
-    def __init__(self):
+    def __init__(self, actions=None, clock=time.time):
+        self.actions = actions or SystemActions()
+        self.clock = clock
         self.hold_start = None
         self.armed = False
         self.start_x = None
@@ -23,7 +26,7 @@ class IndexSwipeController:
         - status_text (str or None)
         - swipe_direction ("LEFT" | "RIGHT" | None)
         """
-        now = time.time()
+        now = self.clock()
         index_tip = lm.landmark[8]
         x = index_tip.x
 
@@ -52,11 +55,11 @@ class IndexSwipeController:
             self.triggered = True
 
             if dx > 0:
-                pyautogui.hotkey("alt", "shift", "tab")
+                self.actions.hotkey("alt", "shift", "tab")
                 self.reset()
                 return None, "RIGHT"
             else:
-                pyautogui.hotkey("alt", "tab")
+                self.actions.hotkey("alt", "tab")
                 self.reset()
                 return None, "LEFT"
 
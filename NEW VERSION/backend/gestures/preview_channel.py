@@ -0,0 +1,175 @@
+# BACKEND/gestures/preview_channel.py
+"""
+In-process gesture preview channel: gesture thread -> Qt UI, no encoding.
+
+    channel = PreviewChannel(notify=signal.emit)
+    channel.publish(frame_bgr)               # gesture render stage
+    with channel.read() as preview:          # GUI thread, after notify()
+        QImage(preview.rgb.data, w, h, preview.stride, Format_RGB888)
+
+- publish() downscales straight to the size the UI paints at (set via
+  set_target_size) and converts BGR -> RGB into a preallocated buffer.
+- Three buffers rotate (front / being read / being written), so the
+  writer never touches the array a QImage is wrapping.
+- notify() fires once per batch of frames: while a notification is still
+  pending, newer frames just replace the front buffer and the UI paints
+  only the newest one.
+- latest_jpeg() encodes on demand for remote consumers (mobile hub).
+"""
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    import cv2
+except ImportError:  # headless test boxes without OpenCV
+    cv2 = None
+
+
+@dataclass
+class PreviewFrame:
+    seq: int
+    rgb: np.ndarray  # (h, w, 3) uint8, C-contiguous
+
+    @property
+    def width(self) -> int:
+        return self.rgb.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.rgb.shape[0]
+
+    @property
+    def stride(self) -> int:
+        return self.rgb.strides[0]
+
+
+def fit_size(width: int, height: int, box_w: int, box_h: int):
+    """Largest (w, h) with the frame's aspect ratio inside the box, never upscaled."""
+    scale = min(box_w / width, box_h / height, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+class PreviewChannel:
+    def __init__(self, notify: Optional[Callable[[], None]] = None, target_size=(320, 240)):
+        self.notify = notify
+        self._target = tuple(target_size)
+        self._buffers = [None, None, None]
+        self._scratch = None
+        self._front = None          # index of the newest complete frame
+        self._readers = [0, 0, 0]   # readers holding each buffer
+        self._seq = 0
+        self._pending = False
+        self._lock = threading.Lock()
+
+        self._jpeg_seq = -1
+        self._jpeg = None
+
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0  # replaced before the UI read them
+        self.skipped = 0
+
+    # ------------------------
+    # Writer (gesture thread)
+    # ------------------------
+    def set_target_size(self, width: int, height: int):
+        """Size the UI paints at; called from the GUI thread on resize."""
+        self._target = (max(1, int(width)), max(1, int(height)))
+
+    def publish(self, frame_bgr):
+        if frame_bgr is None:
+            return
+        h, w = frame_bgr.shape[:2]
+        out_w, out_h = fit_size(w, h, *self._target)
+
+        with self._lock:
+            index = next((i for i in range(3) if i != self._front and not self._readers[i]), None)
+            if index is None:  # UI and a remote reader both hold old frames
+                self.skipped += 1
+                return
+            self._readers[index] += 1  # reserve for writing
+        buf = self._buffers[index]
+        if buf is None or buf.shape[:2] != (out_h, out_w):
+            buf = self._buffers[index] = np.empty((out_h, out_w, 3), dtype=np.uint8)
+        self._convert(frame_bgr, buf)
+
+        with self._lock:
+            self._readers[index] -= 1
+            self._front = index
+            self._seq += 1
+            self.published += 1
+            should_notify = not self._pending
+            if self._pending:
+                self.coalesced += 1
+            self._pending = True
+        if should_notify and self.notify:
+            self.notify()
+
+    def _convert(self, frame_bgr, out):
+        out_h, out_w = out.shape[:2]
+        if cv2 is not None:
+            src = frame_bgr
+            if src.shape[:2] != (out_h, out_w):
+                if self._scratch is None or self._scratch.shape != out.shape:
+                    self._scratch = np.empty_like(out)
+                src = cv2.resize(frame_bgr, (out_w, out_h), dst=self._scratch, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=out)
+            return
+        h, w = frame_bgr.shape[:2]
+        ys = np.arange(out_h) * h // out_h
+        xs = np.arange(out_w) * w // out_w
+        out[...] = frame_bgr[ys[:, None], xs[None, :], ::-1]
+
+    # ------------------------
+    # Readers
+    # ------------------------
+    @contextmanager
+    def read(self, consume: bool = True):
+        """
+        Newest frame (or None); the buffer is not reused until the block exits.
+        consume=False peeks without re-arming notify() (remote consumers).
+        """
+        with self._lock:
+            index = self._front
+            seq = self._seq
+            if consume:
+                self._pending = False
+                if index is not None:
+                    self.delivered += 1
+            if index is not None:
+                self._readers[index] += 1
+        try:
+            yield None if index is None else PreviewFrame(seq, self._buffers[index])
+        finally:
+            if index is not None:
+                with self._lock:
+                    self._readers[index] -= 1
+
+    def latest_jpeg(self, quality: int = 80) -> Optional[bytes]:
+        """JPEG of the newest frame for remote consumers; encoded at most once per frame."""
+        if cv2 is None:
+            return None
+        with self.read(consume=False) as preview:
+            if preview is None:
+                return None
+            if preview.seq != self._jpeg_seq:
+                bgr = cv2.cvtColor(preview.rgb, cv2.COLOR_RGB2BGR)
+                ok, buf = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+                if not ok:
+                    return None
+                self._jpeg, self._jpeg_seq = buf.tobytes(), preview.seq
+            return self._jpeg
+
+    def get_stats(self) -> dict:
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "size": self._target,
+        }
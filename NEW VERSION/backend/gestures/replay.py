@@ -0,0 +1,284 @@
+# BACKEND/gestures/replay.py
+"""
+Recording and deterministic replay of the gesture stack.
+
+Record (live):
+    recorder = GestureRecorder(keep_frames=True)
+    GestureManager(recorder=recorder, ...).run()
+    recorder.save("session.npz")
+
+Replay (headless):
+    rec = GestureRecording.load("session.npz")
+    ReplayCameraStream(rec)       camera frames -> full pipeline incl. MediaPipe
+    LandmarkReplayStream(rec)     recorded landmarks, MediaPipe skipped
+    replay(manager, rec, clock)   synchronous, frame by frame, on a ReplayClock:
+                                  same input -> same decisions, every run
+
+A recording is an .npz with `timestamps` (N,), `points` (N, 21, 3; NaN
+where no hand was found) and optionally `labels` (N,) and `frames`
+(N, H, W, 3 BGR). `points` / `labels` are what bench_gesture_classifier
+--file reads as well.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from BACKEND.gestures.detection.landmark_features import landmarks_to_array
+from BACKEND.gestures.detection.synthetic_hands import as_landmarks, synthetic_session
+from BACKEND.gestures.frame_pipeline import FramePacket
+
+
+@dataclass
+class GestureRecording:
+    timestamps: np.ndarray                 # (N,) seconds from the first frame
+    points: np.ndarray                     # (N, 21, 3), NaN rows = no hand
+    labels: Optional[np.ndarray] = None    # (N,) expected raw gesture, if annotated
+    frames: Optional[np.ndarray] = None    # (N, H, W, 3) BGR camera frames, if kept
+    frame_size: Tuple[int, int] = (640, 480)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def duration(self) -> float:
+        return float(self.timestamps[-1]) if len(self) else 0.0
+
+    def landmarks(self, i):
+        """MediaPipe-like landmarks of frame i, or None when no hand was recorded."""
+        pts = self.points[i]
+        if np.isnan(pts[0, 0]):
+            return None
+        return as_landmarks(pts)
+
+    def save(self, path):
+        data = {
+            "timestamps": self.timestamps,
+            "points": self.points,
+            "frame_size": np.array(self.frame_size),
+        }
+        if self.labels is not None:
+            data["labels"] = np.asarray(self.labels, dtype=str)
+        if self.frames is not None:
+            data["frames"] = self.frames
+        np.savez_compressed(path, **data)
+
+    @classmethod
+    def load(cls, path) -> "GestureRecording":
+        data = np.load(path, allow_pickle=False)
+        timestamps = data["timestamps"] if "timestamps" in data else np.arange(len(data["points"])) / 30.0
+        return cls(
+            timestamps=timestamps,
+            points=data["points"],
+            labels=data["labels"] if "labels" in data else None,
+            frames=data["frames"] if "frames" in data else None,
+            frame_size=tuple(int(v) for v in data["frame_size"]) if "frame_size" in data else (640, 480),
+        )
+
+
+def synthetic_recording(frames=900, fps=30.0, seed=0, hold=(20, 60), noise=0.003, **kwargs) -> GestureRecording:
+    """Labelled landmark-only recording of held poses (steady hands, INDEX_ONLY drifts)."""
+    points, labels = synthetic_session(frames=frames, seed=seed, hold=hold, noise=noise, steady=True, **kwargs)
+    return GestureRecording(
+        timestamps=np.arange(len(points)) / fps,
+        points=points,
+        labels=np.asarray(labels),
+    )
+
+
+class GestureRecorder:
+    """Collects what the inference stage saw; attach via GestureManager(recorder=...)."""
+
+    def __init__(self, keep_frames: bool = False, clock: Callable[[], float] = time.perf_counter):
+        self.keep_frames = keep_frames
+        self.clock = clock
+        self._start = None
+        self._timestamps: List[float] = []
+        self._points: List[np.ndarray] = []
+        self._frames: List[np.ndarray] = []
+        self._frame_size = (640, 480)
+        self._lock = threading.Lock()
+
+    def record(self, frame, lm):
+        """frame: raw camera frame (before the mirror flip); lm: full-frame landmarks or None."""
+        now = self.clock()
+        points = np.full((21, 3), np.nan) if lm is None else landmarks_to_array(lm)
+        with self._lock:
+            if self._start is None:
+                self._start = now
+                self._frame_size = (frame.shape[1], frame.shape[0])
+            self._timestamps.append(now - self._start)
+            self._points.append(points)
+            if self.keep_frames:
+                self._frames.append(frame)
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def to_recording(self) -> GestureRecording:
+        with self._lock:
+            return GestureRecording(
+                timestamps=np.array(self._timestamps),
+                points=np.array(self._points, dtype=np.float32).reshape(-1, 21, 3),
+                frames=np.stack(self._frames) if self._frames else None,
+                frame_size=self._frame_size,
+            )
+
+    def save(self, path):
+        self.to_recording().save(path)
+
+
+@dataclass
+class LandmarkFrame:
+    """What LandmarkReplayStream yields: the inference stage uses `landmarks` as-is."""
+
+    image: np.ndarray  # blank canvas (already mirrored) the render stage draws on
+    landmarks: Any
+    timestamp: float
+
+
+class ReplayCameraStream:
+    """
+    Drop-in CameraStream over a recording's camera frames.
+
+    realtime=True paces read() to the recorded timestamps (divided by
+    `speed`) like the webcam did; realtime=False returns frames as fast as
+    the pipeline takes them.
+    """
+
+    def __init__(self, recording: GestureRecording, realtime: bool = True, loop: bool = False, speed: float = 1.0):
+        self.recording = recording
+        self.realtime = realtime
+        self.loop = loop
+        self.speed = speed
+        self.index = 0
+        self._started_at = None
+        self._offset = 0.0
+        self._check()
+
+    def _check(self):
+        if self.recording.frames is None:
+            raise ValueError("recording has no camera frames; use LandmarkReplayStream")
+
+    def _item(self, i):
+        return self.recording.frames[i]
+
+    def read(self):
+        if self.index >= len(self.recording):
+            if not self.loop or not len(self.recording):
+                return False, None
+            self._offset += self.recording.duration + 1.0 / 30.0
+            self.index = 0
+
+        if self.realtime:
+            now = time.perf_counter()
+            if self._started_at is None:
+                self._started_at = now
+            due = self._started_at + (self._offset + self.recording.timestamps[self.index]) / self.speed
+            if due > now:
+                time.sleep(due - now)
+
+        item = self._item(self.index)
+        self.index += 1
+        return True, item
+
+    def release(self):
+        self.index = len(self.recording)
+        self.loop = False
+
+
+class LandmarkReplayStream(ReplayCameraStream):
+    """Replays recorded landmarks; GestureManager skips flip + MediaPipe for these."""
+
+    def _check(self):
+        pass
+
+    def _item(self, i):
+        w, h = self.recording.frame_size
+        return LandmarkFrame(np.zeros((h, w, 3), dtype=np.uint8), self.recording.landmarks(i), float(self.recording.timestamps[i]))
+
+
+class ReplayClock:
+    """Stand-in for time.time: returns whatever the replay driver set."""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class ReplayResult:
+    infer_ms: np.ndarray
+    render_ms: np.ndarray
+    events: List[Tuple[float, str]]
+
+    @property
+    def frame_ms(self) -> np.ndarray:
+        return self.infer_ms + self.render_ms
+
+
+def replay(manager, recording: GestureRecording, clock: ReplayClock, landmark_only: bool = True) -> ReplayResult:
+    """
+    Feed every recorded frame through manager's inference + render stages on
+    this thread. `clock` must be the one the manager (and its actions) use.
+    """
+    events = []
+    on_event = manager.on_event
+
+    def log_event(gesture):
+        events.append((clock.now, gesture))
+        if on_event:
+            on_event(gesture)
+
+    manager.on_event = log_event
+    stream = (LandmarkReplayStream if landmark_only else ReplayCameraStream)(recording, realtime=False)
+    n = len(recording)
+    infer_ms, render_ms = np.zeros(n), np.zeros(n)
+    try:
+        for i in range(n):
+            clock.now = float(recording.timestamps[i])
+            _, frame = stream.read()
+            t0 = time.perf_counter()
+            packet = FramePacket(i, frame, t0, result=manager._infer(frame))
+            t1 = time.perf_counter()
+            keep_going = manager._render(packet)
+            t2 = time.perf_counter()
+            infer_ms[i], render_ms[i] = (t1 - t0) * 1000.0, (t2 - t1) * 1000.0
+            if keep_going is False:
+                infer_ms, render_ms = infer_ms[:i + 1], render_ms[:i + 1]
+                break
+    finally:
+        manager.on_event = on_event
+    return ReplayResult(infer_ms, render_ms, events)
+
+
+def decision_latencies(recording: GestureRecording, events, ignore=("NONE",)) -> Dict[str, Dict[str, Any]]:
+    """
+    Per labelled gesture: seconds from the start of each held segment to the
+    first matching gesture event inside it. Needs `labels`.
+    """
+    if recording.labels is None:
+        raise ValueError("recording has no labels")
+    labels, ts = recording.labels, recording.timestamps
+    out: Dict[str, Dict[str, Any]] = {}
+    start = 0
+    for end in range(1, len(labels) + 1):
+        if end < len(labels) and labels[end] == labels[start]:
+            continue
+        label = str(labels[start])
+        if label not in ignore:
+            seg_start = ts[start]
+            seg_end = ts[end - 1]
+            hit = next((t for t, g in events if g == label and seg_start <= t <= seg_end), None)
+            entry = out.setdefault(label, {"segments": 0, "detected": 0, "latencies": []})
+            entry["segments"] += 1
+            if hit is not None:
+                entry["detected"] += 1
+                entry["latencies"].append(hit - seg_start)
+        start = end
+    return out
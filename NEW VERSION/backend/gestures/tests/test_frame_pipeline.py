@@ -0,0 +1,105 @@
+# BACKEND/gestures/tests/test_frame_pipeline.py
+"""
+Unit tests for the capture -> inference -> render gesture pipeline
+"""
+
+import threading
+import time
+import unittest
+
+from BACKEND.gestures.frame_pipeline import FramePipeline, LatestSlot
+
+
+class FakeCamera:
+    """Recorded-stream stand-in: yields numbered frames at a fixed rate."""
+
+    def __init__(self, frames=30, fps=100.0):
+        self.frames = frames
+        self.interval = 1.0 / fps
+        self.read_count = 0
+        self.released = False
+
+    def read(self):
+        if self.read_count >= self.frames:
+            return False, None
+        time.sleep(self.interval)
+        self.read_count += 1
+        return True, self.read_count
+
+    def release(self):
+        self.released = True
+
+
+class TestLatestSlot(unittest.TestCase):
+    def test_keeps_only_newest(self):
+        slot = LatestSlot()
+        for i in range(5):
+            slot.put(i)
+        self.assertEqual(slot.get(timeout=0), 4)
+        self.assertEqual(slot.dropped, 4)
+        self.assertIsNone(slot.get(timeout=0.01))
+
+    def test_close_wakes_reader(self):
+        slot = LatestSlot()
+        threading.Timer(0.05, slot.close).start()
+        t0 = time.perf_counter()
+        self.assertIsNone(slot.get(timeout=2.0))
+        self.assertLess(time.perf_counter() - t0, 1.0)
+
+
+class TestFramePipeline(unittest.TestCase):
+    def test_slow_inference_drops_stale_frames(self):
+        camera = FakeCamera(frames=40, fps=200.0)
+        rendered = []
+
+        def infer(frame):
+            time.sleep(0.02)
+            return frame * 10
+
+        def render(packet):
+            rendered.append((packet.seq, packet.result))
+            return True
+
+        pipeline = FramePipeline(camera, infer, render)
+        pipeline.run()
+
+        self.assertEqual(camera.read_count, 40)
+        self.assertLess(len(rendered), 40)
+        seqs = [seq for seq, _ in rendered]
+        self.assertEqual(seqs, sorted(seqs))
+        self.assertTrue(all(result == seq * 10 for seq, result in rendered))
+
+        stats = pipeline.get_stats()
+        self.assertGreater(stats["dropped"]["capture"], 0)
+        self.assertAlmostEqual(stats["inference"]["latency_ms"], 20, delta=15)
+        self.assertEqual(stats["render"]["frames"], len(rendered))
+
+    def test_render_can_stop_pipeline(self):
+        camera = FakeCamera(frames=1000)
+        pipeline = FramePipeline(camera, lambda f: f, lambda packet: packet.seq < 5)
+        t0 = time.perf_counter()
+        pipeline.run()
+        self.assertLess(time.perf_counter() - t0, 2.0)
+        self.assertLess(camera.read_count, 1000)
+
+    def test_external_stop(self):
+        camera = FakeCamera(frames=10_000)
+        pipeline = FramePipeline(camera, lambda f: f, lambda packet: True)
+        thread = threading.Thread(target=pipeline.run)
+        thread.start()
+        time.sleep(0.1)
+        pipeline.stop()
+        thread.join(timeout=2.0)
+        self.assertFalse(thread.is_alive())
+
+    def test_inference_error_is_raised(self):
+        def infer(frame):
+            raise RuntimeError("model crashed")
+
+        pipeline = FramePipeline(FakeCamera(frames=5), infer, lambda packet: True)
+        with self.assertRaises(RuntimeError):
+            pipeline.run()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# BACKEND/gestures/tests/test_gesture_classifier.py
+"""
+Unit tests for vectorized landmark features, raw classifiers and the smoother
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from BACKEND.gestures.detection.gesture_classifier import (
+    ModelGestureClassifier,
+    RuleGestureClassifier,
+    classify_raw_gesture,
+    dist,
+)
+from BACKEND.gestures.detection.gesture_smoother import GestureSmoother
+from BACKEND.gestures.detection.landmark_features import FEATURE_SIZE, extract_features, feature_vector
+from BACKEND.gestures.detection.synthetic_hands import POSES, as_landmarks, make_hand, synthetic_session
+
+
+class TestLandmarkFeatures(unittest.TestCase):
+    def test_matches_scalar_distances(self):
+        pts = make_hand("V_SIGN", np.random.default_rng(0))
+        lm = as_landmarks(pts)
+        f = extract_features(lm)
+        self.assertAlmostEqual(f.hand_size, dist(lm.landmark[0], lm.landmark[9]), places=5)
+        self.assertAlmostEqual(f.v_gap, dist(lm.landmark[8], lm.landmark[12]), places=5)
+        self.assertAlmostEqual(f.pinch, dist(lm.landmark[4], lm.landmark[8]), places=5)
+        self.assertEqual(list(f.fingers_up), [True, True, False, False])
+        self.assertEqual(f.vector().shape, (FEATURE_SIZE,))
+
+    def test_vector_is_scale_invariant(self):
+        pts = make_hand("FIST", np.random.default_rng(1), noise=0.0)
+        big = pts.copy()
+        big[:, :2] = (big[:, :2] - big[0, :2]) * 2 + big[0, :2]
+        np.testing.assert_allclose(extract_features(pts).vector(), extract_features(big).vector(), atol=1e-5)
+
+
+class TestClassifiers(unittest.TestCase):
+    def test_rules_on_every_pose(self):
+        rng = np.random.default_rng(2)
+        for pose in POSES:
+            for _ in range(20):
+                self.assertEqual(classify_raw_gesture(as_landmarks(make_hand(pose, rng))), pose)
+
+    def test_batch_matches_per_frame(self):
+        points, _ = synthetic_session(frames=400, seed=6, noise=0.01)
+        rules = RuleGestureClassifier()
+        per_frame = [rules.classify(extract_features(p)) for p in points]
+        self.assertEqual(list(rules.classify_batch(points)), per_frame)
+
+    def test_learned_model_round_trip(self):
+        points, labels = synthetic_session(frames=1500, seed=3)
+        clf = ModelGestureClassifier.train(feature_vector(points), labels)
+
+        test_points, test_labels = synthetic_session(frames=300, seed=4)
+        predicted = [clf.classify(extract_features(p)) for p in test_points]
+        self.assertGreater(np.mean(np.array(predicted) == test_labels), 0.95)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "gestures.npz")
+            clf.save(path)
+            loaded = ModelGestureClassifier.load(path)
+        self.assertEqual(list(loaded.classify_batch(test_points)), predicted)
+
+    def test_classifier_is_pluggable(self):
+        class Always:
+            def classify(self, f):
+                return "FIST"
+
+        pts = make_hand("V_SIGN", np.random.default_rng(5))
+        self.assertEqual(classify_raw_gesture(pts, classifier=Always()), "FIST")
+        self.assertEqual(classify_raw_gesture(pts, classifier=RuleGestureClassifier()), "V_SIGN")
+
+
+class TestGestureSmoother(unittest.TestCase):
+    def test_stabilizing_until_full(self):
+        s = GestureSmoother(size=5)
+        self.assertEqual([s.update("FIST") for _ in range(4)], ["STABILIZING"] * 4)
+        self.assertEqual(s.update("FIST"), "FIST")
+
+    def test_hysteresis_holds_through_flicker(self):
+        s = GestureSmoother(size=10, enter_ratio=0.8, exit_ratio=0.6)
+        for _ in range(10):
+            s.update("V_SIGN")
+        # 3 stray frames: 7/10 >= exit threshold, still V_SIGN
+        self.assertEqual([s.update(g) for g in ("NONE", "FIST", "NONE")], ["V_SIGN"] * 3)
+        # Once below the exit threshold it drops out
+        self.assertEqual(s.update("NONE"), "V_SIGN")
+        self.assertEqual(s.update("NONE"), "TRANSITIONING")
+
+    def test_switch_needs_enter_majority(self):
+        s = GestureSmoother(size=10)
+        for _ in range(10):
+            s.update("FIST")
+        out = [s.update("INDEX_ONLY") for _ in range(10)]
+        self.assertEqual(out[-1], "INDEX_ONLY")
+        self.assertEqual(out.index("INDEX_ONLY"), 8)  # 9/10 > 8
+
+    def test_instances_are_independent(self):
+        a, b = GestureSmoother(size=3), GestureSmoother(size=3)
+        for _ in range(3):
+            a.update("FIST")
+        self.assertEqual(b.update("NONE"), "STABILIZING")
+        a.reset()
+        self.assertEqual(a.update("FIST"), "STABILIZING")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+# BACKEND/gestures/tests/test_gesture_replay.py
+"""
+Unit tests for gesture recordings, replay streams and recording action sinks
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from BACKEND.gestures.actions import RecordingActions
+from BACKEND.gestures.detection.synthetic_hands import as_landmarks, make_hand
+from BACKEND.gestures.gesture_engine import GestureEngine
+from BACKEND.gestures.gestures.index_swipe import HOLD_TIME, IndexSwipeController
+from BACKEND.gestures.replay import (
+    GestureRecorder,
+    GestureRecording,
+    LandmarkFrame,
+    LandmarkReplayStream,
+    ReplayCameraStream,
+    ReplayClock,
+    decision_latencies,
+    synthetic_recording,
+)
+from BACKEND.gestures.config import HOLD_TIME_LOCK
+
+HAS_CV2 = importlib.util.find_spec("cv2") is not None
+
+
+def hand(pose, x_shift=0.0):
+    return as_landmarks(make_hand(pose, np.random.default_rng(0), noise=0.0, scale=1.0, shift=(x_shift, 0.0)))
+
+
+class TestRecording(unittest.TestCase):
+    def test_save_load_round_trip(self):
+        rec = synthetic_recording(frames=120, seed=1)
+        rec.points[5] = np.nan
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.npz")
+            rec.save(path)
+            loaded = GestureRecording.load(path)
+        np.testing.assert_array_equal(loaded.timestamps, rec.timestamps)
+        np.testing.assert_array_equal(loaded.labels, rec.labels)
+        self.assertIsNone(loaded.landmarks(5))
+        self.assertAlmostEqual(loaded.landmarks(6).landmark[8].x, float(rec.points[6, 8, 0]), places=6)
+
+    def test_recorder_collects_frames_and_landmarks(self):
+        clock = ReplayClock(10.0)
+        recorder = GestureRecorder(keep_frames=True, clock=clock)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        for i in range(3):
+            clock.now = 10.0 + i / 30
+            recorder.record(frame, None if i == 1 else hand("FIST"))
+        rec = recorder.to_recording()
+        self.assertEqual(rec.frame_size, (64, 48))
+        self.assertEqual(rec.frames.shape, (3, 48, 64, 3))
+        np.testing.assert_allclose(rec.timestamps, [0, 1 / 30, 2 / 30])
+        self.assertIsNone(rec.landmarks(1))
+        self.assertIsNotNone(rec.landmarks(2))
+
+
+class TestReplayStreams(unittest.TestCase):
+    def test_landmark_stream_yields_every_frame(self):
+        rec = synthetic_recording(frames=50)
+        stream = LandmarkReplayStream(rec, realtime=False)
+        items = []
+        while True:
+            ok, item = stream.read()
+            if not ok:
+                break
+            items.append(item)
+        self.assertEqual(len(items), 50)
+        self.assertIsInstance(items[0], LandmarkFrame)
+        self.assertEqual(items[0].image.shape, (480, 640, 3))
+        self.assertEqual(items[-1].timestamp, rec.timestamps[-1])
+
+    def test_realtime_pacing_and_loop(self):
+        rec = synthetic_recording(frames=10, fps=200.0)
+        stream = LandmarkReplayStream(rec, realtime=True, loop=True)
+        t0 = time.perf_counter()
+        for _ in range(20):
+            self.assertTrue(stream.read()[0])
+        self.assertGreater(time.perf_counter() - t0, 0.08)
+        stream.release()
+        self.assertFalse(stream.read()[0])
+
+    def test_camera_stream_needs_frames(self):
+        with self.assertRaises(ValueError):
+            ReplayCameraStream(synthetic_recording(frames=10))
+
+
+class TestRecordingActions(unittest.TestCase):
+    def test_fist_hold_locks_once(self):
+        clock = ReplayClock()
+        actions = RecordingActions(clock)
+        engine = GestureEngine(actions, clock)
+        engine.active = True
+        lm = hand("FIST")
+        for i in range(60):
+            clock.now = i / 30
+            engine.update("FIST", lm)
+        locks = actions.of("lock_screen")
+        self.assertEqual(len(locks), 1)
+        self.assertAlmostEqual(locks[0].time, HOLD_TIME_LOCK, delta=1 / 30)
+
+    def test_volume_pinch_sets_volume(self):
+        actions = RecordingActions()
+        engine = GestureEngine(actions)
+        engine.active = True
+        _, percent = engine.update("VOLUME_PINCH", hand("VOLUME_PINCH"))
+        self.assertEqual(actions.events[-1].action, "set_volume")
+        self.assertEqual(int(actions.events[-1].args[0] * 100), percent)
+
+    def test_index_swipe_sends_hotkey(self):
+        clock = ReplayClock()
+        actions = RecordingActions(clock)
+        swipe = IndexSwipeController(actions, clock)
+        swipe.update(hand("INDEX_ONLY"), 640)
+        clock.now = HOLD_TIME + 0.1
+        swipe.update(hand("INDEX_ONLY"), 640)  # armed
+        clock.now += 0.1
+        _, direction = swipe.update(hand("INDEX_ONLY", x_shift=0.2), 640)
+        self.assertEqual(direction, "RIGHT")
+        self.assertEqual(actions.events[-1].args, ("alt", "shift", "tab"))
+
+
+class TestDecisionLatency(unittest.TestCase):
+    def test_latency_per_segment(self):
+        labels = ["NONE"] * 3 + ["FIST"] * 4 + ["NONE"] * 3 + ["FIST"] * 3
+        rec = GestureRecording(np.arange(len(labels)) / 10, np.zeros((len(labels), 21, 3)), np.array(labels))
+        events = [(0.5, "FIST"), (0.6, "STABILIZING")]
+        result = decision_latencies(rec, events)
+        self.assertEqual(result["FIST"]["segments"], 2)
+        self.assertEqual(result["FIST"]["detected"], 1)
+        self.assertAlmostEqual(result["FIST"]["latencies"][0], 0.2)
+
+
+@unittest.skipUnless(HAS_CV2, "OpenCV not installed")
+class TestManagerReplay(unittest.TestCase):
+    def run_once(self, rec):
+        from BACKEND.gestures.gesture_manager import GestureManager
+        from BACKEND.gestures.replay import replay
+
+        clock = ReplayClock()
+        actions = RecordingActions(clock)
+        manager = GestureManager(
+            camera=LandmarkReplayStream(rec, realtime=False), actions=actions, clock=clock, active=True
+        )
+        result = replay(manager, rec, clock)
+        return result.events, [(e.time, e.action, e.args) for e in actions.events]
+
+    def test_replay_is_deterministic(self):
+        rec = synthetic_recording(frames=600, seed=2)
+        first, second = self.run_once(rec), self.run_once(rec)
+        self.assertEqual(first, second)
+        self.assertTrue(first[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# BACKEND/gestures/tests/test_preview_channel.py
+"""
+Unit tests for the in-process gesture preview channel
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from BACKEND.gestures import preview_channel
+from BACKEND.gestures.preview_channel import PreviewChannel, fit_size
+
+
+def bgr_frame(value, width=640, height=480):
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[..., 0] = value      # blue
+    frame[..., 2] = 255 - value  # red
+    return frame
+
+
+class TestPreviewChannel(unittest.TestCase):
+    def test_fit_size_keeps_aspect_and_never_upscales(self):
+        self.assertEqual(fit_size(640, 480, 320, 320), (320, 240))
+        self.assertEqual(fit_size(640, 480, 1920, 1080), (640, 480))
+
+    def test_frame_is_downscaled_rgb(self):
+        channel = PreviewChannel(target_size=(160, 160))
+        channel.publish(bgr_frame(10))
+        with channel.read() as preview:
+            self.assertEqual(preview.rgb.shape, (120, 160, 3))
+            self.assertTrue(preview.rgb.flags["C_CONTIGUOUS"])
+            self.assertEqual(preview.stride, 160 * 3)
+            # BGR -> RGB: red channel first
+            self.assertEqual(tuple(preview.rgb[0, 0]), (245, 0, 10))
+
+    def test_notifications_are_coalesced(self):
+        calls = []
+        channel = PreviewChannel(notify=lambda: calls.append(1))
+        for i in range(5):
+            channel.publish(bgr_frame(i))
+        self.assertEqual(len(calls), 1)
+
+        with channel.read() as preview:
+            self.assertEqual(preview.seq, 5)
+            self.assertEqual(preview.rgb[0, 0, 2], 4)  # newest frame only
+        channel.publish(bgr_frame(9))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(channel.get_stats()["coalesced"], 4)
+
+    def test_buffer_being_read_is_never_overwritten(self):
+        channel = PreviewChannel()
+        channel.publish(bgr_frame(1))
+        with channel.read() as preview:
+            held = preview.rgb
+            for i in range(2, 20):
+                channel.publish(bgr_frame(i))
+            self.assertTrue(np.all(held[..., 2] == 1))
+        with channel.read() as preview:
+            self.assertEqual(preview.rgb[0, 0, 2], 19)
+
+    def test_peek_does_not_swallow_notification(self):
+        calls = []
+        channel = PreviewChannel(notify=lambda: calls.append(1))
+        channel.publish(bgr_frame(1))
+        with channel.read(consume=False):
+            pass
+        channel.publish(bgr_frame(2))
+        self.assertEqual(len(calls), 1)  # UI still has a pending notification
+
+    def test_concurrent_publish_and_read(self):
+        channel = PreviewChannel(target_size=(64, 48))
+        errors = []
+        stop = threading.Event()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                channel.publish(bgr_frame(i % 256, 64, 48))
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(500):
+                with channel.read() as preview:
+                    if preview is not None:
+                        # A torn frame would mix two values
+                        blue = preview.rgb[..., 2]
+                        if not np.all(blue == blue[0, 0]):
+                            errors.append(preview.seq)
+        finally:
+            stop.set()
+            thread.join()
+        self.assertEqual(errors, [])
+
+    @unittest.skipIf(preview_channel.cv2 is None, "OpenCV not installed")
+    def test_jpeg_for_remote_consumers(self):
+        channel = PreviewChannel()
+        self.assertIsNone(channel.latest_jpeg())
+        channel.publish(bgr_frame(1))
+        jpeg = channel.latest_jpeg()
+        self.assertTrue(jpeg.startswith(b"\xff\xd8"))
+        self.assertIs(channel.latest_jpeg(), jpeg)  # cached until a new frame
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# BACKEND/gestures/tests/test_roi_tracker.py
+"""
+Unit tests for ROI hand tracking (crop, coordinate mapping, lost / idle modes)
+"""
+
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from BACKEND.gestures.detection.roi_tracker import RoiTracker
+
+WIDTH, HEIGHT = 640, 480
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class BrightBlobDetector:
+    """'Hand' = bright pixels; returns 21 landmarks spread over their box."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, rgb):
+        self.calls.append(rgb.shape[:2])
+        ys, xs = np.nonzero(rgb[..., 0] > 128)
+        if len(xs) == 0:
+            return None
+        h, w = rgb.shape[:2]
+        x0, x1 = xs.min() / w, (xs.max() + 1) / w
+        y0, y1 = ys.min() / h, (ys.max() + 1) / h
+        points = [
+            SimpleNamespace(x=x0 + (x1 - x0) * (i % 5) / 4, y=y0 + (y1 - y0) * (i // 5) / 4, z=0.0)
+            for i in range(21)
+        ]
+        return SimpleNamespace(landmark=points)
+
+
+def frame_with_hand(x0=None, y0=None, size=80):
+    frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    if x0 is not None:
+        frame[y0:y0 + size, x0:x0 + size] = 255
+    return frame
+
+
+class TestRoiTracker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.detector = BrightBlobDetector()
+        self.tracker = RoiTracker(self.detector, clock=self.clock, full_size=320, roi_size=128)
+
+    def _step(self, frame, dt=1 / 30):
+        self.clock.now += dt
+        return self.tracker.process(frame)
+
+    def test_full_frame_then_roi_with_mapped_coordinates(self):
+        lm = self._step(frame_with_hand(400, 200))
+        self.assertIsNotNone(lm)
+        self.assertEqual(self.tracker.frames["full"], 1)
+        # Full frame was downscaled for inference
+        self.assertEqual(self.detector.calls[0], (240, 320))
+
+        lm = self._step(frame_with_hand(404, 202))
+        self.assertEqual(self.tracker.frames["roi"], 1)
+        self.assertLessEqual(max(self.detector.calls[1]), 128)
+        xs = [p.x * WIDTH for p in lm.landmark]
+        ys = [p.y * HEIGHT for p in lm.landmark]
+        self.assertAlmostEqual(min(xs), 404, delta=4)
+        self.assertAlmostEqual(max(xs), 484, delta=4)
+        self.assertAlmostEqual(min(ys), 202, delta=4)
+        self.assertLess(self.tracker.last_input_pixels, WIDTH * HEIGHT // 10)
+
+    def test_roi_follows_moving_hand(self):
+        for i in range(20):
+            lm = self._step(frame_with_hand(100 + i * 10, 150))
+            self.assertIsNotNone(lm)
+        self.assertEqual(self.tracker.frames["full"], 1)
+        x0, _, x1, _ = self.tracker.roi
+        self.assertTrue(x0 <= 290 and x1 >= 370)
+
+    def test_lost_hand_widens_to_full_frame(self):
+        self._step(frame_with_hand(100, 100))
+        self._step(frame_with_hand(100, 100))
+        self.assertIsNotNone(self.tracker.roi)
+
+        # Hand jumped out of the ROI
+        self.assertIsNone(self._step(frame_with_hand(500, 350)))
+        self.assertIsNone(self._step(frame_with_hand(500, 350)))
+        self.assertIsNone(self.tracker.roi)
+        self.assertIsNotNone(self._step(frame_with_hand(500, 350)))
+        self.assertEqual(self.tracker.frames["full"], 2)
+
+    def test_idle_throttles_inference(self):
+        empty = frame_with_hand()
+        for _ in range(30):  # 1 s at 30 fps: not idle yet, every frame inferred
+            self._step(empty)
+        self.assertEqual(self.tracker.frames["skipped"], 0)
+
+        for _ in range(90):  # 3 more seconds
+            self._step(empty)
+        self.assertTrue(self.tracker.idle)
+        self.assertGreater(self.tracker.frames["skipped"], 60)
+        self.assertEqual(self.tracker.get_stats()["mode"], "idle")
+
+        # A hand is picked up within one idle interval and full rate resumes
+        found = [self._step(frame_with_hand(300, 200)) is not None for _ in range(8)]
+        self.assertTrue(any(found))
+        self.assertFalse(self.tracker.idle)
+        self.assertTrue(all(found[found.index(True):]))
+
+
+if __name__ == "__main__":
+    unittest.main()
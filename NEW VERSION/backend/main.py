@@ -9,26 +9,50 @@ import threading
 import traceback
 import queue
 import time
-import re
 from colorama import Fore, init
 
-from BACKEND.core.brain.intent_classifier import IntentClassifier
-from BACKEND.core.brain.action_router import ActionRouter
 from BACKEND.core.brain.state_manager import StateManager, AudioState
 from BACKEND.core.speaker.speech_service import SpeechService
 from BACKEND.core.security.rate_limiter import RateLimiter
-from BACKEND.automations.battery.battery_monitor import BatteryMonitor, BatteryMonitorConfig
-from BACKEND.automations.battery.battery_config import get_battery_settings
-from BACKEND.gestures.gesture_manager import GestureManager
-from BACKEND.mobile.mobile import MobileServer
-from BACKEND.core.listener.voice_listener import VoiceListener
-import cv2
+from BACKEND.core.startup import StartupOrchestrator, StartupError
+from BACKEND.core.command_pipeline import CommandPipeline
+from BACKEND.core.language.rules import SYNEX_RULES, RuleEngine, normalize_hinglish
+
+# Heavy modules (torch/transformers, selenium, flask, cv2, mediapipe,
+# speech_recognition) are imported inside the startup stages / on first use.
 
 # ================================
 # CONFIG
 # ================================
 TEST_MODE = True  # True = text testing | False = voice mode
 INTENT_CONFIDENCE_THRESHOLD = 0.55
+INPUT_QUEUE_SIZE = int(os.getenv("SYNEX_INPUT_QUEUE", "32"))
+
+# Typed / spoken on their own, these cancel every queued or running command
+CANCEL_PHRASES = ("cancel", "cancel that", "cancel it", "cancel all", "stop all", "stop everything")
+BUSY_RESPONSE = "I'm still busy with earlier commands, please try again in a moment."
+
+# Fixed replies spoken by the main loop; pre-rendered into the speech cache
+CANNED_RESPONSES = (
+    "Hello, how can I help?",
+    "I'm not sure I understood that.",
+    "Going to sleep.",
+    "I've completed the task. Is there anything else you need?",
+    "I encountered an error. Please try again.",
+    "Please wait before sending another command",
+    "You just sent that command",
+    "Gesture mode is changing too fast",
+    "Gesture mode activated.",
+    "Gesture mode disabled.",
+    "Gesture mode is already active.",
+    "Gesture mode is already disabled.",
+    "Cancelled.",
+    "Nothing to cancel.",
+    BUSY_RESPONSE,
+)
+
+# Keyword fast paths (browser, battery, wake word, gesture), compiled once
+FAST_RULES = RuleEngine(SYNEX_RULES)
 
 init(autoreset=True)
 
@@ -77,16 +101,11 @@ class Synex:
 
         try:
             # ------------------------
-            # Core systems
+            # Core systems (needed before the prompt)
             # ------------------------
             print(Fore.CYAN + "🔧 Loading core systems...")
             self.state_manager = StateManager()
-            self.speech = SpeechService(self.state_manager)
-            self.intent_classifier = IntentClassifier()
-            self.router = ActionRouter(self.speech)
             self.rate_limiter = RateLimiter()  # Security rate limiter
-            self.mobile_server = MobileServer(self)
-            self.mobile_server.start()
 
             # ------------------------
             # Response callback (GUI)
@@ -95,21 +114,17 @@ class Synex:
             self.heard_callback = None
             self.gesture_status_callback = None
             self.gesture_frame_callback = None
+            # Created with the gesture manager; the GUI reads frames from it directly
+            self.gesture_preview = None
             self.gesture_event_callback = None
 
             # ------------------------
             # Input queue (GUI mode)
             # ------------------------
-            self.input_queue = queue.Queue()
-
-            from BACKEND.mobile.ws_server import MobileWebSocketServer
-            import asyncio
-
-            self.ws_server = MobileWebSocketServer(self)
-            threading.Thread(
-                target=lambda: asyncio.run(self.ws_server.start()),
-                daemon=True
-            ).start()
+            # Commands that arrive while components are still loading wait here.
+            # Bounded: when full, submit_text refuses (back-pressure to GUI / mobile)
+            self.input_queue = queue.Queue(maxsize=INPUT_QUEUE_SIZE)
+            self.pipeline = None
 
             # ------------------------
             # Runtime flags
@@ -127,37 +142,37 @@ class Synex:
             self.voice_listening = False
             self.voice_stop_event = threading.Event()
             self.voice_thread = None
-            self.listener = VoiceListener(self.state_manager)
             self._last_mic_busy_at = 0.0
 
             # ------------------------
-            # 🔋 Battery monitor (background)
+            # Staged startup: independent components load in parallel
             # ------------------------
-            print(Fore.CYAN + "🔋 Starting battery monitor...")
-            battery_settings = get_battery_settings()
-            battery_cfg = BatteryMonitorConfig(
-                critical_threshold=battery_settings.config.critical_threshold,
-                low_threshold=battery_settings.config.low_threshold,
-                full_threshold=battery_settings.config.full_threshold,
-                plug_cooldown=battery_settings.config.plug_cooldown,
-                level_cooldown=battery_settings.config.level_cooldown,
-                idle_only=battery_settings.config.idle_only,
-                max_pending=battery_settings.config.max_pending_alerts,
-            )
-            self.battery_monitor = BatteryMonitor(
-                self.speech,
-                interval=battery_settings.config.monitor_interval,
-                config=battery_cfg,
-                settings=battery_settings,
-            )
-            self.battery_monitor.start()
+            self.speech = None
+            self.intent_classifier = None
+            self.router = None
+            self.mobile_transport = None
+            self.websocket_server = None
+            self.listener = None
+            self.battery_monitor = None
+
+            self.startup = StartupOrchestrator(max_workers=4)
+            self._add_stage("speech", lambda: SpeechService(self.state_manager), critical=True)
+            self._add_stage("intent_classifier", self._load_intent_classifier)
+            self._add_stage("router", self._load_router, deps=("speech",))
+            self._add_stage("mobile_transport", self._start_mobile_transport, deps=("speech",))
+            self._add_stage("listener", self._load_voice_listener)
+            self._add_stage("battery_monitor", self._start_battery_monitor, deps=("speech",))
+            self.startup.add("speech_cache", self._prewarm_speech, deps=("speech",))
+            self.startup.add("browser", self._prewarm_browser)
+            self.startup.add("whatsapp_outbox", self._resume_whatsapp_outbox, deps=("router",))
+            self.startup.start()
 
             # ------------------------
             # 🎙 Voice listener (toggle from GUI)
             # ------------------------
-            print(Fore.CYAN + "🎙 Voice listener ready (toggle from GUI)")
+            print(Fore.CYAN + "🎙 Voice listener loading in background (toggle from GUI)")
 
-            print(Fore.GREEN + "\n✅ System ready")
+            print(Fore.GREEN + "\n✅ System ready (model warming up in background)")
             print(
                 Fore.YELLOW +
                 ("💬 TEXT MODE ENABLED\n" if TEST_MODE else "🎙 VOICE MODE ENABLED\n")
@@ -178,14 +193,117 @@ class Synex:
             print(Fore.YELLOW + "Attempting to start with minimal functionality...")
             # Continue with minimal setup if possible
 
+    # ================================
+    # STARTUP STAGES
+    # ================================
+    def _add_stage(self, name, factory, deps=(), critical=False):
+        """Register a startup stage whose result is stored as self.<name>."""
+        def load():
+            value = factory()
+            setattr(self, name, value)
+            return value
+
+        self.startup.add(name, load, deps=deps, critical=critical)
+
+    def _require(self, name, announce=True):
+        """Return a component, waiting for it if it is still loading."""
+        value = getattr(self, name, None)
+        if value is not None:
+            return value
+        if announce and not self.startup.is_ready(name):
+            warming = f"Still warming up ({name.replace('_', ' ')}), one moment..."
+            print(Fore.YELLOW + f"⏳ {warming}")
+            if self.response_callback:
+                self.response_callback(warming)
+        return self.startup.wait(name)
+
+    def _load_intent_classifier(self):
+        from BACKEND.core.brain.intent_classifier import IntentClassifier
+        return IntentClassifier()
+
+    def _load_router(self):
+        from BACKEND.core.brain.action_router import ActionRouter
+        return ActionRouter(self.speech, notify=self._on_automation_status)
+
+    def _start_mobile_transport(self):
+        # WebSocket, HTTP (old 5055 bridge) and Bluetooth on one event loop
+        from BACKEND.mobile_hub.connectivity.transport import TransportHost
+        return TransportHost(self).start().wait_ready()
+
+    def _load_voice_listener(self):
+        from BACKEND.core.listener.voice_listener import VoiceListener
+        return VoiceListener(self.state_manager)
+
+    def _start_battery_monitor(self):
+        from BACKEND.automations.battery.battery_monitor import BatteryMonitor, BatteryMonitorConfig
+        from BACKEND.automations.battery.battery_config import get_battery_settings
+
+        print(Fore.CYAN + "🔋 Starting battery monitor...")
+        battery_settings = get_battery_settings()
+        battery_cfg = BatteryMonitorConfig(
+            critical_threshold=battery_settings.config.critical_threshold,
+            low_threshold=battery_settings.config.low_threshold,
+            full_threshold=battery_settings.config.full_threshold,
+            plug_cooldown=battery_settings.config.plug_cooldown,
+            level_cooldown=battery_settings.config.level_cooldown,
+            idle_only=battery_settings.config.idle_only,
+            max_pending=battery_settings.config.max_pending_alerts,
+        )
+        monitor = BatteryMonitor(
+            self.speech,
+            interval=battery_settings.config.monitor_interval,
+            config=battery_cfg,
+            settings=battery_settings,
+        )
+        monitor.start()
+        return monitor
+
+    def _prewarm_speech(self):
+        """Queue canned replies for background rendering into the TTS audio cache"""
+        from BACKEND.automations.battery.battery_monitor import BatteryMonitor
+        from BACKEND.core.brain.action_router import ActionRouter
+
+        phrases = CANNED_RESPONSES + ActionRouter.CANNED_RESPONSES + BatteryMonitor.CANNED_RESPONSES
+        queued = self.speech.prewarm(phrases)
+        if queued:
+            print(Fore.CYAN + f"🔊 Rendering {queued} canned phrases into the speech cache")
+        return queued
+
+    def _prewarm_browser(self):
+        """Launch the shared automation browser and open its tabs before the first command"""
+        from BACKEND.automations.browser.browser_pool import PREWARM, BrowserPool
+
+        if not PREWARM.strip():
+            return None
+        return BrowserPool().prewarm()
+
+    def _resume_whatsapp_outbox(self):
+        """Deliver WhatsApp messages a previous run left queued; offer to resend failed ones"""
+        return self.router.resume_whatsapp_outbox()
+
+    def get_startup_status(self):
+        """Per-stage startup status and timing (ms)"""
+        return self.startup.timings()
+
     # ================================
     # MAIN LOOP
     # ================================
     def run(self):
+        """
+        Ingest loop: feeds console / queued input into the command pipeline
+        (normalize -> classify -> dispatch per automation family).
+        """
+        self.pipeline = CommandPipeline(
+            normalize=self._normalize_command,
+            classify=self._classify_command,
+            dispatch=self._dispatch_command,
+            respond=self._respond_command,
+            on_error=self._on_command_error,
+            on_reject=self._on_command_rejected,
+        ).start()
         try:
             while True:
                 try:
-                    self.state_manager.set_state(AudioState.LISTENING)
                     # ------------------------
                     # INPUT
                     # ------------------------
@@ -201,17 +319,11 @@ class Synex:
                         else:
                             text = self._clean_text(str(item))
                             source = "text"
-
-                        if source == "text":
-                            if text.lower() == 'exit':
-                                print(Fore.YELLOW + "👋 Goodbye!")
-                                break
-                            if text.lower() == 'help':
-                                self._show_help()
-                                continue
                     else:
                         text = self._clean_text(input(Fore.CYAN + "You: "))
                         source = "text"
+
+                    if source == "text":
                         if text.lower() == 'exit':
                             print(Fore.YELLOW + "👋 Goodbye!")
                             break
@@ -222,150 +334,9 @@ class Synex:
                     if not text:
                         continue
 
-                    print(Fore.YELLOW + f"👤 Input: {text}")
-                    text_lower = text.lower()
-
-                    # ========================
-                    # ⚔️  SECURITY: RATE LIMITING
-                    # ========================
-                    # Check input rate
-                    ok, reason = self.rate_limiter.check_input_rate()
-                    if not ok:
-                        print(Fore.MAGENTA + f"🛡️  Rate limit: {reason}")
-                        self.speech.speak("Please wait before sending another command")
-                        self.state_manager.set_state(AudioState.IDLE)
-                        continue
-                    
-                    # Check for duplicate commands
-                    ok, reason = self.rate_limiter.check_duplicate(text)
-                    if not ok:
-                        print(Fore.MAGENTA + f"🛡️  Duplicate command: {reason}")
-                        self.speech.speak("You just sent that command")
-                        self.state_manager.set_state(AudioState.IDLE)
-                        continue
-
-                    battery_intent = self._detect_battery_intent(text_lower)
-                    browser_intent, browser_payload = self._detect_browser_intent(text_lower)
-
-                    # ------------------------
-                    # WAKE WORD (VOICE INPUT)
-                    # ------------------------
-                    if source == "voice" and not self.awake:
-                        if self._is_wake_word(text_lower):
-                            self.awake = True
-                            greeting = "Hello, how can I help?"
-                            print(Fore.GREEN + f"🤖 Response: {greeting}")
-                            if self.response_callback:
-                                self.response_callback(greeting)
-                            self.speech.speak(greeting)
-                        continue
-
-                    # ------------------------
-                    # INTENT CLASSIFICATION
-                    # ------------------------
-                    self.state_manager.set_state(AudioState.THINKING)
-
-                    # ------------------------
-                    # GESTURE MODE (VOICE OVERRIDE)
-                    # ------------------------
-                    gesture_cmd = self._parse_gesture_command(text_lower)
-                    if gesture_cmd:
-                        # Rate limit gesture mode toggles
-                        ok, reason = self.rate_limiter.check_gesture_toggle_rate()
-                        if not ok:
-                            print(Fore.MAGENTA + f"🛡️  Gesture rate limit: {reason}")
-                            self.speech.speak("Gesture mode is changing too fast")
-                            self.state_manager.set_state(AudioState.IDLE)
-                            continue
-                        
-                        if gesture_cmd == "on":
-                            self._start_gesture_mode(source="voice")
-                            self.state_manager.set_state(AudioState.IDLE)
-                            continue
-                        if gesture_cmd == "off":
-                            self._stop_gesture_mode(source="voice")
-                            self.state_manager.set_state(AudioState.IDLE)
-                            continue
-                        if gesture_cmd == "toggle":
-                            self._toggle_gesture_mode(source="voice")
-                            self.state_manager.set_state(AudioState.IDLE)
-                            continue
-
-                    if browser_intent:
-                        intent, confidence = browser_intent, 1.0
-                    elif battery_intent:
-                        intent, confidence = battery_intent, 1.0
-                    else:
-                        intent, confidence = self.intent_classifier.predict(text_lower)
-
-                    print(
-                        Fore.MAGENTA +
-                        f"🧠 Intent: {intent} (Confidence: {confidence:.2f})"
-                    )
-
-                    # ------------------------
-                    # LOW CONFIDENCE GUARD
-                    # ------------------------
-                    if confidence < INTENT_CONFIDENCE_THRESHOLD:
-                        low_conf_response = "I'm not sure I understood that."
-                        print(Fore.YELLOW + f"⚠️  Low confidence ({confidence:.2f}) - asking for clarification")
-                        if self.response_callback:
-                            self.response_callback(low_conf_response)
-                        self.speech.speak(low_conf_response)
-                        self.state_manager.set_state(AudioState.IDLE)
-                        continue
-
-                    # ------------------------
-                    # ROUTE ACTION
-                    # ------------------------
-                    if browser_intent:
-                        result = self.router.handle(intent, browser_payload or text_lower)
-                    else:
-                        result = self.router.handle(intent, text_lower)
-
-                    # ------------------------
-                    # GESTURE MODE
-                    # ------------------------
-                    if result == "START_GESTURE":
-                        self._toggle_gesture_mode(source="voice")
-                        continue
-
-                    # ------------------------
-                    # SLEEP
-                    # ------------------------
-                    if result == "SLEEP":
-                        self.awake = False
-                        sleep_response = "Going to sleep."
-                        print(Fore.GREEN + f"🤖 Response: {sleep_response}")
-                        if self.response_callback:
-                            self.response_callback(sleep_response)
-                        self.speech.speak(sleep_response)
-                        continue
-
-                    # ------------------------
-                    # SPEAK RESULT
-                    # ------------------------
-                    # Always generate and speak a response
-                    result_text = None
-                    if result is not None:
-                        result_text = str(result).strip()
-                    
-                    if result_text:
-                        print(Fore.GREEN + f"🤖 Response: {result_text}")
-                        # Send response to UI callback
-                        if self.response_callback:
-                            self.response_callback(result_text)
-                        # ALWAYS speak the response regardless of input source
-                        self.speech.speak(result_text)
-                    else:
-                        # If no response, provide a fallback response
-                        fallback = "I've completed the task. Is there anything else you need?"
-                        print(Fore.GREEN + f"🤖 Response: {fallback}")
-                        if self.response_callback:
-                            self.response_callback(fallback)
-                        self.speech.speak(fallback)
-
-                    self.state_manager.set_state(AudioState.IDLE)
+                    # Waits while the pipeline is saturated; the bounded
+                    # input_queue then pushes back on GUI / mobile submitters
+                    self.pipeline.submit({"text": text, "source": source})
 
                 except KeyboardInterrupt:
                     print(Fore.YELLOW + "\n👋 Shutting down gracefully...")
@@ -374,14 +345,192 @@ class Synex:
                 except Exception as e:
                     print(Fore.RED + f"[ERROR] {e}")
                     traceback.print_exc()
-                    error_response = "I encountered an error. Please try again."
-                    if self.response_callback:
-                        self.response_callback(error_response)
-                    self.speech.speak(error_response)
-                    self.state_manager.set_state(AudioState.IDLE)
         finally:
+            self.pipeline.stop()
             self._cleanup()
 
+    # ------------------------
+    # Pipeline stages
+    # ------------------------
+    def _normalize_command(self, cmd):
+        """Rate limits, cancel / wake word / gesture toggles. False = handled here."""
+        text = cmd.text
+        print(Fore.YELLOW + f"👤 Input: {text}")
+        text_lower = text.lower()
+        cmd.hits = FAST_RULES.scan(text_lower)
+
+        # ========================
+        # ⚔️  SECURITY: RATE LIMITING
+        # ========================
+        # Check input rate
+        ok, reason = self.rate_limiter.check_input_rate()
+        if not ok:
+            print(Fore.MAGENTA + f"🛡️  Rate limit: {reason}")
+            self.speech.speak("Please wait before sending another command")
+            return False
+
+        # Check for duplicate commands
+        ok, reason = self.rate_limiter.check_duplicate(text)
+        if not ok:
+            print(Fore.MAGENTA + f"🛡️  Duplicate command: {reason}")
+            self.speech.speak("You just sent that command")
+            return False
+
+        # ------------------------
+        # CANCEL RUNNING TASKS
+        # ------------------------
+        if text_lower in CANCEL_PHRASES:
+            cancelled = self.pipeline.cancel_all(exclude=cmd.id)
+            reply = "Cancelled." if cancelled else "Nothing to cancel."
+            print(Fore.GREEN + f"🤖 Response: {reply} ({cancelled} task(s))")
+            self._reply(reply)
+            return False
+
+        # ------------------------
+        # WAKE WORD (VOICE INPUT)
+        # ------------------------
+        if cmd.source == "voice" and not self.awake:
+            if self._is_wake_word(text_lower, cmd.hits):
+                self.awake = True
+                greeting = "Hello, how can I help?"
+                print(Fore.GREEN + f"🤖 Response: {greeting}")
+                self._reply(greeting)
+            return False
+
+        # ------------------------
+        # GESTURE MODE (VOICE OVERRIDE)
+        # ------------------------
+        gesture_cmd = self._parse_gesture_command(text_lower, cmd.hits)
+        if gesture_cmd:
+            # Rate limit gesture mode toggles
+            ok, reason = self.rate_limiter.check_gesture_toggle_rate()
+            if not ok:
+                print(Fore.MAGENTA + f"🛡️  Gesture rate limit: {reason}")
+                self.speech.speak("Gesture mode is changing too fast")
+                return False
+
+            if gesture_cmd == "on":
+                self._start_gesture_mode(source="voice")
+                return False
+            if gesture_cmd == "off":
+                self._stop_gesture_mode(source="voice")
+                return False
+            if gesture_cmd == "toggle":
+                self._toggle_gesture_mode(source="voice")
+                return False
+
+        return True
+
+    def _classify_command(self, cmd):
+        """Fill cmd.intent / cmd.payload. False = dropped by the confidence guard."""
+        self.state_manager.set_state(AudioState.THINKING)
+        text_lower = cmd.text.lower()
+
+        # Browser / battery keyword rules skip the model
+        fast_intent, fast_payload = FAST_RULES.match(text_lower, hits=cmd.hits)
+
+        if fast_intent:
+            intent, confidence = fast_intent, 1.0
+            cmd.payload = fast_payload or text_lower
+        else:
+            intent, confidence = self._require("intent_classifier").predict(text_lower)
+        cmd.intent, cmd.confidence = intent, confidence
+        if cmd.payload is None:
+            cmd.payload = text_lower
+
+        print(
+            Fore.MAGENTA +
+            f"🧠 Intent: {intent} (Confidence: {confidence:.2f})"
+        )
+
+        # ------------------------
+        # LOW CONFIDENCE GUARD
+        # ------------------------
+        if confidence < INTENT_CONFIDENCE_THRESHOLD:
+            low_conf_response = "I'm not sure I understood that."
+            print(Fore.YELLOW + f"⚠️  Low confidence ({confidence:.2f}) - asking for clarification")
+            self._reply(low_conf_response)
+            return False
+        return True
+
+    def _dispatch_command(self, cmd):
+        """Runs on the executor of the command's automation family."""
+        return self._require("router").handle(cmd.intent, cmd.payload)
+
+    def _respond_command(self, cmd, result):
+        # ------------------------
+        # GESTURE MODE
+        # ------------------------
+        if result == "START_GESTURE":
+            self._toggle_gesture_mode(source="voice")
+            return
+
+        # ------------------------
+        # SLEEP
+        # ------------------------
+        if result == "SLEEP":
+            self.awake = False
+            sleep_response = "Going to sleep."
+            print(Fore.GREEN + f"🤖 Response: {sleep_response}")
+            self._reply(sleep_response)
+            return
+
+        # ------------------------
+        # SPEAK RESULT
+        # ------------------------
+        # Always generate and speak a response
+        result_text = None
+        if result is not None:
+            result_text = str(result).strip()
+
+        if not result_text:
+            # If no response, provide a fallback response
+            result_text = "I've completed the task. Is there anything else you need?"
+        print(Fore.GREEN + f"🤖 Response: {result_text}")
+        # ALWAYS speak the response regardless of input source
+        self._reply(result_text)
+
+    def _on_automation_status(self, text: str):
+        """Late outcome of background automation work (WhatsApp outbox) for the UI."""
+        print(Fore.GREEN + f"🤖 {text}")
+        if self.response_callback:
+            self.response_callback(text)
+
+    def _on_command_error(self, cmd, error):
+        print(Fore.RED + f"[ERROR] {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        self._reply("I encountered an error. Please try again.")
+
+    def _on_command_rejected(self, cmd):
+        self._reply(BUSY_RESPONSE)
+
+    def _reply(self, text: str):
+        """Send a response to the UI callback and speak it."""
+        if self.response_callback:
+            self.response_callback(text)
+        self.speech.speak(text)
+        if not self.pipeline or self.pipeline.get_metrics()["in_flight"] <= 1:
+            self.state_manager.set_state(AudioState.IDLE)
+
+    def get_gesture_stats(self):
+        """Capture / inference / render FPS and latency of the gesture camera pipeline"""
+        stats = self.gesture_manager.get_stats() if self.gesture_manager else dict(getattr(self, "gesture_stats", {}))
+        if self.gesture_preview is not None:
+            stats["preview"] = self.gesture_preview.get_stats()
+        return stats
+
+    def get_pipeline_status(self):
+        """Per-stage queue depths and per-family executor load"""
+        if not self.pipeline:
+            return {}
+        status = self.pipeline.get_metrics()
+        status["stages"]["input"] = {
+            "depth": self.input_queue.qsize(),
+            "capacity": self.input_queue.maxsize,
+        }
+        status["active"] = self.pipeline.active()
+        return status
+
     def _show_help(self):
         """Show available commands"""
         print(Fore.CYAN + "\n📚 Available Commands:")
@@ -408,23 +557,37 @@ class Synex:
     def _cleanup(self):
         """Cleanup resources before exit"""
         print(Fore.YELLOW + "Cleaning up resources...")
-        if hasattr(self, 'battery_monitor'):
+        if getattr(self, 'battery_monitor', None):
             self.battery_monitor.stop()
         if hasattr(self, 'gesture_manager') and self.gesture_manager:
             self.gesture_manager.stop()
+        if hasattr(self, 'intent_classifier') and self.intent_classifier:
+            self.intent_classifier.shutdown()
         if hasattr(self, 'speech') and self.speech:
             try:
                 self.speech.shutdown()
             except Exception:
                 pass
+        if hasattr(self, 'startup'):
+            self.startup.shutdown()
 
-    def submit_text(self, text: str):
-        """Receive text input from GUI and enqueue it for processing."""
+    def submit_text(self, text: str) -> bool:
+        """
+        Receive text input from GUI / mobile and enqueue it for processing.
+        Returns False when the input queue is full (command not accepted).
+        """
         if not hasattr(self, "input_queue"):
-            self.input_queue = queue.Queue()
+            self.input_queue = queue.Queue(maxsize=INPUT_QUEUE_SIZE)
         if text is None:
-            return
-        self.input_queue.put({"text": self._clean_text(text), "source": "text"})
+            return False
+        try:
+            self.input_queue.put_nowait({"text": self._clean_text(text), "source": "text"})
+            return True
+        except queue.Full:
+            print(Fore.MAGENTA + f"🛡️  Input queue full, refusing: {text}")
+            if self.response_callback:
+                self.response_callback(BUSY_RESPONSE)
+            return False
 
     def safe_speak(self, text: str):
         """Speak with rate limiting to prevent spam"""
@@ -443,13 +606,22 @@ class Synex:
             self.rate_limiter.DUPLICATE_TIMEOUT = duplicate_timeout
 
     def get_rate_limit_status(self):
-        """Get current rate limiter configuration"""
-        return {
+        """Get current rate limiter configuration and intent/speech cache stats"""
+        status = {
             "min_input_interval": self.rate_limiter.MIN_INPUT_INTERVAL,
             "min_gesture_interval": self.rate_limiter.MIN_GESTURE_INTERVAL,
             "duplicate_timeout": self.rate_limiter.DUPLICATE_TIMEOUT,
             "min_tts_interval": self.rate_limiter.MIN_TTS_INTERVAL,
         }
+        if getattr(self, "intent_classifier", None):
+            status["intent_cache"] = self.intent_classifier.get_cache_stats()
+        if getattr(self, "speech", None):
+            status["speech_cache"] = self.speech.tts.get_cache_stats()
+        # Only once the contact index has been loaded; never load it for a status call
+        contacts = getattr(getattr(self, "router", None), "_contacts", None)
+        if contacts is not None:
+            status["contact_cache"] = contacts.get_stats()
+        return status
 
     def set_gesture_allowed(self, allowed: bool):
         """
@@ -499,7 +671,12 @@ class Synex:
             return
         self.voice_listening = True
         self.voice_stop_event.clear()
-        self.listener.start_listening()
+        try:
+            self._require("listener").start_listening()
+        except StartupError as e:
+            print(Fore.RED + f"❌ Voice listener unavailable: {e}")
+            self.voice_listening = False
+            return
         self.voice_thread = threading.Thread(target=self._voice_loop, daemon=True)
         self.voice_thread.start()
 
@@ -509,7 +686,7 @@ class Synex:
         self.voice_listening = False
         self.voice_stop_event.set()
         self.awake = False
-        if hasattr(self, "listener"):
+        if getattr(self, "listener", None):
             try:
                 self.listener.stop()
             except Exception:
@@ -523,10 +700,7 @@ class Synex:
                     now = time.time()
                     if now - self._last_mic_busy_at > 5:
                         self._last_mic_busy_at = now
-                        self.input_queue.put({
-                            "text": "Microphone is busy. Please close other apps using it.",
-                            "source": "text"
-                        })
+                        self.submit_text("Microphone is busy. Please close other apps using it.")
                     time.sleep(1.0)
                     continue
                 if not text:
@@ -537,7 +711,10 @@ class Synex:
                 print(Fore.LIGHTCYAN_EX + f"🎧 Heard (clean): {cleaned}")
                 if self.heard_callback:
                     self.heard_callback(cleaned)
-                self.input_queue.put({"text": cleaned, "source": "voice"})
+                try:
+                    self.input_queue.put({"text": cleaned, "source": "voice"}, timeout=5.0)
+                except queue.Full:
+                    print(Fore.MAGENTA + f"🛡️  Input queue full, dropping: {cleaned}")
             except Exception as e:
                 print(Fore.RED + f"[VOICE LOOP ERROR] {e}")
                 time.sleep(0.5)
@@ -551,164 +728,60 @@ class Synex:
         cleaned = self._normalize_hinglish(cleaned)
         return " ".join(cleaned.strip().split())
 
-    def _is_wake_word(self, text_lower: str) -> bool:
-        if not text_lower:
-            return False
-        wake_phrases = [
-            "jarvis",
-            "jarvish",
-            "jaarvis",
-            "jervis",
-            "synex",
-            "wake up",
-            "wakeup",
-            "wake",
-            "vek ap",
-            "vek up",
-            "वेक अप",
-            "वेक",
-            "जागो",
-            "जाग जाओ",
-        ]
-        return any(phrase in text_lower for phrase in wake_phrases)
+    def _is_wake_word(self, text_lower: str, hits=None) -> bool:
+        intent, _ = FAST_RULES.match(text_lower, group="wake", hits=hits)
+        return intent is not None
 
     def _normalize_hinglish(self, text: str) -> str:
-        if not text:
-            return ""
-        t = text.lower()
-
-        phrase_rules = [
-            (r"\b(open|kholo|khol)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "open"),
-            (r"\b(search|dhundho|dhundo|khojo)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "search"),
-            (r"\b(play|chalao|bajao|bjao)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "play"),
-            (r"\b(close|band)\s+(kro|karo|kar do|kr do|krdo|kardo)\b", "close"),
-            (r"\b(send|bhejo|bhej do)\b", "send"),
-            (r"\b(batao|tell)\b", "tell"),
-            (r"\b(dikhao|dikhaao|dikhayo|show)\b", "show"),
-        ]
-
-        for pattern, repl in phrase_rules:
-            t = re.sub(pattern, repl, t, flags=re.IGNORECASE)
-
-        word_rules = {
-            "kholo": "open",
-            "khol": "open",
-            "band": "close",
-            "bnd": "close",
-            "dhundho": "search",
-            "dhundo": "search",
-            "khojo": "search",
-            "chalao": "play",
-            "bajao": "play",
-            "bjao": "play",
-            "bhejo": "send",
-            "batao": "tell",
-            "dikhao": "show",
-            "gaana": "song",
-            "gaane": "songs",
-        }
-
-        tokens = [word_rules.get(tok, tok) for tok in t.split()]
-        t = " ".join(tokens)
-
-        t = re.sub(r"\b(kro|karo|kar do|kr do|krdo|kardo|krna|karna)\b", "", t, flags=re.IGNORECASE)
-        return t
-
-    def _detect_battery_intent(self, text_lower: str):
-        if not text_lower:
-            return None
-        if any(word in text_lower for word in ["battery", "charge", "charging", "charger", "power"]):
-            if any(word in text_lower for word in ["plug", "plugged", "plugged in", "on charge", "charging", "charger"]):
-                return "check_battery_plug"
-            return "check_battery_percentage"
-        return None
-
-    def _detect_browser_intent(self, text_lower: str):
-        if not text_lower:
-            return None, None
-
-        # search google
-        if any(w in text_lower for w in ["search", "google"]):
-            query = (
-                text_lower
-                .replace("search", "", 1)
-                .replace("on google", "")
-                .replace("google", "", 1)
-                .strip()
-            )
-            if query:
-                return "google_search", query
-
-        # open website
-        if "open" in text_lower or "website" in text_lower:
-            name = (
-                text_lower
-                .replace("open", "", 1)
-                .replace("website", "", 1)
-                .strip()
-            )
-            if name:
-                return "open_item", name
-
-        # close tab/window
-        if "close tab" in text_lower or "close" in text_lower:
-            return "close_item", None
-
-        # navigation / tabs / scroll / refresh
-        if "new tab" in text_lower or "open new tab" in text_lower:
-            return "browser_new_tab", None
-        if "next tab" in text_lower:
-            return "browser_next_tab", None
-        if "previous tab" in text_lower or "prev tab" in text_lower:
-            return "browser_previous_tab", None
-        if "back" in text_lower:
-            return "browser_back", None
-        if "forward" in text_lower:
-            return "browser_forward", None
-        if "refresh" in text_lower or "reload" in text_lower:
-            return "browser_refresh", None
-        if "scroll down" in text_lower:
-            return "browser_scroll_down", None
-        if "scroll up" in text_lower:
-            return "browser_scroll_up", None
-        if "scroll top" in text_lower:
-            return "browser_scroll_top", None
-        if "scroll bottom" in text_lower:
-            return "browser_scroll_bottom", None
-
-        return None, None
+        return normalize_hinglish(text)
 
     def shutdown(self):
         """Shutdown backend services and stop the main loop."""
         self.stop_voice_listening()
+        if getattr(self, "mobile_transport", None):
+            self.mobile_transport.stop()
+        from BACKEND.automations.browser.browser_pool import BrowserPool
+        if BrowserPool._instance is not None:
+            BrowserPool._instance.close()
+        if getattr(self, "router", None):
+            self.router.shutdown()
+        if getattr(self, "pipeline", None):
+            self.pipeline.cancel_all()
         if hasattr(self, "input_queue"):
-            self.input_queue.put(None)
+            while True:
+                try:
+                    self.input_queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    # Pending input is moot once we are shutting down
+                    try:
+                        self.input_queue.get_nowait()
+                    except queue.Empty:
+                        pass
 
     # ================================
     # GESTURE MODE
     # ================================
-    def _parse_gesture_command(self, text_lower: str):
-        if "gesture" not in text_lower:
-            return None
-
-        on_keywords = ["on", "enable", "start", "activate"]
-        off_keywords = ["off", "disable", "stop", "deactivate"]
-
-        if any(k in text_lower for k in on_keywords):
-            return "on"
-        if any(k in text_lower for k in off_keywords):
-            return "off"
-        return "toggle"
+    def _parse_gesture_command(self, text_lower: str, hits=None):
+        """'on' / 'off' / 'toggle' when the text mentions gesture mode, else None."""
+        command, _ = FAST_RULES.match(text_lower, group="gesture", hits=hits)
+        return command
 
     def _ensure_gesture_manager(self):
         if self.gesture_manager and self.gesture_thread and self.gesture_thread.is_alive():
             return
 
+        # cv2 + mediapipe are only loaded once gesture mode is first used
+        from BACKEND.gestures.gesture_manager import GestureManager
+        from BACKEND.gestures.preview_channel import PreviewChannel
+
+        if self.gesture_preview is None:
+            self.gesture_preview = PreviewChannel(notify=self._notify_gesture_frame)
         self.gesture_manager = GestureManager(
             on_exit=self._on_gesture_exit,
             on_toggle=lambda: self._toggle_gesture_mode(source="gesture"),
             on_status=self._emit_gesture_status,
-            on_frame=self._emit_gesture_frame,
+            on_frame=self.gesture_preview.publish,
             on_event=self._emit_gesture_event,
             active=False,
             show_ui=False,
@@ -762,29 +835,29 @@ class Synex:
         self.gesture_active = False
         self._emit_gesture_status(self.gesture_active, "INACTIVE", 0.0)
 
-    def _emit_gesture_status(self, active: bool, gesture: str, fps: float):
+    def _emit_gesture_status(self, active: bool, gesture: str, fps: float, stats=None):
+        if stats is not None:
+            self.gesture_stats = stats
         if self.gesture_status_callback:
             try:
                 self.gesture_status_callback(active, gesture, fps)
             except Exception:
                 pass
 
-    def _emit_gesture_frame(self, frame):
-        if self.gesture_frame_callback and frame is not None:
+    def _notify_gesture_frame(self):
+        # Coalesced by the channel: one call per batch of frames, the GUI
+        # reads the newest one itself (no JPEG encode / decode in-process)
+        if self.gesture_frame_callback:
             try:
-                # Encode frame as JPEG bytes to avoid Qt memoryview issues
-                ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                if ok:
-                    self.gesture_frame_callback(buf.tobytes())
-                else:
-                    # Fallback: emit raw frame
-                    self.gesture_frame_callback(frame)
+                self.gesture_frame_callback(self.gesture_preview)
             except Exception:
-                # Fallback on any error
-                try:
-                    self.gesture_frame_callback(frame)
-                except Exception:
-                    pass
+                pass
+
+    def get_gesture_preview_jpeg(self, quality: int = 80):
+        """Newest gesture preview as JPEG bytes for remote consumers (mobile hub), or None."""
+        if self.gesture_preview is None:
+            return None
+        return self.gesture_preview.latest_jpeg(quality)
 
     def _emit_gesture_event(self, gesture: str):
         if self.gesture_event_callback:
@@ -794,6 +867,25 @@ class Synex:
                 pass
 
 
+    # ================================
+    # MOBILE (called from the transport loop)
+    # ================================
+    def _on_mobile_registration(self, connected: bool, device_name: str, device_id: str, host: str):
+        if connected:
+            print(Fore.CYAN + f"📲 {device_name} connected @ {host}")
+        else:
+            print(Fore.CYAN + f"📴 {device_id} disconnected")
+
+    def _on_mobile_notification(self, data: dict):
+        app = data.get("app_name") or data.get("app")
+        print(Fore.CYAN + f"🔔 Notification: {data}")
+        threading.Thread(target=self.speech.speak, args=(f"Notification from {app}",), daemon=True).start()
+
+    def _on_incoming_call(self, data: dict):
+        print(Fore.CYAN + f"📞 Incoming call: {data}")
+        threading.Thread(target=self.speech.speak, args=("Incoming call",), daemon=True).start()
+
+
 # ================================
 # ENTRY POINT
 # ================================
@@ -1,70 +1,522 @@
+# Path: d:\New folder (2) - JARVIS\backend\mobile_hub\audio_bridge.py
+"""
+Audio Bridge - Streaming two-way call audio between the laptop and a phone
+
+    laptop mic -> AudioSender -> [seq | codec | samples | payload] -> phone
+    phone -> receive() -> JitterBuffer -> decode / conceal -> laptop speaker
+
+- Frames are `frame_ms` long (SYNEX_CALL_FRAME_MS, default 20) and
+  sequence-numbered, so loss, reordering and late arrival are visible.
+- Codec: "opus" (opuslib, ~24 kbit/s) or "pcm" (raw int16, 256 kbit/s),
+  SYNEX_CALL_CODEC; falls back to PCM when opuslib / libopus is missing.
+  Each frame names its codec, so both directions may differ.
+- JitterBuffer adapts its playout delay to the measured interarrival
+  jitter (RFC 3550 estimator) within [min_delay_ms, max_delay_ms]: lost
+  frames are concealed, a buffer that grows past its target (sender clock
+  faster than ours) drops frames, an empty one rebuffers.
+- framed=False talks to legacy clients: raw PCM both ways, no header.
+"""
 
-import pyaudio
-import threading
-import queue
 import logging
+import math
+import os
+import struct
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
 
-class AudioBridge:
-    def __init__(self, callback_send_func):
+import numpy as np
+
+logger = logging.getLogger("AudioBridge")
+
+SAMPLE_RATE = 16000
+CHANNELS = 1
+SAMPLE_BYTES = 2
+FRAME_MS = int(os.getenv("SYNEX_CALL_FRAME_MS", "20"))
+DEFAULT_CODEC = os.getenv("SYNEX_CALL_CODEC", "opus").lower()
+OPUS_BITRATE = int(os.getenv("SYNEX_CALL_BITRATE", "24000"))
+
+CODEC_PCM = 0
+CODEC_OPUS = 1
+
+FRAME_HEADER = struct.Struct(">IBH")  # seq, codec, samples per channel
+SEQ_MOD = 1 << 32
+OPUS_FRAME_MS = (2.5, 5, 10, 20, 40, 60)
+
+
+# ------------------------
+# Codecs
+# ------------------------
+class PcmCodec:
+    codec_id = CODEC_PCM
+    name = "pcm"
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, frame_samples: int = 320):
+        self.frame_samples = frame_samples
+
+    def encode(self, pcm: bytes) -> bytes:
+        return pcm
+
+    def decode(self, payload: bytes, samples: int) -> bytes:
+        return payload
+
+    def conceal(self, last_pcm: Optional[bytes], samples: int) -> bytes:
+        """Fade the previous frame out instead of a hard drop to silence"""
+        if not last_pcm:
+            return bytes(samples * SAMPLE_BYTES)
+        pcm = np.frombuffer(last_pcm, dtype=np.int16)[:samples]
+        return (pcm * 0.5).astype(np.int16).tobytes()
+
+
+class OpusCodec:
+    codec_id = CODEC_OPUS
+    name = "opus"
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, frame_samples: int = 320, bitrate: int = OPUS_BITRATE):
+        import opuslib
+
+        if frame_samples * 1000 / sample_rate not in OPUS_FRAME_MS:
+            raise ValueError(f"Opus frames must be one of {OPUS_FRAME_MS} ms")
+        self.frame_samples = frame_samples
+        self.encoder = opuslib.Encoder(sample_rate, CHANNELS, opuslib.APPLICATION_VOIP)
+        self.encoder.bitrate = bitrate
+        self.decoder = opuslib.Decoder(sample_rate, CHANNELS)
+
+    def encode(self, pcm: bytes) -> bytes:
+        return self.encoder.encode(pcm, self.frame_samples)
+
+    def decode(self, payload: bytes, samples: int) -> bytes:
+        return self.decoder.decode(payload, samples)
+
+    def conceal(self, last_pcm: Optional[bytes], samples: int) -> bytes:
+        try:
+            return self.decoder.decode(b"", samples)  # Opus packet loss concealment
+        except Exception:
+            return PcmCodec.conceal(self, last_pcm, samples)
+
+
+CODECS = {"pcm": PcmCodec, "opus": OpusCodec}
+
+
+def make_codec(name: str = DEFAULT_CODEC, sample_rate: int = SAMPLE_RATE, frame_ms: float = FRAME_MS):
+    frame_samples = int(sample_rate * frame_ms / 1000)
+    try:
+        return CODECS[name](sample_rate, frame_samples)
+    except Exception as e:
+        if name != "pcm":
+            logger.warning(f"Codec {name} unavailable ({e}); using PCM")
+        return PcmCodec(sample_rate, frame_samples)
+
+
+def pack_frame(seq: int, codec_id: int, samples: int, payload: bytes) -> bytes:
+    return FRAME_HEADER.pack(seq % SEQ_MOD, codec_id, samples) + payload
+
+
+def unpack_frame(data: bytes) -> Tuple[int, int, int, bytes]:
+    if len(data) < FRAME_HEADER.size:
+        raise ValueError("short audio frame")
+    seq, codec_id, samples = FRAME_HEADER.unpack_from(data)
+    return seq, codec_id, samples, bytes(data[FRAME_HEADER.size:])
+
+
+# ------------------------
+# Jitter buffer
+# ------------------------
+class JitterBuffer:
+    """
+    Reorders frames by sequence number and releases one per playout tick.
+    pop() -> (status, frame): "ok" with (codec_id, samples, payload),
+    "lost" (conceal one frame), "wait" (prefilling: play silence).
+    """
+
+    def __init__(self, frame_ms: float = FRAME_MS, min_delay_ms: float = 40.0, max_delay_ms: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.frame_s = frame_ms / 1000.0
+        self.min_frames = max(1, math.ceil(min_delay_ms / frame_ms))
+        self.max_frames = max(self.min_frames + 1, math.ceil(max_delay_ms / frame_ms))
+        self.clock = clock
+
+        self._frames: Dict[int, Tuple[int, int, bytes]] = {}
+        self._next: Optional[int] = None  # next seq to play
+        self._playing = False
+        self._last_transit: Optional[float] = None
+        self._lock = threading.Lock()
+
+        self.jitter = 0.0  # seconds, RFC 3550 interarrival jitter
+        self.stats = {"received": 0, "played": 0, "lost": 0, "late": 0, "duplicates": 0,
+                      "underruns": 0, "drift_drops": 0, "overflow_drops": 0}
+
+    @property
+    def target_frames(self) -> int:
+        wanted = math.ceil(3.0 * self.jitter / self.frame_s) + 1
+        return min(self.max_frames, max(self.min_frames, wanted))
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def delay_ms(self) -> float:
+        return len(self._frames) * self.frame_s * 1000.0
+
+    def push(self, seq: int, codec_id: int, samples: int, payload: bytes):
+        now = self.clock()
+        with self._lock:
+            self.stats["received"] += 1
+            transit = now - seq * self.frame_s
+            if self._last_transit is not None:
+                d = abs(transit - self._last_transit)
+                if d < 1.0:  # ignore stream restarts
+                    self.jitter += (d - self.jitter) / 16.0
+            self._last_transit = transit
+
+            if self._next is not None and seq < self._next:
+                self.stats["late"] += 1
+                return
+            if seq in self._frames:
+                self.stats["duplicates"] += 1
+                return
+            self._frames[seq] = (codec_id, samples, payload)
+            while len(self._frames) > self.max_frames:
+                del self._frames[min(self._frames)]
+                self.stats["overflow_drops"] += 1
+                if self._next is not None:
+                    self._next = min(self._frames)
+
+    def pop(self):
+        with self._lock:
+            if not self._playing:
+                if len(self._frames) < self.target_frames:
+                    return "wait", None
+                self._playing = True
+                self._next = min(self._frames)
+
+            if not self._frames:
+                # Ran dry: conceal this tick, then prefill again
+                self.stats["underruns"] += 1
+                self._playing = False
+                return "lost", None
+
+            # Sender clock running ahead of ours: shed frames beyond the target
+            if len(self._frames) > self.target_frames + max(2, self.target_frames // 2):
+                self._frames.pop(self._next, None)
+                self._next = min(self._frames) if self._frames else self._next + 1
+                self.stats["drift_drops"] += 1
+
+            frame = self._frames.pop(self._next, None)
+            self._next += 1
+            if frame is None:
+                self.stats["lost"] += 1
+                return "lost", None
+            self.stats["played"] += 1
+            return "ok", frame
+
+    def reset(self):
+        with self._lock:
+            self._frames.clear()
+            self._next = None
+            self._playing = False
+            self._last_transit = None
+
+
+# ------------------------
+# Devices
+# ------------------------
+class PyAudioDevice:
+    """Laptop mic + speaker at the bridge's frame size"""
+
+    def __init__(self, sample_rate: int, frame_samples: int):
+        import pyaudio
+
+        self.frame_samples = frame_samples
         self.p = pyaudio.PyAudio()
-        self.chunk = 1024
-        self.format = pyaudio.paInt16
-        self.channels = 1
-        self.rate = 16000
-        
-        self.input_stream = None
-        self.output_stream = None
+        self.stream_out = self.p.open(format=pyaudio.paInt16, channels=CHANNELS, rate=sample_rate,
+                                      output=True, frames_per_buffer=frame_samples)
+        self.stream_in = self.p.open(format=pyaudio.paInt16, channels=CHANNELS, rate=sample_rate,
+                                     input=True, frames_per_buffer=frame_samples)
+
+    def read(self) -> bytes:
+        return self.stream_in.read(self.frame_samples, exception_on_overflow=False)
+
+    def write(self, pcm: bytes):
+        self.stream_out.write(pcm)
+
+    def close(self):
+        for stream in (self.stream_in, self.stream_out):
+            try:
+                stream.stop_stream()
+                stream.close()
+            except Exception:
+                pass
+        self.p.terminate()
+
+
+class FakeAudioDevice:
+    """Device stand-in for tests / benchmarks: a sine 'mic' and a recording 'speaker'"""
+
+    def __init__(self, sample_rate: int, frame_samples: int, freq: float = 440.0, realtime: bool = False):
+        self.sample_rate = sample_rate
+        self.frame_samples = frame_samples
+        self.freq = freq
+        self.realtime = realtime
+        self._t = 0
+        self.played = []
+
+    def read(self) -> bytes:
+        if self.realtime:
+            time.sleep(self.frame_samples / self.sample_rate)
+        n = np.arange(self._t, self._t + self.frame_samples)
+        self._t += self.frame_samples
+        return (np.sin(2 * np.pi * self.freq * n / self.sample_rate) * 8000).astype(np.int16).tobytes()
+
+    def write(self, pcm: bytes):
+        if self.realtime:
+            time.sleep(self.frame_samples / self.sample_rate)
+        self.played.append(pcm)
+
+    def close(self):
+        pass
+
+
+# ------------------------
+# Bridge
+# ------------------------
+class AudioSender:
+    """Cuts captured PCM into codec frames and numbers them"""
+
+    def __init__(self, codec, framed: bool = True):
+        self.codec = codec
+        self.framed = framed
+        self.seq = 0
+        self._pending = b""
+        self.frame_bytes = codec.frame_samples * SAMPLE_BYTES
+        self.stats = {"frames": 0, "pcm_bytes": 0, "wire_bytes": 0}
+
+    def push(self, pcm: bytes):
+        """Yields wire packets for every complete frame in pcm (plus leftovers from before)"""
+        self._pending += pcm
+        while len(self._pending) >= self.frame_bytes:
+            frame, self._pending = self._pending[:self.frame_bytes], self._pending[self.frame_bytes:]
+            if self.framed:
+                packet = pack_frame(self.seq, self.codec.codec_id, self.codec.frame_samples, self.codec.encode(frame))
+            else:
+                packet = frame
+            self.seq = (self.seq + 1) % SEQ_MOD
+            self.stats["frames"] += 1
+            self.stats["pcm_bytes"] += len(frame)
+            self.stats["wire_bytes"] += len(packet)
+            yield packet
+
+
+class AudioBridge:
+    """
+    One call's audio. `callback_send_func(packet)` is called from the
+    capture thread for every outgoing frame; receive() takes packets from
+    the network in any thread.
+    """
+
+    def __init__(self, callback_send_func, codec: str = DEFAULT_CODEC, frame_ms: float = FRAME_MS,
+                 framed: bool = True, sample_rate: int = SAMPLE_RATE,
+                 device_factory=PyAudioDevice, clock: Callable[[], float] = time.monotonic,
+                 min_delay_ms: float = 40.0, max_delay_ms: float = 300.0):
+        self.callback_send = callback_send_func  # Function to send data to WS
+        self.sample_rate = sample_rate
+        self.framed = framed
+        self.codec = make_codec(codec if framed else "pcm", sample_rate, frame_ms)
+        self.frame_samples = self.codec.frame_samples
+        self.frame_ms = self.frame_samples * 1000.0 / sample_rate
+        self.device_factory = device_factory
+        self.clock = clock
+
+        self.sender = AudioSender(self.codec, framed)
+        self.jitter = JitterBuffer(self.frame_ms, min_delay_ms, max_delay_ms, clock)
+        self._decoders = {self.codec.codec_id: self.codec}
+        self._raw_seq = 0
+        self._raw_pending = b""
+        self._last_pcm = None
+        self._delays = deque(maxlen=500)  # jitter buffer delay at each playout, ms
+        self.stats = {"wire_bytes_in": 0, "concealed": 0, "silence": 0, "bad_frames": 0}
+
+        self.device = None
         self.is_running = False
-        
-        self.callback_send = callback_send_func # Function to send data to WS
-        self.logger = logging.getLogger("AudioBridge")
+        self._threads = []
+        self.logger = logger
 
     def start(self):
         if self.is_running: return
-        self.is_running = True
-        
         try:
-            # Output Stream (Play received audio)
-            self.output_stream = self.p.open(format=self.format,
-                                            channels=self.channels,
-                                            rate=self.rate,
-                                            output=True)
-            
-            # Input Stream (Capture mic)
-            self.input_stream = self.p.open(format=self.format,
-                                           channels=self.channels,
-                                           rate=self.rate,
-                                           input=True,
-                                           frames_per_buffer=self.chunk,
-                                           stream_callback=self._mic_callback)
-                                           
-            self.input_stream.start_stream()
-            self.logger.info("Audio Bridge Started (Mic + Speaker)")
-            
+            self.device = self.device_factory(self.sample_rate, self.frame_samples)
         except Exception as e:
             self.logger.error(f"Failed to start Audio Bridge: {e}")
-            self.stop()
+            return
+        self.is_running = True
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="AudioBridge-mic", daemon=True),
+            threading.Thread(target=self._playback_loop, name="AudioBridge-speaker", daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        self.logger.info(f"Audio Bridge Started ({self.codec.name}, {self.frame_ms:g} ms frames)")
+
+    # ------------------------
+    # Laptop -> phone
+    # ------------------------
+    def capture_once(self):
+        for packet in self.sender.push(self.device.read()):
+            self.callback_send(packet)
+
+    def _capture_loop(self):
+        while self.is_running:
+            try:
+                self.capture_once()
+            except Exception as e:
+                self.logger.error(f"Mic capture error: {e}")
+                break
+
+    # ------------------------
+    # Phone -> laptop
+    # ------------------------
+    def receive(self, data: bytes):
+        self.stats["wire_bytes_in"] += len(data)
+        if not self.framed:
+            # Legacy raw PCM chunks of any size: number them on arrival
+            self._raw_pending += bytes(data)
+            frame_bytes = self.frame_samples * SAMPLE_BYTES
+            while len(self._raw_pending) >= frame_bytes:
+                frame, self._raw_pending = self._raw_pending[:frame_bytes], self._raw_pending[frame_bytes:]
+                self.jitter.push(self._raw_seq, CODEC_PCM, self.frame_samples, frame)
+                self._raw_seq += 1
+            return
+        try:
+            seq, codec_id, samples, payload = unpack_frame(data)
+        except ValueError:
+            self.stats["bad_frames"] += 1
+            return
+        self.jitter.push(seq, codec_id, samples, payload)
 
-    def _mic_callback(self, in_data, frame_count, time_info, status):
-        if self.is_running and self.callback_send:
-            # Send captured mic data to Android
-            self.callback_send(in_data)
-        return (None, pyaudio.paContinue)
+    play_audio = receive
 
-    def play_audio(self, data):
-        if self.is_running and self.output_stream:
+    def next_playout(self) -> bytes:
+        """PCM for the next frame period: decoded, concealed or silence"""
+        self._delays.append(self.jitter.delay_ms)
+        status, frame = self.jitter.pop()
+        if status == "ok":
+            codec_id, samples, payload = frame
             try:
-                self.output_stream.write(data)
+                pcm = self._decoder(codec_id).decode(payload, samples)
+            except Exception as e:
+                self.logger.debug(f"Audio decode failed: {e}")
+                status = "lost"
+            else:
+                self._last_pcm = pcm
+                return pcm
+        if status == "lost":
+            self.stats["concealed"] += 1
+            pcm = self.codec.conceal(self._last_pcm, self.frame_samples)
+            self._last_pcm = pcm
+            return pcm
+        self.stats["silence"] += 1
+        return bytes(self.frame_samples * SAMPLE_BYTES)
+
+    def play_once(self):
+        self.device.write(self.next_playout())
+
+    def _playback_loop(self):
+        # The output device's blocking write is the playout clock
+        while self.is_running:
+            try:
+                self.play_once()
             except Exception as e:
                 self.logger.error(f"Error playing audio: {e}")
+                time.sleep(self.frame_ms / 1000.0)
+
+    def _decoder(self, codec_id: int):
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            name = next(name for name, cls in CODECS.items() if cls.codec_id == codec_id)
+            decoder = self._decoders[codec_id] = CODECS[name](self.sample_rate, self.frame_samples)
+        return decoder
+
+    # ------------------------
+    # Metrics / shutdown
+    # ------------------------
+    def get_stats(self) -> dict:
+        delays = sorted(self._delays)
+        sent = self.sender.stats
+        seconds = max(sent["frames"] * self.frame_ms / 1000.0, 1e-9)
+        return {
+            "codec": self.codec.name,
+            "frame_ms": self.frame_ms,
+            "framed": self.framed,
+            "sent_frames": sent["frames"],
+            "send_kbps": sent["wire_bytes"] * 8 / seconds / 1000.0,
+            "compression": sent["wire_bytes"] / sent["pcm_bytes"] if sent["pcm_bytes"] else 1.0,
+            **self.jitter.stats,
+            **self.stats,
+            "jitter_ms": self.jitter.jitter * 1000.0,
+            "target_delay_ms": self.jitter.target_frames * self.frame_ms,
+            "buffer_ms_p50": delays[len(delays) // 2] if delays else 0.0,
+            "buffer_ms_max": delays[-1] if delays else 0.0,
+        }
 
     def stop(self):
         self.is_running = False
-        if self.input_stream:
-            self.input_stream.stop_stream()
-            self.input_stream.close()
-        if self.output_stream:
-            self.output_stream.stop_stream()
-            self.output_stream.close()
-        # self.p.terminate() # Keep PyAudio alive for re-use
+        for t in self._threads:
+            if t is not threading.current_thread():
+                t.join(timeout=1.0)
+        self._threads = []
+        if self.device:
+            self.device.close()
+            self.device = None
+        self.jitter.reset()
         self.logger.info("Audio Bridge Stopped")
+
+
+# ------------------------
+# Simulation (tests / benchmarks)
+# ------------------------
+class ManualClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def simulate_call(frames: int = 500, jitter_ms: float = 40.0, loss: float = 0.02, seed: int = 0,
+                  codec: str = "pcm", drift: float = 0.0, **bridge_kwargs):
+    """
+    Laptop bridge -> simulated network -> phone bridge with fake devices,
+    stepped one frame period at a time. Packets are delayed uniformly by up
+    to `jitter_ms` (so they also reorder) and lost with probability `loss`;
+    `drift` makes the sender's clock that much faster than the playout clock.
+    Returns (laptop, phone) bridges.
+    """
+    import random
+
+    rng = random.Random(seed)
+    clock = ManualClock()
+    outgoing = []
+    laptop = AudioBridge(outgoing.append, codec=codec, device_factory=FakeAudioDevice, clock=clock, **bridge_kwargs)
+    phone = AudioBridge(lambda packet: None, codec=codec, device_factory=FakeAudioDevice, clock=clock, **bridge_kwargs)
+    for bridge in (laptop, phone):
+        bridge.device = bridge.device_factory(bridge.sample_rate, bridge.frame_samples)
+
+    frame_s = laptop.frame_ms / 1000.0
+    extra_every = int(1 / drift) if drift else 0
+    in_flight = []  # (due, packet)
+    for tick in range(frames):
+        now = tick * frame_s
+        clock.now = now
+        for _ in range(2 if extra_every and tick % extra_every == 0 else 1):
+            laptop.capture_once()
+        for packet in outgoing:
+            if rng.random() >= loss:
+                in_flight.append((now + rng.uniform(0.0, jitter_ms / 1000.0), packet))
+        outgoing.clear()
+        in_flight.sort(key=lambda item: item[0])
+        while in_flight and in_flight[0][0] <= now:
+            phone.receive(in_flight.pop(0)[1])
+        phone.play_once()
+    return laptop, phone
+
@@ -0,0 +1,164 @@
+# BACKEND/mobile_hub/connectivity/tests/test_transport.py
+"""
+Tests for the single-loop transport host (RFCOMM adapter over a TCP stand-in,
+the uvicorn WebSocket / HTTP side on ephemeral ports)
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+import unittest
+import urllib.request
+from unittest.mock import patch
+
+from BACKEND.mobile_hub.connectivity.transport import RfcommAdapter, TransportError, TransportHost, bind_tcp
+from BACKEND.mobile_hub.features.notifications import NotificationManager
+
+
+class FakeSynex:
+    def __init__(self):
+        self.submitted = []
+        self.notifications = []
+
+    def submit_text(self, text):
+        self.submitted.append(text)
+        return True
+
+    def _on_mobile_notification(self, payload):
+        self.notifications.append(payload)
+
+
+class NotificationsFixture(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        NotificationManager._instance = None
+        NotificationManager(os.path.join(self.dir, "notifications.json"))
+        self.jarvis = FakeSynex()
+
+    def tearDown(self):
+        NotificationManager._instance.store.close()
+        NotificationManager._instance = None
+        shutil.rmtree(self.dir)
+
+
+class TestTransportHost(NotificationsFixture):
+    def setUp(self):
+        super().setUp()
+        self.host = TransportHost(self.jarvis, port=0, http_port=None, web=False, discovery=False)
+        self.host.rfcomm.listen = lambda: bind_tcp("127.0.0.1", 0)
+        self.host.start()
+        self.assertTrue(self.host.ready.wait(5))
+
+    def tearDown(self):
+        self.host.stop()
+        super().tearDown()
+
+    def _connect(self):
+        sock = socket.create_connection(self.host.rfcomm.address[:2], timeout=5)
+        return sock, sock.makefile("rwb")
+
+    def _read(self, stream):
+        return json.loads(stream.readline())
+
+    def test_rfcomm_lines_reach_the_shared_router(self):
+        sock, stream = self._connect()
+        with sock, stream:
+            self.assertEqual(self._read(stream), {"type": "connected", "status": "ready"})
+
+            stream.write(b'{"type": "text_input", "text": "open notepad"}\n')
+            stream.write(b"what time is it\n")
+            stream.write(b'{"type": "notification", "app_name": "Gmail", "title": "hi", "key": "n1"}\n')
+            stream.flush()
+            replies = [self._read(stream) for _ in range(3)]
+
+            self.assertEqual([r["type"] for r in replies], ["response", "response", "response"])
+            self.assertEqual(self.jarvis.submitted, ["open notepad", "what time is it"])
+            self.assertEqual(self.jarvis.notifications[0]["title"], "hi")
+
+            devices = self.host.client_manager.devices
+            self.assertEqual(len(devices), 1)
+            self.assertEqual(next(iter(devices.values()))["transport"], "rfcomm")
+
+        stats = self.host.get_stats()
+        self.assertEqual(stats["routing"]["rfcomm"]["messages"], 3)
+        self.assertGreater(stats["routing"]["rfcomm"]["route_ms_p99"], 0.0)
+        self.assertEqual(stats["errors"], 0)
+
+    def test_active_rfcomm_client_is_not_reaped(self):
+        manager = self.host.client_manager
+        manager.heartbeat_timeout = 1
+        manager.reap_interval = 0.1
+        sock, stream = self._connect()
+        with sock, stream:
+            self._read(stream)
+            for _ in range(6):
+                stream.write(b'{"type": "heartbeat", "payload": {}}\n')
+                stream.flush()
+                self._read(stream)
+                time.sleep(0.3)
+            self.assertEqual(len(manager._clients), 1)
+
+            # Silent for longer than the timeout: dropped
+            self.assertEqual(stream.readline(), b"")
+        self.assertEqual(len(manager._clients), 0)
+
+    def test_stop_closes_clients_and_the_loop(self):
+        sock, stream = self._connect()
+        with sock, stream:
+            self._read(stream)
+            self.host.stop()
+            self.assertEqual(stream.readline(), b"")  # closed by the host
+        self.assertFalse(self.host._thread.is_alive())
+        self.assertTrue(self.host.loop.is_closed())
+
+
+@unittest.skipUnless(importlib.util.find_spec("fastapi") and importlib.util.find_spec("uvicorn"),
+                     "fastapi / uvicorn not installed")
+class TestWebTransport(NotificationsFixture):
+    def test_uvicorn_serves_http_routes(self):
+        host = TransportHost(self.jarvis, host="127.0.0.1", port=0, http_port=None, bluetooth=False,
+                             discovery=False).start().wait_ready()
+        try:
+            base = "http://127.0.0.1:%d" % host.web_address[1]
+            with urllib.request.urlopen(base + "/ping", timeout=5) as r:
+                self.assertEqual(json.load(r)["status"], "online")
+            with urllib.request.urlopen(base + "/health", timeout=5) as r:
+                self.assertEqual(json.load(r)["status"], "healthy")
+
+            body = json.dumps({"device_id": "p1", "app_name": "Gmail", "title": "hi", "key": "n1"}).encode()
+            request = urllib.request.Request(base + "/notification", data=body,
+                                             headers={"Content-Type": "application/json"})
+            with urllib.request.urlopen(request, timeout=5) as r:
+                self.assertEqual(json.load(r), {"ok": True})
+            self.assertEqual(self.jarvis.notifications[0]["title"], "hi")
+            self.assertEqual(host.get_stats()["routing"]["http"]["messages"], 1)
+        finally:
+            host.stop()
+        self.assertFalse(host._thread.is_alive())
+
+
+class TestMissingWebStack(NotificationsFixture):
+    def test_missing_web_stack_fails_startup(self):
+        with patch.dict(sys.modules, {"uvicorn": None}):
+            host = TransportHost(self.jarvis, port=0, http_port=None, bluetooth=False, discovery=False).start()
+            with self.assertRaises(TransportError):
+                host.wait_ready(5)
+        host.stop()
+
+
+class TestRfcommParsing(unittest.TestCase):
+    def test_flat_and_wrapped_messages(self):
+        parse = RfcommAdapter._parse
+        self.assertEqual(parse('{"type": "command", "text": "hi"}'), {"type": "command", "payload": {"text": "hi"}})
+        self.assertEqual(parse('{"type": "heartbeat", "payload": {}}'), {"type": "heartbeat", "payload": {}})
+        self.assertEqual(parse("lock the screen")["payload"]["text"], "lock the screen")
+        self.assertEqual(parse("[1, 2]")["type"], "command")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,407 @@
+# Path: d:\New folder (2) - JARVIS\backend\mobile_hub\connectivity\transport.py
+"""
+Transport Host - One event loop for every way a phone can reach Synex
+
+Replaces the Flask bridge (5055), the standalone websockets server and the
+thread-per-client Bluetooth server with adapters on a single asyncio loop
+running in a single thread:
+- WebSocket: the FastAPI WebSocketServer (/ws, /health)
+- HTTP: the old bridge routes (/ping, /register, /notification) on the same
+  app, served by the same uvicorn server on a second socket
+- RFCOMM: newline-delimited JSON over asyncio streams
+
+All of them share one ClientManager (device state, outbound queues) and feed
+one MessageRouter through dispatch(), which records per-transport routing
+latency. stop() shuts the adapters down in order from any thread.
+
+The WebSocket / HTTP side is what the phone app needs: when fastapi /
+uvicorn are missing or its ports can't be bound, wait_ready() raises
+TransportError instead of the hub coming up without it.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from ..core.manager import ClientManager
+from ..core.router import MessageRouter
+from ..core.protocol import create_error
+
+if TYPE_CHECKING:
+    from backend.main import Synex
+
+logger = logging.getLogger(__name__)
+
+WS_PORT = 8765
+HTTP_PORT = 5055  # legacy Flask bridge port, same app as WS_PORT
+RFCOMM_CHANNELS = range(1, 11)
+
+
+def bind_tcp(host: str, port: int) -> Optional[socket.socket]:
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(128)
+        sock.setblocking(False)
+        return sock
+    except OSError as e:
+        logger.warning(f"Port {port} unavailable ({e}); skipping it")
+        print(f"⚠️ Mobile port {port} already in use. Skipping it.")
+        return None
+
+
+def bind_rfcomm() -> Optional[socket.socket]:
+    """First free RFCOMM channel, or None (no adapter / no Bluetooth support)"""
+    if not hasattr(socket, "AF_BLUETOOTH"):
+        return None
+    for channel in RFCOMM_CHANNELS:
+        sock = None
+        try:
+            sock = socket.socket(socket.AF_BLUETOOTH, socket.SOCK_STREAM, socket.BTPROTO_RFCOMM)
+            sock.bind((socket.BDADDR_ANY, channel))
+            sock.listen(1)
+            sock.setblocking(False)
+            print(f"BT: Bluetooth Server started on RFCOMM channel {channel}")
+            return sock
+        except OSError:
+            if sock:
+                sock.close()
+    logger.warning("Could not find an open RFCOMM channel (1-10)")
+    return None
+
+
+class TransportError(RuntimeError):
+    """A required adapter (WebSocket / HTTP) could not start"""
+
+
+class StreamChannel:
+    """Line-delimited JSON over an asyncio stream; stands in for the websocket in ClientManager"""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+
+    async def send_text(self, data: str):
+        self.writer.write(data.encode("utf-8") + b"\n")
+        await self.writer.drain()
+
+    async def send_bytes(self, data: bytes):
+        pass  # audio / preview frames have no meaning on the JSON-lines link
+
+    async def close(self):
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+class RfcommAdapter:
+    """Bluetooth clients: register with the shared ClientManager and route every line"""
+
+    def __init__(self, host: 'TransportHost', listen: Callable[[], Optional[socket.socket]] = bind_rfcomm):
+        self.host = host
+        self.listen = listen
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        sock = self.listen()
+        if sock is None:
+            return
+        try:
+            self.server = await asyncio.start_server(self._handle, sock=sock, limit=64 * 1024)
+        except (OSError, NotImplementedError) as e:
+            # e.g. an event loop that can't drive Bluetooth sockets
+            sock.close()
+            logger.error(f"Failed to start Bluetooth transport: {e}")
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname() if self.server else None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")  # (bdaddr, channel)
+        address = str(peer[0]) if isinstance(peer, tuple) else str(peer)
+        device_id = "bt-" + ("-".join(map(str, peer)) if isinstance(peer, tuple) else address)
+        manager = self.host.client_manager
+        channel = StreamChannel(writer)
+        client = await manager.register(channel, device_id, "Bluetooth", "1.0.0", transport="rfcomm", address=address)
+        await manager.send_to_client(device_id, {"type": "connected", "status": "ready"})
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    continue  # line over the limit: skip it
+                if not line:
+                    break
+                text = line.decode("utf-8", errors="replace").strip()
+                if not text:
+                    continue
+                # Any line proves the link is alive (keeps the stale-client reaper off)
+                await manager.update_heartbeat(device_id)
+                response = await self.host.dispatch(self._parse(text), device_id, "rfcomm")
+                if response:
+                    await manager.send_to_client(device_id, response)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            await manager.disconnect(device_id, client)
+
+    @staticmethod
+    def _parse(text: str) -> dict:
+        """The RFCOMM app sends flat messages ({"type": "command", "text": ...}) or bare text"""
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return {"type": "command", "payload": {"text": text, "source": "bluetooth"}}
+        if not isinstance(data, dict):
+            return {"type": "command", "payload": {"text": text, "source": "bluetooth"}}
+        msg_type = data.get("type")
+        if msg_type == "text_input":
+            msg_type = "command"
+        payload = data.get("payload")
+        if not isinstance(payload, dict):
+            payload = {k: v for k, v in data.items() if k != "type"}
+        return {"type": msg_type, "payload": payload}
+
+    async def stop(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+
+class TransportHost:
+    """Runs every mobile adapter on one asyncio loop in one daemon thread"""
+
+    def __init__(self, jarvis_instance: 'Synex', host: str = "0.0.0.0", port: int = WS_PORT,
+                 http_port: Optional[int] = HTTP_PORT, web: bool = True, bluetooth: bool = True,
+                 discovery: bool = True,
+                 client_manager: Optional[ClientManager] = None,
+                 message_router: Optional[MessageRouter] = None):
+        self.jarvis = jarvis_instance
+        self.host = host
+        self.port = port
+        self.http_port = http_port
+        self.client_manager = client_manager or ClientManager()
+        self.message_router = message_router or MessageRouter(jarvis_instance)
+        self.use_web = web
+        self.rfcomm = RfcommAdapter(self) if bluetooth else None
+        self.use_discovery = discovery
+
+        self.websocket = None  # WebSocketServer, created on the loop
+        self.discovery = None
+        self.server = None     # uvicorn.Server
+        self.web_sockets: List[socket.socket] = []
+        self.error: Optional[BaseException] = None  # why serve() stopped early
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._stop_requested = False
+
+        self._latencies: Dict[str, deque] = {}  # transport -> routing seconds
+        self._counts: Dict[str, int] = {}
+        self._errors = 0
+
+    # ------------------------
+    # Routing
+    # ------------------------
+    async def dispatch(self, message: dict, device_id: str, transport: str) -> dict:
+        """Route one message from any adapter; the only place routing latency is measured"""
+        started = time.perf_counter()
+        try:
+            return await self.message_router.route_message(message, device_id)
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Routing failed for {device_id} ({transport}): {e}", exc_info=True)
+            return create_error("ROUTING_ERROR", "Internal server error", {"error": str(e)})
+        finally:
+            self._latencies.setdefault(transport, deque(maxlen=4096)).append(time.perf_counter() - started)
+            self._counts[transport] = self._counts.get(transport, 0) + 1
+
+    def get_stats(self) -> dict:
+        routing = {}
+        for transport, samples in self._latencies.items():
+            latencies = sorted(samples)
+
+            def pct(q):
+                return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000.0 if latencies else 0.0
+
+            routing[transport] = {"messages": self._counts[transport], "route_ms_p50": pct(0.50),
+                                  "route_ms_p99": pct(0.99)}
+        return {
+            "routing": routing,
+            "errors": self._errors,
+            "devices": len(self.client_manager.devices),
+            "outbound": self.client_manager.get_stats(),
+        }
+
+    # ------------------------
+    # HTTP adapter (old Flask bridge routes)
+    # ------------------------
+    def _mount_http(self, app):
+        from fastapi import Request
+
+        @app.get("/ping")
+        async def ping():
+            return {
+                "status": "online",
+                "name": "Synex",
+                "features": ["notifications", "calls", "device_info", "websocket"]
+            }
+
+        @app.post("/register")
+        async def register(request: Request):
+            data = await request.json()
+            device_id = data["device_id"]
+            name = data.get("device_name", "Android")
+            ip = request.client.host if request.client else ""
+            self.client_manager.remember(device_id, name, ip, "http")
+            print(f"📱 Registered {name} @ {ip}")
+            return {"status": "registered"}
+
+        @app.post("/notification")
+        async def notification(request: Request):
+            data = await request.json()
+            ip = request.client.host if request.client else ""
+            device_id = data.get("device_id") or f"http-{ip}"
+            self.client_manager.remember(device_id, address=ip, transport="http")
+            response = await self.dispatch({"type": "notification", "payload": data}, device_id, "http")
+            return {"ok": response.get("type") != "error"}
+
+        @app.get("/transport")
+        async def transport():
+            return self.get_stats()
+
+    # ------------------------
+    # Lifecycle
+    # ------------------------
+    def start(self) -> 'TransportHost':
+        """Start the loop thread and return at once; `ready` is set once sockets are bound"""
+        if self._thread and self._thread.is_alive():
+            return self
+        self._thread = threading.Thread(target=self._run, name="MobileTransport", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait_ready(self, timeout: float = 15.0) -> 'TransportHost':
+        """Block until the adapters are up; raises what kept them from starting"""
+        if not self.ready.wait(timeout):
+            raise TransportError(f"Mobile transport not up after {timeout:.0f}s")
+        if self.error is not None:
+            raise self.error
+        return self
+
+    @property
+    def web_address(self):
+        return self.web_sockets[0].getsockname() if self.web_sockets else None
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.serve())
+        except Exception as e:
+            self.error = e
+            logger.error(f"Mobile transport stopped: {e}", exc_info=True)
+        finally:
+            self.ready.set()
+            self.loop.close()
+
+    async def serve(self):
+        """Bring every adapter up, wait for stop(), then take them down in order"""
+        self.loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        if self._stop_requested:
+            self._stopping.set()
+        server_task = None
+        try:
+            if self.use_web:
+                server_task = await self._start_web()
+            if self.rfcomm:
+                await self.rfcomm.start()
+            if self.use_discovery:
+                await self._start_discovery()
+            self.ready.set()
+            await self._stopping.wait()
+        finally:
+            await self._shutdown(server_task)
+
+    async def _start_web(self) -> asyncio.Task:
+        try:
+            import uvicorn
+            from .websocket import WebSocketServer
+        except ImportError as e:
+            raise TransportError(f"WebSocket / HTTP transport needs fastapi and uvicorn: {e}") from e
+
+        self.websocket = WebSocketServer(self.jarvis, self.client_manager, self.message_router, self.dispatch)
+        self.websocket.loop = self.loop
+        self.jarvis.websocket_server = self.websocket
+        self._mount_http(self.websocket.app)
+
+        ports = [self.port] + ([self.http_port] if self.http_port and self.http_port != self.port else [])
+        sockets: List[socket.socket] = [s for s in (bind_tcp(self.host, p) for p in ports) if s]
+        if not sockets:
+            raise TransportError(f"Could not bind the mobile transport to port(s) {ports}")
+        self.web_sockets = sockets
+        config = uvicorn.Config(app=self.websocket.app, log_level="warning", access_log=False,
+                                timeout_graceful_shutdown=5)
+        self.server = uvicorn.Server(config)
+        print("🌐 Mobile transport listening on", ", ".join(str(s.getsockname()[1]) for s in sockets))
+        return asyncio.create_task(self.server.serve(sockets=sockets))
+
+    async def _start_discovery(self):
+        try:
+            from .discovery import DiscoveryService
+        except ImportError as e:
+            logger.info(f"mDNS discovery unavailable: {e}")
+            return
+        # Zeroconf registration blocks for a moment; keep it off the loop
+        self.discovery = await self.loop.run_in_executor(None, DiscoveryService, self.port)
+        await self.loop.run_in_executor(None, self.discovery.start)
+
+    async def _shutdown(self, server_task: Optional[asyncio.Task]):
+        if self.discovery:
+            await self.loop.run_in_executor(None, self.discovery.stop)
+        if self.rfcomm:
+            await self.rfcomm.stop()
+        if self.websocket:
+            self.websocket.audio_handler.stop_bridge()
+        # Close client sockets first so the HTTP server has nothing left to wait for
+        await self.client_manager.close()
+        if self.server:
+            self.server.should_exit = True
+        if server_task:
+            try:
+                await asyncio.wait_for(server_task, timeout=10)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+        self.message_router.notification_manager.flush()
+
+    def stop(self, timeout: float = 10.0):
+        """Graceful shutdown from any thread"""
+        self._stop_requested = True
+        loop = self.loop
+        if loop and self._stopping and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._stopping.set)
+            except RuntimeError:
+                pass  # loop already gone
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    # ------------------------
+    # Outbound helpers (any thread)
+    # ------------------------
+    def broadcast_sync(self, message: dict):
+        if self.loop and self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.client_manager.broadcast(message), self.loop)
+
+    def send_sync(self, device_id: str, message: dict):
+        if self.loop and self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.client_manager.send_to_client(device_id, message), self.loop)
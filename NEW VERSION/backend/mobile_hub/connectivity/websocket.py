@@ -7,15 +7,19 @@ Unified transport and launcher for mobile clients
 import logging
 import asyncio
 import json
+import zlib
 import uvicorn
 import threading
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 from ..core.manager import ClientManager
 from ..core.router import MessageRouter
 from ..core.protocol import create_response, create_error
-from backend.core.audio_handler import AudioHandler
+from ..core.framing import (
+    KIND_AUDIO, KIND_MESSAGE, KIND_PREVIEW, FrameError, ProtocolSession, negotiate
+)
+from BACKEND.core.audio_handler import AudioHandler
 
 if TYPE_CHECKING:
     from backend.main import Synex
@@ -25,10 +29,14 @@ logger = logging.getLogger(__name__)
 class WebSocketServer:
     """FastAPI WebSocket server for JARVIS mobile clients"""
     
-    def __init__(self, jarvis_instance: 'Synex'):
+    def __init__(self, jarvis_instance: 'Synex', client_manager: Optional[ClientManager] = None,
+                 message_router: Optional[MessageRouter] = None, dispatch=None):
         self.jarvis = jarvis_instance
-        self.client_manager = ClientManager()
-        self.message_router = MessageRouter(jarvis_instance)
+        # The transport host passes the manager / router it shares with its
+        # other adapters, and a dispatch(message, device_id, transport) that times routing
+        self.client_manager = client_manager or ClientManager()
+        self.message_router = message_router or MessageRouter(jarvis_instance)
+        self.dispatch = dispatch or self._route
         self.audio_handler = AudioHandler(self)
         self.app = FastAPI(title="JARVIS Mobile Hub API")
         self.loop = None
@@ -41,7 +49,9 @@ class WebSocketServer:
         async def health():
             return {
                 "status": "healthy",
-                "connected_clients": await self.client_manager.count()
+                "connected_clients": await self.client_manager.count(),
+                "outbound": self.client_manager.get_stats(),
+                "audio": self.audio_handler.get_stats()
             }
         
     async def handle_connection(self, websocket: WebSocket):
@@ -50,6 +60,19 @@ class WebSocketServer:
 
         await websocket.accept()
         device_id = None
+        client = None
+        session = ProtocolSession()  # JSON until registration negotiates something else
+
+        async def reply(message: dict):
+            if client is not None:
+                # Through the client's queue, so frames stay in sequence order
+                await self.client_manager.send_to_client(device_id, message)
+                return
+            data = session.encode_message(message)
+            if session.binary:
+                await websocket.send_bytes(data)
+            else:
+                await websocket.send_text(data)
         
         try:
             while websocket.application_state.name != "DISCONNECTED":
@@ -61,54 +84,72 @@ class WebSocketServer:
                     
                 if "text" in data:
                     try:
-                        message = json.loads(data["text"])
+                        message = session.decode_text(data["text"])
                     except json.JSONDecodeError:
                         continue
-                    
-                    msg_type = message.get("type")
-                    
-                    if msg_type == "heartbeat":
-                        if device_id:
-                            await self.client_manager.update_heartbeat(device_id)
-                        await websocket.send_json({"type": "heartbeat_ack"})
+                
+                elif "bytes" in data:
+                    try:
+                        kind, message = session.decode_binary(data["bytes"])
+                    except (FrameError, zlib.error) as e:
+                        logger.warning(f"Dropping bad frame from {device_id}: {e}")
                         continue
-
-                    if msg_type == "registration":
-                        payload = message.get("payload", {})
-                        temp_device_id = payload.get("device_id")
-                        if temp_device_id:
-                            device_id = temp_device_id
-                            await self.client_manager.register(
-                                websocket, device_id, 
-                                payload.get("device_name", "Unknown"),
-                                payload.get("app_version", "1.0.0")
-                            )
-                            await websocket.send_json(create_response(
-                                status="success",
-                                message="Registration successful"
-                            ))
-                            self.jarvis._on_mobile_registration(
-                                True, 
-                                payload.get("device_name", "Unknown"),
-                                device_id,
-                                websocket.client.host
-                            )
+                    if kind == KIND_AUDIO:
+                        self.audio_handler.handle_mobile_audio(message)
                         continue
-
-                    if not device_id:
-                        await websocket.send_json(create_error("UNAUTHORIZED", "Please register first"))
+                    if kind != KIND_MESSAGE:
                         continue
-
-                    response = await self.message_router.route_message(message, device_id)
-                    
-                    if msg_type == "command" and message.get("command") == "answer_call":
-                         self.audio_handler.start_bridge(device_id)
+                else:
+                    continue
                     
-                    if response:
-                        await websocket.send_json(response)
+                msg_type = message.get("type")
                 
-                elif "bytes" in data:
-                    self.audio_handler.handle_mobile_audio(data["bytes"])
+                if msg_type == "heartbeat":
+                    if device_id:
+                        await self.client_manager.update_heartbeat(device_id)
+                    await reply({"type": "heartbeat_ack"})
+                    continue
+
+                if msg_type == "registration":
+                    payload = message.get("payload", {})
+                    temp_device_id = payload.get("device_id")
+                    if temp_device_id:
+                        device_id = temp_device_id
+                        negotiated = negotiate(payload)
+                        # The answer goes out in the protocol the client registered with
+                        await reply(create_response(
+                            status="success",
+                            message="Registration successful",
+                            data=negotiated.describe()
+                        ))
+                        session = negotiated
+                        client = await self.client_manager.register(
+                            websocket, device_id, 
+                            payload.get("device_name", "Unknown"),
+                            payload.get("app_version", "1.0.0"),
+                            session,
+                            transport="ws",
+                            address=websocket.client.host
+                        )
+                        self._notify_registration(
+                            True, 
+                            payload.get("device_name", "Unknown"),
+                            device_id,
+                            websocket.client.host
+                        )
+                    continue
+
+                if not device_id:
+                    await reply(create_error("UNAUTHORIZED", "Please register first"))
+                    continue
+
+                response = await self.dispatch(message, device_id, "ws")
+                
+                if msg_type == "command" and message.get("command") == "answer_call":
+                     self.audio_handler.start_bridge(device_id, framed=session.binary)
+                
+                if response:
+                    await reply(response)
 
         except WebSocketDisconnect:
             pass
@@ -116,15 +157,25 @@ class WebSocketServer:
             logger.error(f"WebSocket error: {e}")
         finally:
             if device_id:
-                await self.client_manager.disconnect(device_id)
-                self.audio_handler.stop_bridge()
-                self.jarvis._on_mobile_registration(False, "", device_id, "")
+                await self.client_manager.disconnect(device_id, client)
+                self.audio_handler.stop_bridge(device_id)
+                self._notify_registration(False, "", device_id, "")
+
+    async def _route(self, message: dict, device_id: str, transport: str) -> dict:
+        return await self.message_router.route_message(message, device_id)
+
+    def _notify_registration(self, connected: bool, device_name: str, device_id: str, host: str):
+        if hasattr(self.jarvis, '_on_mobile_registration'):
+            self.jarvis._on_mobile_registration(connected, device_name, device_id, host)
+
+    async def send_to_device_binary(self, device_id: str, data: bytes, kind: int = KIND_AUDIO):
+        await self.client_manager.send_binary(device_id, kind, data)
 
-    async def send_to_device_binary(self, device_id: str, data: bytes):
+    async def send_preview_to_device(self, device_id: str, jpeg: bytes):
+        """Gesture preview frame; only protocol-2 clients can tell it apart from audio"""
         client = await self.client_manager.get_client(device_id)
-        if client:
-            try: await client.websocket.send_bytes(data)
-            except: pass
+        if client and client.session.binary:
+            await self.client_manager.send_binary(device_id, KIND_PREVIEW, jpeg)
 
     async def broadcast(self, message: dict):
         await self.client_manager.broadcast(message)
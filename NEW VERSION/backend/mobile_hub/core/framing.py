@@ -0,0 +1,231 @@
+# Path: d:\New folder (2) - JARVIS\backend\mobile_hub\core\framing.py
+"""
+Wire Framing - Negotiated WebSocket protocol versions for mobile clients
+
+Version 1 (JSON, fallback):
+    text frames carry the JSON message dicts from protocol.py,
+    binary frames are raw audio.
+
+Version 2 (msgpack, binary frames only):
+    header  >BBBI  version | kind | flags | seq (per-connection, per-direction)
+    body    MESSAGE  msgpack [type_tag, payload, timestamp, message_id(, extras)]
+                     extras: any other top-level keys ({"command": ...}),
+                     only present when there are some
+            AUDIO    raw PCM16 chunk
+            PREVIEW  JPEG bytes
+    flags   FLAG_ZLIB: body is zlib-compressed (only used when it helps)
+
+Negotiation: the client lists the versions it speaks in its (JSON)
+registration payload, e.g. {"protocols": [2, 1], "compression": ["zlib"]};
+the registration response carries the chosen {"protocol", "compression"}.
+Clients that send nothing stay on version 1.
+"""
+
+import json
+import logging
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:  # version 2 is simply not offered
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_JSON = 1
+PROTOCOL_MSGPACK = 2
+
+KIND_MESSAGE = 1
+KIND_AUDIO = 2
+KIND_PREVIEW = 3
+
+FLAG_ZLIB = 0x01
+
+HEADER = struct.Struct(">BBBI")
+SEQ_MOD = 1 << 32
+
+# Frequent message types travel as one-byte tags; anything else as its string
+TYPE_TAGS = {
+    "registration": 1,
+    "command": 2,
+    "response": 3,
+    "heartbeat": 4,
+    "heartbeat_ack": 5,
+    "notification": 6,
+    "error": 7,
+    "incoming_call": 8,
+    "notification_sync": 9,
+}
+TAG_TYPES = {tag: name for name, tag in TYPE_TAGS.items()}
+
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 1  # speed over ratio: messages are small and frequent
+
+
+def supported_protocols():
+    return (PROTOCOL_MSGPACK, PROTOCOL_JSON) if msgpack is not None else (PROTOCOL_JSON,)
+
+
+def negotiate(registration_payload: Dict[str, Any]) -> "ProtocolSession":
+    """Pick the highest protocol both sides speak (JSON when the client says nothing)."""
+    offered = registration_payload.get("protocols") or [PROTOCOL_JSON]
+    try:
+        offered = {int(v) for v in offered}
+    except (TypeError, ValueError):
+        offered = {PROTOCOL_JSON}
+    version = max((v for v in supported_protocols() if v in offered), default=PROTOCOL_JSON)
+    compression = version == PROTOCOL_MSGPACK and "zlib" in (registration_payload.get("compression") or [])
+    return ProtocolSession(version, compression)
+
+
+class FrameError(ValueError):
+    """Malformed or unexpected binary frame"""
+
+
+@dataclass
+class ProtocolSession:
+    """Encoder / decoder state of one connection."""
+
+    version: int = PROTOCOL_JSON
+    compression: bool = False
+    send_seq: int = 0
+    recv_seq: Optional[int] = None
+    stats: Dict[str, int] = field(default_factory=lambda: {
+        "sent": 0, "received": 0, "bytes_out": 0, "bytes_in": 0, "compressed": 0, "gaps": 0,
+    })
+
+    @property
+    def binary(self) -> bool:
+        return self.version >= PROTOCOL_MSGPACK
+
+    def describe(self) -> Dict[str, Any]:
+        """What goes back to the client in the registration response."""
+        return {"protocol": self.version, "compression": ["zlib"] if self.compression else []}
+
+    # ------------------------
+    # Encoding
+    # ------------------------
+    @property
+    def variant(self) -> Tuple[int, bool]:
+        """Sessions with the same variant can share a prepared message."""
+        return self.version, self.compression
+
+    def encode_body(self, message: Dict[str, Any]) -> Tuple[int, bytes]:
+        """(flags, body) of a message; reusable across connections of the same settings."""
+        return encode_body(message, self.compression)
+
+    def prepare(self, message: Dict[str, Any]):
+        """Connection-independent part of a message frame (see finish())."""
+        return prepare_message(message, self.version, self.compression)
+
+    def frame(self, kind: int, flags: int, body: bytes) -> bytes:
+        seq = self.send_seq
+        self.send_seq = (seq + 1) % SEQ_MOD
+        data = HEADER.pack(self.version, kind, flags, seq) + body
+        self.stats["sent"] += 1
+        self.stats["bytes_out"] += len(data)
+        if flags & FLAG_ZLIB:
+            self.stats["compressed"] += 1
+        return data
+
+    def finish(self, kind: int, prepared):
+        """
+        What goes on the wire: str (JSON text frame) or bytes. `prepared` is
+        prepare()'s result for KIND_MESSAGE, raw bytes for audio / preview.
+        Sequence numbers are assigned here, in send order.
+        """
+        if not self.binary:
+            self.stats["sent"] += 1
+            self.stats["bytes_out"] += len(prepared)
+            return prepared
+        if kind == KIND_MESSAGE:
+            flags, body = prepared
+            return self.frame(kind, flags, body)
+        return self.frame(kind, 0, bytes(prepared))
+
+    def encode_message(self, message: Dict[str, Any]):
+        """str (JSON text frame) for version 1, bytes for version 2."""
+        return self.finish(KIND_MESSAGE, self.prepare(message))
+
+    def encode_binary(self, kind: int, data: bytes) -> bytes:
+        """Audio / preview payload; raw bytes for version 1 clients."""
+        return self.finish(kind, data)
+
+    # ------------------------
+    # Decoding
+    # ------------------------
+    def decode_text(self, text: str) -> Dict[str, Any]:
+        self.stats["received"] += 1
+        self.stats["bytes_in"] += len(text)
+        return json.loads(text)
+
+    def decode_binary(self, data: bytes) -> Tuple[int, Any]:
+        """(kind, message dict | raw bytes). Version 1 binary is always audio."""
+        self.stats["received"] += 1
+        self.stats["bytes_in"] += len(data)
+        if not self.binary:
+            return KIND_AUDIO, data
+        if len(data) < HEADER.size:
+            raise FrameError("short frame")
+        version, kind, flags, seq = HEADER.unpack_from(data)
+        if version != self.version:
+            raise FrameError(f"unexpected protocol version {version}")
+        self._track_seq(seq)
+
+        body = memoryview(data)[HEADER.size:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        if kind == KIND_MESSAGE:
+            return kind, decode_body(body)
+        if kind in (KIND_AUDIO, KIND_PREVIEW):
+            return kind, bytes(body)
+        raise FrameError(f"unknown frame kind {kind}")
+
+    def _track_seq(self, seq: int):
+        if self.recv_seq is not None:
+            expected = (self.recv_seq + 1) % SEQ_MOD
+            if seq != expected:
+                self.stats["gaps"] += 1
+                logger.debug(f"Frame sequence gap: expected {expected}, got {seq}")
+        self.recv_seq = seq
+
+
+def prepare_message(message: Dict[str, Any], version: int, compression: bool):
+    if version < PROTOCOL_MSGPACK:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+    return encode_body(message, compression)
+
+
+BODY_KEYS = ("type", "payload", "timestamp", "message_id")
+
+
+def encode_body(message: Dict[str, Any], compression: bool) -> Tuple[int, bytes]:
+    msg_type = message.get("type")
+    fields = [TYPE_TAGS.get(msg_type, msg_type), message.get("payload"), message.get("timestamp"),
+              message.get("message_id")]
+    extras = {k: v for k, v in message.items() if k not in BODY_KEYS}
+    if extras:
+        fields.append(extras)
+    body = msgpack.packb(fields, use_bin_type=True)
+    if compression and len(body) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(body, COMPRESS_LEVEL)
+        if len(packed) < len(body):
+            return FLAG_ZLIB, packed
+    return 0, body
+
+
+def decode_body(body) -> Dict[str, Any]:
+    try:
+        tag, payload, timestamp, message_id, *rest = msgpack.unpackb(body, raw=False)
+        extras = dict(rest[0]) if rest else {}
+    except (ValueError, TypeError, msgpack.ExtraData) as e:
+        raise FrameError(f"bad message body: {e}") from e
+    message = {**extras, "type": TAG_TYPES.get(tag, tag), "payload": payload if payload is not None else {}}
+    if timestamp is not None:
+        message["timestamp"] = timestamp
+    if message_id is not None:
+        message["message_id"] = message_id
+    return message
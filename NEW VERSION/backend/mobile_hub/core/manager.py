@@ -2,119 +2,380 @@
 """
 Client Manager - Manages multiple connected WebSocket clients
 Thread-safe operations for multi-client scenarios
+
+The transport host shares one ClientManager between its adapters: RFCOMM
+clients register here too (their stream stands in for the websocket), and
+devices that only ever talk plain HTTP are remembered in `devices`.
+
+Every client gets a bounded outbound queue drained by its own writer task,
+so a slow phone only backs up its own queue:
+- broadcast() prepares each message once per protocol variant and only
+  enqueues; it never awaits a socket
+- per message type a policy decides what happens under pressure
+  (POLICY_KEEP / POLICY_DROP / POLICY_COALESCE, see DEFAULT_POLICIES)
+- a client whose queue overflows with must-deliver messages is disconnected
+- a reaper task drops clients whose socket send is stuck for longer than
+  send_timeout or that stopped sending heartbeats
 """
 
 import asyncio
 import logging
-from typing import Dict, Optional, Set
-from fastapi import WebSocket
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
 from datetime import datetime
 
+from .framing import KIND_AUDIO, KIND_MESSAGE, KIND_PREVIEW, ProtocolSession, prepare_message
+
+if TYPE_CHECKING:
+    from fastapi import WebSocket
+
 logger = logging.getLogger(__name__)
 
+POLICY_KEEP = "keep"          # must be delivered; overflow disconnects the client
+POLICY_DROP = "drop"          # may be dropped (oldest first) when the queue is full
+POLICY_COALESCE = "coalesce"  # a newer one replaces the one still waiting; the latest is kept
+
+# Message type (or "audio" / "preview" for binary frames) -> policy; others are kept
+DEFAULT_POLICIES = {
+    "heartbeat_ack": POLICY_COALESCE,
+    "notification_sync": POLICY_COALESCE,
+    "audio": POLICY_DROP,
+    "preview": POLICY_COALESCE,
+}
+
+BINARY_KEYS = {KIND_AUDIO: "audio", KIND_PREVIEW: "preview"}
+
+
+@dataclass
+class Outgoing:
+    kind: int
+    payload: Any       # ProtocolSession.prepare() result, or raw bytes
+    key: str
+    policy: str
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class OutboundQueue:
+    """Bounded FIFO with drop / coalesce handling; single consumer (the writer task)."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._pending: Dict[str, Outgoing] = {}  # coalesce key -> queued item
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def put(self, item: Outgoing) -> bool:
+        """False when a must-deliver item does not fit (the client can't keep up)."""
+        if item.policy == POLICY_COALESCE:
+            pending = self._pending.get(item.key)
+            if pending is not None:
+                pending.payload = item.payload  # keeps its place (and queued_at) in line
+                self.coalesced += 1
+                return True
+
+        if len(self._items) >= self.maxsize:
+            victim = next((i for i in self._items if i.policy == POLICY_DROP), None)
+            if victim is None:
+                if item.policy != POLICY_DROP:
+                    return False
+                self.dropped += 1
+                return True
+            self._items.remove(victim)
+            self._forget(victim)
+            self.dropped += 1
+
+        self._items.append(item)
+        if item.policy == POLICY_COALESCE:
+            self._pending[item.key] = item
+        self._ready.set()
+        return True
+
+    async def get(self) -> Outgoing:
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        item = self._items.popleft()
+        self._forget(item)
+        return item
+
+    def _forget(self, item: Outgoing):
+        if self._pending.get(item.key) is item:
+            del self._pending[item.key]
+
 
 class ConnectedClient:
     """Represents a connected WebSocket client"""
-    
-    def __init__(self, websocket: WebSocket, device_id: str, device_name: str, app_version: str):
-        self.websocket = websocket
+
+    def __init__(self, websocket: 'WebSocket', device_id: str, device_name: str, app_version: str,
+                 session: Optional[ProtocolSession] = None, queue_size: int = 256,
+                 transport: str = "ws", address: str = ""):
+        self.websocket = websocket  # anything with send_text / send_bytes / close
         self.device_id = device_id
         self.device_name = device_name
         self.app_version = app_version
+        self.transport = transport
+        self.address = address
+        self.session = session or ProtocolSession()
+        self.queue = OutboundQueue(queue_size)
+        self.writer: Optional[asyncio.Task] = None
+        self.sending_since: Optional[float] = None  # set while a socket send is in flight
+        self.closing = False
         self.connected_at = datetime.utcnow()
         self.last_heartbeat = datetime.utcnow()
-        
+
+    async def write(self, kind: int, payload: Any):
+        """Frame and send one queued item (writer task only: keeps sequence numbers in order)"""
+        data = self.session.finish(kind, payload)
+        if isinstance(data, str):
+            await self.websocket.send_text(data)
+        else:
+            await self.websocket.send_bytes(data)
+
     def __repr__(self):
-        return f"<Client {self.device_name} ({self.device_id})>"
+        return f"<Client {self.device_name} ({self.device_id}, {self.transport})>"
 
 
 class ClientManager:
     """Manages all connected WebSocket clients"""
-    
-    def __init__(self):
+
+    def __init__(self, queue_size: int = 256, send_timeout: float = 5.0,
+                 policies: Optional[Dict[str, str]] = None,
+                 heartbeat_timeout: int = 120, reap_interval: float = 1.0):
         self._clients: Dict[str, ConnectedClient] = {}  # device_id -> ConnectedClient
+        self.devices: Dict[str, dict] = {}  # device_id -> name / address / transport / last_seen, all transports
         self._lock = asyncio.Lock()
-        
-    async def register(self, websocket: WebSocket, device_id: str, device_name: str, app_version: str) -> ConnectedClient:
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.heartbeat_timeout = heartbeat_timeout
+        self.reap_interval = reap_interval
+        self._reaper: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()  # fire-and-forget disconnects
+        self._latencies = deque(maxlen=4096)    # queue -> socket, seconds
+        self._stats = {"sent": 0, "dropped": 0, "coalesced": 0, "overflows": 0, "failed": 0}
+
+    def remember(self, device_id: str, device_name: Optional[str] = None, address: Optional[str] = None,
+                 transport: Optional[str] = None):
+        """Record that a device was seen (connected or not, e.g. a plain HTTP POST)"""
+        info = self.devices.setdefault(device_id, {"name": "Unknown", "address": "", "transport": ""})
+        if device_name:
+            info["name"] = device_name
+        if address:
+            info["address"] = address
+        if transport:
+            info["transport"] = transport
+        info["last_seen"] = time.time()
+        return info
+
+    async def register(self, websocket: 'WebSocket', device_id: str, device_name: str, app_version: str,
+                       session: Optional[ProtocolSession] = None, transport: str = "ws",
+                       address: str = "") -> ConnectedClient:
         """Register a new client"""
+        client = ConnectedClient(websocket, device_id, device_name, app_version, session, self.queue_size,
+                                 transport, address)
+        self.remember(device_id, device_name, address, transport)
         async with self._lock:
-            # Disconnect existing client with same device_id if present
-            if device_id in self._clients:
-                logger.warning(f"Device {device_id} already connected. Replacing old connection.")
-                await self.disconnect(device_id)
-            
-            client = ConnectedClient(websocket, device_id, device_name, app_version)
+            # Replace an existing client with the same device_id
+            old = self._clients.pop(device_id, None)
             self._clients[device_id] = client
-            logger.info(f"📱 Registered {client}")
-            return client
-    
-    async def disconnect(self, device_id: str):
-        """Disconnect a client"""
+            client.writer = asyncio.create_task(self._writer(client))
+        if old:
+            logger.warning(f"Device {device_id} already connected. Replacing old connection.")
+            await self._close(old)
+        self._start_reaper()
+        logger.info(f"📱 Registered {client}")
+        return client
+
+    async def disconnect(self, device_id: str, client: Optional[ConnectedClient] = None):
+        """Disconnect a client (only if it is still `client`, when given)"""
         async with self._lock:
-            if device_id in self._clients:
-                client = self._clients.pop(device_id)
-                try:
-                    await client.websocket.close()
-                except Exception as e:
-                    logger.debug(f"Error closing websocket for {device_id}: {e}")
-                logger.info(f"📴 Disconnected {client}")
-    
+            current = self._clients.get(device_id)
+            if current is None or (client is not None and current is not client):
+                return
+            del self._clients[device_id]
+        await self._close(current)
+        logger.info(f"📴 Disconnected {current}")
+
+    async def _close(self, client: ConnectedClient):
+        client.closing = True
+        self._collect(client)
+        if client.writer and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+        try:
+            await client.websocket.close()
+        except Exception as e:
+            logger.debug(f"Error closing websocket for {client.device_id}: {e}")
+
+    def _disconnect_later(self, client: ConnectedClient):
+        if client.closing:
+            return
+        client.closing = True
+        task = asyncio.create_task(self.disconnect(client.device_id, client))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     async def get_client(self, device_id: str) -> Optional[ConnectedClient]:
         """Get a specific client"""
         async with self._lock:
             return self._clients.get(device_id)
-    
+
     async def get_all_clients(self) -> Dict[str, ConnectedClient]:
         """Get all connected clients (copy)"""
         async with self._lock:
             return self._clients.copy()
-    
-    async def send_to_client(self, device_id: str, message: dict) -> bool:
-        """Send message to a specific client"""
-        client = await self.get_client(device_id)
-        if client:
+
+    # ------------------------
+    # Sending
+    # ------------------------
+    def _enqueue(self, client: ConnectedClient, kind: int, payload: Any, key: str) -> bool:
+        if client.closing:
+            return False  # already on its way out
+        item = Outgoing(kind, payload, key, self.policies.get(key, POLICY_KEEP))
+        if client.queue.put(item):
+            return True
+        self._stats["overflows"] += 1
+        logger.warning(f"Outbound queue of {client.device_id} is full ({client.queue.maxsize}); disconnecting")
+        self._disconnect_later(client)
+        return False
+
+    async def _writer(self, client: ConnectedClient):
+        while True:
+            item = await client.queue.get()
+            client.sending_since = time.perf_counter()
             try:
-                await client.websocket.send_json(message)
-                return True
+                await client.write(item.kind, item.payload)
             except Exception as e:
-                logger.error(f"Failed to send message to {device_id}: {e}")
-                await self.disconnect(device_id)
-                return False
-        return False
-    
+                self._stats["failed"] += 1
+                logger.error(f"Failed to send message to {client.device_id}: {e!r}")
+                self._disconnect_later(client)
+                return
+            finally:
+                client.sending_since = None
+            self._stats["sent"] += 1
+            self._latencies.append(time.perf_counter() - item.queued_at)
+
+    async def send_to_client(self, device_id: str, message: dict) -> bool:
+        """Queue a message for a specific client"""
+        client = self._clients.get(device_id)
+        if client is None:
+            return False
+        return self._enqueue(client, KIND_MESSAGE, client.session.prepare(message), message.get("type"))
+
+    async def send_binary(self, device_id: str, kind: int, data: bytes) -> bool:
+        """Queue an audio / preview frame for a specific client"""
+        return self.queue_binary(device_id, kind, data)
+
+    def queue_binary(self, device_id: str, kind: int, data: bytes) -> bool:
+        """send_binary() without the coroutine: for loop.call_soon_threadsafe from capture threads"""
+        client = self._clients.get(device_id)
+        if client is None:
+            return False
+        return self._enqueue(client, kind, data, BINARY_KEYS.get(kind, "binary"))
+
     async def broadcast(self, message: dict, exclude: Optional[Set[str]] = None):
         """Broadcast message to all clients (optionally excluding some)"""
         exclude = exclude or set()
-        clients = await self.get_all_clients()
-        
-        for device_id, client in clients.items():
-            if device_id not in exclude:
-                try:
-                    await client.websocket.send_json(message)
-                except Exception as e:
-                    logger.error(f"Failed to broadcast to {device_id}: {e}")
-                    await self.disconnect(device_id)
-    
+        key = message.get("type")
+        prepared = {}  # session variant -> payload: serialize once, frame per client
+
+        for device_id, client in list(self._clients.items()):
+            if device_id in exclude:
+                continue
+            variant = client.session.variant
+            if variant not in prepared:
+                prepared[variant] = prepare_message(message, *variant)
+            self._enqueue(client, KIND_MESSAGE, prepared[variant], key)
+
     async def update_heartbeat(self, device_id: str):
         """Update last heartbeat timestamp for a client"""
         async with self._lock:
             if device_id in self._clients:
                 self._clients[device_id].last_heartbeat = datetime.utcnow()
-    
+        if device_id in self.devices:
+            self.devices[device_id]["last_seen"] = time.time()
+
     async def count(self) -> int:
         """Get number of connected clients"""
         async with self._lock:
             return len(self._clients)
-    
-    async def cleanup_stale_connections(self, timeout_seconds: int = 120):
+
+    async def cleanup_stale_connections(self, timeout_seconds: Optional[int] = None):
         """Remove clients that haven't sent heartbeat in timeout_seconds"""
+        timeout_seconds = self.heartbeat_timeout if timeout_seconds is None else timeout_seconds
         now = datetime.utcnow()
         async with self._lock:
-            stale_devices = [
-                device_id for device_id, client in self._clients.items()
+            stale = [
+                client for client in self._clients.values()
                 if (now - client.last_heartbeat).total_seconds() > timeout_seconds
             ]
-        
-        for device_id in stale_devices:
-            logger.warning(f"Removing stale connection: {device_id}")
-            await self.disconnect(device_id)
+
+        for client in stale:
+            logger.warning(f"Removing stale connection: {client.device_id}")
+            await self.disconnect(client.device_id, client)
+
+    async def cleanup_stalled_sends(self):
+        """Remove clients whose current send has been in flight longer than send_timeout"""
+        now = time.perf_counter()
+        stalled = [
+            client for client in list(self._clients.values())
+            if client.sending_since is not None and now - client.sending_since > self.send_timeout
+        ]
+        for client in stalled:
+            self._stats["failed"] += 1
+            logger.warning(f"Send to {client.device_id} stuck for {now - client.sending_since:.1f}s; disconnecting")
+            await self.disconnect(client.device_id, client)
+
+    # ------------------------
+    # Reaper / shutdown
+    # ------------------------
+    def _start_reaper(self):
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def _reap(self):
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                await self.cleanup_stalled_sends()
+                await self.cleanup_stale_connections()
+            except Exception as e:
+                logger.error(f"Stale connection cleanup failed: {e}")
+
+    async def close(self):
+        """Stop the reaper and disconnect everyone"""
+        if self._reaper:
+            self._reaper.cancel()
+            self._reaper = None
+        for device_id, client in list(self._clients.items()):
+            await self.disconnect(device_id, client)
+
+    # ------------------------
+    # Stats
+    # ------------------------
+    def _collect(self, client: ConnectedClient):
+        self._stats["dropped"] += client.queue.dropped
+        self._stats["coalesced"] += client.queue.coalesced
+        client.queue.dropped = client.queue.coalesced = 0
+
+    def get_stats(self) -> dict:
+        for client in self._clients.values():
+            self._collect(client)
+        latencies = sorted(self._latencies)
+
+        def pct(q):
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000.0 if latencies else 0.0
+
+        return {
+            **self._stats,
+            "clients": len(self._clients),
+            "queued": sum(len(c.queue) for c in self._clients.values()),
+            "send_ms_p50": pct(0.50),
+            "send_ms_p99": pct(0.99),
+        }
@@ -5,7 +5,7 @@ Uses Pydantic for type safety and validation
 """
 
 from pydantic import BaseModel, Field
-from typing import Literal, Any, Optional, Dict
+from typing import Literal, Any, Optional, Dict, List
 from datetime import datetime
 import uuid
 
@@ -25,6 +25,8 @@ class RegistrationPayload(BaseModel):
     device_id: str
     device_name: str
     app_version: str
+    protocols: List[int] = [1]         # wire versions the client speaks (see framing.py)
+    compression: List[str] = []
 
 
 class RegistrationMessage(BaseMessage):
@@ -89,9 +89,18 @@ class MessageRouter:
             
             # Submit command to JARVIS processing queue
             if hasattr(self.jarvis, 'submit_text'):
-                self.jarvis.submit_text(text)
+                accepted = self.jarvis.submit_text(text) is not False
             else:
                  self.jarvis.input_queue.put(text)
+                 accepted = True
+
+            if not accepted:
+                # Back-pressure: the command queue is full, the client should retry later
+                return create_error(
+                    code="BUSY",
+                    message="Assistant is busy, please retry shortly",
+                    details={"command": text}
+                )
 
             return create_response(
                 status="success",
@@ -0,0 +1,196 @@
+# BACKEND/mobile_hub/core/tests/test_client_manager.py
+"""
+Unit tests for the queued, concurrent ClientManager
+"""
+
+import asyncio
+import json
+import unittest
+from datetime import datetime, timedelta
+
+from BACKEND.mobile_hub.core.framing import KIND_AUDIO, PROTOCOL_MSGPACK, ProtocolSession
+from BACKEND.mobile_hub.core.manager import (
+    POLICY_COALESCE,
+    POLICY_DROP,
+    POLICY_KEEP,
+    ClientManager,
+    OutboundQueue,
+    Outgoing,
+)
+
+
+class FakeSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed = False
+        self.gate = None  # asyncio.Event: block sends until set
+
+    async def _send(self, data):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(data)
+
+    async def send_text(self, data):
+        await self._send(data)
+
+    async def send_bytes(self, data):
+        await self._send(data)
+
+    async def close(self):
+        self.closed = True
+
+    def messages(self):
+        return [json.loads(m) for m in self.sent if isinstance(m, str)]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestOutboundQueue(unittest.TestCase):
+    def test_coalesce_and_drop(self):
+        async def scenario():
+            q = OutboundQueue(maxsize=3)
+            self.assertTrue(q.put(Outgoing(1, "a", "notification", POLICY_KEEP)))
+            self.assertTrue(q.put(Outgoing(1, "s1", "sync", POLICY_COALESCE)))
+            self.assertTrue(q.put(Outgoing(1, "s2", "sync", POLICY_COALESCE)))
+            self.assertEqual((len(q), q.coalesced), (2, 1))
+            self.assertTrue(q.put(Outgoing(2, "pcm1", "audio", POLICY_DROP)))
+            # Full: the droppable item makes room, the coalesced one stays
+            self.assertTrue(q.put(Outgoing(1, "b", "notification", POLICY_KEEP)))
+            self.assertEqual(q.dropped, 1)
+            return [(await q.get()).payload for _ in range(len(q))]
+
+        self.assertEqual(run(scenario()), ["a", "s2", "b"])
+
+    def test_overflow_of_keep_items(self):
+        async def scenario():
+            q = OutboundQueue(maxsize=2)
+            q.put(Outgoing(1, "a", "x", POLICY_KEEP))
+            q.put(Outgoing(1, "b", "x", POLICY_KEEP))
+            lossy = q.put(Outgoing(2, "pcm", "audio", POLICY_DROP))
+            return lossy, q.put(Outgoing(1, "c", "x", POLICY_KEEP)), q.dropped
+
+        self.assertEqual(run(scenario()), (True, False, 1))
+
+
+class TestClientManager(unittest.TestCase):
+    def test_slow_client_does_not_stall_broadcast(self):
+        async def scenario():
+            manager = ClientManager()
+            slow, fast = FakeSocket(), FakeSocket()
+            slow.gate = asyncio.Event()
+            await manager.register(slow, "slow", "Slow", "1")
+            await manager.register(fast, "fast", "Fast", "1")
+            for i in range(5):
+                await manager.broadcast({"type": "notification", "payload": {"i": i}})
+            await settle()
+            fast_got, slow_got = len(fast.sent), len(slow.sent)
+            slow.gate.set()
+            await settle()
+            stats = manager.get_stats()
+            await manager.close()
+            return fast_got, slow_got, len(slow.sent), stats
+
+        fast_got, slow_got, slow_later, stats = run(scenario())
+        self.assertEqual((fast_got, slow_got, slow_later), (5, 0, 5))
+        self.assertEqual(stats["sent"], 10)
+
+    def test_mixed_protocols_and_binary(self):
+        async def scenario():
+            manager = ClientManager()
+            v1, v2 = FakeSocket(), FakeSocket()
+            await manager.register(v1, "a", "A", "1")
+            await manager.register(v2, "b", "B", "1", ProtocolSession(PROTOCOL_MSGPACK))
+            await manager.broadcast({"type": "notification", "payload": {"title": "hi"}})
+            await manager.send_binary("b", KIND_AUDIO, b"pcm")
+            await settle()
+            await manager.close()
+            return v1, v2
+
+        v1, v2 = run(scenario())
+        self.assertEqual(v1.messages()[0]["payload"], {"title": "hi"})
+        receiver = ProtocolSession(PROTOCOL_MSGPACK)
+        self.assertEqual(receiver.decode_binary(v2.sent[0])[1]["payload"], {"title": "hi"})
+        self.assertEqual(receiver.decode_binary(v2.sent[1]), (KIND_AUDIO, b"pcm"))
+
+    def test_overflow_disconnects_only_that_client(self):
+        async def scenario():
+            manager = ClientManager(queue_size=4)
+            stuck, ok = FakeSocket(), FakeSocket()
+            stuck.gate = asyncio.Event()
+            await manager.register(stuck, "stuck", "Stuck", "1")
+            await manager.register(ok, "ok", "Ok", "1")
+            for i in range(10):
+                await manager.broadcast({"type": "notification", "payload": {"i": i}})
+                await settle()
+            return stuck.closed, await manager.count(), len(ok.sent), manager.get_stats()["overflows"]
+
+        closed, count, ok_sent, overflows = run(scenario())
+        self.assertTrue(closed)
+        self.assertEqual((count, ok_sent, overflows), (1, 10, 1))
+
+    def test_failed_send_disconnects(self):
+        class Broken(FakeSocket):
+            async def send_text(self, data):
+                raise ConnectionResetError("gone")
+
+        async def scenario():
+            manager = ClientManager()
+            await manager.register(Broken(), "x", "X", "1")
+            await manager.send_to_client("x", {"type": "response", "payload": {}})
+            await settle()
+            return await manager.count(), manager.get_stats()["failed"]
+
+        self.assertEqual(run(scenario()), (0, 1))
+
+    def test_stuck_send_is_reaped(self):
+        async def scenario():
+            manager = ClientManager(send_timeout=0.02, reap_interval=0.01)
+            stuck = FakeSocket()
+            stuck.gate = asyncio.Event()
+            await manager.register(stuck, "stuck", "Stuck", "1")
+            await manager.send_to_client("stuck", {"type": "response", "payload": {}})
+            await asyncio.sleep(0.1)
+            return stuck.closed, await manager.count(), manager.get_stats()["failed"]
+
+        self.assertEqual(run(scenario()), (True, 0, 1))
+
+    def test_replaced_connection_survives_old_disconnect(self):
+        async def scenario():
+            manager = ClientManager()
+            old = await manager.register(FakeSocket(), "phone", "Phone", "1")
+            new_socket = FakeSocket()
+            await manager.register(new_socket, "phone", "Phone", "1")
+            await manager.disconnect("phone", old)  # old connection's handler exits
+            await manager.send_to_client("phone", {"type": "response", "payload": {}})
+            await settle()
+            await manager.close()
+            return old.websocket.closed, len(new_socket.sent)
+
+        self.assertEqual(run(scenario()), (True, 1))
+
+    def test_reaper_removes_stale_clients(self):
+        async def scenario():
+            manager = ClientManager(heartbeat_timeout=60, reap_interval=0.01)
+            client = await manager.register(FakeSocket(), "idle", "Idle", "1")
+            await manager.register(FakeSocket(), "alive", "Alive", "1")
+            client.last_heartbeat = datetime.utcnow() - timedelta(seconds=120)
+            await asyncio.sleep(0.05)
+            remaining = list((await manager.get_all_clients()).keys())
+            await manager.close()
+            return remaining
+
+        self.assertEqual(run(scenario()), ["alive"])
+
+
+if __name__ == "__main__":
+    unittest.main()
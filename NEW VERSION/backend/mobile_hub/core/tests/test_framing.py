@@ -0,0 +1,107 @@
+# BACKEND/mobile_hub/core/tests/test_framing.py
+"""
+Unit tests for the negotiated mobile hub wire protocol
+"""
+
+import json
+import unittest
+
+from BACKEND.mobile_hub.core import framing
+from BACKEND.mobile_hub.core.framing import (
+    FLAG_ZLIB,
+    HEADER,
+    KIND_AUDIO,
+    KIND_MESSAGE,
+    KIND_PREVIEW,
+    PROTOCOL_JSON,
+    PROTOCOL_MSGPACK,
+    FrameError,
+    ProtocolSession,
+    negotiate,
+)
+
+NOTIFICATION = {
+    "type": "notification",
+    "payload": {"app": "WhatsApp", "title": "Mom", "body": "Call me when you're free 🙂", "data": None},
+    "timestamp": "2026-01-01T10:00:00",
+    "message_id": "0f8fad5b-d9cb-469f-a165-70867728950e",
+}
+
+
+@unittest.skipIf(framing.msgpack is None, "msgpack not installed")
+class TestProtocolSession(unittest.TestCase):
+    def test_negotiation(self):
+        self.assertEqual(negotiate({}).version, PROTOCOL_JSON)
+        self.assertEqual(negotiate({"protocols": [1]}).version, PROTOCOL_JSON)
+        self.assertEqual(negotiate({"protocols": ["bogus"]}).version, PROTOCOL_JSON)
+
+        session = negotiate({"protocols": [2, 1], "compression": ["zlib"]})
+        self.assertEqual(session.version, PROTOCOL_MSGPACK)
+        self.assertTrue(session.compression)
+        self.assertEqual(session.describe(), {"protocol": 2, "compression": ["zlib"]})
+        # Compression is only offered on top of the binary protocol
+        self.assertFalse(negotiate({"protocols": [1], "compression": ["zlib"]}).compression)
+
+    def test_json_fallback(self):
+        session = ProtocolSession()
+        text = session.encode_message(NOTIFICATION)
+        self.assertIsInstance(text, str)
+        self.assertEqual(json.loads(text), NOTIFICATION)
+        self.assertEqual(session.decode_binary(b"\x01\x02"), (KIND_AUDIO, b"\x01\x02"))
+        self.assertEqual(session.encode_binary(KIND_AUDIO, b"pcm"), b"pcm")
+
+    def test_message_round_trip(self):
+        sender, receiver = ProtocolSession(PROTOCOL_MSGPACK), ProtocolSession(PROTOCOL_MSGPACK)
+        data = sender.encode_message(NOTIFICATION)
+        self.assertIsInstance(data, bytes)
+        self.assertLess(len(data), len(json.dumps(NOTIFICATION)))
+        self.assertEqual(receiver.decode_binary(data), (KIND_MESSAGE, NOTIFICATION))
+
+        unknown = {"type": "custom_thing", "payload": {"x": 1}}
+        self.assertEqual(receiver.decode_binary(sender.encode_message(unknown))[1], unknown)
+
+        # Top-level keys outside the fixed fields survive (call commands)
+        command = {"type": "command", "command": "answer_call", "payload": {}}
+        data = sender.encode_message(command)
+        self.assertEqual(receiver.decode_binary(data)[1], command)
+        self.assertEqual(receiver.decode_binary(sender.encode_message(NOTIFICATION))[1], NOTIFICATION)
+
+    def test_compression_only_when_it_helps(self):
+        sender = ProtocolSession(PROTOCOL_MSGPACK, compression=True)
+        receiver = ProtocolSession(PROTOCOL_MSGPACK, compression=True)
+
+        small = sender.encode_message({"type": "heartbeat_ack", "payload": {}})
+        self.assertFalse(HEADER.unpack_from(small)[2] & FLAG_ZLIB)
+
+        sync = {"type": "notification_sync", "payload": {"items": [NOTIFICATION["payload"]] * 40}}
+        big = sender.encode_message(sync)
+        self.assertTrue(HEADER.unpack_from(big)[2] & FLAG_ZLIB)
+        self.assertEqual(receiver.decode_binary(big)[1]["payload"], sync["payload"])
+        self.assertEqual(sender.stats["compressed"], 1)
+
+    def test_binary_kinds_and_sequence(self):
+        sender, receiver = ProtocolSession(PROTOCOL_MSGPACK), ProtocolSession(PROTOCOL_MSGPACK)
+        audio = sender.encode_binary(KIND_AUDIO, b"\x00\x01" * 256)
+        preview = sender.encode_binary(KIND_PREVIEW, b"\xff\xd8jpeg")
+        self.assertEqual([HEADER.unpack_from(f)[3] for f in (audio, preview)], [0, 1])
+
+        self.assertEqual(receiver.decode_binary(audio), (KIND_AUDIO, b"\x00\x01" * 256))
+        sender.encode_message(NOTIFICATION)  # lost on the way
+        self.assertEqual(receiver.decode_binary(sender.encode_binary(KIND_PREVIEW, b"x"))[0], KIND_PREVIEW)
+        self.assertEqual(receiver.stats["gaps"], 1)
+        self.assertEqual(preview[HEADER.size:], b"\xff\xd8jpeg")
+
+    def test_bad_frames(self):
+        receiver = ProtocolSession(PROTOCOL_MSGPACK)
+        with self.assertRaises(FrameError):
+            receiver.decode_binary(b"\x02")
+        with self.assertRaises(FrameError):
+            receiver.decode_binary(HEADER.pack(1, KIND_MESSAGE, 0, 0) + b"x")
+        with self.assertRaises(FrameError):
+            receiver.decode_binary(HEADER.pack(2, 9, 0, 1) + b"x")
+        with self.assertRaises(FrameError):
+            receiver.decode_binary(HEADER.pack(2, KIND_MESSAGE, 0, 2) + b"\xc1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,258 @@
+# Path: d:\New folder (2) - JARVIS\backend\mobile_hub\features\notification_store.py
+"""
+Notification Store - Indexed in-memory notifications backed by SQLite (WAL)
+
+- Reads never touch the disk: an insertion-ordered dict keyed by
+  notification key is the source of truth while running.
+- Writes are queued and a background thread applies them in batches
+  (one transaction per flush_interval), so the event loop never waits
+  on the disk. Several changes to one key within a batch collapse into one.
+- Retention is bounded (max_items): the oldest notifications are evicted.
+- The WAL is checkpointed and free pages reclaimed every compact_interval.
+- A legacy notifications.json next to the database is imported once.
+"""
+
+import itertools
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_ITEMS = int(os.getenv("SYNEX_NOTIFICATION_LIMIT", "2000"))
+
+_UPSERT = "upsert"
+_DELETE = "delete"
+_CLEAR = "clear"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    key   TEXT PRIMARY KEY,
+    seq   INTEGER NOT NULL,
+    app   TEXT,
+    title TEXT,
+    text  TEXT
+)
+"""
+
+
+def _record(app_name: str, title: str, text: str, key: str) -> Dict:
+    # Same shape the JSON list used to hold (UI and mobile code read both spellings)
+    return {'app': app_name, 'app_name': app_name, 'title': title, 'text': text, 'id': key, 'key': key}
+
+
+class NotificationStore:
+    def __init__(self, db_path: str = "data/notifications.db", max_items: int = MAX_ITEMS,
+                 flush_interval: float = 0.5, compact_interval: float = 300.0,
+                 legacy_json: Optional[str] = None):
+        self.db_path = db_path
+        self.max_items = max_items
+        self.flush_interval = flush_interval
+        self.compact_interval = compact_interval
+
+        self._items: Dict[str, Dict] = {}  # key -> record, oldest first
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._lock = threading.Lock()
+        self._ops: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self.stats = {"writes": 0, "batches": 0, "evicted": 0, "compactions": 0}
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._load()
+        if legacy_json:
+            self._import_legacy(legacy_json)
+
+        self._writer = threading.Thread(target=self._write_loop, name="NotificationStore", daemon=True)
+        self._writer.start()
+
+    # ------------------------
+    # Reads
+    # ------------------------
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._items.get(key)
+
+    def page(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Newest first"""
+        with self._lock:
+            newest = reversed(self._items.values())
+            stop = None if limit is None else offset + limit
+            return list(itertools.islice(newest, offset, stop))
+
+    # ------------------------
+    # Writes (in memory now, on disk with the next batch)
+    # ------------------------
+    def upsert(self, app_name: str, title: str, text: str, key: str) -> bool:
+        """True when the key is new; an update keeps the notification's place."""
+        record = _record(app_name, title, text, key)
+        with self._lock:
+            is_new = key not in self._items
+            self._items[key] = record
+            if is_new:
+                self._seq[key] = self._next_seq
+                self._next_seq += 1
+            self._ops.put((_UPSERT, key, self._seq[key], app_name, title, text))
+            evicted = self._evict()
+        for old_key in evicted:
+            self._ops.put((_DELETE, old_key))
+        return is_new
+
+    def delete(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            record = self._items.pop(key, None)
+            self._seq.pop(key, None)
+        if record is not None:
+            self._ops.put((_DELETE, key))
+        return record
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._seq.clear()
+        self._ops.put((_CLEAR,))
+
+    def _evict(self) -> List[str]:
+        evicted = []
+        while len(self._items) > self.max_items:
+            old_key = next(iter(self._items))
+            del self._items[old_key]
+            del self._seq[old_key]
+            evicted.append(old_key)
+        self.stats["evicted"] += len(evicted)
+        return evicted
+
+    # ------------------------
+    # Disk
+    # ------------------------
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")  # only takes effect on a new file
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        return conn
+
+    def _load(self):
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute("SELECT key, seq, app, title, text FROM notifications ORDER BY seq").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading notifications: {e}")
+            rows = []
+        for key, seq, app, title, text in rows:
+            self._items[key] = _record(app, title, text, key)
+            self._seq[key] = seq
+        self._next_seq = rows[-1][1] + 1 if rows else 0
+        for old_key in self._evict():
+            self._ops.put((_DELETE, old_key))
+
+    def _import_legacy(self, path: str):
+        """Move a notifications.json (newest first) into the store once"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading legacy notifications: {e}")
+            return
+        for n in reversed(legacy):
+            key = n.get('key') or n.get('id')
+            if key and key not in self._items:
+                self.upsert(n.get('app_name') or n.get('app', 'Unknown'), n.get('title', ''), n.get('text', ''), key)
+        os.replace(path, path + ".migrated")
+        logger.info(f"Imported {len(legacy)} notifications from {path}")
+
+    def _write_loop(self):
+        conn = self._connect()
+        last_compact = time.monotonic()
+        try:
+            while True:
+                batch = [self._ops.get()]
+                time.sleep(self.flush_interval)  # let a burst accumulate
+                while True:
+                    try:
+                        batch.append(self._ops.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = self._apply(conn, batch)
+
+                if time.monotonic() - last_compact > self.compact_interval:
+                    self._compact(conn)
+                    last_compact = time.monotonic()
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    def _apply(self, conn: sqlite3.Connection, batch) -> bool:
+        """Collapse the batch to the last op per key and write it in one transaction"""
+        stop = False
+        cleared = False
+        pending: Dict[str, tuple] = {}
+        for op in batch:
+            if op[0] == _CLEAR:
+                cleared = True
+                pending.clear()
+            elif op[0] is None:
+                stop = True
+            else:
+                pending[op[1]] = op
+        upserts = [op[1:] for op in pending.values() if op[0] == _UPSERT]
+        deletes = [(key,) for key, op in pending.items() if op[0] == _DELETE]
+        try:
+            with conn:
+                if cleared:
+                    conn.execute("DELETE FROM notifications")
+                if upserts:
+                    conn.executemany(
+                        "INSERT INTO notifications (key, seq, app, title, text) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET "
+                        "seq=excluded.seq, app=excluded.app, title=excluded.title, text=excluded.text",
+                        upserts,
+                    )
+                if deletes:
+                    conn.executemany("DELETE FROM notifications WHERE key = ?", deletes)
+            self.stats["writes"] += len(upserts) + len(deletes)
+            self.stats["batches"] += 1
+        except sqlite3.Error as e:
+            logger.error(f"Error saving notifications: {e}")
+        finally:
+            for _ in batch:
+                self._ops.task_done()
+        return stop
+
+    def _compact(self, conn: sqlite3.Connection):
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("PRAGMA incremental_vacuum")
+            self.stats["compactions"] += 1
+        except sqlite3.Error as e:
+            logger.debug(f"Notification store compaction failed: {e}")
+
+    def flush(self):
+        """Block until everything queued so far is on disk"""
+        if self._writer.is_alive():
+            self._ops.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._ops.put((None,))
+        self._writer.join(timeout=5.0)
@@ -1,16 +1,18 @@
 
-import json
-import os
+import atexit
 import logging
+import uuid
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from .notification_store import NotificationStore
+
 logger = logging.getLogger(__name__)
 
 class NotificationManager:
     """
     Unified Notification Manager for JARVIS.
-    Supports file persistence (common file) and real-time callbacks.
+    Supports persistence (indexed SQLite store, see notification_store.py) and real-time callbacks.
     """
     _instance = None
     
@@ -23,97 +25,67 @@ class NotificationManager:
     def __init__(self, storage_file: str = "data/notifications.json"):
         if getattr(self, 'initialized', False):
             return
+        # storage_file names the legacy JSON list; it is imported into the
+        # SQLite store next to it on first start
         self.storage_file = storage_file
-        self.notifications = []
+        self.store = NotificationStore(
+            str(Path(storage_file).with_suffix(".db")),
+            legacy_json=storage_file,
+        )
         self.callbacks = []
-        self._ensure_storage_exists()
-        self.load_from_file()
+        atexit.register(self.store.close)
         self.initialized = True
 
-    def _ensure_storage_exists(self):
-        Path(self.storage_file).parent.mkdir(parents=True, exist_ok=True)
-        if not os.path.exists(self.storage_file):
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump([], f)
-
-    def load_from_file(self):
-        try:
-            if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    self.notifications = json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading notifications: {e}")
-            self.notifications = []
-
-    def _save_to_file(self):
-        try:
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(self.notifications, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Error saving notifications: {e}")
+    @property
+    def notifications(self) -> List[Dict]:
+        """All notifications, most recent first"""
+        return self.store.page()
 
     def add(self, notification: Dict) -> bool:
         """New Hub-style add method. Wraps legacy add_notification."""
         app = notification.get("app") or notification.get("app_name") or "Unknown"
         title = notification.get("title", "")
         text = notification.get("text", "")
-        notif_id = notification.get("key") or notification.get("id") or str(len(self.notifications))
+        # No key from the phone: a fresh id (a count-based one repeats once the store is full)
+        notif_id = notification.get("key") or notification.get("id") or uuid.uuid4().hex
         
         return self.add_notification(app, title, text, notif_id)
 
     def add_notification(self, app_name: str, title: str, text: str, notif_id: str):
         """Standard notification addition with persistence and callbacks"""
-        # Check if exists (update)
-        for i, n in enumerate(self.notifications):
-            if n.get('id') == notif_id or n.get('key') == notif_id:
-                self.notifications[i] = {
-                    'app': app_name,
-                    'app_name': app_name,
-                    'title': title,
-                    'text': text,
-                    'id': notif_id,
-                    'key': notif_id
-                }
-                self._save_to_file()
-                self._notify_listeners('update', self.notifications[i])
-                return True
+        is_new = self.store.upsert(app_name, title, text, notif_id)
+        notif = self.store.get(notif_id)
+        if not is_new:
+            self._notify_listeners('update', notif)
+            return True
 
-        # New
-        notif = {
-            'app': app_name,
-            'app_name': app_name,
-            'title': title,
-            'text': text,
-            'id': notif_id,
-            'key': notif_id
-        }
-        self.notifications.insert(0, notif) # Most recent first
-        self._save_to_file()
         self._notify_listeners('add', notif)
         logger.info(f"Notification added: {app_name} - {title}")
         return True
 
     def delete(self, notif_id: str) -> bool:
         """Delete a notification by ID"""
-        for i, n in enumerate(self.notifications):
-            if n.get('id') == notif_id or n.get('key') == notif_id:
-                removed = self.notifications.pop(i)
-                self._save_to_file()
-                self._notify_listeners('delete', removed)
-                logger.info(f"Notification deleted: {notif_id}")
-                return True
-        return False
+        removed = self.store.delete(notif_id)
+        if removed is None:
+            return False
+        self._notify_listeners('delete', removed)
+        logger.info(f"Notification deleted: {notif_id}")
+        return True
 
     def clear_all(self):
         """Clear all notifications"""
-        self.notifications.clear()
-        self._save_to_file()
+        self.store.clear()
         self._notify_listeners('clear', None)
         logger.info("All notifications cleared")
         return True
 
-    def get_all(self) -> List[Dict]:
-        return self.notifications
+    def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Most recent first; limit/offset page through the history"""
+        return self.store.page(limit, offset)
+
+    def flush(self):
+        """Wait until pending changes are on disk"""
+        self.store.flush()
 
     def register_callback(self, callback):
         if callback not in self.callbacks:
@@ -0,0 +1,129 @@
+# BACKEND/mobile_hub/features/tests/test_notification_store.py
+"""
+Unit tests for the indexed SQLite notification store
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from BACKEND.mobile_hub.features.notification_store import NotificationStore
+from BACKEND.mobile_hub.features.notifications import NotificationManager
+
+
+class TestNotificationStore(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.db = os.path.join(self.dir, "notifications.db")
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.dir)
+
+    def _store(self, **kwargs):
+        kwargs.setdefault("flush_interval", 0.0)
+        store = NotificationStore(self.db, **kwargs)
+        self.stores.append(store)
+        return store
+
+    def test_upsert_keeps_place_and_pages_newest_first(self):
+        store = self._store()
+        for i in range(5):
+            self.assertTrue(store.upsert("App", f"t{i}", "", f"k{i}"))
+        self.assertFalse(store.upsert("App", "t1 edited", "", "k1"))
+
+        self.assertEqual([n["key"] for n in store.page()], ["k4", "k3", "k2", "k1", "k0"])
+        self.assertEqual([n["key"] for n in store.page(limit=2, offset=2)], ["k2", "k1"])
+        self.assertEqual(store.get("k1")["title"], "t1 edited")
+        self.assertEqual(store.get("k1")["app_name"], "App")
+
+    def test_persists_across_restarts(self):
+        store = self._store()
+        for i in range(4):
+            store.upsert("App", f"t{i}", "body", f"k{i}")
+        store.upsert("App", "t0 edited", "body", "k0")
+        store.delete("k2")
+        store.close()
+
+        reopened = self._store()
+        self.assertEqual([n["key"] for n in reopened.page()], ["k3", "k1", "k0"])
+        self.assertEqual(reopened.get("k0")["title"], "t0 edited")
+        reopened.upsert("App", "new", "", "k4")
+        self.assertEqual(reopened.page(limit=1)[0]["key"], "k4")
+
+    def test_clear_then_add_in_one_batch(self):
+        store = self._store(flush_interval=0.05)
+        store.upsert("App", "a", "", "a")
+        store.clear()
+        store.upsert("App", "b", "", "b")
+        store.close()
+        self.assertEqual([n["key"] for n in self._store().page()], ["b"])
+
+    def test_bounded_retention(self):
+        store = self._store(max_items=3)
+        for i in range(10):
+            store.upsert("App", "", "", f"k{i}")
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.stats["evicted"], 7)
+        store.close()
+        self.assertEqual([n["key"] for n in self._store(max_items=3).page()], ["k9", "k8", "k7"])
+
+    def test_burst_is_batched(self):
+        store = self._store(flush_interval=0.05)
+        for i in range(1000):
+            store.upsert("App", "", "", f"k{i % 200}")
+        store.flush()
+        self.assertLess(store.stats["batches"], 10)
+        self.assertLessEqual(store.stats["writes"], 200 * store.stats["batches"])
+
+    def test_legacy_json_import(self):
+        legacy = os.path.join(self.dir, "notifications.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump([
+                {"app": "B", "title": "newer", "text": "", "id": "2", "key": "2"},
+                {"app_name": "A", "title": "older", "text": "", "id": "1"},
+            ], f)
+        store = self._store(legacy_json=legacy)
+        self.assertEqual([n["key"] for n in store.page()], ["2", "1"])
+        self.assertEqual(store.get("1")["app"], "A")
+        self.assertFalse(os.path.exists(legacy))
+        self.assertTrue(os.path.exists(legacy + ".migrated"))
+
+
+class TestNotificationManager(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        NotificationManager._instance = None
+        self.manager = NotificationManager(os.path.join(self.dir, "notifications.json"))
+
+    def tearDown(self):
+        self.manager.store.close()
+        NotificationManager._instance = None
+        shutil.rmtree(self.dir)
+
+    def test_callbacks_and_paging(self):
+        events = []
+        self.manager.register_callback(lambda action, data: events.append((action, data and data["key"])))
+        self.manager.add({"app_name": "WhatsApp", "title": "hi", "text": "", "key": "a"})
+        self.manager.add({"app_name": "WhatsApp", "title": "hi again", "text": "", "key": "a"})
+        self.manager.add({"app": "Gmail", "title": "mail", "text": "", "key": "b"})
+        self.assertTrue(self.manager.delete("a"))
+        self.assertFalse(self.manager.delete("a"))
+
+        self.assertEqual(events, [("add", "a"), ("update", "a"), ("add", "b"), ("delete", "a")])
+        self.assertEqual([n["key"] for n in self.manager.get_all(limit=10)], ["b"])
+        self.assertTrue(os.path.exists(os.path.join(self.dir, "notifications.db")))
+
+    def test_keyless_notifications_never_overwrite(self):
+        self.manager.store.max_items = 2
+        for title in ("one", "two", "three", "four"):
+            self.manager.add({"app_name": "SMS", "title": title, "text": ""})
+        self.assertEqual([n["title"] for n in self.manager.get_all(limit=10)], ["four", "three"])
+
+
+if __name__ == "__main__":
+    unittest.main()
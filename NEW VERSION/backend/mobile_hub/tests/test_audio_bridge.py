@@ -0,0 +1,108 @@
+# BACKEND/mobile_hub/tests/test_audio_bridge.py
+"""
+Unit and loopback tests for the streaming call audio bridge (fake devices)
+"""
+
+import random
+import unittest
+
+from BACKEND.mobile_hub.audio_bridge import (
+    CODEC_PCM,
+    FRAME_HEADER,
+    AudioBridge,
+    FakeAudioDevice,
+    JitterBuffer,
+    ManualClock,
+    make_codec,
+    simulate_call,
+)
+
+
+class TestJitterBuffer(unittest.TestCase):
+    def test_reorders_and_conceals(self):
+        clock = ManualClock()
+        jb = JitterBuffer(frame_ms=20, min_delay_ms=40, clock=clock)
+        for seq in (1, 0, 3):
+            jb.push(seq, CODEC_PCM, 320, bytes([seq]))
+        statuses = [jb.pop() for _ in range(4)]
+        self.assertEqual([s for s, _ in statuses], ["ok", "ok", "lost", "ok"])
+        self.assertEqual([f[2] for s, f in statuses if s == "ok"], [b"\x00", b"\x01", b"\x03"])
+
+        jb.push(1, CODEC_PCM, 320, b"late")
+        self.assertEqual(jb.stats["late"], 1)
+        self.assertEqual(jb.pop()[0], "lost")  # ran dry
+        self.assertEqual(jb.stats["underruns"], 1)
+        self.assertEqual(jb.pop()[0], "wait")  # prefilling again
+
+    def test_target_adapts_to_jitter(self):
+        clock = ManualClock()
+        jb = JitterBuffer(frame_ms=20, min_delay_ms=40, max_delay_ms=300, clock=clock)
+        for seq in range(50):
+            clock.now = seq * 0.02
+            jb.push(seq, CODEC_PCM, 320, b"")
+        calm = jb.target_frames
+        rng = random.Random(1)
+        for seq in range(50, 150):
+            clock.now = seq * 0.02 + rng.uniform(0, 0.08)
+            jb.push(seq, CODEC_PCM, 320, b"")
+        self.assertEqual(calm, 2)
+        self.assertGreater(jb.target_frames, calm)
+        self.assertLessEqual(jb.target_frames, jb.max_frames)
+        self.assertLessEqual(len(jb), jb.max_frames)
+
+
+class TestAudioBridgeLoopback(unittest.TestCase):
+    def test_jittery_lossy_link(self):
+        laptop, phone = simulate_call(frames=500, jitter_ms=40.0, loss=0.02)
+        stats = phone.get_stats()
+        self.assertEqual(len(phone.device.played), 500)
+        self.assertGreater(stats["received"], 470)
+        # ~2% loss concealed, no long dropouts, bounded buffering
+        self.assertGreater(stats["concealed"], 0)
+        self.assertLess(stats["concealed"], 30)
+        self.assertLessEqual(stats["underruns"], 2)
+        self.assertLessEqual(stats["buffer_ms_max"], 300.0)
+        self.assertGreater(stats["jitter_ms"], 5.0)
+
+        # What was played in order is what was captured
+        sent = FakeAudioDevice(laptop.sample_rate, laptop.frame_samples)
+        source = {sent.read() for _ in range(500)}
+        played_ok = [pcm for pcm in phone.device.played if pcm in source]
+        self.assertGreater(len(played_ok), 450)
+
+    def test_sender_clock_drift_stays_bounded(self):
+        _, phone = simulate_call(frames=1000, jitter_ms=10.0, loss=0.0, drift=0.02)
+        stats = phone.get_stats()
+        self.assertGreater(stats["drift_drops"], 0)
+        self.assertLessEqual(stats["buffer_ms_max"], 200.0)
+
+    def test_framing_and_bandwidth_report(self):
+        laptop, _ = simulate_call(frames=50, loss=0.0)
+        stats = laptop.get_stats()
+        self.assertEqual(stats["sent_frames"], 50)
+        self.assertEqual(stats["codec"], "pcm")
+        expected = (640 + FRAME_HEADER.size) * 8 * 50 / 1.0 / 1000.0
+        self.assertAlmostEqual(stats["send_kbps"], expected, places=3)
+
+    def test_legacy_raw_pcm(self):
+        sent = []
+        bridge = AudioBridge(sent.append, framed=False, codec="opus", device_factory=FakeAudioDevice)
+        bridge.device = FakeAudioDevice(bridge.sample_rate, bridge.frame_samples)
+        self.assertEqual(bridge.codec.name, "pcm")
+        bridge.capture_once()
+        self.assertEqual(sent, [FakeAudioDevice(16000, 320).read()])  # raw, no header
+
+        bridge.receive(b"\x01\x00" * 1024)  # old 1024-sample chunks
+        self.assertEqual(len(bridge.jitter), 3)  # 3 full 20 ms frames, remainder kept
+
+    def test_opus_when_available(self):
+        codec = make_codec("opus")
+        if codec.name != "opus":
+            self.skipTest("opuslib / libopus not installed")
+        laptop, phone = simulate_call(frames=200, codec="opus")
+        self.assertLess(laptop.get_stats()["compression"], 0.2)
+        self.assertEqual(len(phone.device.played), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -682,23 +682,29 @@ class CenterContent(QWidget):
         if frame is None:
             self.preview_label.setText("No preview")
             return
-        
-        # Handle JPEG bytes or memoryview
+
+        # In-process preview channel: RGB buffer already at paint size
+        if hasattr(frame, "read"):
+            with frame.read() as preview:
+                if preview is None:
+                    return
+                image = QImage(
+                    preview.rgb.data, preview.width, preview.height, preview.stride, QImage.Format.Format_RGB888
+                )
+                # fromImage copies, so the buffer can go back to the channel afterwards
+                pixmap = QPixmap.fromImage(image)
+            self._show_preview_pixmap(pixmap, channel=frame)
+            return
+
+        # Handle JPEG bytes (remote sources) or a raw BGR numpy array
         image = QImage()
         try:
             if isinstance(frame, (bytes, bytearray, memoryview)):
                 image.loadFromData(bytes(frame))
             else:
-                # Assume numpy array in BGR - make a copy to avoid issues
-                if hasattr(frame, 'copy'):
-                    frame = frame.copy()
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) if 'cv2' in dir() else frame[:, :, ::-1]
+                rgb = np.ascontiguousarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
                 h, w, ch = rgb.shape
-                bytes_per_line = ch * w
-                # Ensure data is contiguous
-                if not rgb.flags['C_CONTIGUOUS']:
-                    rgb = np.ascontiguousarray(rgb)
-                image = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+                image = QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888).copy()
         except Exception as e:
             self.preview_label.setText(f"Preview error: {str(e)[:30]}")
             return
@@ -707,36 +713,44 @@ class CenterContent(QWidget):
             self.preview_label.setText("Invalid frame")
             return
 
-        pixmap = QPixmap.fromImage(image)
-        
-        # Use the full preview area
+        self._show_preview_pixmap(QPixmap.fromImage(image))
+
+    def _preview_target_size(self, source_size):
+        """Size the preview is painted at: fit the label, with a gentle zoom-in."""
         available_size = self.preview_label.contentsRect().size()
         target_width = max(1, available_size.width())
         target_height = max(1, available_size.height())
-        target_size = QSize(target_width, target_height)
 
         # Keep aspect ratio
-        fitted_size = pixmap.size().scaled(
-            target_size,
+        fitted_size = source_size.scaled(
+            QSize(target_width, target_height),
             Qt.AspectRatioMode.KeepAspectRatio
         )
 
         # Gentle zoom-in to reduce empty space
         zoom_factor = 1.08
-        zoomed_size = QSize(
+        return QSize(
             min(target_width, int(fitted_size.width() * zoom_factor)),
             min(target_height, int(fitted_size.height() * zoom_factor)),
         )
 
-        # Use FastTransformation for smoother updates (less CPU intensive)
-        scaled_pixmap = pixmap.scaled(
-            zoomed_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.FastTransformation,  # Changed from SmoothTransformation
-        )
+    def _show_preview_pixmap(self, pixmap, channel=None):
+        zoomed_size = self._preview_target_size(pixmap.size())
+        if channel is not None:
+            # Next frames arrive already at this size, so no scaling on the GUI thread
+            channel.set_target_size(zoomed_size.width(), zoomed_size.height())
+
+        # A frame fitted to the box matches it in one dimension; otherwise rescale here
+        if abs(pixmap.width() - zoomed_size.width()) > 1 and abs(pixmap.height() - zoomed_size.height()) > 1:
+            # Use FastTransformation for smoother updates (less CPU intensive)
+            pixmap = pixmap.scaled(
+                zoomed_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
 
         # Direct pixmap update without opacity effects to prevent flicker
-        self.preview_label.setPixmap(scaled_pixmap)
+        self.preview_label.setPixmap(pixmap)
 
     def update_gesture_event(self, gesture: str):
         pretty = gesture.replace("_", " ")
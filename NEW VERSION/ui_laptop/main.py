@@ -1,7 +1,6 @@
 import sys
 import os
 import threading
-import time
 
 # Set UTF-8 encoding for output
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -54,9 +53,10 @@ class BackendThread(QThread):
         except Exception as e:
             print(f"Backend thread error: {e}")
 
-    def submit_text(self, text: str):
+    def submit_text(self, text: str) -> bool:
         if hasattr(self, "synex") and not self._stop_requested:
-            self.synex.submit_text(text)
+            return self.synex.submit_text(text)
+        return False
 
     def start_voice_listening(self):
         if hasattr(self, "synex") and not self._stop_requested:
@@ -220,15 +220,11 @@ class JARVISWindow(QMainWindow):
         self.center_content.update_gesture_status(active, gesture, fps)
 
     def on_gesture_frame(self, frame):
-        """Throttle frame updates to reduce flickering"""
-        # Only update if enough time has passed (limit to ~15 FPS for preview)
-        current_time = time.time()
-        if not hasattr(self, '_last_frame_time'):
-            self._last_frame_time = 0
-        
-        if current_time - self._last_frame_time >= 0.066:  # ~15 FPS (66ms)
-            self._last_frame_time = current_time
-            self.center_content.update_gesture_preview(frame)
+        """Paint the newest preview frame.
+        No time-based throttle here: the preview channel already coalesces,
+        and skipping a notification would leave newer frames unpainted.
+        """
+        self.center_content.update_gesture_preview(frame)
 
     def on_gesture_event(self, gesture: str):
         self.center_content.update_gesture_event(gesture)
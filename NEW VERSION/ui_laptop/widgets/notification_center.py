@@ -43,6 +43,8 @@ class NotificationItem(QFrame):
         layout.addWidget(lbl_text)
 
 class NotificationCenter(QWidget):
+    HISTORY_LIMIT = 100  # widgets built at startup; the store keeps more
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -80,7 +82,7 @@ class NotificationCenter(QWidget):
         try:
             from backend.mobile_hub.features.notifications import NotificationManager
             manager = NotificationManager()
-            history = manager.get_all()
+            history = manager.get_all(limit=self.HISTORY_LIMIT)
             for notif in reversed(history): # Reversed because we insert at index 0 in add_notification
                 self.add_notification(
                     notif.get("app_name") or notif.get("app", "Unknown"),